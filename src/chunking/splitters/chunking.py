@@ -4,12 +4,11 @@ Document chunking orchestration and metadata creation.
 v0.3.3: Updated to support intelligent chunking strategies (semantic, hierarchical)
 """
 
-import re
 from pathlib import Path
 from typing import Any
 
 from src.chunking.splitters.page_tracking import (
-    build_page_position_map,
+    PageMarkerIndex,
     estimate_page_from_position,
     map_chunks_to_pages,
 )
@@ -53,21 +52,29 @@ def chunk_document(document: Document, splitter: Any | None = None, strategy: st
 
     logger.info(f"Chunking document: {document.document_id}")
 
-    # Build page position map from original content
+    # Locate page markers in one pass and remove them for chunking
     original_content = document.content
-    page_positions = build_page_position_map(original_content)
-
-    # Remove page markers for chunking
-    clean_content = re.sub(r'<!-- PAGE \d+ -->\n?', '', original_content)
-
-    # Split content (using cleaned content without markers)
-    text_chunks = splitter.split_text(clean_content)
+    markers = PageMarkerIndex(original_content)
+    page_positions = markers.page_positions
+    clean_content = markers.strip_markers(original_content)
+
+    # Split content (using cleaned content without markers); splitters that
+    # report offsets spare the page mapper from searching for each chunk
+    chunk_offsets: list[tuple[int, int]] | None = None
+    if hasattr(splitter, "split_text_with_offsets"):
+        spans = splitter.split_text_with_offsets(clean_content)
+        text_chunks = [chunk for _, _, chunk in spans]
+        chunk_offsets = [(start, end) for start, end, _ in spans]
+    else:
+        text_chunks = splitter.split_text(clean_content)
     total_chunks = len(text_chunks)
 
     logger.info(f"Created {total_chunks} chunks")
 
     # Map chunks to their page numbers
-    chunk_pages = map_chunks_to_pages(text_chunks, clean_content, original_content, page_positions)
+    chunk_pages = map_chunks_to_pages(
+        text_chunks, clean_content, original_content, page_positions, chunk_offsets=chunk_offsets, markers=markers
+    )
 
     # Get total pages for fallback estimation
     # Keep None for documents without pages (TXT, MD, HTML)
@@ -1,6 +1,61 @@
 """Page tracking and mapping for document chunks."""
 
 import re
+from bisect import bisect_right
+
+# Page marker including the newline that follows it, as removed before chunking
+PAGE_MARKER_PATTERN = re.compile(r'<!-- PAGE (\d+) -->\n?')
+
+
+class PageMarkerIndex:
+    """Page markers of a document stored as sorted offset arrays.
+
+    A single scan records where each marker sits in the original content and in
+    the content with markers removed, plus the cumulative length removed. Clean
+    offsets translate to original offsets with one bisect, so no per-character
+    mapping is needed.
+    """
+
+    def __init__(self, content: str):
+        """Scan ``content`` for <!-- PAGE N --> markers."""
+        self.pages: list[int] = []
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        # Clean offset each marker was removed at, and total length removed so far
+        self._clean_offsets: list[int] = []
+        self._removed: list[int] = []
+
+        removed = 0
+        for match in PAGE_MARKER_PATTERN.finditer(content):
+            start, end = match.span()
+            self.pages.append(int(match.group(1)))
+            self.starts.append(start)
+            self.ends.append(end)
+            self._clean_offsets.append(start - removed)
+            removed += end - start
+            self._removed.append(removed)
+
+        self.clean_length = len(content) - removed
+
+    @property
+    def page_positions(self) -> list[tuple[int, int]]:
+        """(page_number, position) tuples, as from build_page_position_map."""
+        return list(zip(self.pages, self.starts, strict=True))
+
+    def strip_markers(self, content: str) -> str:
+        """Return ``content`` (the scanned document) with its page markers removed."""
+        if not self.starts:
+            return content
+        pieces = [content[: self.starts[0]]]
+        for end, next_start in zip(self.ends[:-1], self.starts[1:], strict=True):
+            pieces.append(content[end:next_start])
+        pieces.append(content[self.ends[-1] :])
+        return "".join(pieces)
+
+    def to_original(self, clean_position: int) -> int:
+        """Translate a position in the marker-free content to the original content."""
+        index = bisect_right(self._clean_offsets, clean_position)
+        return clean_position + (self._removed[index - 1] if index else 0)
 
 
 def build_page_position_map(content: str) -> list[tuple[int, int]]:
@@ -34,25 +89,21 @@ def get_page_for_position(position: int, page_positions: list[tuple[int, int]])
     Returns:
         Page number (1-indexed)
     """
-    if not page_positions:
-        return 1  # Default to page 1 if no markers
-
     # Find the last page marker that comes before or at this position
-    current_page = 1
-    for page_num, page_pos in page_positions:
-        if page_pos <= position:
-            current_page = page_num
-        else:
-            break
+    index = bisect_right(page_positions, position, key=lambda page_position: page_position[1])
+    if index == 0:
+        return 1  # Default to page 1 if no markers precede the position
 
-    return current_page
+    return page_positions[index - 1][0]
 
 
 def build_clean_to_orig_map(original_content: str) -> list[int]:
     """Build a mapping from cleaned content positions to original content positions.
 
     When we remove page markers for chunking, we need to map chunk positions
-    back to the original content positions to determine page numbers.
+    back to the original content positions to determine page numbers. This
+    holds one entry per character; PageMarkerIndex.to_original gives the same
+    answer from the marker offsets alone.
 
     Args:
         original_content: Content with <!-- PAGE N --> markers
@@ -94,7 +145,9 @@ def map_chunks_to_pages(
     text_chunks: list[str],
     clean_content: str,
     original_content: str,
-    page_positions: list[tuple[int, int]]
+    page_positions: list[tuple[int, int]],
+    chunk_offsets: list[tuple[int, int]] | None = None,
+    markers: PageMarkerIndex | None = None,
 ) -> list[tuple[int | None, str | None]]:
     """Map text chunks to their page numbers.
 
@@ -103,6 +156,10 @@ def map_chunks_to_pages(
         clean_content: Content without page markers (used for chunking)
         original_content: Original content with page markers
         page_positions: List of (page_number, position) tuples
+        chunk_offsets: Optional (start, end) span of each chunk in clean_content,
+            as reported by the splitter. When omitted, chunks are located by
+            searching clean_content in order.
+        markers: Optional PageMarkerIndex already built from original_content
 
     Returns:
         List of (page_number, page_range) tuples for each chunk.
@@ -112,27 +169,24 @@ def map_chunks_to_pages(
         # No page markers, return None for all chunks
         return [(None, None) for _ in text_chunks]
 
-    # Build position mapping
-    clean_to_orig = build_clean_to_orig_map(original_content)
+    if markers is None:
+        markers = PageMarkerIndex(original_content)
+    spans = chunk_offsets if chunk_offsets is not None else _find_chunk_offsets(text_chunks, clean_content)
 
     chunk_pages: list[tuple[int | None, str | None]] = []
-    current_pos = 0
 
-    for chunk_text in text_chunks:
-        # Find where this chunk starts and ends in the clean content
-        chunk_start = clean_content.find(chunk_text, current_pos)
-
-        if chunk_start == -1:
+    for span in spans:
+        if span is None:
             # Chunk not found (shouldn't happen, but handle gracefully)
             chunk_pages.append((None, None))
             continue
 
-        chunk_end = chunk_start + len(chunk_text)
+        chunk_start, chunk_end = span
 
         # Map to original positions
-        if chunk_start < len(clean_to_orig) and chunk_end <= len(clean_to_orig):
-            orig_start = clean_to_orig[chunk_start]
-            orig_end = clean_to_orig[chunk_end - 1] if chunk_end > 0 else orig_start
+        if chunk_start < markers.clean_length and chunk_end <= markers.clean_length:
+            orig_start = markers.to_original(chunk_start)
+            orig_end = markers.to_original(chunk_end - 1) if chunk_end > 0 else orig_start
 
             # Determine page numbers
             start_page = get_page_for_position(orig_start, page_positions)
@@ -146,9 +200,26 @@ def map_chunks_to_pages(
             # Fallback
             chunk_pages.append((None, None))
 
+    return chunk_pages
+
+
+def _find_chunk_offsets(text_chunks: list[str], clean_content: str) -> list[tuple[int, int] | None]:
+    """Locate chunks in order in clean_content, for splitters that report no offsets."""
+    spans: list[tuple[int, int] | None] = []
+    current_pos = 0
+
+    for chunk_text in text_chunks:
+        chunk_start = clean_content.find(chunk_text, current_pos)
+
+        if chunk_start == -1:
+            spans.append(None)
+            continue
+
+        chunk_end = chunk_start + len(chunk_text)
+        spans.append((chunk_start, chunk_end))
         current_pos = chunk_end
 
-    return chunk_pages
+    return spans
 
 
 def estimate_page_from_position(chunk_position: int, total_chunks: int, total_pages: int) -> int:
@@ -4,6 +4,10 @@
 from src.chunking.token_counter import count_tokens
 from src.config.settings import get_settings
 
+# Candidates whose summed piece counts come within this many tokens of
+# chunk_size are re-counted exactly, absorbing token merges across seams.
+_EXACT_MARGIN = 16
+
 
 class RecursiveCharacterTextSplitter:
     """Recursively split text into chunks, trying different separators."""
@@ -26,60 +30,94 @@ class RecursiveCharacterTextSplitter:
 
     def split_text(self, text: str) -> list[str]:
         """Split text into chunks using recursive splitting."""
+        return [chunk for _, _, chunk in self.split_text_with_offsets(text)]
+
+    def split_text_with_offsets(self, text: str) -> list[tuple[int, int, str]]:
+        """Split text into chunks, reporting where each chunk lies in ``text``.
+
+        Returns:
+            List of (start, end, chunk) tuples. ``text[start:end]`` is the region
+            the chunk covers, including any overlap carried from the previous
+            chunk, so page lookups need no search for the chunk text.
+        """
         if not text:
             return []
 
         return self._split_recursive(text, self.separators)
 
-    def _split_recursive(self, text: str, separators: list[str]) -> list[str]:
-        """Recursively split text by trying separators in order."""
+    def _split_recursive(
+        self, text: str, separators: list[str], offset: int = 0
+    ) -> list[tuple[int, int, str]]:
+        """Recursively split text by trying separators in order.
+
+        Each piece is tokenized once and chunks are packed by summing piece and
+        separator token counts. Joining pieces can merge tokens at the seams, so
+        a candidate within ``_EXACT_MARGIN`` tokens of ``chunk_size`` is counted
+        exactly before deciding; this keeps the chunk boundaries identical to
+        re-counting every candidate chunk while avoiding quadratic work.
+
+        ``offset`` is the position of ``text`` in the document being split.
+        """
         if not separators:
             # No more separators, split by character
-            return self._split_by_characters(text)
+            return self._split_by_characters(text, offset)
 
         separator = separators[0]
         remaining_separators = separators[1:]
 
-        # Split by current separator
-        if separator:
-            splits = text.split(separator)
-        else:
+        if not separator:
             # Empty separator means split by character
-            return self._split_by_characters(text)
-
-        # Process splits
-        chunks = []
-        current_chunk = ""
-
-        for split in splits:
-            # Check token count
-            test_chunk = current_chunk + (separator if current_chunk else "") + split
-            token_count = count_tokens(test_chunk)
+            return self._split_by_characters(text, offset)
+
+        separator_tokens = count_tokens(separator)
+        threshold = self.chunk_size - _EXACT_MARGIN
+
+        # The current chunk is the span text[chunk_start:chunk_end]; pieces are
+        # contiguous in text, so a candidate chunk is always a single slice.
+        chunks: list[tuple[int, int, str]] = []
+        chunk_start = chunk_end = 0
+        chunk_tokens = 0
+        split_start = 0
+
+        for split in text.split(separator):
+            split_end = split_start + len(split)
+            split_tokens = count_tokens(split)
+
+            if chunk_end > chunk_start:
+                token_count = chunk_tokens + separator_tokens + split_tokens
+                if token_count >= threshold:
+                    token_count = count_tokens(text[chunk_start:split_end])
+                candidate_start = chunk_start
+            else:
+                token_count = split_tokens
+                candidate_start = split_start
 
             if token_count <= self.chunk_size:
-                current_chunk = test_chunk
+                chunk_start, chunk_end, chunk_tokens = candidate_start, split_end, token_count
             else:
                 # Current chunk is ready
-                if current_chunk:
-                    chunks.append(current_chunk)
+                if chunk_end > chunk_start:
+                    chunks.append((offset + chunk_start, offset + chunk_end, text[chunk_start:chunk_end]))
 
                 # Check if split itself is too large
-                if count_tokens(split) > self.chunk_size:
+                if split_tokens > self.chunk_size:
                     # Recursively split this piece
-                    sub_chunks = self._split_recursive(split, remaining_separators)
-                    chunks.extend(sub_chunks)
-                    current_chunk = ""
+                    chunks.extend(self._split_recursive(split, remaining_separators, offset + split_start))
+                    chunk_start = chunk_end = split_end
+                    chunk_tokens = 0
                 else:
-                    current_chunk = split
+                    chunk_start, chunk_end, chunk_tokens = split_start, split_end, split_tokens
+
+            split_start = split_end + len(separator)
 
         # Add remaining
-        if current_chunk:
-            chunks.append(current_chunk)
+        if chunk_end > chunk_start:
+            chunks.append((offset + chunk_start, offset + chunk_end, text[chunk_start:chunk_end]))
 
         # Add overlap
         return self._add_overlap(chunks)
 
-    def _split_by_characters(self, text: str) -> list[str]:
+    def _split_by_characters(self, text: str, offset: int = 0) -> list[tuple[int, int, str]]:
         """Split text by character count."""
         chunks = []
         start = 0
@@ -97,21 +135,21 @@ class RecursiveCharacterTextSplitter:
                 end = start + int(len(chunk) * 0.9)
                 chunk = text[start:end]
 
-            chunks.append(chunk)
+            chunks.append((offset + start, offset + end, chunk))
             start = end
 
         return self._add_overlap(chunks)
 
-    def _add_overlap(self, chunks: list[str]) -> list[str]:
-        """Add overlap between chunks."""
+    def _add_overlap(self, chunks: list[tuple[int, int, str]]) -> list[tuple[int, int, str]]:
+        """Add overlap between chunks, extending each span back over the overlap."""
         if len(chunks) <= 1 or self.chunk_overlap == 0:
             return chunks
 
         overlapped = [chunks[0]]
 
         for i in range(1, len(chunks)):
-            prev_chunk = chunks[i - 1]
-            curr_chunk = chunks[i]
+            prev_start, prev_end, prev_chunk = chunks[i - 1]
+            _, curr_end, curr_chunk = chunks[i]
 
             # Get overlap from previous chunk
             overlap_chars = self.chunk_overlap * 4  # Rough estimate
@@ -119,6 +157,7 @@ class RecursiveCharacterTextSplitter:
 
             # Prepend overlap to current chunk
             overlapped_chunk = overlap_text + " " + curr_chunk
-            overlapped.append(overlapped_chunk)
+            overlap_start = max(prev_start, prev_end - len(overlap_text))
+            overlapped.append((overlap_start, curr_end, overlapped_chunk))
 
         return overlapped
@@ -43,6 +43,12 @@ logger = get_logger(__name__)
     type=int,
     help="Batch size for vision embedding (default: 4, adjust based on VRAM)"
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Parallel loader processes for folder ingestion; above 1, loading, embedding and storing overlap (default: 1)"
+)
 def add(
     path: Path,
     format: str | None,
@@ -54,6 +60,7 @@ def add(
     vision: bool,
     vision_device: str,
     vision_batch_size: int | None,
+    workers: int,
 ) -> None:
     """Ingest document(s) into the system.
 
@@ -62,11 +69,16 @@ def add(
     Supported formats: PDF, TXT, MD, HTML
     """
     from src.chunking.splitters import chunk_document
+    from src.config.constants import INGEST_EMBEDDING_CACHE_CHUNKS
+    from src.config.settings import get_settings
     from src.embeddings.factory import get_embedder
     from src.ingestion.batch import BatchIngester, IngestionStatus
     from src.ingestion.loaders import load_document
+    from src.ingestion.manifest import IngestionManifest
     from src.ingestion.scanner import DocumentScanner
+    from src.retrieval.bm25 import BM25Retriever
     from src.storage.vector_store import VectorStore
+    from src.utils.multi_tier_cache import MultiTierCache
 
     # Determine if we're processing a single file or directory
     is_directory = path.is_dir()
@@ -75,25 +87,51 @@ def add(
         # Folder ingestion with batch processing
         console.print(f"[bold blue]Scanning:[/bold blue] {path}")
 
+        # Fingerprints of earlier runs let unchanged files skip parsing
+        manifest = IngestionManifest()
+
         scanner = DocumentScanner(
             follow_symlinks=False,
             max_depth=max_depth if not recursive else None,
+            manifest=manifest,
         )
 
         file_paths = scanner.scan(path)
 
         if not file_paths:
+            if scanner.unchanged:
+                console.print(
+                    f"[green]All {len(scanner.unchanged)} documents unchanged since last ingestion.[/green]"
+                )
+                return
             console.print("[yellow]No supported documents found.[/yellow]")
             console.print("Supported formats: PDF, TXT, MD, HTML")
             return
 
-        console.print(f"Found {len(file_paths)} documents")
+        console.print(f"Found {len(file_paths)} new or modified documents")
+        if scanner.unchanged:
+            console.print(f"Skipping {len(scanner.unchanged)} unchanged documents")
+
+        # Chunks embedded by earlier runs are not sent to the model again
+        settings = get_settings()
+        embedding_cache = None
+        if settings.cache_chunk_embeddings:
+            embedding_cache = MultiTierCache(
+                settings.embedding_cache_dir,
+                l2_maxsize=INGEST_EMBEDDING_CACHE_CHUNKS,
+                enable_l1=False,
+                enable_l3=False,
+            )
 
         # Batch ingestion
         batch_ingester = BatchIngester(
             console=console,
             continue_on_error=not fail_fast,
             skip_duplicates=True,  # Auto-skip duplicates in batch mode
+            bm25_retriever=BM25Retriever(index_dir=settings.bm25_index_dir),
+            manifest=manifest,
+            workers=workers,
+            embedding_cache=embedding_cache,
         )
 
         with ProgressType() as progress:
@@ -104,6 +142,7 @@ def add(
         console.print("[bold]Summary:[/bold]")
         console.print(f"  ✓ Successful: {summary.successful}")
         console.print(f"  ⊗ Duplicates: {summary.duplicates} (skipped)")
+        console.print(f"  ≡ Unchanged: {len(scanner.unchanged) + summary.skipped} (skipped)")
         console.print(f"  ✗ Failed: {summary.failed}")
         console.print(f"  📊 Total chunks: {summary.total_chunks}")
 
@@ -219,6 +258,9 @@ def add(
             # Delete old chunks
             console.print(f"[yellow]Removing {existing_count} old chunks...[/yellow]")
             vector_store.delete(ids=existing["ids"])
+            bm25_retriever = BM25Retriever(index_dir=get_settings().bm25_index_dir)
+            bm25_retriever.remove_documents(existing["ids"])
+            bm25_retriever.save()
             console.print("[green]✓[/green] Removed old chunks")
             console.print()
 
@@ -264,6 +306,11 @@ def add(
                 documents=chunk_texts,
                 metadatas=metadatas,
             )
+
+            # Keep the persisted keyword index in sync
+            bm25_retriever = BM25Retriever(index_dir=get_settings().bm25_index_dir)
+            bm25_retriever.add_documents(chunk_texts, ids, metadatas)
+            bm25_retriever.save()
             progress.update(task, advance=10)
 
         console.print(f"[bold green]✓[/bold green] Document ingested: {document.document_id}")
@@ -89,14 +89,18 @@ def bench_embedding_init(runs: int, warmup: int, model: str | None):
 @click.option("--size", "-s", default=100, help="Batch size to test")
 @click.option("--runs", "-n", default=5, help="Number of benchmark runs")
 @click.option("--warmup", "-w", default=2, help="Number of warmup runs")
-def bench_batch_embed(size: int, runs: int, warmup: int):
+@click.option("--mixed-lengths", is_flag=True, help="Mix short and long texts, as real chunks are")
+def bench_batch_embed(size: int, runs: int, warmup: int, mixed_lengths: bool):
     """Benchmark batch embedding performance.
 
     Measures throughput of embedding generation for different batch sizes.
+    For embedders with length-bucketed encoding, also times that path and
+    reports the time spent in each length bucket.
 
     Examples:
         ragged benchmark batch-embed --size 50
         ragged benchmark batch-embed --size 200 --runs 10
+        ragged benchmark batch-embed --size 500 --mixed-lengths
     """
     from src.embeddings.factory import get_embedder
 
@@ -106,6 +110,9 @@ def bench_batch_embed(size: int, runs: int, warmup: int):
 
     # Create test data
     test_texts = [f"Sample text number {i} for embedding benchmark" for i in range(size)]
+    if mixed_lengths:
+        # Mostly short chunks with occasional long ones
+        test_texts = [text * (40 if i % 10 == 0 else 1 + i % 4) for i, text in enumerate(test_texts)]
 
     # Get embedder
     embedder = get_embedder()
@@ -139,6 +146,40 @@ def bench_batch_embed(size: int, runs: int, warmup: int):
     console.print(table)
     console.print()
 
+    if not hasattr(embedder, "embed_batch_bucketed"):
+        return
+
+    bucketed_bench = Benchmark(
+        name=f"batch-embed-bucketed-{size}",
+        warmup_iterations=warmup,
+        test_iterations=runs
+    )
+
+    bucketed_result = bucketed_bench.run(embedder.embed_batch_bucketed, test_texts, metadata={"batch_size": size})
+    _, buckets = embedder.embed_batch_bucketed(test_texts)
+
+    # Display per-bucket timing from the last run
+    bucket_table = Table(title="Length-Bucketed Encoding")
+    bucket_table.add_column("Max tokens", style="cyan", justify="right")
+    bucket_table.add_column("Texts", justify="right")
+    bucket_table.add_column("Batch size", justify="right")
+    bucket_table.add_column("Time", style="green", justify="right")
+    bucket_table.add_column("Throughput", style="green", justify="right")
+
+    for bucket in buckets:
+        bucket_table.add_row(
+            str(bucket.max_tokens),
+            str(len(bucket.indices)),
+            str(bucket.batch_size),
+            f"{bucket.seconds*1000:.2f} ms",
+            f"{len(bucket.indices) / bucket.seconds:.1f} texts/sec" if bucket.seconds else "-",
+        )
+
+    console.print(bucket_table)
+    console.print(f"Bucketed mean: {bucketed_result.mean*1000:.2f} ms")
+    console.print(str(Benchmark.compare(result, bucketed_result)))
+    console.print()
+
 
 @benchmark.command("query")
 @click.option("--count", "-c", default=20, help="Number of queries to benchmark")
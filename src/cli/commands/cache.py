@@ -55,6 +55,7 @@ def _get_cache_info() -> dict[str, Any]:
         ("Query History", data_dir / "query_history.json"),
         ("Embeddings Cache", data_dir / "embeddings_cache"),
         ("Query Cache", data_dir / "query_cache"),
+        ("Quality Assessments", data_dir / "quality_assessments.db"),
         ("Temporary Files", data_dir / "tmp"),
         ("Logs", data_dir / "logs"),
     ]
@@ -164,7 +165,7 @@ def cache_info(output_format: str) -> None:
     "-t",
     "cache_type",
     type=click.Choice(
-        ["history", "embeddings", "queries", "temp", "logs", "all"],
+        ["history", "embeddings", "queries", "quality", "temp", "logs", "all"],
         case_sensitive=False,
     ),
     default="all",
@@ -194,6 +195,7 @@ def clear_cache(cache_type: str, yes: bool) -> None:
             "history": [data_dir / "query_history.json"],
             "embeddings": [data_dir / "embeddings_cache"],
             "queries": [data_dir / "query_cache"],
+            "quality": [data_dir / "quality_assessments.db"],
             "temp": [data_dir / "tmp"],
             "logs": [data_dir / "logs"],
         }
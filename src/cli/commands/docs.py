@@ -56,6 +56,9 @@ def list_docs(output_format: str) -> None:
 @click.option("--force", "-f", is_flag=True, help="Skip confirmation")
 def clear(force: bool) -> None:
     """Clear all ingested documents from the database."""
+    from src.config.settings import get_settings
+    from src.ingestion.manifest import IngestionManifest
+    from src.retrieval.bm25 import BM25Retriever
     from src.storage.vector_store import VectorStore
 
     try:
@@ -72,6 +75,12 @@ def clear(force: bool) -> None:
                 return
 
         vector_store.clear()
+        # Keep keyword search consistent with the emptied vector store
+        bm25_retriever = BM25Retriever(index_dir=get_settings().bm25_index_dir)
+        bm25_retriever.clear()
+        bm25_retriever.save()
+        # Forget ingested fingerprints so the same files can be added again
+        IngestionManifest().clear()
         console.print(f"[bold green]✓[/bold green] Cleared {count} chunks from the database")
 
     except Exception as e:
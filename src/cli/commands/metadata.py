@@ -54,8 +54,8 @@ def list_metadata(limit: int, output_format: str) -> None:
     try:
         vector_store = VectorStore()
 
-        # Get all documents (ChromaDB returns unique documents by metadata)
-        results = vector_store.collection.get(limit=limit)
+        # Only metadata is displayed, so leave chunk text on the server
+        results = vector_store.collection.get(limit=limit, include=["metadatas"])
 
         if not results or not results.get("ids"):
             console.print("[yellow]No documents found in the database.[/yellow]")
@@ -296,3 +296,66 @@ def search_metadata(filters: tuple, output_format: str) -> None:
         console.print(f"[bold red]✗[/bold red] Failed to search metadata: {e}")
         logger.error(f"Search metadata failed: {e}", exc_info=True)
         sys.exit(1)
+
+
+@metadata.command("facets")
+@click.argument("fields", nargs=-1)
+@click.option("--limit", "-n", default=20, type=click.IntRange(min=1), help="Maximum values per field")
+@click.option("--rebuild", is_flag=True, help="Recount facets from every stored chunk first")
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(FORMAT_CHOICES, case_sensitive=False),
+    default="table",
+    help="Output format",
+)
+def facets_metadata(fields: tuple, limit: int, rebuild: bool, output_format: str) -> None:
+    """Show metadata values and how many chunks have each (facets).
+
+    Counts are maintained as documents are added, updated and deleted, so
+    this does not scan the collection. Without FIELDS, all counted fields
+    are shown.
+
+    \b
+    Examples:
+        ragged metadata facets
+        ragged metadata facets tag author --limit 5
+        ragged metadata facets --rebuild
+    """
+    from src.retrieval.metadata_filter import FacetedSearch
+    from src.storage.vector_store import VectorStore
+
+    try:
+        vector_store = VectorStore()
+
+        if rebuild:
+            counted = vector_store.rebuild_facets()
+            console.print(f"[green]✓[/green] Recounted facets from {counted} chunks")
+        elif vector_store.facets_stale():
+            console.print(
+                "[yellow]Facet counts do not match the collection size; "
+                "run 'ragged metadata facets --rebuild' to recount.[/yellow]"
+            )
+
+        rows = []
+        for field in fields or vector_store.facet_fields():
+            counts = FacetedSearch.count_facet_values(vector_store, field)
+            for value, count in list(counts.items())[:limit]:
+                rows.append({"field": field, "value": value, "chunks": count})
+
+        if not rows:
+            console.print("[yellow]No facet values found.[/yellow]")
+            return
+
+        print_formatted(
+            rows,
+            format_type=output_format,  # type: ignore
+            title="Facets",
+            console=console,
+        )
+
+    except Exception as e:
+        console.print(f"[bold red]✗[/bold red] Failed to get facets: {e}")
+        logger.error(f"Facets failed: {e}", exc_info=True)
+        sys.exit(1)
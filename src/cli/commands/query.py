@@ -54,7 +54,7 @@ def query(query: str, k: int, show_sources: bool, output_format: str, no_history
         # Retrieve relevant chunks using hybrid retrieval
         settings = get_settings()
         vector_retriever = Retriever()
-        bm25_retriever = BM25Retriever()
+        bm25_retriever = BM25Retriever(index_dir=settings.bm25_index_dir)
         hybrid_retriever = HybridRetriever(
             vector_retriever=vector_retriever,
             bm25_retriever=bm25_retriever
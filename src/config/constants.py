@@ -32,3 +32,22 @@ EMBEDDING_DIMENSIONS = {
     "all-MiniLM-L6-v2": 384,  # Lightweight model commonly used
     "nomic-embed-text": 768,
 }
+OLLAMA_EMBED_BATCH_SIZE = 32  # Texts per /api/embed request
+OLLAMA_EMBED_CONCURRENCY = 4  # In-flight requests when /api/embed is unavailable
+
+# Embedding Micro-Batching
+EMBED_BATCH_MAX_LATENCY = 0.02  # Longest a submitted chunk waits for a fuller batch (seconds)
+EMBED_CHARS_PER_TOKEN = 4  # Rough characters per token when estimating batch cost
+
+# Batch Ingestion Pipeline
+INGEST_PIPELINE_DOCS_PER_WORKER = 4  # Documents in flight across all stages, per loader worker
+INGEST_WRITE_BATCH_CHUNKS = 512  # Chunks per vector store write
+INGEST_EMBEDDING_CACHE_CHUNKS = 50_000  # Chunk embeddings kept for re-ingesting unchanged text
+
+# API Upload Jobs
+UPLOAD_READ_CHUNK_BYTES = 1024 * 1024  # Bytes read per step when spooling an upload to disk
+UPLOAD_PROGRESS_BATCH_CHUNKS = 64  # Chunks embedded and stored between job progress updates
+UPLOAD_JOB_POLL_INTERVAL = 1.0  # Delay between job status checks in the web UI (seconds)
+
+# Quality Assessment
+QUALITY_PAGES_PER_SHARD = 16  # Pages each worker process assesses per task in parallel mode
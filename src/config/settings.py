@@ -129,6 +129,25 @@ class Settings(BaseSettings):
         default=True,
         description="Cache quality assessment results"
     )
+    persist_quality_assessments: bool = Field(
+        default=True,
+        description="Keep cached quality assessments on disk, so restarts skip re-assessing known files"
+    )
+    quality_assessment_workers: int = Field(
+        default=1,
+        gt=0,
+        description="Worker processes assessing PDF pages in parallel (full assessment only)"
+    )
+    quality_assessment_deadline: float | None = Field(
+        default=None,
+        gt=0,
+        description="Seconds after which quality assessment stops and uses the pages assessed so far"
+    )
+    quality_assessment_agreement_pages: int | None = Field(
+        default=None,
+        gt=0,
+        description="Stop quality assessment once this many pages agree on born-digital vs scanned"
+    )
 
     # Retrieval Configuration
     retrieval_k: int = Field(default=5, gt=0, description="Number of chunks to retrieve")
@@ -150,6 +169,12 @@ class Settings(BaseSettings):
     max_file_size_mb: int = Field(
         default=100, gt=0, description="Maximum file size in megabytes"
     )
+    upload_workers: int = Field(
+        default=1, gt=0, description="Uploaded documents the API ingests concurrently"
+    )
+    cache_chunk_embeddings: bool = Field(
+        default=True, description="Reuse embeddings of unchanged chunk text when re-ingesting folders"
+    )
 
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
@@ -282,6 +307,41 @@ class Settings(BaseSettings):
         """
         return ensure_directory(self.data_dir)
 
+    @property
+    def bm25_index_dir(self) -> Path:
+        """Directory holding the persisted BM25 keyword index segment."""
+        return self.data_dir / "bm25_index"
+
+    @property
+    def ingestion_manifest_path(self) -> Path:
+        """SQLite manifest of ingested file fingerprints."""
+        return self.data_dir / "ingestion_manifest.db"
+
+    @property
+    def embedding_cache_dir(self) -> Path:
+        """Directory holding the chunk embedding cache."""
+        return self.data_dir / "embedding_cache"
+
+    @property
+    def facet_index_path(self) -> Path:
+        """SQLite facet counts of vector store metadata."""
+        return self.data_dir / "facet_index.db"
+
+    @property
+    def quality_assessment_cache_path(self) -> Path:
+        """SQLite cache of document quality assessments."""
+        return self.data_dir / "quality_assessments.db"
+
+    @property
+    def ingestion_jobs_path(self) -> Path:
+        """SQLite records of background ingestion jobs."""
+        return self.data_dir / "ingestion_jobs.db"
+
+    @property
+    def upload_dir(self) -> Path:
+        """Directory uploads are spooled to until they are ingested."""
+        return self.data_dir / "uploads"
+
     def model_post_init(self, __context: Any) -> None:
         """Load user config if available (without creating directories as side effect)."""
         # Import here to avoid circular dependency
@@ -5,6 +5,7 @@ v0.3.5: Detects duplicate pages using quick hash, perceptual hash, and text simi
 
 import hashlib
 from collections import defaultdict
+from dataclasses import dataclass
 from pathlib import Path
 
 import pymupdf
@@ -12,9 +13,23 @@ from PIL import Image
 
 from src.correction.schemas import IssueReport, IssueType
 from src.utils.logging import get_logger
+from src.utils.lsh import HammingLSH, MinHashLSH, hamming_distance, jaccard, word_shingles
 
 logger = get_logger(__name__)
 
+DHASH_SIZE = 8  # 8x8 difference hash
+DHASH_BITS = DHASH_SIZE * DHASH_SIZE
+
+
+@dataclass
+class PageFingerprint:
+    """Hashes of one page used to find duplicates."""
+
+    page_num: int  # 1-indexed
+    quick_hash: str  # MD5 of the low-resolution render
+    dhash: int  # Perceptual difference hash
+    shingles: set[str]  # Word shingles of the page text
+
 
 class DuplicateDetector:
     """Detects duplicate pages in PDFs.
@@ -24,6 +39,10 @@ class DuplicateDetector:
     - Layer 2: Perceptual hash (difference hash for near-duplicates)
     - Layer 3: Content comparison (text similarity for validation)
 
+    Each page is rendered once. Near-duplicate candidates come from LSH
+    indexes (MinHash on text shingles, dHash bands for pages without text),
+    and only candidate pairs are compared exactly.
+
     Confidence threshold: 0.95 (95% similarity required for duplicate detection)
     """
 
@@ -51,11 +70,13 @@ class DuplicateDetector:
         try:
             doc = pymupdf.open(pdf_path)
 
+            fingerprints = self._fingerprint_pages(doc)
+
             # Layer 1: Quick hash - find exact duplicates
-            quick_hash_groups = self._find_exact_duplicates(doc)
+            quick_hash_groups = self._find_exact_duplicates(fingerprints)
 
             # Layer 2 & 3: Perceptual hash and text similarity for near-duplicates
-            perceptual_groups = self._find_near_duplicates(doc)
+            perceptual_groups = self._find_near_duplicates(fingerprints)
 
             # Merge duplicate groups
             all_duplicate_groups = self._merge_duplicate_groups(
@@ -105,107 +126,124 @@ class DuplicateDetector:
         logger.debug(f"Duplicate detection: {len(issues)} duplicate groups found")
         return issues
 
-    def _find_exact_duplicates(self, doc: pymupdf.Document) -> list[set[int]]:
-        """Find exact duplicate pages using quick hash.
+    def _fingerprint_pages(self, doc: pymupdf.Document) -> list[PageFingerprint]:
+        """Render each page once and compute its quick hash, dHash and shingles.
 
         Args:
             doc: PyMuPDF document object.
 
         Returns:
-            List of sets, each containing page numbers of exact duplicates.
+            Fingerprints of all pages, in page order.
         """
-        hash_to_pages = defaultdict(set)
+        fingerprints = []
 
         for page_num in range(len(doc)):
             page = doc[page_num]
 
-            # Render page at low resolution for quick hashing
+            # Render page at low resolution; both hashes use this render
             pix = page.get_pixmap(matrix=pymupdf.Matrix(0.5, 0.5))  # 50% scale
-            img_bytes = pix.tobytes()
 
-            # Quick hash (MD5)
-            quick_hash = hashlib.md5(img_bytes).hexdigest()
-            hash_to_pages[quick_hash].add(page_num + 1)  # 1-indexed
+            fingerprints.append(
+                PageFingerprint(
+                    page_num=page_num + 1,  # 1-indexed
+                    quick_hash=hashlib.md5(pix.tobytes(), usedforsecurity=False).hexdigest(),
+                    dhash=self._compute_dhash(pix),
+                    shingles=word_shingles(page.get_text()),
+                )
+            )
+
+        return fingerprints
+
+    def _find_exact_duplicates(self, fingerprints: list[PageFingerprint]) -> list[set[int]]:
+        """Find exact duplicate pages using quick hash.
+
+        Args:
+            fingerprints: Page fingerprints.
+
+        Returns:
+            List of sets, each containing page numbers of exact duplicates.
+        """
+        hash_to_pages = defaultdict(set)
+
+        for fingerprint in fingerprints:
+            hash_to_pages[fingerprint.quick_hash].add(fingerprint.page_num)
 
         # Return groups with more than one page
         return [pages for pages in hash_to_pages.values() if len(pages) > 1]
 
-    def _find_near_duplicates(self, doc: pymupdf.Document) -> list[set[int]]:
-        """Find near-duplicate pages using perceptual hashing and text similarity.
+    def _candidate_pairs(self, fingerprints: list[PageFingerprint]) -> set[tuple[int, int]]:
+        """Find page pairs that may be near-duplicates, without comparing every pair.
+
+        Pages with text only match pages with text, so they are bucketed by
+        MinHash LSH on their shingles. Pages without text (e.g. scans with no
+        text layer) only match each other, so they are bucketed by dHash bands.
 
         Args:
-            doc: PyMuPDF document object.
+            fingerprints: Page fingerprints.
 
         Returns:
-            List of sets, each containing page numbers of near-duplicates.
+            Pairs of indexes into fingerprints, smaller index first.
         """
-        # Store page hashes and text
-        page_data = []
+        max_distance = int((1.0 - self.similarity_threshold) * DHASH_BITS + 1e-9)
+        dhash_index = HammingLSH(bits=DHASH_BITS, max_distance=max_distance)
+        text_index = MinHashLSH(threshold=self.similarity_threshold)
 
-        for page_num in range(len(doc)):
-            page = doc[page_num]
+        for index, fingerprint in enumerate(fingerprints):
+            if fingerprint.shingles:
+                text_index.add(index, fingerprint.shingles)
+            else:
+                dhash_index.add(index, fingerprint.dhash)
+
+        return text_index.candidates() | dhash_index.candidates()
 
-            # Compute perceptual hash (difference hash)
-            dhash = self._compute_dhash(page)
+    def _find_near_duplicates(self, fingerprints: list[PageFingerprint]) -> list[set[int]]:
+        """Find near-duplicate pages using perceptual hashing and text similarity.
 
-            # Extract text for content comparison
-            text = page.get_text()
+        Only candidate pairs from the LSH indexes are verified exactly, so a
+        long document is not compared page against page.
 
-            page_data.append({
-                "page_num": page_num + 1,  # 1-indexed
-                "dhash": dhash,
-                "text": text,
-            })
+        Args:
+            fingerprints: Page fingerprints.
 
-        # Find similar pages
+        Returns:
+            List of sets, each containing page numbers of near-duplicates.
+        """
+        # Verify candidates: both hash and text similarity must be high
+        similar: dict[int, list[int]] = defaultdict(list)
+        for i, j in self._candidate_pairs(fingerprints):
+            page_i, page_j = fingerprints[i], fingerprints[j]
+            if (
+                self._compare_hashes(page_i.dhash, page_j.dhash) >= self.similarity_threshold
+                and jaccard(page_i.shingles, page_j.shingles) >= self.similarity_threshold
+            ):
+                similar[i].append(j)
+
+        # Group each page with its later similar pages, in page order
         duplicate_groups = []
         processed = set()
 
-        for i, page_i in enumerate(page_data):
-            if page_i["page_num"] in processed:
+        for i in sorted(similar):
+            if i in processed:
                 continue
 
-            similar_pages = {page_i["page_num"]}
+            group = {i} | {j for j in similar[i] if j not in processed}
 
-            for j, page_j in enumerate(page_data[i + 1 :], start=i + 1):
-                if page_j["page_num"] in processed:
-                    continue
-
-                # Compare hashes
-                hash_similarity = self._compare_hashes(
-                    page_i["dhash"], page_j["dhash"]
-                )
-
-                # Compare text
-                text_similarity = self._compare_text(page_i["text"], page_j["text"])
-
-                # Consider pages near-duplicates if both hash and text similarity are high
-                if (
-                    hash_similarity >= self.similarity_threshold
-                    and text_similarity >= self.similarity_threshold
-                ):
-                    similar_pages.add(page_j["page_num"])
-                    processed.add(page_j["page_num"])
-
-            if len(similar_pages) > 1:
-                duplicate_groups.append(similar_pages)
-                processed.update(similar_pages)
+            if len(group) > 1:
+                duplicate_groups.append({fingerprints[index].page_num for index in group})
+                processed.update(group)
 
         return duplicate_groups
 
-    def _compute_dhash(self, page: pymupdf.Page, hash_size: int = 8) -> str:
-        """Compute difference hash (dHash) for a page.
+    def _compute_dhash(self, pix: pymupdf.Pixmap, hash_size: int = DHASH_SIZE) -> int:
+        """Compute difference hash (dHash) of a rendered page.
 
         Args:
-            page: PyMuPDF page object.
+            pix: Rendered page (RGB pixmap).
             hash_size: Size of hash (8 = 64-bit hash).
 
         Returns:
-            Hexadecimal string representation of hash.
+            Hash as an integer of hash_size * hash_size bits.
         """
-        # Render page to image at low resolution
-        pix = page.get_pixmap(matrix=pymupdf.Matrix(0.3, 0.3))  # 30% scale
-
         # Convert to PIL Image
         img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
 
@@ -215,22 +253,17 @@ class DuplicateDetector:
 
         # Compute differences
         pixels = list(img.getdata())
-        difference = []
+        value = 0
 
         for row in range(hash_size):
             for col in range(hash_size):
                 pixel_left = pixels[row * (hash_size + 1) + col]
                 pixel_right = pixels[row * (hash_size + 1) + col + 1]
-                difference.append(pixel_left > pixel_right)
+                value = (value << 1) | (pixel_left > pixel_right)
 
-        # Convert to hexadecimal
-        decimal_value = 0
-        for bit in difference:
-            decimal_value = (decimal_value << 1) | bit
+        return value
 
-        return format(decimal_value, '016x')
-
-    def _compare_hashes(self, hash1: str, hash2: str) -> float:
+    def _compare_hashes(self, hash1: int, hash2: int) -> float:
         """Compare two perceptual hashes using Hamming distance.
 
         Args:
@@ -240,57 +273,19 @@ class DuplicateDetector:
         Returns:
             Similarity score (0.0-1.0), where 1.0 is identical.
         """
-        if hash1 == hash2:
-            return 1.0
-
-        # Convert to binary and compute Hamming distance
-        int1 = int(hash1, 16)
-        int2 = int(hash2, 16)
-        xor = int1 ^ int2
-
-        # Count number of different bits
-        hamming_distance = bin(xor).count('1')
-
-        # Convert to similarity (max distance = 64 for 8x8 hash)
-        max_distance = 64
-        similarity = 1.0 - (hamming_distance / max_distance)
-
-        return similarity
+        return 1.0 - hamming_distance(hash1, hash2) / DHASH_BITS
 
     def _compare_text(self, text1: str, text2: str) -> float:
-        """Compare two text strings using simple similarity metric.
+        """Compare two text strings by the overlap of their word shingles.
 
         Args:
             text1: First text.
             text2: Second text.
 
         Returns:
-            Similarity score (0.0-1.0), where 1.0 is identical.
+            Jaccard similarity (0.0-1.0), where 1.0 is identical.
         """
-        if not text1 and not text2:
-            return 1.0
-
-        if not text1 or not text2:
-            return 0.0
-
-        # Normalize text
-        text1_norm = text1.lower().strip()
-        text2_norm = text2.lower().strip()
-
-        if text1_norm == text2_norm:
-            return 1.0
-
-        # Simple character-level similarity (Jaccard index on character sets)
-        set1 = set(text1_norm)
-        set2 = set(text2_norm)
-
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
-
-        if union == 0:
-            return 0.0
-
-        return intersection / union
+        return jaccard(word_shingles(text1), word_shingles(text2))
 
     def _merge_duplicate_groups(
         self, quick_groups: list[set[int]], perceptual_groups: list[set[int]]
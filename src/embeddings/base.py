@@ -5,6 +5,7 @@ This module defines the interface that all embedding implementations must follow
 enabling swappable backends (SentenceTransformers, Ollama, etc.).
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import cast
 
@@ -50,6 +51,35 @@ class BaseEmbedder(ABC):
         """
         pass
 
+    async def embed_text_async(self, text: str) -> np.ndarray:
+        """
+        Embed a single text string without blocking the event loop.
+
+        The default runs :meth:`embed_text` in the loop's executor; embedders
+        backed by an HTTP API override this with a non-blocking client.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Numpy array of shape (dimensions,) containing the embedding
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.embed_text, text)
+
+    async def embed_batch_async(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed multiple text strings without blocking the event loop.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            Numpy array of shape (len(texts), dimensions) containing embeddings
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.embed_batch, texts)
+
     @property
     @abstractmethod
     def dimensions(self) -> int:
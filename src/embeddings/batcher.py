@@ -0,0 +1,290 @@
+"""
+Cross-producer embedding micro-batcher.
+
+Collects texts submitted by many producers (for example one per document
+during ingestion) and embeds them in batches sized by a token budget rather
+than by document, so short documents share a batch and long documents are
+split across several. Texts whose embeddings are already in an embedding
+cache are answered from it and never reach the model.
+"""
+
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.config.constants import EMBED_BATCH_MAX_LATENCY
+from src.embeddings.base import BaseEmbedder
+from src.embeddings.batch_tuner import BatchTuner, estimate_tokens
+from src.utils.hashing import hash_content
+from src.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from src.utils.multi_tier_cache import MultiTierCache
+
+logger = get_logger(__name__)
+
+
+def chunk_cache_keys(embedder: BaseEmbedder, texts: Sequence[str]) -> list[str]:
+    """Embedding cache keys for texts, distinct per embedding model.
+
+    Args:
+        embedder: Embedder the texts are embedded with
+        texts: Texts to key
+
+    Returns:
+        One SHA-256 key per text
+    """
+    return [hash_content(f"{embedder.model_name}\0{text}") for text in texts]
+
+
+@dataclass
+class _Request:
+    """Texts submitted together, resolved once every text is embedded."""
+
+    future: "Future[np.ndarray]"
+    size: int
+    remaining: int
+    embeddings: np.ndarray | None = None
+
+
+@dataclass
+class _Pending:
+    """One submitted text waiting for a batch."""
+
+    request: _Request
+    position: int
+    text: str
+    key: str | None = None
+    tokens: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.tokens = estimate_tokens(self.text)
+
+
+class EmbeddingBatcher:
+    """Embeds texts from many producers in token-budgeted batches.
+
+    A background thread waits until the pending texts reach the token budget
+    or the oldest has waited max_latency seconds, then sorts them by length
+    (so texts of similar length are padded together) and packs them into
+    batches whose padded size (texts x longest text) stays within the
+    budget. Each producer's embeddings are scattered back in the order it
+    submitted them.
+
+    Unless a fixed token_budget is given, the embedder's BatchTuner (or a
+    default one) sets the budget from the pending texts before each flush.
+
+    With a cache, each submission is looked up with one batched read and only
+    the misses are queued; each embedded batch is stored with one batched
+    write.
+
+    Example:
+        >>> with EmbeddingBatcher(embedder) as batcher:
+        ...     futures = [batcher.submit(texts) for texts in per_document_texts]
+        ...     embeddings = [future.result() for future in futures]
+    """
+
+    def __init__(
+        self,
+        embedder: BaseEmbedder,
+        token_budget: int | None = None,
+        max_latency: float = EMBED_BATCH_MAX_LATENCY,
+        tuner: BatchTuner | None = None,
+        cache: "MultiTierCache | None" = None,
+    ):
+        """Initialize batcher and start its worker thread.
+
+        Args:
+            embedder: Embedder whose embed_batch is called for each batch
+            token_budget: Fixed padded-token budget per batch
+                (default: suggested by the tuner before each flush)
+            max_latency: Longest a text waits for a fuller batch (seconds)
+            tuner: Batch tuner driving the budget
+                (default: the embedder's own tuner, if it has one)
+            cache: Optional cache of chunk embeddings (L2 tier), keyed by
+                chunk_cache_keys
+        """
+        self.embedder = embedder
+        self.cache = cache
+        self.max_latency = max_latency
+        embedder_tuner = getattr(embedder, "batch_tuner", None)
+        if tuner is None:
+            tuner = embedder_tuner if isinstance(embedder_tuner, BatchTuner) else BatchTuner()
+        self.tuner = tuner
+        self._fixed_budget = token_budget
+        self.token_budget = token_budget or self.tuner.suggest_token_budget([], memory_check=False)
+
+        self._pending: list[_Pending] = []
+        self._pending_tokens = 0
+        self._oldest: float | None = None
+        self._closed = False
+        self._dimensions = 0
+        self._condition = threading.Condition()
+
+        self.batches = 0
+        self.texts = 0
+        self.cache_hits = 0
+
+        self._thread = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, texts: list[str]) -> "Future[np.ndarray]":
+        """Queue texts for embedding.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Future resolving to an array of shape (len(texts), dimensions)
+
+        Raises:
+            RuntimeError: If the batcher has been closed
+        """
+        future: Future[np.ndarray] = Future()
+        if not texts:
+            future.set_result(np.empty((0, self._dimensions), dtype=np.float32))
+            return future
+
+        request = _Request(future=future, size=len(texts), remaining=len(texts))
+        keys: list[str | None] = [None] * len(texts)
+        misses = list(range(len(texts)))
+        if self.cache is not None:
+            cache_keys = chunk_cache_keys(self.embedder, texts)
+            hits, cached = self.cache.get_many_document_embeddings(cache_keys)
+            keys = list(cache_keys)
+            if hits.any():
+                dtype = np.promote_types(cached.dtype, np.float32)
+                request.embeddings = np.empty((len(texts), cached.shape[1]), dtype=dtype)
+                request.embeddings[hits] = cached
+                misses = np.flatnonzero(~hits).tolist()
+                request.remaining = len(misses)
+                self.cache_hits += len(texts) - len(misses)
+                if not misses:
+                    future.set_result(request.embeddings)
+                    return future
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("EmbeddingBatcher is closed")
+            if not self._pending:
+                self._oldest = time.monotonic()
+            for position in misses:
+                pending = _Pending(request, position, texts[position], keys[position])
+                self._pending.append(pending)
+                self._pending_tokens += pending.tokens
+            self._condition.notify()
+
+        return future
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Embed texts, waiting for their batch to complete.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Array of shape (len(texts), dimensions)
+        """
+        return self.submit(texts).result()
+
+    def close(self) -> None:
+        """Embed everything still pending and stop the worker thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def __enter__(self) -> "EmbeddingBatcher":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        """Worker loop: wait for a full batch or the deadline, then flush."""
+        while True:
+            with self._condition:
+                while True:
+                    if self._pending:
+                        assert self._oldest is not None
+                        wait = self._oldest + self.max_latency - time.monotonic()
+                        if self._closed or self._pending_tokens >= self.token_budget or wait <= 0:
+                            break
+                        self._condition.wait(wait)
+                    elif self._closed:
+                        return
+                    else:
+                        self._condition.wait()
+
+                pending = self._pending
+                self._pending = []
+                self._pending_tokens = 0
+                self._oldest = None
+
+            self._flush(pending)
+
+    def _flush(self, pending: list[_Pending]) -> None:
+        """Embed pending texts in length-sorted, budgeted batches."""
+        if self._fixed_budget is None:
+            try:
+                self.token_budget = self.tuner.suggest_token_budget([p.text for p in pending])
+            except Exception as e:
+                # Never leave the pending futures unresolved
+                logger.warning(f"Batch tuning failed, keeping budget of {self.token_budget} tokens: {e}")
+
+        pending.sort(key=lambda p: p.tokens)
+        for batch in self._pack(pending):
+            self._embed(batch)
+
+    def _pack(self, pending: list[_Pending]) -> list[list[_Pending]]:
+        """Split length-sorted texts into batches within the token budget.
+
+        Since texts are sorted, the last one in a batch is the longest and
+        every text in the batch is padded to its length.
+        """
+        batches: list[list[_Pending]] = []
+        batch: list[_Pending] = []
+        for item in pending:
+            full = len(batch) >= self.tuner.max_size
+            if batch and (full or (len(batch) + 1) * item.tokens > self.token_budget):
+                batches.append(batch)
+                batch = []
+            batch.append(item)
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _embed(self, batch: list[_Pending]) -> None:
+        """Embed one batch and scatter the vectors to their requests."""
+        try:
+            embeddings = np.asarray(self.embedder.embed_batch([p.text for p in batch]))
+        except Exception as e:
+            logger.error(f"Embedding batch of {len(batch)} texts failed: {e}")
+            for item in batch:
+                if not item.request.future.done():
+                    item.request.future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.texts += len(batch)
+        self._dimensions = embeddings.shape[1]
+
+        if self.cache is not None:
+            self.cache.set_many_document_embeddings([p.key for p in batch if p.key is not None], embeddings)
+
+        for item, embedding in zip(batch, embeddings, strict=True):
+            request = item.request
+            if request.future.done():
+                # An earlier batch for this request failed
+                continue
+            if request.embeddings is None:
+                request.embeddings = np.empty((request.size, embeddings.shape[1]), dtype=embeddings.dtype)
+            request.embeddings[item.position] = embedding
+            request.remaining -= 1
+            if request.remaining == 0:
+                request.future.set_result(request.embeddings)
@@ -2,9 +2,15 @@
 Ollama-based embedding implementation.
 
 Uses Ollama API to generate embeddings using models like nomic-embed-text.
+
+v0.5.2: Batches go through the multi-input ``/api/embed`` endpoint, falling
+back to a bounded pool of concurrent single-text requests on older servers.
+Async variants use ``ollama.AsyncClient`` so they never block the event loop.
 """
 
-from typing import TYPE_CHECKING
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
@@ -20,6 +26,8 @@ from src.config.constants import (
     DEFAULT_API_TIMEOUT,
     DEFAULT_EMBEDDING_DIMENSION,
     DEFAULT_MAX_RETRIES,
+    OLLAMA_EMBED_BATCH_SIZE,
+    OLLAMA_EMBED_CONCURRENCY,
 )
 from src.config.settings import get_settings
 from src.embeddings.base import BaseEmbedder
@@ -53,6 +61,8 @@ class OllamaEmbedder(BaseEmbedder):
         base_url: str | None = None,
         timeout: int = DEFAULT_API_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        batch_size: int = OLLAMA_EMBED_BATCH_SIZE,
+        max_concurrency: int = OLLAMA_EMBED_CONCURRENCY,
     ):
         """
         Initialize Ollama embedder.
@@ -62,6 +72,9 @@ class OllamaEmbedder(BaseEmbedder):
             base_url: Ollama API base URL (uses config if None)
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            batch_size: Texts sent per multi-input embed request
+            max_concurrency: Concurrent requests when the server has no
+                multi-input endpoint
 
         TODO: Implement initialization:
               1. Get base_url from config if not provided
@@ -74,12 +87,18 @@ class OllamaEmbedder(BaseEmbedder):
         self._model_name = model_name
         self._timeout = timeout
         self._max_retries = max_retries
+        self._batch_size = max(1, batch_size)
+        self._max_concurrency = max(1, max_concurrency)
+        # None until the first batch tells us whether /api/embed exists
+        self._supports_batch_endpoint: bool | None = None
 
         settings = get_settings()
         self._base_url = base_url or settings.ollama_url
 
-        # Create Ollama client
+        # Create Ollama client (its HTTP connection pool is shared by all
+        # requests, including concurrent ones from embed_batch)
         self.client = ollama_module.Client(host=self._base_url)
+        self.async_client = ollama_module.AsyncClient(host=self._base_url)
 
         # Verify model and get dimensions
         self._verify_model_available()
@@ -109,6 +128,14 @@ class OllamaEmbedder(BaseEmbedder):
             logger.warning(f"Could not determine dimensions, using default {DEFAULT_EMBEDDING_DIMENSION}")
             return DEFAULT_EMBEDDING_DIMENSION
 
+    def _parse_single(self, response: Any) -> np.ndarray:
+        """Convert an ``/api/embeddings`` response into a unit vector.
+
+        ``/api/embed`` already returns unit vectors; normalising here keeps
+        queries and batched chunks on the same scale for L2 search.
+        """
+        return self.normalize(np.array(response['embedding'], dtype=np.float32))
+
     @with_retry(max_attempts=3, base_delay=1.0, retryable_exceptions=(ConnectionError, TimeoutError, LLMConnectionError, EmbeddingError))
     def _embed_text_internal(self, text: str) -> np.ndarray:
         """
@@ -122,11 +149,11 @@ class OllamaEmbedder(BaseEmbedder):
                 model=self._model_name,
                 prompt=text
             )
-            return np.array(response['embedding'], dtype=np.float32)
+            return self._parse_single(response)
         except (KeyError, ValueError, TypeError) as e:
-            raise EmbeddingError(f"Invalid embedding response: {e}")
+            raise EmbeddingError(f"Invalid embedding response: {e}") from e
         except (ConnectionError, TimeoutError) as e:
-            raise LLMConnectionError(f"Ollama connection failed: {e}")
+            raise LLMConnectionError(f"Ollama connection failed: {e}") from e
 
     def embed_text(self, text: str) -> np.ndarray:
         """
@@ -142,7 +169,7 @@ class OllamaEmbedder(BaseEmbedder):
                     model=self._model_name,
                     prompt=text
                 )
-                return np.array(response['embedding'], dtype=np.float32)
+                return self._parse_single(response)
             except Exception as e:
                 logger.error(f"Embedding failed: {e}")
                 raise
@@ -150,16 +177,187 @@ class OllamaEmbedder(BaseEmbedder):
         # v0.2.9: Use advanced error recovery
         return self._embed_text_internal(text)
 
+    def _request_batch(self, texts: list[str]) -> Any | None:
+        """Call the multi-input endpoint, returning None if the server lacks it."""
+        try:
+            return self.client.embed(model=self._model_name, input=texts)
+        except ollama_module.ResponseError as e:
+            if e.status_code == 404:
+                return None
+            raise
+
+    def _parse_batch(self, response: Any, count: int) -> np.ndarray:
+        """Convert an ``/api/embed`` response into a ``(count, dim)`` array."""
+        try:
+            embeddings = np.array(response['embeddings'], dtype=np.float32)
+        except (KeyError, ValueError, TypeError) as e:
+            raise EmbeddingError(f"Invalid embedding response: {e}") from e
+
+        if embeddings.ndim != 2 or embeddings.shape[0] != count:
+            raise EmbeddingError(
+                f"Expected {count} embeddings, got shape {embeddings.shape}"
+            )
+        return embeddings
+
+    @with_retry(max_attempts=3, base_delay=1.0, retryable_exceptions=(ConnectionError, TimeoutError, LLMConnectionError, EmbeddingError))
+    def _embed_chunk_internal(self, texts: list[str]) -> np.ndarray | None:
+        """Embed one chunk of texts with circuit breaker protection."""
+        try:
+            response = _ollama_circuit_breaker.call(self._request_batch, texts)
+        except (ConnectionError, TimeoutError) as e:
+            raise LLMConnectionError(f"Ollama connection failed: {e}") from e
+
+        if response is None:
+            return None
+        return self._parse_batch(response, len(texts))
+
+    def _embed_chunk(self, texts: list[str]) -> np.ndarray | None:
+        """Embed one chunk via ``/api/embed``; None if the endpoint is missing."""
+        settings = get_settings()
+        if settings.feature_flags.enable_advanced_error_recovery:
+            return self._embed_chunk_internal(texts)
+
+        response = self._request_batch(texts)
+        if response is None:
+            return None
+        return self._parse_batch(response, len(texts))
+
+    def _embed_concurrent(self, texts: list[str]) -> list[np.ndarray]:
+        """Embed texts one request each, keeping a bounded number in flight."""
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_concurrency, len(texts)),
+            thread_name_prefix="ollama-embed",
+        ) as executor:
+            return list(executor.map(self.embed_text, texts))
+
     def embed_batch(self, texts: list[str]) -> np.ndarray:
-        """Embed multiple texts (calls embed_text for each)."""
-        embeddings = []
+        """Embed multiple texts, preserving input order.
+
+        Texts are sent ``batch_size`` at a time to Ollama's multi-input
+        ``/api/embed`` endpoint. Servers without it get up to
+        ``max_concurrency`` concurrent ``embed_text`` requests instead.
+        """
+        if not texts:
+            return np.empty((0, self._dimensions), dtype=np.float32)
+
+        embeddings: list[np.ndarray] = []
+
+        for start in range(0, len(texts), self._batch_size):
+            if start > 0 and start % (self._batch_size * 10) == 0:
+                logger.info(f"Embedded {start}/{len(texts)} texts")
+
+            result = None
+            if self._supports_batch_endpoint is not False:
+                result = self._embed_chunk(texts[start:start + self._batch_size])
+                if result is None and self._supports_batch_endpoint is None:
+                    logger.info(
+                        "Ollama /api/embed unavailable, using concurrent "
+                        f"single-text requests (max {self._max_concurrency})"
+                    )
+                self._supports_batch_endpoint = result is not None
+
+            if result is None:
+                # Keep the pool full for the rest of the batch
+                embeddings.extend(self._embed_concurrent(texts[start:]))
+                break
+
+            embeddings.extend(result)
+
+        return np.array(embeddings, dtype=np.float32)
+
+    @with_retry(max_attempts=3, base_delay=1.0, retryable_exceptions=(ConnectionError, TimeoutError, LLMConnectionError, EmbeddingError))
+    async def _embed_text_internal_async(self, text: str) -> np.ndarray:
+        """Async twin of :meth:`_embed_text_internal`."""
+        try:
+            response = await _ollama_circuit_breaker.call_async(
+                self.async_client.embeddings,
+                model=self._model_name,
+                prompt=text
+            )
+            return self._parse_single(response)
+        except (KeyError, ValueError, TypeError) as e:
+            raise EmbeddingError(f"Invalid embedding response: {e}") from e
+        except (ConnectionError, TimeoutError) as e:
+            raise LLMConnectionError(f"Ollama connection failed: {e}") from e
+
+    async def embed_text_async(self, text: str) -> np.ndarray:
+        """Embed a single text string over non-blocking HTTP."""
+        settings = get_settings()
+        if not settings.feature_flags.enable_advanced_error_recovery:
+            try:
+                response = await self.async_client.embeddings(
+                    model=self._model_name,
+                    prompt=text
+                )
+                return self._parse_single(response)
+            except Exception as e:
+                logger.error(f"Embedding failed: {e}")
+                raise
+
+        return await self._embed_text_internal_async(text)
+
+    async def _request_batch_async(self, texts: list[str]) -> Any | None:
+        """Async twin of :meth:`_request_batch`."""
+        try:
+            return await self.async_client.embed(model=self._model_name, input=texts)
+        except ollama_module.ResponseError as e:
+            if e.status_code == 404:
+                return None
+            raise
+
+    @with_retry(max_attempts=3, base_delay=1.0, retryable_exceptions=(ConnectionError, TimeoutError, LLMConnectionError, EmbeddingError))
+    async def _embed_chunk_internal_async(self, texts: list[str]) -> np.ndarray | None:
+        """Async twin of :meth:`_embed_chunk_internal`."""
+        try:
+            response = await _ollama_circuit_breaker.call_async(
+                self._request_batch_async, texts
+            )
+        except (ConnectionError, TimeoutError) as e:
+            raise LLMConnectionError(f"Ollama connection failed: {e}") from e
+
+        if response is None:
+            return None
+        return self._parse_batch(response, len(texts))
+
+    async def _embed_chunk_async(self, texts: list[str]) -> np.ndarray | None:
+        """Async twin of :meth:`_embed_chunk`."""
+        settings = get_settings()
+        if settings.feature_flags.enable_advanced_error_recovery:
+            return await self._embed_chunk_internal_async(texts)
+
+        response = await self._request_batch_async(texts)
+        if response is None:
+            return None
+        return self._parse_batch(response, len(texts))
+
+    async def _embed_concurrent_async(self, texts: list[str]) -> list[np.ndarray]:
+        """Embed texts one request each, with at most ``max_concurrency`` in flight."""
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def embed_one(text: str) -> np.ndarray:
+            async with semaphore:
+                return await self.embed_text_async(text)
+
+        return list(await asyncio.gather(*(embed_one(text) for text in texts)))
+
+    async def embed_batch_async(self, texts: list[str]) -> np.ndarray:
+        """Embed multiple texts over non-blocking HTTP, preserving input order."""
+        if not texts:
+            return np.empty((0, self._dimensions), dtype=np.float32)
+
+        embeddings: list[np.ndarray] = []
+
+        for start in range(0, len(texts), self._batch_size):
+            result = None
+            if self._supports_batch_endpoint is not False:
+                result = await self._embed_chunk_async(texts[start:start + self._batch_size])
+                self._supports_batch_endpoint = result is not None
 
-        for i, text in enumerate(texts):
-            if i > 0 and i % 100 == 0:
-                logger.info(f"Embedded {i}/{len(texts)} texts")
+            if result is None:
+                embeddings.extend(await self._embed_concurrent_async(texts[start:]))
+                break
 
-            embedding = self.embed_text(text)
-            embeddings.append(embedding)
+            embeddings.extend(result)
 
         return np.array(embeddings, dtype=np.float32)
 
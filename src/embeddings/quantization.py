@@ -0,0 +1,459 @@
+"""
+Quantized embedding storage and search.
+
+Codecs store embeddings as float16 (2x smaller than float32) or as scalar
+int8 (4x smaller). QuantizedVectors keeps a growable matrix of codes and
+searches it by cosine distance, scoring a chunk of rows at a time and
+optionally re-ranking the best candidates against float32 originals kept
+on disk. Codes can also be appended to a file so the matrix is reloaded on
+restart.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Rows scored or copied per step, bounding the temporaries of a search or compaction
+SCORE_CHUNK_ROWS = 16_384
+
+
+class EmbeddingCodec(ABC):
+    """Converts float32 embeddings to a compact storage dtype and back."""
+
+    name: str
+    dtype: np.dtype
+
+    @abstractmethod
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Encode vectors of shape (n, dimensions) to storage codes."""
+
+    @abstractmethod
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """Decode storage codes back to float32 vectors."""
+
+    def scores(self, query: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """Dot products of a float32 query with encoded vectors.
+
+        Args:
+            query: Query vector of shape (dimensions,)
+            codes: Encoded vectors of shape (n, dimensions)
+
+        Returns:
+            Array of shape (n,) with approximate dot products
+        """
+        return self.decode(codes) @ query
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise codec parameters."""
+        return {"name": self.name}
+
+
+class Float32Codec(EmbeddingCodec):
+    """Full precision (no compression)."""
+
+    name = "float32"
+    dtype = np.dtype(np.float32)
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        return np.asarray(vectors, dtype=np.float32)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        return np.asarray(codes, dtype=np.float32)
+
+    def scores(self, query: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        return codes @ query
+
+
+class Float16Codec(EmbeddingCodec):
+    """Half precision: 2x smaller, near-lossless for normalised embeddings."""
+
+    name = "float16"
+    dtype = np.dtype(np.float16)
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        return np.asarray(vectors, dtype=np.float16)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        return np.asarray(codes, dtype=np.float32)
+
+
+class Int8Codec(EmbeddingCodec):
+    """Symmetric scalar int8: 4x smaller.
+
+    By default every dimension maps [-1, 1] onto [-127, 127], which covers
+    any unit-length embedding, so codes do not depend on which vectors were
+    stored first. fit() instead calibrates one scale per dimension from a
+    sample, for when the full set of vectors is known up front.
+    """
+
+    name = "int8"
+    dtype = np.dtype(np.int8)
+    UNIT_SCALE = 1.0 / 127.0
+
+    def __init__(self, scale: np.ndarray | float | None = None):
+        """Initialize codec.
+
+        Args:
+            scale: Per-dimension (or shared) scale (default: UNIT_SCALE)
+        """
+        self.scale = np.asarray(self.UNIT_SCALE if scale is None else scale, dtype=np.float32)
+
+    def fit(self, vectors: np.ndarray) -> "Int8Codec":
+        """Calibrate per-dimension scales to the largest absolute values.
+
+        Args:
+            vectors: Array of shape (n, dimensions)
+
+        Returns:
+            The codec, for chaining
+        """
+        max_abs = np.abs(np.asarray(vectors, dtype=np.float32)).max(axis=0)
+        # Avoid division by zero for dimensions that are always 0
+        self.scale = np.where(max_abs > 0, max_abs / 127.0, 1.0).astype(np.float32)
+        return self
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        scaled = np.rint(np.asarray(vectors, dtype=np.float32) / self.scale)
+        clipped = int(np.count_nonzero(np.abs(scaled) > 127))
+        if clipped:
+            logger.warning(
+                f"Clipped {clipped} values outside the int8 range; "
+                "normalise embeddings or fit the codec"
+            )
+        return np.clip(scaled, -127, 127).astype(np.int8)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        return codes.astype(np.float32) * self.scale
+
+    def scores(self, query: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        # Fold the scale into the query instead of decoding every row
+        return codes @ (query * self.scale)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "scale": self.scale.tolist(),
+        }
+
+
+CODECS: dict[str, type[EmbeddingCodec]] = {
+    Float32Codec.name: Float32Codec,
+    Float16Codec.name: Float16Codec,
+    Int8Codec.name: Int8Codec,
+}
+
+
+def get_codec(name: str | None) -> EmbeddingCodec:
+    """Create a codec by name.
+
+    Args:
+        name: "float32", "float16" or "int8" (None means float32)
+
+    Returns:
+        New codec instance
+
+    Raises:
+        ValueError: If the name is not a known codec
+    """
+    name = name or Float32Codec.name
+    if name not in CODECS:
+        raise ValueError(f"Unknown embedding quantization '{name}', expected one of {sorted(CODECS)}")
+    return CODECS[name]()
+
+
+def codec_from_dict(data: dict[str, Any]) -> EmbeddingCodec:
+    """Restore a codec serialised with :meth:`EmbeddingCodec.to_dict`."""
+    codec = get_codec(data.get("name"))
+    if isinstance(codec, Int8Codec) and data.get("scale") is not None:
+        codec.scale = np.asarray(data["scale"], dtype=np.float32)
+    return codec
+
+
+class RowFile:
+    """Append-only rows of fixed width in a file, read through a memory map.
+
+    Used to keep float32 originals of quantized vectors off the heap, so
+    they are only paged in for the few candidates being rescored, and to
+    persist codes without rewriting earlier rows.
+    """
+
+    def __init__(self, path: Path, dtype: np.dtype | type, dimensions: int | None = None):
+        """Open a row file.
+
+        Args:
+            path: File to store rows in
+            dtype: Element type of the rows
+            dimensions: Row width of an existing file to resume; when not
+                given, any previous contents are discarded
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.dtype = np.dtype(dtype)
+        self._dimensions = dimensions or 0
+        self._map: np.memmap | None = None
+
+        if dimensions and self.path.exists():
+            row_bytes = dimensions * self.dtype.itemsize
+            self._rows = self.path.stat().st_size // row_bytes
+        else:
+            self.path.write_bytes(b"")
+            self._rows = 0
+
+    def __len__(self) -> int:
+        """Number of rows stored."""
+        return self._rows
+
+    def append(self, rows: np.ndarray) -> None:
+        """Append rows of shape (n, dimensions)."""
+        rows = np.ascontiguousarray(rows, dtype=self.dtype)
+        with open(self.path, "ab") as f:
+            f.write(rows.tobytes())
+        self._rows += rows.shape[0]
+        self._dimensions = rows.shape[1]
+        self._map = None
+
+    def take(self, rows: np.ndarray | slice) -> np.ndarray:
+        """Read rows by position."""
+        if self._map is None:
+            self._map = np.memmap(self.path, dtype=self.dtype, mode="r", shape=(self._rows, self._dimensions))
+        return np.asarray(self._map[rows])
+
+
+class QuantizedVectors:
+    """Growable matrix of quantized embeddings with cosine search.
+
+    Rows keep their position for life: removing a row only masks it, so
+    callers can map their own ids to row numbers.
+
+    Example:
+        >>> vectors = QuantizedVectors(get_codec("int8"), originals_path=Path("rows.f32"))
+        >>> rows = vectors.add(embeddings)
+        >>> rows, distances = vectors.search(query, k=10)
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(
+        self,
+        codec: EmbeddingCodec,
+        originals_path: Path | None = None,
+        oversample: int = 4,
+        codes_path: Path | None = None,
+        dimensions: int | None = None,
+    ):
+        """Initialize storage.
+
+        Args:
+            codec: Codec used to store vectors (fitted, when resuming)
+            originals_path: File for float32 originals used to rescore the
+                best quantized candidates (default: no rescoring)
+            oversample: Candidates rescored per requested result
+            codes_path: File the codes are appended to, so the vectors
+                persist (default: memory only)
+            dimensions: Vector width of existing files to resume; without
+                it the files start empty
+        """
+        self.codec = codec
+        self.oversample = oversample
+        self.originals = RowFile(originals_path, np.float32, dimensions) if originals_path else None
+        self.codes_file = RowFile(codes_path, codec.dtype, dimensions) if codes_path else None
+
+        self._codes: np.ndarray | None = None
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._live = np.zeros(0, dtype=bool)
+        self._size = 0
+
+        if self.codes_file is not None and len(self.codes_file):
+            self._store(self.codes_file.take(slice(None)))
+
+    def __len__(self) -> int:
+        """Number of live rows."""
+        return int(self._live[: self._size].sum())
+
+    @property
+    def size(self) -> int:
+        """Number of rows ever stored, including removed ones."""
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the codes of all stored rows."""
+        if self._codes is None:
+            return 0
+        return self._size * self._codes.shape[1] * self._codes.itemsize
+
+    def _reserve(self, rows: int, dimensions: int) -> None:
+        """Grow storage geometrically to hold at least ``rows`` rows."""
+        capacity = 0 if self._codes is None else self._codes.shape[0]
+        if rows <= capacity:
+            return
+
+        new_capacity = max(rows, capacity * 2, self.INITIAL_CAPACITY)
+        codes = np.zeros((new_capacity, dimensions), dtype=self.codec.dtype)
+        norms = np.zeros(new_capacity, dtype=np.float32)
+        live = np.zeros(new_capacity, dtype=bool)
+        if self._codes is not None:
+            codes[: self._size] = self._codes[: self._size]
+            norms[: self._size] = self._norms[: self._size]
+            live[: self._size] = self._live[: self._size]
+        self._codes, self._norms, self._live = codes, norms, live
+
+    def add(self, vectors: np.ndarray) -> np.ndarray:
+        """Store vectors.
+
+        Args:
+            vectors: Array of shape (n, dimensions)
+
+        Returns:
+            Row numbers assigned to the vectors
+        """
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        count, dimensions = vectors.shape
+        if self._codes is not None and dimensions != self._codes.shape[1]:
+            raise ValueError(f"Expected {self._codes.shape[1]}-dimensional vectors, got {dimensions}")
+
+        codes = self.codec.encode(vectors)
+        rows = self._store(codes)
+
+        if self.codes_file is not None:
+            self.codes_file.append(codes)
+        if self.originals is not None:
+            self.originals.append(vectors)
+
+        return rows
+
+    def _store(self, codes: np.ndarray) -> np.ndarray:
+        """Append encoded rows to the in-memory matrix."""
+        count, dimensions = codes.shape
+        self._reserve(self._size + count, dimensions)
+        assert self._codes is not None
+
+        rows = np.arange(self._size, self._size + count)
+        self._codes[rows] = codes
+        # Norms of what is stored, so quantized scores are cosine-consistent
+        self._norms[rows] = np.linalg.norm(self.codec.decode(codes), axis=1)
+        self._live[rows] = True
+        self._size += count
+        return rows
+
+    def remove(self, rows: np.ndarray | list[int]) -> None:
+        """Mark rows as deleted."""
+        self._live[np.asarray(rows, dtype=np.int64)] = False
+
+    def compacted(
+        self,
+        rows: np.ndarray,
+        codes_path: Path | None = None,
+        originals_path: Path | None = None,
+    ) -> "QuantizedVectors":
+        """Copy rows, in order, into new storage without removed rows.
+
+        Codes and originals are copied as stored, not re-encoded, so the
+        copy scores exactly like the source. Row ``i`` of the copy is
+        ``rows[i]`` of the source.
+
+        Args:
+            rows: Rows to keep
+            codes_path: File for the copy's codes (default: memory only)
+            originals_path: File for the copy's originals; used only when
+                the source keeps originals
+
+        Returns:
+            New storage holding only the given rows
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        copy = QuantizedVectors(
+            self.codec,
+            originals_path=originals_path if self.originals is not None else None,
+            oversample=self.oversample,
+            codes_path=codes_path,
+        )
+        if self._codes is None:
+            return copy
+
+        for start in range(0, rows.size, SCORE_CHUNK_ROWS):
+            chunk = rows[start:start + SCORE_CHUNK_ROWS]
+            codes = self._codes[chunk]
+            copy._store(codes)
+            if copy.codes_file is not None:
+                copy.codes_file.append(codes)
+            if copy.originals is not None and self.originals is not None:
+                copy.originals.append(self.originals.take(chunk))
+        return copy
+
+    def get(self, rows: np.ndarray | list[int]) -> np.ndarray:
+        """Decode rows back to float32 vectors."""
+        if self._codes is None:
+            return np.zeros((0, 0), dtype=np.float32)
+        return self.codec.decode(self._codes[np.asarray(rows, dtype=np.int64)])
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int,
+        rows: np.ndarray | None = None,
+        rescore: bool = True,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the rows closest to a query by cosine distance.
+
+        Args:
+            query: Query vector of shape (dimensions,)
+            k: Number of results
+            rows: Restrict the search to these rows (default: all live rows)
+            rescore: Re-rank the best k x oversample quantized candidates
+                against the float32 originals, when they are kept
+
+        Returns:
+            Tuple of (row numbers, cosine distances), closest first
+        """
+        empty = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32))
+        if self._codes is None or k <= 0:
+            return empty
+
+        if rows is None:
+            rows = np.flatnonzero(self._live[: self._size])
+        else:
+            rows = np.asarray(rows, dtype=np.int64)
+            rows = rows[self._live[rows]]
+        if rows.size == 0:
+            return empty
+
+        query = np.asarray(query, dtype=np.float32).ravel()
+        query_norm = float(np.linalg.norm(query))
+        if query_norm == 0:
+            return rows[:k], np.ones(min(k, rows.size), dtype=np.float32)
+
+        norms = self._norms[rows]
+        scores = np.empty(rows.size, dtype=np.float32)
+        for start in range(0, rows.size, SCORE_CHUNK_ROWS):
+            chunk = rows[start:start + SCORE_CHUNK_ROWS]
+            scores[start:start + chunk.size] = self.codec.scores(query, self._codes[chunk])
+        similarity = np.divide(scores, norms * query_norm, out=np.zeros_like(scores), where=norms > 0)
+
+        use_originals = rescore and self.originals is not None
+        candidates = min(rows.size, k * self.oversample if use_originals else k)
+        top = self._top(-similarity, candidates)
+        rows, similarity = rows[top], similarity[top]
+
+        if use_originals:
+            assert self.originals is not None
+            originals = self.originals.take(rows)
+            norms = np.linalg.norm(originals, axis=1)
+            scores = originals @ query
+            similarity = np.divide(scores, norms * query_norm, out=np.zeros_like(scores), where=norms > 0)
+            top = self._top(-similarity, min(k, rows.size))
+            rows, similarity = rows[top], similarity[top]
+
+        return rows, (1.0 - similarity).astype(np.float32)
+
+    @staticmethod
+    def _top(keys: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k smallest keys, in ascending order."""
+        part = np.argpartition(keys, k - 1)[:k] if k < keys.size else np.arange(keys.size)
+        return part[np.argsort(keys[part], kind="stable")]
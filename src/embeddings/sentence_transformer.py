@@ -5,6 +5,7 @@ Uses the sentence-transformers library to generate embeddings locally
 on CPU or GPU.
 """
 
+import time
 from typing import TYPE_CHECKING, cast
 
 import numpy as np
@@ -22,7 +23,7 @@ else:
 
 from src.config.settings import get_settings
 from src.embeddings.base import BaseEmbedder
-from src.embeddings.batch_tuner import BatchTuner
+from src.embeddings.batch_tuner import BatchTuner, LengthBucket
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -79,21 +80,66 @@ class SentenceTransformerEmbedder(BaseEmbedder):
     def embed_batch(self, texts: list[str]) -> np.ndarray:
         """Embed multiple texts efficiently in batch.
 
-        v0.2.9: Uses intelligent batch size tuning when enabled.
+        v0.2.9: Uses intelligent batch size tuning when enabled, encoding
+        texts in length buckets with a batch size per bucket.
         """
+        show_progress_bar = len(texts) > 100
+
         # v0.2.9: Use batch tuner if enabled
         if self.batch_tuner:
-            batch_size = self.batch_tuner.suggest_batch_size(texts)
-        else:
-            batch_size = self._batch_size
+            embeddings, _ = self.embed_batch_bucketed(texts, show_progress_bar=show_progress_bar)
+            return embeddings
 
         return self.model.encode(
             texts,
-            batch_size=batch_size,
+            batch_size=self._batch_size,
             convert_to_numpy=True,
-            show_progress_bar=len(texts) > 100,
+            show_progress_bar=show_progress_bar,
         )
 
+    def embed_batch_bucketed(
+        self,
+        texts: list[str],
+        tuner: BatchTuner | None = None,
+        show_progress_bar: bool = False,
+    ) -> tuple[np.ndarray, list[LengthBucket]]:
+        """Embed texts in length buckets and restore their original order.
+
+        Texts are grouped by estimated token length, so short chunks are not
+        padded to the longest text in a mixed batch, and each bucket is
+        encoded with the batch size its token budget allows.
+
+        Args:
+            texts: List of texts to embed
+            tuner: Tuner planning the buckets (default: this embedder's
+                tuner, or one starting from the configured batch size)
+            show_progress_bar: Show a progress bar while encoding each bucket
+
+        Returns:
+            Tuple of (embeddings in input order, buckets with timings)
+        """
+        tuner = tuner or self.batch_tuner or BatchTuner(initial_size=self._batch_size)
+        buckets = tuner.plan_length_buckets(texts)
+
+        embeddings = np.empty((len(texts), self.dimensions), dtype=np.float32)
+        for bucket in buckets:
+            start = time.perf_counter()
+            embeddings[bucket.indices] = self.model.encode(
+                [texts[i] for i in bucket.indices],
+                batch_size=bucket.batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=show_progress_bar,
+            )
+            bucket.seconds = time.perf_counter() - start
+
+            logger.debug(
+                f"Encoded bucket of {len(bucket.indices)} texts "
+                f"(<= {bucket.max_tokens} tokens, batch_size={bucket.batch_size}) "
+                f"in {bucket.seconds * 1000:.1f}ms"
+            )
+
+        return embeddings, buckets
+
     @property
     def dimensions(self) -> int:
         """Get embedding dimensions."""
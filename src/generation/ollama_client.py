@@ -4,7 +4,7 @@ Ollama LLM client for text generation.
 Provides interface to Ollama for generating answers using local LLMs.
 """
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -51,8 +51,9 @@ class OllamaClient:
         self.base_url = base_url or settings.ollama_url
         self.timeout = timeout
 
-        # Create client
+        # Create clients (async one serves the API server without blocking)
         self.client = ollama_module.Client(host=self.base_url)
+        self.async_client = ollama_module.AsyncClient(host=self.base_url)
 
         # Verify model exists
         self._verify_model_available()
@@ -195,6 +196,75 @@ class OllamaClient:
             logger.exception("Streaming generation failed")
             raise RuntimeError(f"Failed to generate streaming response: {e}") from e  # noqa: TRY003
 
+    async def generate_async(
+        self,
+        prompt: str,
+        system: str | None = None,
+        temperature: float = DEFAULT_LLM_TEMPERATURE,
+        max_tokens: int | None = None,
+    ) -> str:
+        """
+        Generate text completion over non-blocking HTTP.
+
+        Args:
+            prompt: User prompt
+            system: Optional system prompt
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Generated text
+        """
+        messages = self._build_messages(prompt, system)
+
+        options = {"temperature": temperature}
+        if max_tokens:
+            options["num_predict"] = max_tokens
+
+        try:
+            response = await self.async_client.chat(
+                model=self.model,
+                messages=messages,
+                options=options,
+            )
+            return str(response["message"]["content"])
+        except Exception as e:  # noqa: BLE001 - Re-raised with context
+            logger.exception("Generation failed")
+            raise RuntimeError(f"Failed to generate response: {e}") from e  # noqa: TRY003
+
+    async def generate_stream_async(
+        self,
+        prompt: str,
+        system: str | None = None,
+        temperature: float = DEFAULT_LLM_TEMPERATURE,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Generate text with streaming response over non-blocking HTTP.
+
+        Args:
+            prompt: User prompt
+            system: Optional system prompt
+            temperature: Sampling temperature
+
+        Yields:
+            Response chunks as they arrive
+        """
+        messages = self._build_messages(prompt, system)
+
+        try:
+            stream = await self.async_client.chat(
+                model=self.model,
+                messages=messages,
+                stream=True,
+                options={"temperature": temperature},
+            )
+            async for chunk in stream:
+                if "message" in chunk and "content" in chunk["message"]:
+                    yield chunk["message"]["content"]
+        except Exception as e:  # noqa: BLE001 - Re-raised with context
+            logger.exception("Streaming generation failed")
+            raise RuntimeError(f"Failed to generate streaming response: {e}") from e  # noqa: TRY003
+
     def health_check(self) -> bool:
         """
         Check if Ollama is accessible.
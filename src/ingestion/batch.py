@@ -5,10 +5,13 @@ duplicate detection, graceful error handling, and memory management.
 """
 
 import gc
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 import psutil  # type: ignore[import-untyped]
 from rich.console import Console
 from rich.progress import Progress
@@ -16,11 +19,16 @@ from rich.progress import Progress
 from src.chunking.splitters import chunk_document
 from src.config.constants import DEFAULT_MEMORY_LIMIT_PERCENTAGE
 from src.embeddings.base import BaseEmbedder
+from src.embeddings.batcher import chunk_cache_keys
 from src.embeddings.factory import get_embedder
 from src.exceptions import MemoryLimitExceededError
 from src.ingestion.loaders import load_document
+from src.ingestion.manifest import IngestionManifest, ManifestCheck, ManifestStatus
+from src.ingestion.models import Document
+from src.retrieval.bm25 import BM25Retriever
 from src.storage.vector_store import VectorStore
 from src.utils.logging import get_logger
+from src.utils.multi_tier_cache import MultiTierCache
 from src.utils.resource_governor import ResourcePriority, get_governor
 
 logger = get_logger(__name__)
@@ -60,6 +68,50 @@ class BatchSummary:
     results: list[IngestionResult]
 
 
+def chunk_metadatas(document: Document) -> list[dict[str, Any]]:
+    """Build vector store metadata for each chunk of a chunked document.
+
+    Args:
+        document: Document with chunks
+
+    Returns:
+        One metadata dict per chunk, limited to ChromaDB-compatible values
+    """
+    metadatas = []
+    for chunk in document.chunks:
+        metadata = chunk.metadata.model_dump()
+        # Convert Path to string if present
+        if "document_path" in metadata and hasattr(
+            metadata["document_path"], "__fspath__"
+        ):
+            metadata["document_path"] = str(metadata["document_path"])
+
+        # Remove None values - ChromaDB only supports str, int, float, bool
+        metadata = {k: v for k, v in metadata.items() if v is not None}
+        metadatas.append(metadata)
+    return metadatas
+
+
+def summarize_results(results: list[IngestionResult]) -> BatchSummary:
+    """Build a batch summary from per-file results.
+
+    Args:
+        results: Per-file ingestion results
+
+    Returns:
+        BatchSummary with statistics and results
+    """
+    return BatchSummary(
+        total=len(results),
+        successful=sum(1 for r in results if r.status == IngestionStatus.SUCCESS),
+        duplicates=sum(1 for r in results if r.status == IngestionStatus.DUPLICATE),
+        skipped=sum(1 for r in results if r.status == IngestionStatus.SKIPPED),
+        failed=sum(1 for r in results if r.status == IngestionStatus.FAILED),
+        total_chunks=sum(r.chunks for r in results if r.status == IngestionStatus.SUCCESS),
+        results=results,
+    )
+
+
 class BatchIngester:
     """Batch document ingestion with error handling and memory management."""
 
@@ -70,6 +122,10 @@ class BatchIngester:
         skip_duplicates: bool = True,
         memory_limit_mb: int | None = None,
         use_resource_governor: bool = True,
+        bm25_retriever: BM25Retriever | None = None,
+        manifest: IngestionManifest | None = None,
+        workers: int = 1,
+        embedding_cache: MultiTierCache | None = None,
     ):
         """Initialize batch ingester.
 
@@ -79,11 +135,23 @@ class BatchIngester:
             skip_duplicates: If True, skip duplicate documents automatically
             memory_limit_mb: Optional memory limit in MB (default: 80% of available)
             use_resource_governor: Use unified resource governance (v0.2.9+)
+            bm25_retriever: Optional keyword index to keep in sync; saved once per batch
+            manifest: Optional ingestion manifest; unchanged and byte-identical
+                files are skipped before loading, and changed files replace
+                their previous chunks
+            workers: Loader processes; above 1, files flow through the staged
+                IngestionPipeline instead of being ingested one at a time
+            embedding_cache: Optional cache of chunk embeddings; chunks whose
+                text was embedded before are not sent to the model again
         """
         self.console = console
         self.continue_on_error = continue_on_error
         self.skip_duplicates = skip_duplicates
         self.use_resource_governor = use_resource_governor
+        self.bm25_retriever = bm25_retriever
+        self.manifest = manifest
+        self.workers = workers
+        self.embedding_cache = embedding_cache
 
         # Set memory limit (default to configured percentage of available RAM)
         if memory_limit_mb is None:
@@ -147,6 +215,11 @@ class BatchIngester:
         Returns:
             BatchSummary with statistics and results
         """
+        if self.workers > 1:
+            from src.ingestion.pipeline import IngestionPipeline
+
+            return IngestionPipeline(self).run(file_paths, progress)
+
         results = []
         total_chunks = 0
 
@@ -226,21 +299,14 @@ class BatchIngester:
         if progress and task:
             progress.update(task, completed=len(file_paths))
 
+        # Persist keyword index once for the whole batch
+        if self.bm25_retriever is not None and total_chunks:
+            self.bm25_retriever.save()
+
         # Final garbage collection
         self._force_garbage_collection()
 
-        # Build summary
-        summary = BatchSummary(
-            total=len(results),
-            successful=sum(1 for r in results if r.status == IngestionStatus.SUCCESS),
-            duplicates=sum(1 for r in results if r.status == IngestionStatus.DUPLICATE),
-            skipped=sum(1 for r in results if r.status == IngestionStatus.SKIPPED),
-            failed=sum(1 for r in results if r.status == IngestionStatus.FAILED),
-            total_chunks=total_chunks,
-            results=results,
-        )
-
-        return summary
+        return summarize_results(results)
 
     def _ingest_single(
         self,
@@ -259,18 +325,19 @@ class BatchIngester:
             IngestionResult with status and details
         """
         try:
+            check, result = self._check_manifest(file_path, vector_store)
+            if result is not None:
+                return result
+
             # Load document
             document = load_document(file_path)
 
             # Check for duplicates using content hash
             if self.skip_duplicates:
-                content_hash = document.metadata.content_hash
-                existing = vector_store.get_documents_by_metadata(
-                    where={"content_hash": content_hash}
-                )
-
-                if existing and existing.get("ids"):
-                    existing_doc_id = existing["metadatas"][0].get("document_id")
+                existing_doc_id = self._find_duplicate(document, vector_store)
+                if existing_doc_id is not None:
+                    self._remove_previous_version(check, vector_store)
+                    self._record(check, existing_doc_id)
                     return IngestionResult(
                         file_path=file_path,
                         status=IngestionStatus.DUPLICATE,
@@ -282,22 +349,11 @@ class BatchIngester:
 
             # Generate embeddings
             chunk_texts = [chunk.text for chunk in document.chunks]
-            embeddings = embedder.embed_batch(chunk_texts)
+            embeddings = self._embed_chunks(chunk_texts, embedder)
 
             # Prepare metadata
             ids = [chunk.chunk_id for chunk in document.chunks]
-            metadatas = []
-            for chunk in document.chunks:
-                metadata = chunk.metadata.model_dump()
-                # Convert Path to string if present
-                if "document_path" in metadata and hasattr(
-                    metadata["document_path"], "__fspath__"
-                ):
-                    metadata["document_path"] = str(metadata["document_path"])
-
-                # Remove None values - ChromaDB only supports str, int, float, bool
-                metadata = {k: v for k, v in metadata.items() if v is not None}
-                metadatas.append(metadata)
+            metadatas = chunk_metadatas(document)
 
             # Store in vector database
             vector_store.add(
@@ -307,6 +363,13 @@ class BatchIngester:
                 metadatas=metadatas,
             )
 
+            if self.bm25_retriever is not None:
+                self.bm25_retriever.add_documents(chunk_texts, ids, metadatas)
+
+            # Only drop the previous version once its replacement is stored
+            self._remove_previous_version(check, vector_store, keep=ids)
+            self._record(check, document.document_id)
+
             # Explicitly clear large objects to free memory
             del embeddings
             del chunk_texts
@@ -326,3 +389,138 @@ class BatchIngester:
                 status=IngestionStatus.FAILED,
                 error=str(e),
             )
+
+    def _check_manifest(
+        self, file_path: Path, vector_store: VectorStore
+    ) -> tuple[ManifestCheck | None, IngestionResult | None]:
+        """Consult the manifest before paying for a parse.
+
+        A previously ingested path whose new bytes duplicate another file has
+        its own previous version removed before it is recorded as a duplicate.
+
+        Args:
+            file_path: Path to document
+            vector_store: Shared vector store instance
+
+        Returns:
+            Tuple of (check, result); result is set when the file needs no
+            further work because it is unchanged or a byte-identical duplicate
+        """
+        if self.manifest is None:
+            return None, None
+
+        check = self.manifest.check(file_path)
+        if check.status == ManifestStatus.UNCHANGED:
+            return check, IngestionResult(
+                file_path=file_path,
+                status=IngestionStatus.SKIPPED,
+                document_id=check.document_id,
+            )
+        if check.status == ManifestStatus.DUPLICATE and self.skip_duplicates:
+            self._remove_previous_version(check, vector_store)
+            self._record(check, check.document_id)
+            return check, IngestionResult(
+                file_path=file_path,
+                status=IngestionStatus.DUPLICATE,
+                duplicate_of=check.document_id,
+            )
+        return check, None
+
+    def _embed_chunks(self, texts: list[str], embedder: BaseEmbedder) -> np.ndarray:
+        """Embed chunk texts, sending only embedding cache misses to the model.
+
+        Args:
+            texts: Chunk texts
+            embedder: Shared embedder instance
+
+        Returns:
+            Array of shape (len(texts), dimensions)
+        """
+        if self.embedding_cache is None:
+            return embedder.embed_batch(texts)
+
+        keys = chunk_cache_keys(embedder, texts)
+        hits, cached = self.embedding_cache.get_many_document_embeddings(keys)
+        if hits.all():
+            return cached
+
+        fresh = np.asarray(embedder.embed_batch([text for text, hit in zip(texts, hits, strict=True) if not hit]))
+        self.embedding_cache.set_many_document_embeddings(
+            [key for key, hit in zip(keys, hits, strict=True) if not hit], fresh
+        )
+        if not hits.any():
+            return fresh
+
+        embeddings = np.empty((len(texts), fresh.shape[1]), dtype=fresh.dtype)
+        embeddings[hits] = cached
+        embeddings[~hits] = fresh
+        return embeddings
+
+    @staticmethod
+    def _find_duplicate(document: Document, vector_store: VectorStore) -> str | None:
+        """Find a stored document with the same content hash.
+
+        Args:
+            document: Loaded document
+            vector_store: Shared vector store instance
+
+        Returns:
+            Document ID of the stored duplicate, or None
+        """
+        existing = vector_store.get_documents_by_metadata(
+            where={"content_hash": document.metadata.content_hash}
+        )
+        if existing and existing.get("ids"):
+            return existing["metadatas"][0].get("document_id")  # type: ignore[no-any-return]
+        return None
+
+    def _remove_previous_version(
+        self,
+        check: ManifestCheck | None,
+        vector_store: VectorStore,
+        keep: Iterable[str] = (),
+    ) -> None:
+        """Remove the chunks stored for a replaced file's previous version.
+
+        Args:
+            check: Manifest check made before loading the file
+            vector_store: Shared vector store instance
+            keep: Chunk IDs of the new version, never removed
+        """
+        if check is not None and check.previous_document_id:
+            self._remove_document(check.previous_document_id, vector_store, keep)
+
+    def _remove_document(
+        self,
+        document_id: str,
+        vector_store: VectorStore,
+        keep: Iterable[str] = (),
+    ) -> None:
+        """Remove the stored chunks of a document from the vector store and keyword index.
+
+        Args:
+            document_id: Document whose chunks to remove
+            vector_store: Shared vector store instance
+            keep: Chunk IDs to leave in place
+        """
+        existing = vector_store.get_documents_by_metadata(where={"document_id": document_id})
+        stored_ids = existing.get("ids") if existing else None
+        kept = set(keep)
+        chunk_ids = [chunk_id for chunk_id in stored_ids or [] if chunk_id not in kept]
+        if not chunk_ids:
+            return
+
+        vector_store.delete(ids=chunk_ids)
+        if self.bm25_retriever is not None:
+            self.bm25_retriever.remove_documents(chunk_ids)
+        logger.info(f"Removed {len(chunk_ids)} chunks of previous version {document_id}")
+
+    def _record(self, check: ManifestCheck | None, document_id: str | None) -> None:
+        """Record a handled file in the manifest, if one is in use.
+
+        Args:
+            check: Manifest check made before loading the file
+            document_id: Document the file was stored as or duplicates
+        """
+        if self.manifest is not None and check is not None:
+            self.manifest.record(check.fingerprint, document_id)
@@ -0,0 +1,374 @@
+"""Persistent background queue for document ingestion jobs.
+
+Uploads are spooled to disk and recorded as jobs in SQLite, then ingested by
+a fixed number of asyncio workers. Requests return as soon as the job is
+queued, the number of documents ingested at once is bounded centrally, and
+jobs queued or running when the process stopped are resumed on restart.
+"""
+
+import asyncio
+import sqlite3
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, replace
+from enum import StrEnum
+from pathlib import Path
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Columns of the jobs table, in IngestionJob field order
+JOB_COLUMNS = (
+    "job_id", "filename", "path", "size", "status", "stage", "chunks_total",
+    "chunks_done", "error", "created_at", "started_at", "finished_at",
+)
+# Statements built once from the constant column list; values are always bound
+SAVE_JOB_SQL = (
+    f"INSERT OR REPLACE INTO jobs ({', '.join(JOB_COLUMNS)}) "  # noqa: S608
+    f"VALUES ({', '.join('?' for _ in JOB_COLUMNS)})"
+)
+SELECT_JOBS_SQL = f"SELECT {', '.join(JOB_COLUMNS)} FROM jobs"  # noqa: S608
+
+
+class JobStatus(StrEnum):
+    """Lifecycle state of an ingestion job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass
+class IngestionJob:
+    """An uploaded file waiting for or undergoing ingestion.
+
+    Attributes:
+        job_id: Unique job identifier
+        filename: Name of the uploaded file
+        path: Spooled copy of the upload
+        size: Upload size in bytes
+        status: Lifecycle state
+        stage: Current ingestion step (e.g. "loading", "embedding")
+        chunks_total: Chunks the document was split into (0 until chunked)
+        chunks_done: Chunks embedded and stored so far
+        error: Failure reason for failed jobs
+        created_at: Time the job was queued (epoch seconds)
+        started_at: Time a worker picked the job up
+        finished_at: Time the job succeeded or failed
+    """
+
+    job_id: str
+    filename: str
+    path: Path
+    size: int
+    status: JobStatus = JobStatus.QUEUED
+    stage: str = "queued"
+    chunks_total: int = 0
+    chunks_done: int = 0
+    error: str | None = None
+    created_at: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has succeeded or failed."""
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    @property
+    def throughput(self) -> float:
+        """Chunks stored per second since the job started."""
+        if self.started_at is None:
+            return 0.0
+        elapsed = (self.finished_at or time.time()) - self.started_at
+        return self.chunks_done / elapsed if elapsed > 0 else 0.0
+
+
+# Called by ingest functions on the event loop to report progress: stage, chunks done, chunks total
+ProgressCallback = Callable[[str, int | None, int | None], None]
+IngestFunction = Callable[[IngestionJob, ProgressCallback], Awaitable[None]]
+
+
+class IngestionJobStore:
+    """SQLite-backed records of ingestion jobs.
+
+    Example:
+        >>> store = IngestionJobStore()
+        >>> store.insert(IngestionJob("abc", "report.pdf", Path("abc.pdf"), 1024))
+        >>> store.get("abc").status
+        <JobStatus.QUEUED: 'queued'>
+    """
+
+    def __init__(self, db_path: Path | None = None):
+        """
+        Initialize job store with SQLite database.
+
+        Args:
+            db_path: Path to SQLite database file.
+                     Defaults to the configured ingestion jobs path
+        """
+        if db_path is None:
+            from src.config.settings import get_settings
+            db_path = get_settings().ingestion_jobs_path
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._init_database()
+        logger.debug(f"Ingestion jobs at {self.db_path}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the jobs database."""
+        return sqlite3.connect(self.db_path, timeout=30.0)
+
+    def _init_database(self) -> None:
+        """Create database schema if not exists."""
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    filename TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    chunks_total INTEGER NOT NULL,
+                    chunks_done INTEGER NOT NULL,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL
+                )
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_jobs_status
+                ON jobs(status)
+            """)
+
+            conn.commit()
+
+    @staticmethod
+    def _row_to_job(row: tuple) -> IngestionJob:
+        """Build a job from a database row in JOB_COLUMNS order."""
+        job = IngestionJob(*row)
+        job.path = Path(job.path)
+        job.status = JobStatus(job.status)
+        return job
+
+    def insert(self, job: IngestionJob) -> None:
+        """Record a new job."""
+        self.save(job)
+
+    def save(self, job: IngestionJob) -> None:
+        """Write the current state of a job."""
+        values = [getattr(job, column) for column in JOB_COLUMNS]
+        values[2] = str(job.path)
+        values[4] = job.status.value
+        with self._connect() as conn:
+            conn.execute(SAVE_JOB_SQL, values)
+            conn.commit()
+
+    def get(self, job_id: str) -> IngestionJob | None:
+        """Look up a job by id."""
+        with self._connect() as conn:
+            row = conn.execute(SELECT_JOBS_SQL + " WHERE job_id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def unfinished(self) -> list[IngestionJob]:
+        """Queued and running jobs, oldest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                SELECT_JOBS_SQL + " WHERE status IN (?, ?) ORDER BY created_at",
+                (JobStatus.QUEUED.value, JobStatus.RUNNING.value),
+            ).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+
+class IngestionJobQueue:
+    """Bounded pool of asyncio workers ingesting queued jobs.
+
+    The ingest function runs on the event loop and is expected to offload
+    blocking work (parsing, storage writes) to threads. It reports progress
+    through the callback it is given; the job is marked succeeded when it
+    returns and failed when it raises. Spooled uploads are deleted once
+    their job finishes.
+
+    Job records are read and written in worker threads so SQLite never
+    blocks the event loop. Running jobs are served from memory, and their
+    progress is only written when the stage changes or the job finishes.
+
+    Example:
+        >>> queue = IngestionJobQueue(ingest_upload, upload_dir=Path("uploads"), workers=2)
+        >>> await queue.start()
+        >>> job = await queue.submit("report.pdf", upload_path, size)
+        >>> (await queue.get(job.job_id)).stage
+        'embedding'
+    """
+
+    def __init__(
+        self,
+        ingest: IngestFunction,
+        upload_dir: Path | None = None,
+        store: IngestionJobStore | None = None,
+        workers: int = 1,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            ingest: Coroutine function ingesting one job
+            upload_dir: Directory uploads are spooled to before ingestion.
+                        Defaults to the configured upload directory
+            store: Job records (defaults to the configured jobs database)
+            workers: Maximum number of jobs ingested concurrently
+        """
+        if upload_dir is None:
+            from src.config.settings import get_settings
+            upload_dir = get_settings().upload_dir
+
+        self.ingest = ingest
+        self.upload_dir = Path(upload_dir)
+        self.upload_dir.mkdir(parents=True, exist_ok=True)
+        self.store = store or IngestionJobStore()
+        self.workers = workers
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+        # Jobs being ingested, by id; the store lags behind on chunk counts
+        self._running: dict[str, IngestionJob] = {}
+        # Serialises writes so snapshots of a job land in the order taken
+        self._save_lock = asyncio.Lock()
+        self._saves: set[asyncio.Task] = set()
+
+    @staticmethod
+    def new_job_id() -> str:
+        """Generate a job id (also used to name the spooled upload)."""
+        return uuid.uuid4().hex
+
+    async def start(self) -> None:
+        """Resume unfinished jobs and start the workers."""
+        for job in await asyncio.to_thread(self.store.unfinished):
+            if not job.path.exists():
+                await self._finish(job, JobStatus.FAILED, "Uploaded file is no longer available")
+                continue
+            # Interrupted jobs start over, so ingest functions must write idempotently
+            job.status, job.stage, job.chunks_done = JobStatus.QUEUED, "queued", 0
+            await self._persist(job)
+            self._queue.put_nowait(job.job_id)
+            logger.info(f"Resuming ingestion job {job.job_id} ({job.filename})")
+
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Stop the workers; unfinished jobs stay queued for the next start."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        # Let progress already reported reach the store
+        await asyncio.gather(*self._saves, return_exceptions=True)
+
+    async def submit(
+        self,
+        filename: str,
+        path: Path,
+        size: int,
+        job_id: str | None = None,
+    ) -> IngestionJob:
+        """
+        Queue a spooled upload for ingestion.
+
+        Args:
+            filename: Original name of the uploaded file
+            path: Spooled copy of the upload (deleted when the job finishes)
+            size: Upload size in bytes
+            job_id: Job id (default: a new one)
+
+        Returns:
+            The queued job
+        """
+        job = IngestionJob(
+            job_id=job_id or self.new_job_id(),
+            filename=filename,
+            path=path,
+            size=size,
+            created_at=time.time(),
+        )
+        await asyncio.to_thread(self.store.insert, job)
+        await self._queue.put(job.job_id)
+        logger.info(f"Queued ingestion job {job.job_id} ({filename}, {size} bytes)")
+        return job
+
+    async def get(self, job_id: str) -> IngestionJob | None:
+        """Current state of a job (None if unknown)."""
+        job = self._running.get(job_id)
+        if job is not None:
+            return replace(job)
+        return await asyncio.to_thread(self.store.get, job_id)
+
+    def pending(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._queue.qsize()
+
+    async def _worker(self) -> None:
+        """Ingest queued jobs one at a time."""
+        while True:
+            job_id = await self._queue.get()
+            try:
+                job = await asyncio.to_thread(self.store.get, job_id)
+                if job is not None and not job.finished:
+                    await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: IngestionJob) -> None:
+        """Ingest one job, recording progress and outcome."""
+        job.status, job.stage, job.started_at = JobStatus.RUNNING, "starting", time.time()
+        self._running[job.job_id] = job
+        await self._persist(job)
+
+        def report(stage: str, chunks_done: int | None = None, chunks_total: int | None = None) -> None:
+            stage_changed = stage != job.stage
+            job.stage = stage
+            if chunks_done is not None:
+                job.chunks_done = chunks_done
+            if chunks_total is not None:
+                job.chunks_total = chunks_total
+            if stage_changed:
+                self._persist(job)
+
+        try:
+            await self.ingest(job, report)
+        except asyncio.CancelledError:
+            # Shutting down: leave the job for the next start
+            raise
+        except Exception as e:  # noqa: BLE001 - Record any ingestion failure on the job
+            logger.exception(f"Ingestion job {job.job_id} ({job.filename}) failed")
+            await self._finish(job, JobStatus.FAILED, str(e))
+        else:
+            logger.info(f"Ingestion job {job.job_id} ({job.filename}) finished: {job.chunks_done} chunks")
+            await self._finish(job, JobStatus.SUCCEEDED)
+        finally:
+            self._running.pop(job.job_id, None)
+
+    def _persist(self, job: IngestionJob) -> asyncio.Task:
+        """Schedule a write of the job's current state, after any earlier writes."""
+        task = asyncio.create_task(self._save(replace(job)))
+        self._saves.add(task)
+        task.add_done_callback(self._saves.discard)
+        return task
+
+    async def _save(self, snapshot: IngestionJob) -> None:
+        """Write a snapshot of a job from a worker thread."""
+        async with self._save_lock:
+            await asyncio.to_thread(self.store.save, snapshot)
+
+    async def _finish(self, job: IngestionJob, status: JobStatus, error: str | None = None) -> None:
+        """Record a job's outcome and delete its spooled upload."""
+        job.status, job.error, job.finished_at = status, error, time.time()
+        job.stage = "done" if status == JobStatus.SUCCEEDED else "failed"
+        await self._persist(job)
+        job.path.unlink(missing_ok=True)
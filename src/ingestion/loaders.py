@@ -52,6 +52,10 @@ def _get_router() -> ProcessorRouter:
             prefer_docling=True,
             fast_quality_assessment=getattr(settings, "fast_quality_assessment", True),
             cache_quality_assessments=getattr(settings, "cache_quality_assessments", True),
+            persist_quality_assessments=getattr(settings, "persist_quality_assessments", True),
+            quality_assessment_workers=getattr(settings, "quality_assessment_workers", 1),
+            quality_assessment_deadline=getattr(settings, "quality_assessment_deadline", None),
+            quality_assessment_agreement_pages=getattr(settings, "quality_assessment_agreement_pages", None),
             collect_metrics=True,
         )
 
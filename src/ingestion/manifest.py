@@ -0,0 +1,271 @@
+"""Persistent manifest of ingested file fingerprints.
+
+Records path, size, modification time and raw-bytes hash for every file that
+was ingested, so repeat runs over the same directory can skip unchanged and
+duplicate files before any parsing happens.
+"""
+
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+
+from src.utils.hashing import hash_file
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ManifestStatus(StrEnum):
+    """How a file compares with its manifest entry."""
+
+    NEW = "new"
+    CHANGED = "changed"
+    UNCHANGED = "unchanged"
+    DUPLICATE = "duplicate"
+
+
+@dataclass
+class FileFingerprint:
+    """Identity of a file's bytes at a point in time."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    raw_hash: str
+
+
+@dataclass
+class ManifestCheck:
+    """Result of comparing a file with the manifest.
+
+    Attributes:
+        status: How the file compares with what was ingested
+        fingerprint: Current fingerprint of the file
+        document_id: Recorded document for UNCHANGED and CHANGED files (the
+            previous version), or the original for DUPLICATE files
+        previous_document_id: Document stored for this path's previous bytes,
+            to remove once it is replaced; None when another path still
+            refers to that document
+    """
+
+    status: ManifestStatus
+    fingerprint: FileFingerprint
+    document_id: str | None = None
+    previous_document_id: str | None = None
+
+
+class IngestionManifest:
+    """SQLite-backed fingerprints of ingested files.
+
+    A file whose size and modification time match its entry is unchanged
+    without reading it. Otherwise its bytes are hashed in a single streaming
+    pass: an unchanged hash only refreshes the entry, a hash recorded under
+    another path marks a duplicate, and anything else needs ingesting.
+
+    Example:
+        >>> manifest = IngestionManifest()
+        >>> check = manifest.check(Path("report.pdf"))
+        >>> if check.status in (ManifestStatus.NEW, ManifestStatus.CHANGED):
+        ...     document_id = ingest(...)
+        ...     manifest.record(check.fingerprint, document_id)
+    """
+
+    def __init__(self, db_path: Path | None = None):
+        """
+        Initialize manifest with SQLite database.
+
+        Args:
+            db_path: Path to SQLite database file.
+                     Defaults to the configured ingestion manifest path
+        """
+        if db_path is None:
+            from src.config.settings import get_settings
+            db_path = get_settings().ingestion_manifest_path
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._init_database()
+        logger.debug(f"Ingestion manifest at {self.db_path}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the manifest database."""
+        return sqlite3.connect(self.db_path, timeout=30.0)
+
+    def _init_database(self) -> None:
+        """Create database schema if not exists."""
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    raw_hash TEXT NOT NULL,
+                    document_id TEXT
+                )
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_files_raw_hash
+                ON files(raw_hash)
+            """)
+
+            conn.commit()
+
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        """Manifest key for a path."""
+        return str(file_path.resolve())
+
+    def is_unchanged(self, file_path: Path) -> bool:
+        """Check from file metadata alone whether a file is unchanged.
+
+        Args:
+            file_path: File to check
+
+        Returns:
+            True if size and modification time match the manifest entry
+        """
+        try:
+            stats = file_path.stat()
+        except OSError:
+            return False
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT size, mtime_ns FROM files WHERE path = ?", (self._key(file_path),)
+            ).fetchone()
+
+        return row is not None and tuple(row) == (stats.st_size, stats.st_mtime_ns)
+
+    def partition_unchanged(self, file_paths: Iterable[Path]) -> tuple[list[Path], list[Path]]:
+        """Split files by whether size and modification time match their entries.
+
+        No file is read; a file whose metadata changed but whose bytes did not
+        is resolved later by check().
+
+        Args:
+            file_paths: Files to check
+
+        Returns:
+            Tuple of (pending, unchanged) paths, each in input order
+        """
+        with self._connect() as conn:
+            recorded = {
+                path: (size, mtime_ns)
+                for path, size, mtime_ns in conn.execute("SELECT path, size, mtime_ns FROM files")
+            }
+
+        pending: list[Path] = []
+        unchanged: list[Path] = []
+        for file_path in file_paths:
+            entry = recorded.get(self._key(file_path))
+            try:
+                stats = file_path.stat()
+            except OSError:
+                pending.append(file_path)
+                continue
+            if entry == (stats.st_size, stats.st_mtime_ns):
+                unchanged.append(file_path)
+            else:
+                pending.append(file_path)
+
+        return pending, unchanged
+
+    def check(self, file_path: Path) -> ManifestCheck:
+        """Compare a file with the manifest.
+
+        Args:
+            file_path: File to check
+
+        Returns:
+            ManifestCheck with the status and current fingerprint
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        key = self._key(file_path)
+        stats = file_path.stat()
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT size, mtime_ns, raw_hash, document_id FROM files WHERE path = ?",
+                (key,),
+            ).fetchone()
+
+            if row is not None and (row[0], row[1]) == (stats.st_size, stats.st_mtime_ns):
+                fingerprint = FileFingerprint(key, stats.st_size, stats.st_mtime_ns, row[2])
+                return ManifestCheck(ManifestStatus.UNCHANGED, fingerprint, row[3])
+
+            fingerprint = FileFingerprint(key, stats.st_size, stats.st_mtime_ns, hash_file(file_path))
+
+            if row is not None and row[2] == fingerprint.raw_hash:
+                # Touched but not modified: refresh metadata so the next scan skips it
+                conn.execute(
+                    "UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?",
+                    (fingerprint.size, fingerprint.mtime_ns, key),
+                )
+                conn.commit()
+                return ManifestCheck(ManifestStatus.UNCHANGED, fingerprint, row[3])
+
+            original = conn.execute(
+                "SELECT document_id FROM files WHERE raw_hash = ? AND path != ? LIMIT 1",
+                (fingerprint.raw_hash, key),
+            ).fetchone()
+
+            previous = row[3] if row is not None else None
+            if previous is not None and conn.execute(
+                "SELECT 1 FROM files WHERE document_id = ? AND path != ? LIMIT 1",
+                (previous, key),
+            ).fetchone():
+                # Recorded as another file's duplicate: that file still owns it
+                previous = None
+
+        if original is not None:
+            if previous == original[0]:
+                previous = None
+            return ManifestCheck(ManifestStatus.DUPLICATE, fingerprint, original[0], previous)
+        if row is not None:
+            return ManifestCheck(ManifestStatus.CHANGED, fingerprint, row[3], previous)
+        return ManifestCheck(ManifestStatus.NEW, fingerprint)
+
+    def record(self, fingerprint: FileFingerprint, document_id: str | None) -> None:
+        """Record a file as ingested.
+
+        Args:
+            fingerprint: Fingerprint returned by check()
+            document_id: Document the file was stored as (or duplicates)
+        """
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO files (path, size, mtime_ns, raw_hash, document_id)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    size = excluded.size,
+                    mtime_ns = excluded.mtime_ns,
+                    raw_hash = excluded.raw_hash,
+                    document_id = excluded.document_id
+                """,
+                (fingerprint.path, fingerprint.size, fingerprint.mtime_ns, fingerprint.raw_hash, document_id),
+            )
+            conn.commit()
+
+    def forget(self, file_path: Path) -> None:
+        """Remove a file's entry so it is ingested again."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM files WHERE path = ?", (self._key(file_path),))
+            conn.commit()
+
+    def clear(self) -> None:
+        """Remove all entries, e.g. after the document store is cleared."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM files")
+            conn.commit()
+
+    def count(self) -> int:
+        """Number of files recorded."""
+        with self._connect() as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM files").fetchone()[0])
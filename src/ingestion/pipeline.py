@@ -0,0 +1,495 @@
+"""Staged, multi-worker batch ingestion.
+
+Files flow through three stages so that CPU-bound parsing, model-bound
+embedding and vector store writes overlap instead of running one document
+at a time:
+
+1. Load and chunk in a worker pool (processes by default)
+2. Embed through an EmbeddingBatcher, which packs chunks from several
+   documents into token-budgeted embed_batch calls
+3. Write, batching several documents into one vector store add
+
+A bounded number of documents is in flight across all stages, so memory use
+stays flat however large the batch is.
+"""
+
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from rich.progress import Progress
+
+from src.chunking.splitters import chunk_document
+from src.config.constants import INGEST_PIPELINE_DOCS_PER_WORKER, INGEST_WRITE_BATCH_CHUNKS
+from src.embeddings.base import BaseEmbedder
+from src.embeddings.batcher import EmbeddingBatcher
+from src.exceptions import MemoryLimitExceededError
+from src.ingestion.loaders import load_document
+from src.ingestion.manifest import ManifestCheck
+from src.ingestion.models import Document
+from src.storage.vector_store import VectorStore
+from src.utils.logging import get_logger
+from src.utils.resource_governor import ResourcePriority
+
+if TYPE_CHECKING:
+    from src.ingestion.batch import BatchIngester, BatchSummary, IngestionResult
+
+logger = get_logger(__name__)
+
+
+def prepare_document(file_path: Path) -> Document:
+    """Load and chunk a document (runs in a loader worker).
+
+    Args:
+        file_path: Path to document
+
+    Returns:
+        Document with chunks
+    """
+    return chunk_document(load_document(file_path))
+
+
+@dataclass
+class _WorkItem:
+    """A file moving through the pipeline."""
+
+    index: int
+    file_path: Path
+    check: ManifestCheck | None
+    operation_id: str | None
+    future: "Future[Document] | None" = None
+    document: Document | None = None
+    embeddings: "Future[np.ndarray] | np.ndarray | None" = None
+
+
+@dataclass
+class _Done:
+    """End-of-stream marker carrying the number of items sent before it."""
+
+    count: int
+
+
+@dataclass
+class _Batch:
+    """Documents that travel between stages together."""
+
+    items: list[_WorkItem] = field(default_factory=list)
+    chunks: int = 0
+
+    def add(self, item: _WorkItem) -> None:
+        self.items.append(item)
+        self.chunks += len(item.document.chunks) if item.document else 0
+
+
+class IngestionPipeline:
+    """Pipelined ingestion for a BatchIngester.
+
+    Reuses the ingester's settings (duplicate handling, manifest, keyword
+    index, resource governor, error policy) and reports the same per-file
+    IngestionResult values as the serial path, in input order.
+
+    Example:
+        >>> ingester = BatchIngester(console, workers=4)
+        >>> summary = IngestionPipeline(ingester).run(file_paths)
+    """
+
+    def __init__(
+        self,
+        ingester: "BatchIngester",
+        use_process_pool: bool = True,
+        max_in_flight: int | None = None,
+        token_budget: int | None = None,
+        write_batch_chunks: int = INGEST_WRITE_BATCH_CHUNKS,
+    ):
+        """Initialize pipeline.
+
+        Args:
+            ingester: Batch ingester whose settings and helpers to use
+            use_process_pool: Load and chunk in processes rather than threads
+            max_in_flight: Documents admitted but not yet finished
+                (default: INGEST_PIPELINE_DOCS_PER_WORKER per worker)
+            token_budget: Fixed embedding batch budget in padded tokens
+                (default: set by the embedder's BatchTuner)
+            write_batch_chunks: Chunks per vector store write
+        """
+        self.ingester = ingester
+        self.workers = max(1, ingester.workers)
+        self.use_process_pool = use_process_pool
+        self.max_in_flight = max_in_flight or self.workers * INGEST_PIPELINE_DOCS_PER_WORKER
+        self.token_budget = token_budget
+        self.write_batch_chunks = write_batch_chunks
+
+        self._results: dict[int, IngestionResult] = {}
+        self._results_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._stop = threading.Event()
+        # Content hashes admitted in this run, for duplicates within the batch
+        self._batch_hashes: dict[str, str] = {}
+        self._progress: Progress | None = None
+        self._task: Any = None
+        self._total = 0
+        self._submitted = 0
+
+    def _create_executor(self) -> Executor:
+        """Create the loader pool."""
+        if self.use_process_pool:
+            # Spawn rather than fork: the stage threads may hold locks
+            return ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ingest-load")
+
+    def run(self, file_paths: list[Path], progress: Progress | None = None) -> "BatchSummary":
+        """Ingest files through the pipeline.
+
+        Args:
+            file_paths: List of document paths to ingest
+            progress: Optional Rich progress bar
+
+        Returns:
+            BatchSummary with statistics and per-file results in input order
+        """
+        from src.ingestion.batch import summarize_results
+
+        vector_store, embedder = self._shared_resources()
+
+        self._total = len(file_paths)
+        self._progress = progress
+        if progress:
+            self._task = progress.add_task("[cyan]Processing documents...", total=len(file_paths))
+
+        # In-flight slots bound both queues
+        prepared: queue.Queue[_WorkItem | _Done] = queue.Queue()
+        embedding: queue.Queue[_WorkItem | _Done] = queue.Queue()
+        batcher = EmbeddingBatcher(
+            embedder, token_budget=self.token_budget, cache=self.ingester.embedding_cache
+        )
+
+        embed_thread = threading.Thread(
+            target=self._embed_stage, args=(prepared, embedding, vector_store, batcher), name="ingest-embed"
+        )
+        write_thread = threading.Thread(
+            target=self._write_stage, args=(embedding, vector_store), name="ingest-write"
+        )
+        embed_thread.start()
+        write_thread.start()
+
+        self._submitted = 0
+        executor = self._create_executor()
+        try:
+            self._dispatch(file_paths, executor, prepared, vector_store)
+        finally:
+            # Count every file submitted, even if admission failed part-way,
+            # so the stages drain all documents already in flight
+            prepared.put(_Done(self._submitted))
+            embed_thread.join()
+            write_thread.join()
+            batcher.close()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        if progress and self._task is not None:
+            progress.update(self._task, completed=len(file_paths))
+
+        results = [self._results[i] for i in sorted(self._results)]
+
+        # Persist keyword index once for the whole batch
+        summary = summarize_results(results)
+        if self.ingester.bm25_retriever is not None and summary.total_chunks:
+            self.ingester.bm25_retriever.save()
+
+        return summary
+
+    @staticmethod
+    def _shared_resources() -> tuple[VectorStore, BaseEmbedder]:
+        """Create the vector store and embedder exactly as the serial path does."""
+        from src.ingestion import batch
+
+        return batch.VectorStore(), batch.get_embedder()
+
+    # -- Stage 0: admission --------------------------------------------------
+
+    def _dispatch(
+        self,
+        file_paths: list[Path],
+        executor: Executor,
+        prepared: "queue.Queue[_WorkItem | _Done]",
+        vector_store: VectorStore,
+    ) -> None:
+        """Admit files into the pipeline, counting submissions in ``_submitted``."""
+        from src.ingestion.batch import IngestionResult, IngestionStatus
+
+        ingester = self.ingester
+
+        for i, file_path in enumerate(file_paths):
+            if self._stop.is_set():
+                break
+
+            # Check memory before admitting another document
+            try:
+                ingester._check_memory_limit(f"document_{i + 1}")
+            except MemoryLimitExceededError as e:
+                logger.warning(f"Memory limit approaching, forcing GC: {e}")
+                ingester._force_garbage_collection()
+                ingester._check_memory_limit(f"document_{i + 1}_post_gc")
+
+            try:
+                check, result = ingester._check_manifest(file_path, vector_store)
+            except OSError as e:
+                self._finish(i, IngestionResult(file_path=file_path, status=IngestionStatus.FAILED, error=str(e)))
+                continue
+            if result is not None:
+                self._finish(i, result)
+                continue
+
+            # Wait for a free slot: bounds documents held across all stages
+            self._slots.acquire()
+
+            operation_id = None
+            if ingester.use_resource_governor:
+                operation_id = f"ingest_{i + 1}_{file_path.stem}"
+                try:
+                    granted = ingester.governor.request_resources(
+                        operation_id=operation_id,
+                        memory_mb=100,
+                        cpu_percent=10.0,
+                        priority=ResourcePriority.NORMAL,
+                        timeout=30.0,
+                    )
+                    if not granted:
+                        raise TimeoutError("timed out waiting for resources")
+                except Exception as e:
+                    logger.error(f"Resource reservation failed for {file_path}: {e}")
+                    self._slots.release()
+                    self._finish(
+                        i,
+                        IngestionResult(
+                            file_path=file_path,
+                            status=IngestionStatus.FAILED,
+                            error=f"Resource unavailable: {str(e)}",
+                        ),
+                    )
+                    continue
+
+            item = _WorkItem(index=i, file_path=file_path, check=check, operation_id=operation_id)
+            item.future = executor.submit(prepare_document, file_path)
+            item.future.add_done_callback(lambda _future, item=item: prepared.put(item))
+            self._submitted += 1
+
+    # -- Stage 2: embedding --------------------------------------------------
+
+    def _embed_stage(
+        self,
+        prepared: "queue.Queue[_WorkItem | _Done]",
+        embedding: "queue.Queue[_WorkItem | _Done]",
+        vector_store: VectorStore,
+        batcher: EmbeddingBatcher,
+    ) -> None:
+        """Submit the chunks of each loaded document to the embedding batcher."""
+        received = 0
+        expected: int | None = None
+
+        while expected is None or received < expected:
+            message = prepared.get()
+            if isinstance(message, _Done):
+                expected = message.count
+                continue
+
+            received += 1
+            item = self._admit(message, vector_store)
+            if item is None:
+                continue
+
+            assert item.document is not None
+            item.embeddings = batcher.submit([chunk.text for chunk in item.document.chunks])
+            embedding.put(item)
+
+        embedding.put(_Done(0))
+
+    def _admit(self, item: _WorkItem, vector_store: VectorStore) -> _WorkItem | None:
+        """Resolve a loader result, returning the item if it still needs storing."""
+        from src.ingestion.batch import IngestionResult, IngestionStatus
+
+        ingester = self.ingester
+        try:
+            assert item.future is not None
+            document = item.future.result()
+
+            check = item.check
+            if ingester.skip_duplicates:
+                content_hash = document.metadata.content_hash
+                existing_doc_id = self._batch_hashes.get(content_hash) or ingester._find_duplicate(
+                    document, vector_store
+                )
+                if existing_doc_id is not None:
+                    ingester._remove_previous_version(check, vector_store)
+                    ingester._record(check, existing_doc_id)
+                    self._finish(
+                        item.index,
+                        IngestionResult(
+                            file_path=item.file_path,
+                            status=IngestionStatus.DUPLICATE,
+                            duplicate_of=existing_doc_id,
+                        ),
+                        item,
+                    )
+                    return None
+                self._batch_hashes[content_hash] = document.document_id
+
+        except Exception as e:
+            logger.error(f"Failed to ingest {item.file_path}: {e}", exc_info=True)
+            self._finish(
+                item.index,
+                IngestionResult(file_path=item.file_path, status=IngestionStatus.FAILED, error=str(e)),
+                item,
+            )
+            return None
+
+        item.document = document
+        item.future = None
+        return item
+
+    # -- Stage 3: writing ----------------------------------------------------
+
+    def _write_stage(self, embedding: "queue.Queue[_WorkItem | _Done]", vector_store: VectorStore) -> None:
+        """Write embedded documents to the stores in batched adds."""
+        pending = _Batch()
+        done = False
+
+        while not done:
+            try:
+                message = embedding.get(block=not pending.items)
+            except queue.Empty:
+                # Nothing else ready: write what we have rather than wait
+                self._write(pending, vector_store)
+                pending = _Batch()
+                continue
+
+            if isinstance(message, _Done):
+                done = True
+            elif self._await_embeddings(message):
+                pending.add(message)
+
+            if pending.chunks >= self.write_batch_chunks or (done and pending.items):
+                self._write(pending, vector_store)
+                pending = _Batch()
+
+    def _await_embeddings(self, item: _WorkItem) -> bool:
+        """Wait for a document's embeddings, reporting it failed if embedding failed."""
+        assert isinstance(item.embeddings, Future)
+        try:
+            item.embeddings = item.embeddings.result()
+        except Exception as e:
+            self._fail(_Batch([item]), e)
+            return False
+        return True
+
+    def _write(self, batch: _Batch, vector_store: VectorStore) -> None:
+        """Store one batch of documents with a single vector store add."""
+        from src.ingestion.batch import IngestionResult, IngestionStatus, chunk_metadatas
+
+        if not batch.items:
+            return
+
+        ids: list[str] = []
+        texts: list[str] = []
+        metadatas: list[dict[str, Any]] = []
+        vectors = []
+        for item in batch.items:
+            document = item.document
+            assert document is not None
+            ids.extend(chunk.chunk_id for chunk in document.chunks)
+            texts.extend(chunk.text for chunk in document.chunks)
+            metadatas.extend(chunk_metadatas(document))
+            if document.chunks:
+                vectors.append(np.asarray(item.embeddings))
+
+        try:
+            if ids:
+                vector_store.add(
+                    ids=ids,
+                    embeddings=np.vstack(vectors),
+                    documents=texts,
+                    metadatas=metadatas,
+                )
+        except Exception as e:
+            self._fail(batch, e)
+            return
+
+        # The chunks are stored and searchable by vector, so a keyword index
+        # failure is reported without failing the documents
+        if ids and self.ingester.bm25_retriever is not None:
+            try:
+                self.ingester.bm25_retriever.add_documents(texts, ids, metadatas)
+            except Exception as e:
+                logger.error(f"Failed to add {len(ids)} chunks to the keyword index: {e}", exc_info=True)
+
+        for item in batch.items:
+            document = item.document
+            assert document is not None
+            # Only drop the previous version once its replacement is stored
+            try:
+                self.ingester._remove_previous_version(
+                    item.check, vector_store, keep=(chunk.chunk_id for chunk in document.chunks)
+                )
+            except Exception as e:
+                self._fail(_Batch([item]), e)
+                continue
+            self.ingester._record(item.check, document.document_id)
+            self._finish(
+                item.index,
+                IngestionResult(
+                    file_path=item.file_path,
+                    status=IngestionStatus.SUCCESS,
+                    document_id=document.document_id,
+                    chunks=len(document.chunks),
+                ),
+                item,
+            )
+
+    # -- Bookkeeping ---------------------------------------------------------
+
+    def _fail(self, batch: _Batch, error: Exception) -> None:
+        """Report every document in a batch as failed."""
+        from src.ingestion.batch import IngestionResult, IngestionStatus
+
+        for item in batch.items:
+            logger.error(f"Failed to ingest {item.file_path}: {error}", exc_info=True)
+            self._finish(
+                item.index,
+                IngestionResult(file_path=item.file_path, status=IngestionStatus.FAILED, error=str(error)),
+                item,
+            )
+
+    def _finish(self, index: int, result: "IngestionResult", item: _WorkItem | None = None) -> None:
+        """Record a file's result and release what it held."""
+        from src.ingestion.batch import IngestionStatus
+
+        if item is not None:
+            if item.operation_id is not None:
+                self.ingester.governor.release_resources(item.operation_id)
+            self._slots.release()
+
+        with self._results_lock:
+            self._results[index] = result
+            completed = len(self._results)
+
+        if self._progress and self._task is not None:
+            self._progress.update(
+                self._task,
+                description=f"[cyan][{completed}/{self._total}] {result.file_path.name}",
+                completed=completed,
+            )
+
+        if (
+            result.status == IngestionStatus.FAILED
+            and not self.ingester.continue_on_error
+            and not self._stop.is_set()
+        ):
+            self._stop.set()
+            self.ingester.console.print(f"[red]Aborting due to error: {result.error}[/red]")
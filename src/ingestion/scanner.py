@@ -7,6 +7,7 @@ respecting ignore patterns and security constraints.
 import fnmatch
 from pathlib import Path
 
+from src.ingestion.manifest import IngestionManifest
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -38,6 +39,7 @@ class DocumentScanner:
         follow_symlinks: bool = False,
         max_depth: int | None = None,
         ignore_patterns: set[str] | None = None,
+        manifest: IngestionManifest | None = None,
     ):
         """Initialize document scanner.
 
@@ -45,10 +47,15 @@ class DocumentScanner:
             follow_symlinks: Whether to follow symbolic links
             max_depth: Maximum directory depth (None for unlimited)
             ignore_patterns: Set of patterns to ignore (fnmatch style)
+            manifest: Optional ingestion manifest; files whose size and
+                modification time match it are left out of scan results
         """
         self.follow_symlinks = follow_symlinks
         self.max_depth = max_depth
         self.ignore_patterns = ignore_patterns or DEFAULT_IGNORE_PATTERNS
+        self.manifest = manifest
+        # Files left out of the last scan because the manifest has them unchanged
+        self.unchanged: list[Path] = []
 
     def scan(self, path: Path) -> list[Path]:
         """
@@ -61,17 +68,19 @@ class DocumentScanner:
             path: File or directory path to scan
 
         Returns:
-            Sorted list of absolute paths to documents
+            Sorted list of absolute paths to documents. With a manifest,
+            unchanged files are excluded and listed in ``self.unchanged``.
 
         Raises:
             ValueError: If path is neither a file nor directory
         """
         path = path.resolve()  # Convert to absolute path
+        self.unchanged = []
 
         if path.is_file():
             # Single file - check if supported
             if self._is_supported_format(path):
-                return [path]
+                return self._skip_unchanged([path])
             else:
                 logger.warning(f"Unsupported file format: {path}")
                 return []
@@ -84,7 +93,24 @@ class DocumentScanner:
         self._scan_recursive(path, depth=0, results=documents)
 
         # Return sorted for deterministic order
-        return sorted(documents)
+        return self._skip_unchanged(sorted(documents))
+
+    def _skip_unchanged(self, documents: list[Path]) -> list[Path]:
+        """Drop documents the manifest records as unchanged.
+
+        Args:
+            documents: Candidate document paths
+
+        Returns:
+            Documents that are new or may have changed
+        """
+        if self.manifest is None:
+            return documents
+
+        pending, self.unchanged = self.manifest.partition_unchanged(documents)
+        if self.unchanged:
+            logger.info(f"Skipping {len(self.unchanged)} unchanged documents")
+        return pending
 
     def _scan_recursive(
         self, dir_path: Path, depth: int, results: list[Path]
@@ -20,6 +20,7 @@ Usage:
     route = router.route(Path("document.pdf"))
 """
 
+from src.processing.assessment_cache import AssessmentCache
 from src.processing.base import (
     BaseProcessor,
     ProcessedDocument,
@@ -41,6 +42,7 @@ __all__ = [
     "QualityAssessment",
     "QualityAssessor",
     "PageQuality",
+    "AssessmentCache",
     "ProcessingRoute",
     "ProcessorRouter",
     "RouterConfig",
@@ -0,0 +1,181 @@
+"""
+Persistent cache of document quality assessments.
+
+Quality assessment renders and analyses PDF pages with PyMuPDF and OpenCV,
+which dominates routing time. This cache stores assessments in SQLite in
+the data directory, keyed by a fingerprint of the file's content and a
+version string describing the assessor settings, so re-ingesting or
+re-routing a known file in a new process skips assessment entirely.
+
+Routing decisions are derived from the cached assessment and the current
+router thresholds, so changing thresholds never serves a stale route.
+
+v0.3.4b: Intelligent Routing
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from src.processing.quality_assessor import PageQuality, QualityAssessment
+from src.utils.hashing import hash_file
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class AssessmentCache:
+    """
+    SQLite-backed quality assessments, keyed by content fingerprint and version.
+
+    The content fingerprint is the SHA-256 of the file. Paths are recorded
+    with their size and modification time, so an unchanged file is not
+    re-hashed; a renamed or copied file is hashed once and then hits the
+    assessment stored for its content.
+
+    Example:
+        >>> cache = AssessmentCache()
+        >>> cache.put(Path("report.pdf"), assessor.cache_version, assessment)
+        >>> cache.get(Path("report.pdf"), assessor.cache_version).overall_score
+        0.92
+    """
+
+    def __init__(self, db_path: Path | None = None):
+        """
+        Initialise assessment cache with SQLite database.
+
+        Args:
+            db_path: Path to SQLite database file.
+                     Defaults to the configured quality assessment cache path
+        """
+        if db_path is None:
+            from src.config.settings import get_settings
+            db_path = get_settings().quality_assessment_cache_path
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._init_database()
+        logger.debug(f"Quality assessment cache at {self.db_path}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the cache database."""
+        return sqlite3.connect(self.db_path, timeout=30.0)
+
+    def _init_database(self) -> None:
+        """Create database schema if not exists."""
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    fingerprint TEXT NOT NULL
+                )
+            """)
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS assessments (
+                    fingerprint TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    assessment TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (fingerprint, version)
+                )
+            """)
+
+            conn.commit()
+
+    def _fingerprint(self, conn: sqlite3.Connection, file_path: Path) -> str:
+        """Content fingerprint of a file, hashing only if it changed since last seen."""
+        key = str(file_path.resolve())
+        stats = file_path.stat()
+
+        row = conn.execute(
+            "SELECT size, mtime_ns, fingerprint FROM files WHERE path = ?", (key,)
+        ).fetchone()
+        if row is not None and (row[0], row[1]) == (stats.st_size, stats.st_mtime_ns):
+            return row[2]
+
+        fingerprint = hash_file(file_path)
+        conn.execute(
+            "INSERT OR REPLACE INTO files (path, size, mtime_ns, fingerprint) VALUES (?, ?, ?, ?)",
+            (key, stats.st_size, stats.st_mtime_ns, fingerprint),
+        )
+        conn.commit()
+        return fingerprint
+
+    @staticmethod
+    def _encode(assessment: QualityAssessment) -> str:
+        """Serialise an assessment to JSON."""
+        return json.dumps(asdict(assessment), default=str)
+
+    @staticmethod
+    def _decode(data: str) -> QualityAssessment:
+        """Rebuild an assessment from JSON."""
+        values = json.loads(data)
+        values["page_scores"] = [PageQuality(**page) for page in values["page_scores"]]
+        return QualityAssessment(**values)
+
+    def get(self, file_path: Path, version: str) -> QualityAssessment | None:
+        """
+        Look up the stored assessment of a file's content.
+
+        Args:
+            file_path: Path to document
+            version: Assessor version string the assessment must match
+
+        Returns:
+            Stored assessment, or None if the content was not assessed
+            with this version
+        """
+        with self._connect() as conn:
+            fingerprint = self._fingerprint(conn, file_path)
+            row = conn.execute(
+                "SELECT assessment FROM assessments WHERE fingerprint = ? AND version = ?",
+                (fingerprint, version),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        try:
+            assessment = self._decode(row[0])
+        except (ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable cached assessment for {file_path.name}: {e}")
+            return None
+
+        # The same content may be stored under another name
+        assessment.metadata["file_name"] = file_path.name
+        return assessment
+
+    def put(self, file_path: Path, version: str, assessment: QualityAssessment) -> None:
+        """
+        Store the assessment of a file's content.
+
+        Args:
+            file_path: Path to document
+            version: Assessor version string the assessment was made with
+            assessment: Quality assessment to store
+        """
+        with self._connect() as conn:
+            fingerprint = self._fingerprint(conn, file_path)
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO assessments (fingerprint, version, assessment, created_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (fingerprint, version, self._encode(assessment), time.time()),
+            )
+            conn.commit()
+
+    def clear(self) -> None:
+        """Drop all stored assessments."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM assessments")
+            conn.execute("DELETE FROM files")
+            conn.commit()
@@ -12,15 +12,24 @@ v0.3.4b: Intelligent Routing
 from __future__ import annotations
 
 import hashlib
+import multiprocessing
 import time
+from concurrent.futures import FIRST_COMPLETED, BrokenExecutor, Executor, ProcessPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from src.config.constants import QUALITY_PAGES_PER_SHARD
 from src.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from src.processing.assessment_cache import AssessmentCache
+
 logger = get_logger(__name__)
 
+# Bump when page heuristics or scoring change, invalidating persisted assessments
+ASSESSOR_VERSION = 1
+
 
 @dataclass
 class PageQuality:
@@ -117,6 +126,13 @@ class QualityAssessor:
     - Per-page quality scoring
     - Overall quality aggregation
 
+    In full mode, long documents can be assessed by a pool of worker
+    processes, each opening the PDF itself and assessing a range of pages.
+    The pool is started on first use and reused for later documents until
+    :meth:`shutdown`. Assessment stops early once enough pages agree on
+    born-digital vs scanned, or when a deadline passes (killing shards
+    still running), so routing a 1,000-page file takes bounded time.
+
     Example:
         >>> assessor = QualityAssessor(fast_mode=True, cache_enabled=True)
         >>> assessment = assessor.assess(Path("document.pdf"))
@@ -129,6 +145,10 @@ class QualityAssessor:
         fast_mode: bool = True,
         cache_enabled: bool = True,
         max_pages_to_analyze: int = 3,
+        workers: int = 1,
+        deadline: float | None = None,
+        agreement_pages: int | None = None,
+        persistent_cache: AssessmentCache | None = None,
     ):
         """
         Initialise quality assessor.
@@ -137,11 +157,24 @@ class QualityAssessor:
             fast_mode: Enable fast mode (analyse subset of pages)
             cache_enabled: Enable quality assessment caching
             max_pages_to_analyze: Maximum pages to analyse in fast mode
+            workers: Worker processes assessing pages in parallel
+                     (1 assesses pages serially in this process)
+            deadline: Stop assessing pages after this many seconds
+                      and aggregate the pages assessed so far
+            agreement_pages: Stop once this many pages are assessed and
+                             all agree on born-digital vs scanned
+            persistent_cache: On-disk cache shared across processes
+                              (used only when cache_enabled)
         """
         self.fast_mode = fast_mode
         self.cache_enabled = cache_enabled
         self.max_pages_to_analyze = max_pages_to_analyze
+        self.workers = workers
+        self.deadline = deadline
+        self.agreement_pages = agreement_pages
+        self.persistent_cache = persistent_cache if cache_enabled else None
         self._cache: dict[str, QualityAssessment] = {}
+        self._executor: Executor | None = None
 
         # Lazy imports for heavy dependencies
         self._pymupdf = None
@@ -150,7 +183,7 @@ class QualityAssessor:
 
         logger.debug(
             f"Quality assessor initialised: "
-            f"fast_mode={fast_mode}, cache_enabled={cache_enabled}"
+            f"fast_mode={fast_mode}, cache_enabled={cache_enabled}, workers={workers}"
         )
 
     def assess(self, file_path: Path) -> QualityAssessment:
@@ -179,6 +212,13 @@ class QualityAssessor:
             logger.debug(f"Using cached quality assessment for {file_path.name}")
             return self._cache[cache_key]
 
+        if self.persistent_cache is not None:
+            stored = self.persistent_cache.get(file_path, self.cache_version)
+            if stored is not None:
+                logger.debug(f"Using persisted quality assessment for {file_path.name}")
+                self._cache[cache_key] = stored
+                return stored
+
         start_time = time.time()
         logger.debug(f"Assessing document quality: {file_path.name}")
 
@@ -189,6 +229,13 @@ class QualityAssessor:
             # Cache result
             if self.cache_enabled:
                 self._cache[cache_key] = assessment
+            # Fallbacks and deadline-truncated results are retried by later processes
+            if (
+                self.persistent_cache is not None
+                and not assessment.metadata.get("fallback")
+                and assessment.metadata.get("early_exit") != "deadline"
+            ):
+                self.persistent_cache.put(file_path, self.cache_version, assessment)
 
             duration = time.time() - start_time
             logger.info(
@@ -205,6 +252,21 @@ class QualityAssessor:
             # Return conservative fallback assessment
             return self._fallback_assessment(file_path, str(e))
 
+    @property
+    def cache_version(self) -> str:
+        """
+        Version string of the settings that determine assessment results.
+
+        Persisted assessments are only reused by an assessor with the
+        same version, so changing the heuristics or page selection
+        re-assesses documents. The deadline is not part of it: assessments
+        cut short by the deadline are never persisted.
+        """
+        return (
+            f"v{ASSESSOR_VERSION}:fast={self.fast_mode}:pages={self.max_pages_to_analyze}:"
+            f"agreement={self.agreement_pages}"
+        )
+
     def _cache_key(self, file_path: Path) -> str:
         """
         Generate cache key from file path, size, and modification time.
@@ -252,20 +314,182 @@ class QualityAssessor:
 
         logger.debug(
             f"Analysing {pages_to_analyze} of {page_count} pages "
-            f"(fast_mode={self.fast_mode})"
+            f"(fast_mode={self.fast_mode}, workers={self.workers})"
         )
 
-        # Analyse each page
+        if self.workers > 1 and pages_to_analyze > QUALITY_PAGES_PER_SHARD:
+            # Workers open the PDF themselves
+            doc.close()
+            page_scores, early_exit = self._assess_pages_parallel(file_path, pages_to_analyze)
+        else:
+            page_scores, early_exit = self._assess_pages_serial(doc, page_indices)
+            doc.close()
+
+        # Aggregate results
+        if not page_scores and early_exit == "deadline":
+            # No shard finished in time: nothing was assessed
+            assessment = self._fallback_assessment(
+                file_path, f"Deadline of {self.deadline}s passed before any page was assessed"
+            )
+            assessment.metadata.update(total_pages=page_count, pages_analyzed=0)
+        else:
+            assessment = self._aggregate_assessment(page_scores, page_count, file_path)
+        if early_exit is not None:
+            logger.debug(
+                f"Stopped assessing {file_path.name} early ({early_exit}) "
+                f"after {len(page_scores)} of {pages_to_analyze} pages"
+            )
+            assessment.metadata["early_exit"] = early_exit
+        return assessment
+
+    def _early_exit(self, page_scores: list[PageQuality], start_time: float) -> str | None:
+        """
+        Check whether page assessment can stop before every page is assessed.
+
+        Args:
+            page_scores: Pages assessed so far
+            start_time: time.monotonic() when page assessment started
+
+        Returns:
+            "deadline" or "agreement" if assessment should stop, else None
+        """
+        if self.deadline is not None and time.monotonic() - start_time >= self.deadline:
+            return "deadline"
+        if (
+            self.agreement_pages is not None
+            and len(page_scores) >= self.agreement_pages
+            and len({p.is_born_digital for p in page_scores}) == 1
+        ):
+            return "agreement"
+        return None
+
+    def _assess_pages_serial(
+        self,
+        doc: Any,
+        page_indices: list[int],
+    ) -> tuple[list[PageQuality], str | None]:
+        """
+        Assess pages one after another in this process.
+
+        Args:
+            doc: Open PyMuPDF document
+            page_indices: Pages to assess (0-indexed)
+
+        Returns:
+            Page assessments and the early-exit reason (None if all pages were assessed)
+        """
+        start_time = time.monotonic()
         page_scores: list[PageQuality] = []
-        for page_idx in page_indices:
+        for position, page_idx in enumerate(page_indices):
             page = doc[page_idx]
-            page_quality = self._assess_page(page, page_idx + 1)
-            page_scores.append(page_quality)
+            page_scores.append(self._assess_page(page, page_idx + 1))
 
-        doc.close()
+            if position + 1 < len(page_indices):
+                early_exit = self._early_exit(page_scores, start_time)
+                if early_exit is not None:
+                    return page_scores, early_exit
 
-        # Aggregate results
-        return self._aggregate_assessment(page_scores, page_count, file_path)
+        return page_scores, None
+
+    def _create_executor(self) -> Executor:
+        """Create the page assessment pool."""
+        # Spawn rather than fork: callers may be multi-threaded
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _get_executor(self) -> Executor:
+        """Return the page assessment pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = self._create_executor()
+        return self._executor
+
+    def _terminate_executor(self) -> None:
+        """Kill the pool's workers without waiting for running shards.
+
+        A new pool is created on next use.
+        """
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+
+        # Executors cannot stop running tasks, so end the worker processes
+        processes = list((getattr(executor, "_processes", None) or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+        logger.debug(f"Terminated {len(processes)} page assessment workers")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the page assessment pool.
+
+        Args:
+            wait: Wait for running shards to complete
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+            logger.debug("Quality assessor pool shutdown")
+
+    def _assess_pages_parallel(
+        self,
+        file_path: Path,
+        page_count: int,
+    ) -> tuple[list[PageQuality], str | None]:
+        """
+        Assess the first page_count pages in shards across worker processes.
+
+        Args:
+            file_path: Path to PDF file
+            page_count: Number of pages to assess
+
+        Returns:
+            Page assessments in page order and the early-exit reason
+            (None if all pages were assessed)
+        """
+        start_time = time.monotonic()
+        page_scores: list[PageQuality] = []
+        early_exit = None
+
+        executor = self._get_executor()
+        pending = {
+            executor.submit(
+                _assess_page_range,
+                str(file_path),
+                start,
+                min(start + QUALITY_PAGES_PER_SHARD, page_count),
+            )
+            for start in range(0, page_count, QUALITY_PAGES_PER_SHARD)
+        }
+        try:
+            while pending:
+                timeout = None
+                if self.deadline is not None:
+                    timeout = max(0.0, self.deadline - (time.monotonic() - start_time))
+
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page_scores.extend(future.result())
+
+                if pending:
+                    early_exit = self._early_exit(page_scores, start_time)
+                    if early_exit is not None:
+                        break
+        except BrokenExecutor:
+            # A worker died; start a new pool for the next document
+            self._executor = None
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+            # Shards still running past the deadline are killed; after
+            # agreement they are short and left to finish in the pool
+            if early_exit == "deadline" and not all(future.done() for future in pending):
+                self._terminate_executor()
+
+        page_scores.sort(key=lambda p: p.page_number)
+        return page_scores, early_exit
 
     def _assess_page(self, page: Any, page_number: int) -> PageQuality:
         """
@@ -682,6 +906,7 @@ class QualityAssessor:
             "total_pages": total_pages,
             "pages_analyzed": len(page_scores),
             "fast_mode": self.fast_mode,
+            "workers": self.workers,
         }
 
         return QualityAssessment(
@@ -732,6 +957,35 @@ class QualityAssessor:
         )
 
     def clear_cache(self) -> None:
-        """Clear the quality assessment cache."""
+        """Clear the quality assessment cache, including persisted assessments."""
         self._cache.clear()
+        if self.persistent_cache is not None:
+            self.persistent_cache.clear()
         logger.debug("Quality assessment cache cleared")
+
+
+def _assess_page_range(file_path: str, start: int, stop: int) -> list[PageQuality]:
+    """
+    Assess a range of pages in a worker process.
+
+    Each worker opens the PDF itself, so only the path and the page
+    assessments cross the process boundary.
+
+    Args:
+        file_path: Path to PDF file
+        start: First page to assess (0-indexed)
+        stop: Page after the last page to assess
+
+    Returns:
+        Page quality metrics for the range
+    """
+    import fitz
+
+    assessor = QualityAssessor(fast_mode=False, cache_enabled=False)
+    assessor._pymupdf = fitz
+
+    doc = fitz.open(file_path)
+    try:
+        return [assessor._assess_page(doc[page_idx], page_idx + 1) for page_idx in range(start, stop)]
+    finally:
+        doc.close()
@@ -13,6 +13,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from src.processing.assessment_cache import AssessmentCache
 from src.processing.base import BaseProcessor, ProcessorConfig
 from src.processing.quality_assessor import QualityAssessment, QualityAssessor
 from src.utils.logging import get_logger
@@ -32,6 +33,11 @@ class RouterConfig:
         enable_paddleocr_fallback: Enable PaddleOCR fallback (v0.3.4c feature)
         fast_quality_assessment: Use fast quality assessment mode
         cache_quality_assessments: Cache quality assessment results
+        persist_quality_assessments: Also cache assessments on disk, across processes
+        quality_assessment_workers: Worker processes assessing pages in parallel
+        quality_assessment_deadline: Seconds after which page assessment stops (None: no limit)
+        quality_assessment_agreement_pages: Pages that must agree on born-digital vs
+            scanned before assessment stops early (None: assess every page)
         collect_metrics: Enable metrics collection
         metrics_retention_days: Days to retain metrics data
     """
@@ -42,6 +48,10 @@ class RouterConfig:
     enable_paddleocr_fallback: bool = False  # Future v0.3.4c
     fast_quality_assessment: bool = True
     cache_quality_assessments: bool = True
+    persist_quality_assessments: bool = False
+    quality_assessment_workers: int = 1
+    quality_assessment_deadline: float | None = None
+    quality_assessment_agreement_pages: int | None = None
     collect_metrics: bool = True
     metrics_retention_days: int = 30
 
@@ -104,6 +114,14 @@ class ProcessorRouter:
         self.assessor = QualityAssessor(
             fast_mode=self.config.fast_quality_assessment,
             cache_enabled=self.config.cache_quality_assessments,
+            workers=self.config.quality_assessment_workers,
+            deadline=self.config.quality_assessment_deadline,
+            agreement_pages=self.config.quality_assessment_agreement_pages,
+            persistent_cache=(
+                AssessmentCache()
+                if self.config.cache_quality_assessments and self.config.persist_quality_assessments
+                else None
+            ),
         )
 
         logger.debug(
@@ -369,6 +387,6 @@ class ProcessorRouter:
         return list(self._processors.keys())
 
     def clear_cache(self) -> None:
-        """Clear quality assessment cache."""
+        """Clear quality assessment cache, including persisted assessments."""
         self.assessor.clear_cache()
         logger.debug("Router cache cleared")
@@ -1,26 +1,146 @@
 """BM25 keyword-based retrieval for ragged v0.2."""
 
+import json
 import logging
-from typing import Any
+import os
+import shutil
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, overload
 
-from rank_bm25 import BM25Okapi
+from src.retrieval.bm25_index import BM25Index, tokenize
+from src.utils.serialization import load_string_column, save_string_column
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, single writer assumed
+    fcntl = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# Changes since the last full save are appended to this log in the segment
+JOURNAL_FILE = "journal.jsonl"
+# The log is folded into a new segment once it holds more documents than
+# this fraction of the live corpus (and at least JOURNAL_MIN_DOCUMENTS)
+JOURNAL_MAX_FRACTION = 0.25
+JOURNAL_MIN_DOCUMENTS = 1000
+# Removed and superseded documents are dropped from memory once they make up
+# this fraction of all slots (and number at least COMPACT_MIN_DELETED)
+COMPACT_DELETED_FRACTION = 0.25
+COMPACT_MIN_DELETED = 256
+
+
+@contextmanager
+def _locked(directory: Path) -> Iterator[None]:
+    """Hold the exclusive lock that serialises processes writing ``directory``."""
+    if fcntl is None:
+        yield
+        return
+
+    directory.parent.mkdir(parents=True, exist_ok=True)
+    with open(directory.with_name(f"{directory.name}.lock"), "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _segment_stamp(directory: Path) -> tuple[int, int] | None:
+    """Identify the segment in ``directory``; a full save writes a new one."""
+    try:
+        stat = (directory / "meta.json").stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns
+
+
+class _LoadedColumn[T](Sequence[T]):
+    """Appendable sequence over a lazily decoded on-disk column.
+
+    Items from the loaded segment are decoded on access; appended items are
+    kept in memory.
+    """
+
+    def __init__(self, base: Sequence[str], decode: Callable[[str], T]) -> None:
+        self._base = base
+        self._decode = decode
+        self._tail: list[T] = []
+
+    def append(self, item: T) -> None:
+        self._tail.append(item)
+
+    def __len__(self) -> int:
+        return len(self._base) + len(self._tail)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index < len(self._base):
+            return self._decode(self._base[index])
+        return self._tail[index - len(self._base)]
+
+    def __iter__(self) -> Iterator[T]:
+        for text in self._base:
+            yield self._decode(text)
+        yield from self._tail
+
 
 class BM25Retriever:
     """BM25 (Best Matching 25) keyword-based retriever.
 
     Uses the Okapi BM25 algorithm for keyword-based document retrieval.
     Complements vector-based semantic search in hybrid retrieval.
+
+    Backed by an inverted :class:`BM25Index`, so documents can be added
+    incrementally without re-tokenizing the existing corpus. With an
+    ``index_dir`` the index is persisted as a binary segment and reopened
+    (memory-mapped) on construction. Saving after adds and removals appends
+    them to a journal next to the segment, so persisting an update costs
+    time proportional to the update; the journal is folded into a new
+    segment once it grows past a fraction of the corpus.
+
+    Several processes may share an ``index_dir``: saves hold a file lock and
+    first apply whatever the others saved, and :meth:`refresh` lets a
+    long-lived reader pick up their changes. Within a process, searches and
+    updates may run on different threads.
     """
 
-    def __init__(self) -> None:
-        """Initialize BM25 retriever."""
-        self.index: BM25Okapi | None = None
-        self.documents: list[str] = []
-        self.doc_ids: list[str] = []
-        self.metadatas: list[dict[str, Any]] = []
+    def __init__(self, index_dir: Path | None = None) -> None:
+        """Initialize BM25 retriever.
+
+        Args:
+            index_dir: Optional directory of a persisted index to open and save to
+        """
+        self.index_dir = index_dir
+        self.index: BM25Index | None = None
+        self.documents: list[str] | _LoadedColumn[str] = []
+        self.doc_ids: list[str] | _LoadedColumn[str] = []
+        self.metadatas: list[dict[str, Any]] | _LoadedColumn[dict[str, Any]] = []
+        self._slots: dict[str, int] | None = {}
+        # Serialises searches with updates, compaction and refresh across threads
+        self._lock = threading.RLock()
+
+        # Directory holding this corpus on disk, and changes not yet written there
+        self._persisted_dir: Path | None = None
+        self._pending: list[dict[str, Any]] = []
+        self._journal_documents = 0
+        # Segment and journal bytes already applied, to spot other writers
+        self._segment_stamp: tuple[int, int] | None = None
+        self._journal_offset = 0
+
+        if index_dir is not None:
+            self.load(index_dir)
 
     def index_documents(
         self,
@@ -28,7 +148,7 @@ class BM25Retriever:
         doc_ids: list[str],
         metadatas: list[dict[str, Any]] | None = None,
     ) -> None:
-        """Index documents for BM25 search.
+        """Index documents for BM25 search, replacing any existing corpus.
 
         Args:
             documents: List of document texts to index
@@ -42,17 +162,168 @@ class BM25Retriever:
             logger.warning("No documents to index")
             return
 
-        # Tokenize documents (simple whitespace split)
-        tokenized_corpus = [doc.lower().split() for doc in documents]
-
-        # Create BM25 index
-        self.index = BM25Okapi(tokenized_corpus)
-        self.documents = documents
-        self.doc_ids = doc_ids
-        self.metadatas = metadatas or [{} for _ in documents]
+        with self._lock:
+            self.documents = []
+            self.doc_ids = []
+            self.metadatas = []
+            self._slots = {}
+            self._forget_persisted()
+            self.index = BM25Index()
+            self._append(documents, doc_ids, metadatas or [{} for _ in documents])
+            self._maybe_compact()
 
         logger.info(f"Indexed {len(documents)} documents for BM25 search")
 
+    def add_documents(
+        self,
+        documents: list[str],
+        doc_ids: list[str],
+        metadatas: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """Add documents to the existing index.
+
+        Only the new documents are tokenized. Re-adding an existing ID
+        replaces the previous version of that document; superseded versions
+        are dropped from memory by periodic compaction.
+
+        Args:
+            documents: Document texts to add
+            doc_ids: Document IDs (must match documents length)
+            metadatas: Optional list of metadata dicts
+        """
+        if len(documents) != len(doc_ids):
+            raise ValueError("documents and doc_ids must have same length")
+
+        if not documents:
+            return
+
+        metadatas = metadatas or [{} for _ in documents]
+        with self._lock:
+            if self.index is None:
+                self.index = BM25Index()
+            self._append(documents, doc_ids, metadatas)
+            self._record({"op": "add", "documents": documents, "doc_ids": doc_ids, "metadatas": metadatas})
+            self._maybe_compact()
+
+        logger.debug(f"Added {len(documents)} documents to BM25 index")
+
+    def _append(
+        self,
+        documents: list[str],
+        doc_ids: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Tokenize and append documents to the index and corpus lists."""
+        assert self.index is not None
+        slots = self._slot_map()
+
+        for doc, doc_id, metadata in zip(documents, doc_ids, metadatas, strict=True):
+            previous = slots.get(doc_id)
+            if previous is not None:
+                self.index.delete(previous)
+
+            slots[doc_id] = self.index.add(tokenize(doc))
+            self.documents.append(doc)
+            self.doc_ids.append(doc_id)
+            self.metadatas.append(metadata)
+
+    def _slot_map(self) -> dict[str, int]:
+        """Map of live document ID to slot, built on first use after a load."""
+        if self._slots is None:
+            index = self.index
+            self._slots = {
+                doc_id: slot
+                for slot, doc_id in enumerate(self.doc_ids)
+                if index is not None and not index.is_deleted(slot)
+            }
+        return self._slots
+
+    def _delete(self, doc_ids: list[str]) -> int:
+        """Tombstone documents by ID.
+
+        Args:
+            doc_ids: Document IDs to delete
+
+        Returns:
+            Number of documents that were live and are now deleted
+        """
+        if self.index is None:
+            return 0
+
+        slots = self._slot_map()
+        removed = 0
+        for doc_id in doc_ids:
+            slot = slots.pop(doc_id, None)
+            if slot is not None and self.index.delete(slot):
+                removed += 1
+        return removed
+
+    def remove_documents(self, doc_ids: list[str]) -> None:
+        """Remove documents by ID (tombstoned until the index is compacted).
+
+        Args:
+            doc_ids: Document IDs to remove
+        """
+        with self._lock:
+            removed = self._delete(doc_ids)
+            if removed:
+                self._record({"op": "remove", "doc_ids": doc_ids})
+                self._maybe_compact()
+            logger.debug(f"Removed {removed} documents from BM25 index")
+
+    def compact(self) -> int:
+        """Drop removed and superseded documents from the index and corpus.
+
+        Surviving documents are renumbered; the persisted segment is not
+        touched (its journal records changes by ID, not slot).
+
+        Returns:
+            Number of document slots reclaimed
+        """
+        with self._lock:
+            if self.index is None or not self.index.num_deleted:
+                return 0
+
+            reclaimed = self.index.num_deleted
+            keep = self.index.compact()
+            self.documents = [self.documents[slot] for slot in keep]
+            self.doc_ids = [self.doc_ids[slot] for slot in keep]
+            self.metadatas = [self.metadatas[slot] for slot in keep]
+            self._slots = {doc_id: slot for slot, doc_id in enumerate(self.doc_ids)}
+
+            logger.debug(f"Compacted BM25 index: reclaimed {reclaimed} slots, {len(keep)} documents remain")
+            return reclaimed
+
+    def _maybe_compact(self) -> None:
+        """Compact once tombstoned slots make up a large part of the index."""
+        if self.index is None:
+            return
+        threshold = max(COMPACT_MIN_DELETED, COMPACT_DELETED_FRACTION * self.index.num_slots)
+        if self.index.num_deleted >= threshold:
+            self.compact()
+
+    def _record(self, change: dict[str, Any]) -> None:
+        """Remember a change for the journal of the persisted segment."""
+        if self._persisted_dir is not None and self._persisted_dir == self.index_dir:
+            self._pending.append(change)
+
+    def _forget_persisted(self) -> None:
+        """Drop journal state after the corpus was replaced in memory."""
+        self._persisted_dir = None
+        self._pending = []
+        self._journal_documents = 0
+        self._segment_stamp = None
+        self._journal_offset = 0
+
+    def _apply(self, change: dict[str, Any]) -> None:
+        """Apply a journaled change in memory without recording it again."""
+        if change["op"] == "add":
+            if self.index is None:
+                self.index = BM25Index()
+            self._append(change["documents"], change["doc_ids"], change["metadatas"])
+        elif change["op"] == "remove":
+            self._delete(change["doc_ids"])
+
     def search(
         self,
         query: str,
@@ -67,36 +338,26 @@ class BM25Retriever:
         Returns:
             List of (doc_id, document, score, metadata) tuples, sorted by score descending
         """
-        if self.index is None:
-            raise RuntimeError("No documents indexed. Call index_documents() first.")
-
-        if not query.strip():
-            return []
-
-        # Tokenize query
-        tokenized_query = query.lower().split()
-
-        # Get BM25 scores
-        scores = self.index.get_scores(tokenized_query)
-
-        # Get top-k indices
-        top_indices = sorted(
-            range(len(scores)),
-            key=lambda i: scores[i],
-            reverse=True
-        )[:top_k]
-
-        # Build results
-        results = [
-            (
-                self.doc_ids[i],
-                self.documents[i],
-                float(scores[i]),
-                self.metadatas[i]
-            )
-            for i in top_indices
-            if scores[i] > 0  # Only return docs with non-zero scores
-        ]
+        with self._lock:
+            if self.index is None:
+                raise RuntimeError("No documents indexed. Call index_documents() first.")
+
+            if not query.strip():
+                return []
+
+            # Score only the postings of the query terms and select top-k
+            slots, scores = self.index.top_k(tokenize(query), top_k)
+
+            # Build results (top_k only returns docs with non-zero scores)
+            results = [
+                (
+                    self.doc_ids[i],
+                    self.documents[i],
+                    float(score),
+                    self.metadatas[i]
+                )
+                for i, score in zip(slots.tolist(), scores.tolist(), strict=True)
+            ]
 
         logger.debug(f"BM25 search for '{query}' returned {len(results)} results")
 
@@ -112,28 +373,237 @@ class BM25Retriever:
             top_k: Number of top results
 
         Returns:
-            List of document indices, sorted by score descending
+            List of indices of matching documents, sorted by score descending
         """
-        if self.index is None:
-            raise RuntimeError("No documents indexed. Call index_documents() first.")
+        with self._lock:
+            if self.index is None:
+                raise RuntimeError("No documents indexed. Call index_documents() first.")
 
-        tokenized_query = query.lower().split()
-        scores = self.index.get_scores(tokenized_query)
-
-        return sorted(
-            range(len(scores)),
-            key=lambda i: scores[i],
-            reverse=True
-        )[:top_k]
+            slots, _ = self.index.top_k(tokenize(query), top_k)
+            return [int(i) for i in slots]
 
     def clear(self) -> None:
         """Clear the index and all stored documents."""
-        self.index = None
-        self.documents = []
-        self.doc_ids = []
-        self.metadatas = []
-        logger.info("BM25 index cleared")
+        with self._lock:
+            self.index = None
+            self.documents = []
+            self.doc_ids = []
+            self.metadatas = []
+            self._slots = {}
+            self._forget_persisted()
+            logger.info("BM25 index cleared")
 
     def count(self) -> int:
-        """Return number of indexed documents."""
+        """Return number of stored documents (removed ones count until compacted)."""
         return len(self.documents)
+
+    def live_count(self) -> int:
+        """Return number of indexed documents that have not been removed."""
+        return self.index.num_live if self.index is not None else 0
+
+    def live_ids(self) -> set[str]:
+        """Return the IDs of indexed documents that have not been removed."""
+        with self._lock:
+            return set(self._slot_map())
+
+    def save(self, directory: Path | None = None) -> None:
+        """Persist the index and corpus.
+
+        Changes since the segment in ``directory`` was written or loaded are
+        appended to its journal. Otherwise, or once the journal is large, a
+        full segment is written to a staging directory and swapped in, so
+        readers never observe a partially written index.
+
+        Args:
+            directory: Target directory (defaults to ``index_dir``)
+
+        Raises:
+            ValueError: If no directory is given or configured
+            OSError: If files cannot be written
+        """
+        directory = directory or self.index_dir
+        if directory is None:
+            raise ValueError("No BM25 index directory configured")
+
+        with self._lock, _locked(directory):
+            # Changes are only journaled for the configured index directory
+            if directory == self._persisted_dir == self.index_dir:
+                self._catch_up(directory)
+            if directory == self._persisted_dir == self.index_dir:
+                journal_documents = self._journal_documents + sum(
+                    len(change["doc_ids"]) for change in self._pending
+                )
+                limit = max(JOURNAL_MIN_DOCUMENTS, JOURNAL_MAX_FRACTION * self.live_count())
+                if journal_documents <= limit:
+                    self._append_journal(directory)
+                    return
+
+            self._write_segment(directory)
+
+    def _write_segment(self, directory: Path) -> None:
+        """Write the whole corpus as a new segment and swap it in."""
+        staging = directory.with_name(f"{directory.name}.tmp")
+        previous = directory.with_name(f"{directory.name}.old")
+        for stale in (staging, previous):
+            if stale.exists():
+                shutil.rmtree(stale)
+
+        (self.index or BM25Index()).save(staging)
+        save_string_column(self.documents, staging, "documents")
+        save_string_column(self.doc_ids, staging, "doc_ids")
+        save_string_column(
+            (json.dumps(metadata, default=str) for metadata in self.metadatas),
+            staging,
+            "metadatas",
+        )
+
+        if directory.exists():
+            directory.rename(previous)
+        staging.rename(directory)
+        if previous.exists():
+            shutil.rmtree(previous)
+
+        self._persisted_dir = directory
+        self._pending = []
+        self._journal_documents = 0
+        self._segment_stamp = _segment_stamp(directory)
+        self._journal_offset = 0
+
+        logger.debug(f"Saved BM25 index ({self.live_count()} documents) to {directory}")
+
+    def _append_journal(self, directory: Path) -> None:
+        """Append pending changes to the segment's journal."""
+        if not self._pending:
+            return
+
+        with open(directory / JOURNAL_FILE, "ab") as f:
+            # Past the caught-up offset there can only be a torn entry
+            if f.tell() > self._journal_offset:
+                f.truncate(self._journal_offset)
+                f.seek(self._journal_offset)
+            for change in self._pending:
+                f.write((json.dumps(change, default=str) + "\n").encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+            self._journal_offset = f.tell()
+
+        self._journal_documents += sum(len(change["doc_ids"]) for change in self._pending)
+        logger.debug(f"Appended {len(self._pending)} changes to BM25 journal in {directory}")
+        self._pending = []
+
+    def _replay_journal(self, directory: Path) -> int:
+        """Apply journaled changes past the already applied offset.
+
+        Returns:
+            Number of documents added or removed by the replayed entries
+        """
+        journal = directory / JOURNAL_FILE
+        if not journal.exists():
+            return 0
+
+        documents = 0
+        with open(journal, "rb") as f:
+            f.seek(self._journal_offset)
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unterminated entry")
+                    change = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Ignoring torn entry at end of {journal}")
+                    break
+
+                self._apply(change)
+                self._journal_offset += len(line)
+                documents += len(change["doc_ids"])
+        return documents
+
+    def _catch_up(self, directory: Path) -> None:
+        """Apply what other processes saved to ``directory`` (under its lock).
+
+        Pending changes are re-applied on top, so memory matches the order
+        in which they will be journaled.
+        """
+        pending = self._pending
+        if _segment_stamp(directory) != self._segment_stamp:
+            # Another process wrote a new segment: reopen it
+            if not self._load(directory):
+                self._forget_persisted()
+                return
+        else:
+            replayed = self._replay_journal(directory)
+            if not replayed:
+                return
+            self._journal_documents += replayed
+
+        for change in pending:
+            self._apply(change)
+        self._pending = pending
+        self._maybe_compact()
+
+    def refresh(self) -> bool:
+        """Pick up changes other processes saved to ``index_dir``.
+
+        Costs two ``stat`` calls when nothing changed, so readers such as
+        the API can call it before each search.
+
+        Returns:
+            True if changes were applied
+        """
+        with self._lock:
+            directory = self.index_dir
+            if directory is None:
+                return False
+            if self._persisted_dir != directory:
+                # Nothing opened yet: the index may have been created since
+                return self.index is None and self.load()
+
+            journal = directory / JOURNAL_FILE
+            journal_size = journal.stat().st_size if journal.exists() else 0
+            if _segment_stamp(directory) == self._segment_stamp and journal_size <= self._journal_offset:
+                return False
+
+            with _locked(directory):
+                self._catch_up(directory)
+            return True
+
+    def load(self, directory: Path | None = None) -> bool:
+        """Open a persisted index without re-tokenizing the corpus.
+
+        Postings, texts, IDs and metadata are memory-mapped and decoded on
+        access, so opening is independent of corpus size. Only documents in
+        the journal are tokenized again.
+
+        Args:
+            directory: Segment directory (defaults to ``index_dir``)
+
+        Returns:
+            True if an index was found and loaded
+        """
+        directory = directory or self.index_dir
+        if directory is None or not (directory / "meta.json").exists():
+            return False
+
+        with self._lock, _locked(directory):
+            return self._load(directory)
+
+    def _load(self, directory: Path) -> bool:
+        """Open the segment in ``directory`` and replay its journal (lock held)."""
+        stamp = _segment_stamp(directory)
+        if stamp is None:
+            return False
+
+        index = BM25Index.load(directory)
+        self.documents = _LoadedColumn(load_string_column(directory, "documents"), str)
+        self.doc_ids = _LoadedColumn(load_string_column(directory, "doc_ids"), str)
+        self.metadatas = _LoadedColumn(load_string_column(directory, "metadatas"), json.loads)
+        self.index = index if index.num_slots else None
+        self._slots = None
+        self._forget_persisted()
+        self._segment_stamp = stamp
+        self._journal_documents = self._replay_journal(directory)
+        self._persisted_dir = directory
+        self._maybe_compact()
+
+        logger.info(f"Loaded BM25 index ({self.live_count()} documents) from {directory}")
+        return True
@@ -0,0 +1,586 @@
+"""Native inverted-index BM25 engine with incremental updates.
+
+Replaces the rank_bm25 ``BM25Okapi`` rebuild-per-add model. Postings are kept
+in compact ``array('I')`` storage per term, while document lengths and the
+tombstone mask live in growable NumPy columns. Document-frequency and length
+statistics are updated on every add and delete, so adding N documents costs
+O(N tokens) instead of O(corpus).
+
+An index can be saved as a binary segment (memory-mapped postings, a sorted
+vocabulary, document lengths and tombstones) and reopened without
+re-tokenizing anything. Documents added after opening are posted to an
+in-memory tail on top of the read-only segment.
+"""
+
+import math
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from src.utils.serialization import (
+    load_arrays,
+    load_json,
+    load_string_column,
+    save_arrays,
+    save_json,
+    save_string_column,
+)
+
+SEGMENT_FORMAT_VERSION = 1
+
+_SEGMENT_ARRAYS = (
+    "df",
+    "post_offsets",
+    "post_docs",
+    "post_tfs",
+    "doc_len",
+    "deleted",
+    "doc_term_offsets",
+    "doc_terms",
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Tokenize text for BM25 (lowercase whitespace split).
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens
+    """
+    return text.lower().split()
+
+
+def _uint32_array(values: npt.NDArray[Any]) -> "array[int]":
+    """Pack a NumPy integer array into compact ``array('I')`` storage."""
+    packed = array("I")
+    packed.frombytes(np.ascontiguousarray(values, dtype=np.uint32).tobytes())
+    return packed
+
+
+def _flatten(arrays: Iterable["array[int]"]) -> npt.NDArray[np.uint32]:
+    """Concatenate ``array('I')`` chunks into a single NumPy array."""
+    flat = array("I")
+    for values in arrays:
+        flat.extend(values)
+    return np.frombuffer(flat, dtype=np.uint32)
+
+
+class _GrowableColumn:
+    """Append-only NumPy column with amortised O(1) growth.
+
+    Growth allocates a fresh buffer, so views handed out earlier remain
+    valid for concurrent readers.
+    """
+
+    def __init__(self, dtype: Any, capacity: int = 64) -> None:
+        self._data: npt.NDArray[Any] = np.zeros(capacity, dtype=dtype)
+        self._size = 0
+
+    @classmethod
+    def from_values(cls, values: npt.NDArray[Any]) -> "_GrowableColumn":
+        column = cls(values.dtype, capacity=max(64, len(values)))
+        column._data[: len(values)] = values
+        column._size = len(values)
+        return column
+
+    def append(self, value: Any) -> None:
+        if self._size == len(self._data):
+            grown = np.zeros(max(64, len(self._data) * 2), dtype=self._data.dtype)
+            grown[: self._size] = self._data[: self._size]
+            self._data = grown
+        self._data[self._size] = value
+        self._size += 1
+
+    def view(self) -> npt.NDArray[Any]:
+        return self._data[: self._size]
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class _Vocabulary:
+    """Term to term-id mapping over an optional sorted, read-only base.
+
+    Base terms own ids ``0..len(base) - 1`` in sorted order and are found by
+    binary search, so opening a saved segment does not build a dict. Terms
+    added afterwards get the following ids and live in an in-memory dict.
+    """
+
+    def __init__(self, base: Sequence[str] = ()) -> None:
+        self._base = base
+        self._added: dict[str, int] = {}
+
+    def get(self, term: str) -> int | None:
+        term_id = self._added.get(term)
+        if term_id is not None:
+            return term_id
+        i = bisect_left(self._base, term)
+        if i < len(self._base) and self._base[i] == term:
+            return i
+        return None
+
+    def add(self, term: str) -> int:
+        term_id = len(self)
+        self._added[term] = term_id
+        return term_id
+
+    def items(self) -> Iterator[tuple[str, int]]:
+        yield from zip(self._base, range(len(self._base)), strict=True)
+        yield from self._added.items()
+
+    def __contains__(self, term: object) -> bool:
+        return isinstance(term, str) and self.get(term) is not None
+
+    def __len__(self) -> int:
+        return len(self._base) + len(self._added)
+
+
+class BM25Index:
+    """Inverted BM25 index with per-document add/delete.
+
+    Deleted documents are tombstoned: their postings stay in place until
+    :meth:`compact`, but they are excluded from N, document frequencies,
+    average length and scoring immediately.
+
+    IDF uses the non-negative Lucene form ``log(1 + (N - df + 0.5) / (df + 0.5))``
+    so no corpus-wide average-IDF floor has to be maintained across updates.
+
+    Postings live in two layers: a read-only base segment in CSR form
+    (populated by :meth:`load`) and per-term ``array('I')`` tails that
+    :meth:`add` appends to.
+
+    Example:
+        >>> index = BM25Index()
+        >>> slot = index.add(tokenize("machine learning basics"))
+        >>> scores = index.get_scores(tokenize("learning"))
+        >>> index.delete(slot)
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
+        """Initialize an empty index.
+
+        Args:
+            k1: Term frequency saturation parameter
+            b: Length normalisation parameter
+        """
+        self.k1 = k1
+        self.b = b
+
+        self.vocab = _Vocabulary()
+        self._df: array[int] = array("I")
+
+        # Base segment (CSR, possibly memory-mapped)
+        self._base_offsets: npt.NDArray[np.int64]
+        self._base_docs: npt.NDArray[np.uint32]
+        self._base_tfs: npt.NDArray[np.uint32]
+        self._base_doc_term_offsets: npt.NDArray[np.int64]
+        self._base_doc_terms: npt.NDArray[np.uint32]
+        self._clear_base()
+
+        # In-memory tails for postings and documents added since the base
+        self._postings_docs: dict[int, array[int]] = {}
+        self._postings_tfs: dict[int, array[int]] = {}
+        self._doc_terms: list[array[int]] = []
+
+        self._doc_len = _GrowableColumn(np.uint32)
+        self._deleted = _GrowableColumn(np.bool_)
+
+        self._live_count = 0
+        self._live_length = 0
+
+    @property
+    def num_slots(self) -> int:
+        """Number of document slots, including tombstoned ones."""
+        return len(self._doc_len)
+
+    @property
+    def num_live(self) -> int:
+        """Number of live (non-deleted) documents."""
+        return self._live_count
+
+    @property
+    def num_deleted(self) -> int:
+        """Number of tombstoned documents awaiting compaction."""
+        return self.num_slots - self._live_count
+
+    @property
+    def avgdl(self) -> float:
+        """Average length of live documents."""
+        return self._live_length / self._live_count if self._live_count else 0.0
+
+    @property
+    def _num_base_terms(self) -> int:
+        return len(self._base_offsets) - 1
+
+    @property
+    def _num_base_slots(self) -> int:
+        return len(self._base_doc_term_offsets) - 1
+
+    def _clear_base(self) -> None:
+        """Reset the base segment to empty."""
+        self._base_offsets = np.zeros(1, dtype=np.int64)
+        self._base_docs = np.zeros(0, dtype=np.uint32)
+        self._base_tfs = np.zeros(0, dtype=np.uint32)
+        self._base_doc_term_offsets = np.zeros(1, dtype=np.int64)
+        self._base_doc_terms = np.zeros(0, dtype=np.uint32)
+
+    def add(self, tokens: list[str]) -> int:
+        """Add a tokenized document.
+
+        Args:
+            tokens: Document tokens
+
+        Returns:
+            Slot number assigned to the document
+        """
+        slot = self.num_slots
+        term_ids = array("I")
+
+        for term, tf in Counter(tokens).items():
+            term_id = self.vocab.get(term)
+            if term_id is None:
+                term_id = self.vocab.add(term)
+                self._df.append(0)
+            docs = self._postings_docs.get(term_id)
+            if docs is None:
+                docs = self._postings_docs[term_id] = array("I")
+                self._postings_tfs[term_id] = array("I")
+            docs.append(slot)
+            self._postings_tfs[term_id].append(tf)
+            self._df[term_id] += 1
+            term_ids.append(term_id)
+
+        self._doc_terms.append(term_ids)
+        self._doc_len.append(len(tokens))
+        self._deleted.append(False)
+        self._live_count += 1
+        self._live_length += len(tokens)
+
+        return slot
+
+    def delete(self, slot: int) -> bool:
+        """Tombstone a document slot.
+
+        Args:
+            slot: Slot returned by :meth:`add`
+
+        Returns:
+            True if the slot was live and is now deleted
+        """
+        if not 0 <= slot < self.num_slots:
+            return False
+
+        deleted = self._deleted.view()
+        if deleted[slot]:
+            return False
+
+        deleted[slot] = True
+        for term_id in self._document_terms(slot).tolist():
+            self._df[term_id] -= 1
+        self._live_count -= 1
+        self._live_length -= int(self._doc_len.view()[slot])
+
+        return True
+
+    def is_deleted(self, slot: int) -> bool:
+        """Check whether a slot is tombstoned."""
+        return bool(self._deleted.view()[slot])
+
+    def idf(self, term: str) -> float:
+        """Inverse document frequency of a term over live documents."""
+        term_id = self.vocab.get(term)
+        df = self._df[term_id] if term_id is not None else 0
+        return math.log(1.0 + (self._live_count - df + 0.5) / (df + 0.5))
+
+    def _document_terms(self, slot: int) -> npt.NDArray[np.uint32]:
+        """Term ids of a document, from the base segment or the tail."""
+        if slot < self._num_base_slots:
+            start, end = self._base_doc_term_offsets[slot], self._base_doc_term_offsets[slot + 1]
+            return self._base_doc_terms[start:end]
+        return np.array(self._doc_terms[slot - self._num_base_slots], dtype=np.uint32)
+
+    def _postings(self, term_id: int) -> tuple[npt.NDArray[np.uint32], npt.NDArray[np.uint32]]:
+        """All postings of a term as (slots, term frequencies), in slot order."""
+        docs = self._postings_docs.get(term_id)
+        tail_docs = np.array(docs, dtype=np.uint32) if docs else None
+        tail_tfs = np.array(self._postings_tfs[term_id], dtype=np.uint32) if docs else None
+
+        if term_id >= self._num_base_terms:
+            if tail_docs is None or tail_tfs is None:
+                return np.zeros(0, dtype=np.uint32), np.zeros(0, dtype=np.uint32)
+            return tail_docs, tail_tfs
+
+        start, end = self._base_offsets[term_id], self._base_offsets[term_id + 1]
+        base_docs, base_tfs = self._base_docs[start:end], self._base_tfs[start:end]
+        if tail_docs is None or tail_tfs is None:
+            return base_docs, base_tfs
+        return np.concatenate([base_docs, tail_docs]), np.concatenate([base_tfs, tail_tfs])
+
+    def _term_contributions(
+        self, query_tokens: list[str]
+    ) -> list[tuple[npt.NDArray[np.intp], npt.NDArray[np.float64]]]:
+        """Compute per-posting BM25 contributions for each query term.
+
+        Tombstoned postings are dropped, so callers only see live slots.
+        """
+        if self._live_count == 0:
+            return []
+
+        doc_len = self._doc_len.view()
+        deleted = self._deleted.view()
+        avgdl = self.avgdl or 1.0
+        contributions = []
+
+        for term in query_tokens:
+            term_id = self.vocab.get(term)
+            if term_id is None or self._df[term_id] == 0:
+                continue
+
+            posting_docs, posting_tfs = self._postings(term_id)
+            docs = posting_docs.astype(np.intp)
+            tfs = posting_tfs.astype(np.float64)
+            live = ~deleted[docs]
+            docs, tfs = docs[live], tfs[live]
+
+            norm = self.k1 * (1.0 - self.b + self.b * doc_len[docs] / avgdl)
+            contributions.append((docs, self.idf(term) * tfs * (self.k1 + 1.0) / (tfs + norm)))
+
+        return contributions
+
+    def get_scores(self, query_tokens: list[str]) -> npt.NDArray[np.float64]:
+        """Score every slot against a query.
+
+        Only the postings of the query terms are read; tombstoned slots
+        score zero. Prefer :meth:`top_k` when only the best matches are needed.
+
+        Args:
+            query_tokens: Tokenized query
+
+        Returns:
+            Array of scores indexed by slot
+        """
+        scores = np.zeros(self.num_slots, dtype=np.float64)
+        for docs, contrib in self._term_contributions(query_tokens):
+            scores[docs] += contrib
+        return scores
+
+    def top_k(
+        self, query_tokens: list[str], k: int
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.float64]]:
+        """Find the k highest-scoring live slots for a query.
+
+        Scores are accumulated only over the postings of the query terms,
+        and the top k are selected with ``np.argpartition``, so the cost
+        depends on query-term selectivity rather than corpus size.
+
+        Args:
+            query_tokens: Tokenized query
+            k: Number of results
+
+        Returns:
+            Tuple of (slots, scores), sorted by score descending (ties by slot).
+            Only slots with a positive score are returned.
+        """
+        contributions = self._term_contributions(query_tokens)
+        if k <= 0 or not contributions:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64)
+
+        if len(contributions) == 1:
+            candidates, totals = contributions[0]
+        else:
+            all_docs = np.concatenate([docs for docs, _ in contributions])
+            all_contrib = np.concatenate([contrib for _, contrib in contributions])
+            candidates, inverse = np.unique(all_docs, return_inverse=True)
+            totals = np.bincount(inverse, weights=all_contrib, minlength=len(candidates))
+
+        positive = totals > 0
+        candidates, totals = candidates[positive], totals[positive]
+
+        if len(candidates) > k:
+            # Keep everything tied with the k-th score so ties break by slot
+            kth = totals[np.argpartition(-totals, k - 1)[k - 1]]
+            best = totals >= kth
+            candidates, totals = candidates[best], totals[best]
+
+        order = np.lexsort((candidates, -totals))[:k]
+        return candidates[order], totals[order]
+
+    def compact(self) -> list[int]:
+        """Drop tombstoned slots and renumber the survivors.
+
+        Postings are filtered and remapped in place of re-tokenizing, and
+        terms that no longer occur in any live document leave the vocabulary.
+        The compacted index is held entirely in memory.
+
+        Returns:
+            Old slot numbers of the surviving documents, in new slot order
+        """
+        deleted = self._deleted.view()
+        keep = np.flatnonzero(~deleted)
+        slot_map = np.full(self.num_slots, -1, dtype=np.int64)
+        slot_map[keep] = np.arange(len(keep))
+
+        vocab = _Vocabulary()
+        postings_docs: dict[int, array[int]] = {}
+        postings_tfs: dict[int, array[int]] = {}
+        df: array[int] = array("I")
+        term_map = np.full(len(self.vocab), -1, dtype=np.int64)
+
+        for term, term_id in self.vocab.items():
+            if self._df[term_id] == 0:
+                continue
+            docs, tfs = self._postings(term_id)
+            docs = slot_map[docs.astype(np.intp)]
+            mask = docs >= 0
+
+            new_id = vocab.add(term)
+            term_map[term_id] = new_id
+            postings_docs[new_id] = _uint32_array(docs[mask])
+            postings_tfs[new_id] = _uint32_array(tfs[mask])
+            df.append(int(mask.sum()))
+
+        doc_terms = [
+            _uint32_array(term_map[self._document_terms(slot).astype(np.intp)])
+            for slot in keep.tolist()
+        ]
+        doc_len = np.array(self._doc_len.view()[keep])
+
+        self._clear_base()
+        self.vocab = vocab
+        self._postings_docs = postings_docs
+        self._postings_tfs = postings_tfs
+        self._df = df
+        self._doc_terms = doc_terms
+        self._doc_len = _GrowableColumn.from_values(doc_len)
+        self._deleted = _GrowableColumn.from_values(np.zeros(len(keep), dtype=np.bool_))
+        self._live_count = len(keep)
+        self._live_length = int(doc_len.sum())
+
+        return [int(slot) for slot in keep]
+
+    def save(self, directory: Path) -> None:
+        """Save the index as a binary segment.
+
+        Terms are written in sorted order so :meth:`load` can look them up by
+        binary search. Slots, including tombstoned ones, keep their numbers.
+
+        Args:
+            directory: Directory to write the segment into
+
+        Raises:
+            OSError: If files cannot be written
+        """
+        terms = sorted(self.vocab.items())
+        term_map = np.zeros(len(terms), dtype=np.int64)
+        for new_id, (_, term_id) in enumerate(terms):
+            term_map[term_id] = new_id
+
+        # Postings: base CSR followed by tails, regrouped by new term id
+        base_terms = np.repeat(np.arange(self._num_base_terms), np.diff(self._base_offsets))
+        tail_ids = list(self._postings_docs)
+        tail_terms = np.repeat(
+            np.array(tail_ids, dtype=np.int64),
+            [len(self._postings_docs[t]) for t in tail_ids],
+        )
+        labels = term_map[np.concatenate([base_terms, tail_terms])]
+        docs = np.concatenate(
+            [self._base_docs, _flatten(self._postings_docs[t] for t in tail_ids)]
+        )
+        tfs = np.concatenate(
+            [self._base_tfs, _flatten(self._postings_tfs[t] for t in tail_ids)]
+        )
+        # Each term's postings are already in slot order, so a stable sort suffices
+        order = np.argsort(labels, kind="stable")
+        post_offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(labels, minlength=len(terms)), out=post_offsets[1:])
+
+        # Per-document term ids (needed to update df on delete)
+        doc_terms = term_map[
+            np.concatenate([self._base_doc_terms, _flatten(self._doc_terms)]).astype(np.intp)
+        ]
+        doc_term_offsets = np.concatenate(
+            [
+                self._base_doc_term_offsets,
+                self._base_doc_term_offsets[-1]
+                + np.cumsum([len(t) for t in self._doc_terms], dtype=np.int64),
+            ]
+        )
+
+        df = np.array(self._df, dtype=np.uint32)[[term_id for _, term_id in terms]]
+
+        save_arrays(
+            {
+                "df": df,
+                "post_offsets": post_offsets,
+                "post_docs": docs[order],
+                "post_tfs": tfs[order],
+                "doc_len": self._doc_len.view(),
+                "deleted": self._deleted.view(),
+                "doc_term_offsets": doc_term_offsets,
+                "doc_terms": doc_terms.astype(np.uint32),
+            },
+            directory,
+        )
+        save_string_column((term for term, _ in terms), directory, "vocab")
+        save_json(
+            {
+                "version": SEGMENT_FORMAT_VERSION,
+                "k1": self.k1,
+                "b": self.b,
+                "num_terms": len(terms),
+                "num_slots": self.num_slots,
+            },
+            directory / "meta.json",
+        )
+
+    @classmethod
+    def load(cls, directory: Path, mmap: bool = True) -> "BM25Index":
+        """Open a segment written by :meth:`save`.
+
+        Postings, the vocabulary and per-document term lists are memory-mapped,
+        so opening costs O(number of slots) for the small length and tombstone
+        columns regardless of corpus text size.
+
+        Args:
+            directory: Segment directory
+            mmap: Memory-map the segment instead of reading it into memory
+
+        Returns:
+            Loaded index, ready for queries and further adds
+
+        Raises:
+            FileNotFoundError: If the segment doesn't exist
+            ValueError: If the segment version is unsupported
+        """
+        meta = load_json(directory / "meta.json")
+        if meta.get("version") != SEGMENT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported BM25 segment version: {meta.get('version')}")
+
+        arrays = load_arrays(directory, _SEGMENT_ARRAYS, mmap=mmap)
+
+        index = cls(k1=meta["k1"], b=meta["b"])
+        index.vocab = _Vocabulary(load_string_column(directory, "vocab"))
+        index._df = array("I")
+        index._df.frombytes(np.ascontiguousarray(arrays["df"], dtype=np.uint32).tobytes())
+        index._base_offsets = arrays["post_offsets"]
+        index._base_docs = arrays["post_docs"]
+        index._base_tfs = arrays["post_tfs"]
+        index._base_doc_term_offsets = arrays["doc_term_offsets"]
+        index._base_doc_terms = arrays["doc_terms"]
+
+        doc_len = np.array(arrays["doc_len"], dtype=np.uint32)
+        deleted = np.array(arrays["deleted"], dtype=np.bool_)
+        index._doc_len = _GrowableColumn.from_values(doc_len)
+        index._deleted = _GrowableColumn.from_values(deleted)
+        index._live_count = int((~deleted).sum())
+        index._live_length = int(doc_len[~deleted].sum())
+
+        return index
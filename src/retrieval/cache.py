@@ -6,10 +6,13 @@ v0.2.10 FEAT-SEC-002: Added session isolation to prevent cross-user data leakage
 """
 
 from collections import OrderedDict
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+import numpy as np
+
 from src.utils.hashing import hash_content, hash_query
 from src.utils.logging import get_logger
 
@@ -170,6 +173,76 @@ class LRUCache:
             f"(size={size_bytes} bytes)"
         )
 
+    def get_many(
+        self, queries: Sequence[str], session_id: str | None = None, **kwargs: Any
+    ) -> tuple[np.ndarray, list[Any]]:
+        """Get cached results for several queries sharing the same parameters.
+
+        Args:
+            queries: Query strings
+            session_id: Session identifier for isolation (None = global cache)
+            **kwargs: Query parameters
+
+        Returns:
+            Tuple of (boolean hit mask aligned with ``queries``, list of the
+            cached results for the hits in input order)
+        """
+        keys = [self._make_key(query, session_id=session_id, **kwargs) for query in queries]
+        hits = np.zeros(len(keys), dtype=bool)
+        values = []
+        now = datetime.now()
+
+        for i, key in enumerate(keys):
+            entry = self._cache.get(key)
+            if entry is None:
+                continue
+
+            # Check TTL expiration
+            if self.ttl_seconds and (now - entry.created_at).total_seconds() > self.ttl_seconds:
+                del self._cache[key]
+                continue
+
+            hits[i] = True
+            self._cache.move_to_end(key)
+            entry.touch()
+            values.append(entry.value)
+
+        self._hits += len(values)
+        self._misses += len(keys) - len(values)
+
+        logger.debug(f"Cache batch lookup: {len(values)}/{len(keys)} hits")
+        return hits, values
+
+    def set_many(
+        self,
+        queries: Sequence[str],
+        values: Sequence[Any],
+        session_id: str | None = None,
+        **kwargs: Any
+    ) -> None:
+        """Store results for several queries sharing the same parameters.
+
+        Args:
+            queries: Query strings
+            values: Results to cache, aligned with ``queries``
+            session_id: Session identifier for isolation (None = global cache)
+            **kwargs: Query parameters
+        """
+        if len(values) != len(queries):
+            raise ValueError(f"Got {len(values)} values for {len(queries)} queries")
+
+        for query, value in zip(queries, values, strict=True):
+            key = self._make_key(query, session_id=session_id, **kwargs)
+
+            # Remove oldest entry if at capacity
+            if len(self._cache) >= self.maxsize and key not in self._cache:
+                del self._cache[next(iter(self._cache))]
+
+            self._cache[key] = CacheEntry(key=key, value=value, size_bytes=len(str(value)))
+            self._cache.move_to_end(key)
+
+        logger.debug(f"Cached {len(queries)} results")
+
     def clear(self) -> None:
         """Clear all cache entries."""
         count = len(self._cache)
@@ -297,6 +370,62 @@ class QueryCache(LRUCache):
             top_k=top_k
         )
 
+    def get_results(
+        self,
+        queries: Sequence[str],
+        collection: str = "default",
+        method: str = "hybrid",
+        top_k: int = 5,
+        session_id: str | None = None
+    ) -> tuple[np.ndarray, list[Any]]:
+        """Get cached results for several queries.
+
+        Args:
+            queries: Query strings
+            collection: Collection name
+            method: Retrieval method
+            top_k: Number of results
+            session_id: Session identifier for isolation (None = global cache)
+
+        Returns:
+            Tuple of (hit mask, cached results for the hits)
+        """
+        return self.get_many(
+            queries,
+            session_id=session_id,
+            collection=collection,
+            method=method,
+            top_k=top_k
+        )
+
+    def set_results(
+        self,
+        queries: Sequence[str],
+        results: Sequence[Any],
+        collection: str = "default",
+        method: str = "hybrid",
+        top_k: int = 5,
+        session_id: str | None = None
+    ) -> None:
+        """Store results for several queries.
+
+        Args:
+            queries: Query strings
+            results: Results to cache, aligned with ``queries``
+            collection: Collection name
+            method: Retrieval method
+            top_k: Number of results
+            session_id: Session identifier for isolation (None = global cache)
+        """
+        self.set_many(
+            queries,
+            results,
+            session_id=session_id,
+            collection=collection,
+            method=method,
+            top_k=top_k
+        )
+
     def invalidate_collection(self, collection: str) -> int:
         """Invalidate all entries for a collection.
 
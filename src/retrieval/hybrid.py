@@ -1,15 +1,38 @@
 """Hybrid retrieval combining vector and keyword search."""
 
+import asyncio
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from typing import Any, Literal
 
+from src.exceptions import SearchError
 from src.retrieval.bm25 import BM25Retriever
 from src.retrieval.fusion import reciprocal_rank_fusion, weighted_fusion
 from src.retrieval.retriever import RetrievedChunk, Retriever
 
 logger = logging.getLogger(__name__)
 
+# Shared by all hybrid retrievers; a leg that misses its deadline keeps its
+# worker until it returns, so leave headroom over the 2 legs per query.
+_LEG_WORKERS = 8
+_leg_executor: ThreadPoolExecutor | None = None
+_leg_executor_lock = threading.Lock()
+
+
+def _get_leg_executor() -> ThreadPoolExecutor:
+    """Return the executor that runs hybrid search legs."""
+    global _leg_executor
+    with _leg_executor_lock:
+        if _leg_executor is None:
+            _leg_executor = ThreadPoolExecutor(
+                max_workers=_LEG_WORKERS, thread_name_prefix="hybrid-leg"
+            )
+        return _leg_executor
+
 
 @dataclass
 class HybridConfig:
@@ -20,6 +43,10 @@ class HybridConfig:
     rrf_k: int = 60
     alpha: float = 0.5  # Weight for vector search in weighted fusion (1-alpha for BM25)
     top_k_multiplier: int = 2  # Retrieve top_k * multiplier from each method
+    # Per-leg deadlines (seconds, None = wait indefinitely). A late or failed
+    # leg is dropped and fusion uses the other leg's results.
+    vector_timeout: float | None = 30.0
+    bm25_timeout: float | None = 10.0
 
 
 class HybridRetriever:
@@ -75,6 +102,58 @@ class HybridRetriever:
         else:
             raise ValueError(f"Unknown retrieval method: {method}")
 
+    async def retrieve_async(
+        self,
+        query: str,
+        top_k: int = 5,
+        method: Literal["vector", "bm25", "hybrid"] | None = None,
+    ) -> list[RetrievedChunk]:
+        """Retrieve relevant chunks without blocking the event loop.
+
+        The vector leg uses :meth:`Retriever.retrieve_async`; BM25 scoring is
+        CPU work and runs in the loop's executor. Hybrid search awaits both
+        legs concurrently, each bounded by its configured timeout.
+
+        Args:
+            query: Search query
+            top_k: Number of results to return
+            method: Retrieval method override (uses config if None)
+
+        Returns:
+            List of retrieved chunks, sorted by relevance
+        """
+        method = method or self.config.method
+        loop = asyncio.get_running_loop()
+
+        if method == "vector":
+            return await self.vector.retrieve_async(query, k=top_k)
+        elif method == "bm25":
+            return await loop.run_in_executor(None, self._bm25_only, query, top_k)
+        elif method == "hybrid":
+            k_expanded = top_k * self.config.top_k_multiplier
+            vector_leg, bm25_leg = await asyncio.gather(
+                asyncio.wait_for(
+                    self.vector.retrieve_async(query, k=k_expanded),
+                    self.config.vector_timeout,
+                ),
+                asyncio.wait_for(
+                    loop.run_in_executor(None, self._bm25_search, query, k_expanded),
+                    self.config.bm25_timeout,
+                ),
+                return_exceptions=True,
+            )
+            vector_error = vector_leg if isinstance(vector_leg, BaseException) else None
+            bm25_error = bm25_leg if isinstance(bm25_leg, BaseException) else None
+            return self._fuse_legs(
+                [] if vector_error else vector_leg,
+                vector_error,
+                [] if bm25_error else bm25_leg,
+                bm25_error,
+                top_k,
+            )
+        else:
+            raise ValueError(f"Unknown retrieval method: {method}")
+
     def _vector_only(self, query: str, top_k: int) -> list[RetrievedChunk]:
         """Vector search only."""
         logger.debug(f"Vector-only retrieval for: {query}")
@@ -108,11 +187,16 @@ class HybridRetriever:
             metadata=metadata,
         )
 
+    def _bm25_search(self, query: str, top_k: int) -> list[tuple[str, str, float, dict[str, Any]]]:
+        """Search the keyword index after picking up changes saved by other processes."""
+        self.bm25.refresh()
+        return self.bm25.search(query, top_k=top_k)
+
     def _bm25_only(self, query: str, top_k: int) -> list[RetrievedChunk]:
         """BM25 search only."""
         logger.debug(f"BM25-only retrieval for: {query}")
 
-        results = self.bm25.search(query, top_k=top_k)
+        results = self._bm25_search(query, top_k)
 
         # Convert to RetrievedChunk format
         chunks = [
@@ -123,18 +207,75 @@ class HybridRetriever:
         return chunks
 
     def _hybrid_search(self, query: str, top_k: int) -> list[RetrievedChunk]:
-        """Hybrid search combining vector and BM25."""
+        """Hybrid search combining vector and BM25.
+
+        Both legs run concurrently, so latency is roughly the slower leg
+        rather than the sum of both.
+        """
         logger.debug(f"Hybrid retrieval for: {query}")
 
         # Retrieve from both methods (more results for better fusion)
         k_expanded = top_k * self.config.top_k_multiplier
 
-        # Vector search
-        vector_results = self.vector.retrieve(query, k=k_expanded)
+        executor = _get_leg_executor()
+        start = time.monotonic()
+        vector_future = executor.submit(self.vector.retrieve, query, k=k_expanded)
+        bm25_future = executor.submit(self._bm25_search, query, k_expanded)
+
+        vector_results, vector_error = self._await_leg(
+            vector_future, self.config.vector_timeout, start
+        )
+        bm25_results, bm25_error = self._await_leg(
+            bm25_future, self.config.bm25_timeout, start
+        )
+
+        return self._fuse_legs(
+            vector_results, vector_error, bm25_results, bm25_error, top_k
+        )
+
+    @staticmethod
+    def _await_leg(
+        future: Future, timeout: float | None, start: float
+    ) -> tuple[list, BaseException | None]:
+        """Wait for a leg until ``start + timeout``; return (results, error)."""
+        remaining = None if timeout is None else max(0.0, start + timeout - time.monotonic())
+        try:
+            return future.result(timeout=remaining), None
+        except FutureTimeoutError:
+            future.cancel()
+            return [], TimeoutError(f"no results after {timeout}s")
+        except Exception as e:  # noqa: BLE001 - Degrade to the other leg
+            return [], e
+
+    def _fuse_legs(
+        self,
+        vector_results: list[RetrievedChunk],
+        vector_error: BaseException | None,
+        bm25_results: list[tuple[str, str, float, dict[str, Any]]],
+        bm25_error: BaseException | None,
+        top_k: int,
+    ) -> list[RetrievedChunk]:
+        """Fuse whichever legs succeeded, failing only if both did not."""
+        if vector_error is not None and bm25_error is not None:
+            raise SearchError(
+                "Hybrid search failed on both legs",
+                details={"vector": repr(vector_error), "bm25": repr(bm25_error)},
+            ) from vector_error
 
-        # BM25 search
-        bm25_results = self.bm25.search(query, top_k=k_expanded)
+        if vector_error is not None:
+            logger.warning(f"Vector leg dropped, using BM25 results only: {vector_error!r}")
+        if bm25_error is not None:
+            logger.warning(f"BM25 leg dropped, using vector results only: {bm25_error!r}")
 
+        return self._fuse(vector_results, bm25_results, top_k)
+
+    def _fuse(
+        self,
+        vector_results: list[RetrievedChunk],
+        bm25_results: list[tuple[str, str, float, dict[str, Any]]],
+        top_k: int,
+    ) -> list[RetrievedChunk]:
+        """Fuse vector and BM25 results into the top_k RetrievedChunks."""
         # Convert to common format for fusion
         vector_tuples = [
             (chunk.chunk_id, chunk, chunk.score, chunk.metadata)
@@ -188,12 +329,77 @@ class HybridRetriever:
         doc_ids: list[str],
         metadatas: list[dict[str, Any]] | None = None,
     ) -> None:
-        """Update BM25 index with new documents.
+        """Add new documents to the BM25 index and persist the change.
+
+        Only the new documents are tokenized, and a persisted index journals
+        them rather than rewriting the corpus, so the cost follows the size
+        of the update. Re-adding an existing ID replaces that document.
 
         Args:
             documents: Document texts
             doc_ids: Document IDs
             metadatas: Optional metadata
         """
-        self.bm25.index_documents(documents, doc_ids, metadatas)
+        self.bm25.add_documents(documents, doc_ids, metadatas)
+        if self.bm25.index_dir is not None:
+            self.bm25.save()
         logger.info(f"Updated BM25 index with {len(documents)} documents")
+
+    def remove_from_bm25_index(self, doc_ids: list[str]) -> None:
+        """Remove documents from the BM25 index and persist the change.
+
+        Args:
+            doc_ids: Document IDs
+        """
+        self.bm25.remove_documents(doc_ids)
+        if self.bm25.index_dir is not None:
+            self.bm25.save()
+
+    def sync_bm25_index(self, page_size: int = 1000) -> bool:
+        """Rebuild the BM25 index from the vector store if they disagree.
+
+        The check compares the sets of chunk IDs, paging through IDs only,
+        so it is cheap enough to run on every startup. It catches chunks
+        stored or deleted without updating the keyword index (including
+        swaps that leave the count unchanged), and a missing index.
+
+        Args:
+            page_size: Chunks read from the vector store per request
+
+        Returns:
+            True if the index was rebuilt
+        """
+        vector_store = self.vector.vector_store
+        self.bm25.refresh()
+        expected: set[str] = set()
+        cursor = None
+        while True:
+            page = vector_store.list(limit=page_size, cursor=cursor, include=[], with_total=False)
+            expected.update(page["ids"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        indexed = self.bm25.live_ids()
+        if indexed == expected:
+            return False
+
+        logger.warning(
+            f"BM25 index has {len(indexed - expected)} chunks missing from the vector store "
+            f"and lacks {len(expected - indexed)} of its {len(expected)} chunks; "
+            "rebuilding it from the vector store"
+        )
+        self.bm25.clear()
+        cursor = None
+        while True:
+            page = vector_store.list(limit=page_size, cursor=cursor, with_total=False)
+            if page["ids"]:
+                self.bm25.add_documents(page["documents"], page["ids"], page["metadatas"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        if self.bm25.index_dir is not None:
+            self.bm25.save()
+        logger.info(f"Rebuilt BM25 index with {self.bm25.live_count()} documents")
+        return True
@@ -2,22 +2,30 @@
 
 v0.2.9: Differential updates, atomic swap, and background compaction for BM25.
 v0.2.10: Replaced pickle with safe JSON serialization (FEAT-SEC-001).
+v0.5.2: Backed by the native inverted BM25Index; adds and deletes no longer
+        rebuild the whole index.
+v0.5.2: Checkpoints are binary base snapshots plus an append-only write-ahead
+        log, so checkpoint cost is proportional to the change, not the corpus.
 """
 
-import threading
+import json
+import os
+import re
+import shutil
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from rank_bm25 import BM25Okapi
-
 from src.retrieval.bm25 import BM25Retriever
+from src.retrieval.bm25_index import BM25Index
 from src.utils.logging import get_logger
 from src.utils.serialization import load_json, save_json
 
 logger = get_logger(__name__)
 
+_BASE_PATTERN = re.compile(r"^bm25_base_v(\d+)$")
+
 
 @dataclass
 class IndexCheckpoint:
@@ -35,11 +43,14 @@ class IncrementalBM25Retriever(BM25Retriever):
     """BM25 retriever with incremental update support.
 
     Features:
-    - Add documents without full rebuild
-    - Remove documents with lazy deletion
+    - Add documents without full rebuild (cost proportional to new tokens)
+    - Remove documents with lazy deletion (tombstones excluded from scoring)
     - Atomic index swap for consistency
     - Background compaction when fragmentation high
-    - Checkpoint persistence for recovery
+    - Checkpoint persistence for recovery: a binary base snapshot
+      (``bm25_base_v{N}/``) plus a write-ahead log of later adds and removals
+      (``bm25_wal_v{N}.jsonl``), compacted into a new base every
+      ``snapshot_interval`` operations and after each compaction
 
     Example:
         >>> retriever = IncrementalBM25Retriever()
@@ -54,6 +65,7 @@ class IncrementalBM25Retriever(BM25Retriever):
         checkpoint_dir: Path | None = None,
         enable_checkpoints: bool = True,
         compaction_threshold: float = 0.5,
+        snapshot_interval: int = 100,
     ):
         """Initialize incremental BM25 retriever.
 
@@ -61,17 +73,22 @@ class IncrementalBM25Retriever(BM25Retriever):
             checkpoint_dir: Directory for checkpoint files
             enable_checkpoints: Enable checkpoint persistence
             compaction_threshold: Trigger compaction when fragmentation >threshold
+            snapshot_interval: Logged operations before a new base snapshot is written
         """
         super().__init__()
 
         self.checkpoint_dir = checkpoint_dir or Path.home() / ".ragged" / "checkpoints"
         self.enable_checkpoints = enable_checkpoints
         self.compaction_threshold = compaction_threshold
+        self.snapshot_interval = snapshot_interval
+
+        # Checkpoint state: version of the current base and ops logged since
+        self._base_version: int | None = None
+        self._wal_entries = 0
 
         # Incremental state
         self.deleted_ids: set[str] = set()
         self.version = 0
-        self._lock = threading.Lock()
 
         # Compaction state
         self.compaction_in_progress = False
@@ -81,6 +98,26 @@ class IncrementalBM25Retriever(BM25Retriever):
             self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
             logger.info(f"Incremental indexing enabled with checkpoints at {self.checkpoint_dir}")
 
+    def index_documents(
+        self,
+        documents: list[str],
+        doc_ids: list[str],
+        metadatas: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """Index documents, replacing the corpus, and snapshot a new base.
+
+        Args:
+            documents: Documents to index
+            doc_ids: Document IDs
+            metadatas: Optional metadata
+        """
+        with self._lock:
+            super().index_documents(documents, doc_ids, metadatas)
+            self.deleted_ids.clear()
+
+            if self.enable_checkpoints and documents:
+                self._write_base()
+
     def add_documents(
         self,
         documents: list[str],
@@ -101,15 +138,11 @@ class IncrementalBM25Retriever(BM25Retriever):
             return
 
         with self._lock:
-            # Append to existing corpus
-            self.documents.extend(documents)
-            self.doc_ids.extend(doc_ids)
-            self.metadatas.extend(metadatas or [{} for _ in documents])
+            # Re-adding a deleted ID revives it
+            self.deleted_ids.difference_update(doc_ids)
 
-            # Rebuild index with updated corpus
-            # Note: BM25Okapi requires full rebuild, but we avoid re-processing docs
-            tokenized_corpus = [doc.lower().split() for doc in self.documents]
-            self.index = BM25Okapi(tokenized_corpus)
+            # Only the new documents are tokenized and posted
+            super().add_documents(documents, doc_ids, metadatas)
 
             self.version += 1
 
@@ -118,9 +151,14 @@ class IncrementalBM25Retriever(BM25Retriever):
                 f"(total: {len(self.documents)}, version: {self.version})"
             )
 
-            # Save checkpoint
+            # Log the delta (snapshots a new base periodically)
             if self.enable_checkpoints:
-                self._save_checkpoint()
+                self._log_operation({
+                    "op": "add",
+                    "documents": documents,
+                    "doc_ids": doc_ids,
+                    "metadatas": metadatas or [{} for _ in documents],
+                })
 
     def remove_documents(self, doc_ids: list[str]) -> None:
         """Remove documents by marking as deleted (lazy deletion).
@@ -131,14 +169,18 @@ class IncrementalBM25Retriever(BM25Retriever):
             doc_ids: Document IDs to remove
         """
         with self._lock:
-            # Mark as deleted
+            # Mark as deleted and tombstone in the index
             self.deleted_ids.update(doc_ids)
+            self._delete(doc_ids)
 
             logger.info(
                 f"Marked {len(doc_ids)} documents for deletion "
                 f"(total deleted: {len(self.deleted_ids)})"
             )
 
+            if self.enable_checkpoints:
+                self._log_operation({"op": "remove", "doc_ids": doc_ids})
+
             # Check if compaction needed
             self.compact_if_needed()
 
@@ -174,36 +216,25 @@ class IncrementalBM25Retriever(BM25Retriever):
             True if compaction successful
         """
         with self._lock:
-            if not self.deleted_ids:
+            if not self.deleted_ids and (self.index is None or self.index.num_deleted == 0):
                 logger.debug("No deleted documents, skipping compaction")
                 return False
 
             self.compaction_in_progress = True
 
             try:
-                # Filter out deleted documents
-                new_documents = []
-                new_doc_ids = []
-                new_metadatas = []
-
-                for i, doc_id in enumerate(self.doc_ids):
-                    if doc_id not in self.deleted_ids:
-                        new_documents.append(self.documents[i])
-                        new_doc_ids.append(doc_id)
-                        new_metadatas.append(self.metadatas[i])
+                # Drop tombstoned postings (no re-tokenization)
+                keep = self.index.compact() if self.index is not None else []
 
                 # Atomic swap
                 old_count = len(self.documents)
-                self.documents = new_documents
-                self.doc_ids = new_doc_ids
-                self.metadatas = new_metadatas
+                self.documents = [self.documents[i] for i in keep]
+                self.doc_ids = [self.doc_ids[i] for i in keep]
+                self.metadatas = [self.metadatas[i] for i in keep]
+                self._slots = {doc_id: slot for slot, doc_id in enumerate(self.doc_ids)}
                 self.deleted_ids.clear()
 
-                # Rebuild index
-                if self.documents:
-                    tokenized_corpus = [doc.lower().split() for doc in self.documents]
-                    self.index = BM25Okapi(tokenized_corpus)
-                else:
+                if not self.documents:
                     self.index = None
 
                 self.version += 1
@@ -215,9 +246,9 @@ class IncrementalBM25Retriever(BM25Retriever):
                     f"(total: {len(self.documents)}, version: {self.version})"
                 )
 
-                # Save checkpoint
+                # Compacted state becomes the new base
                 if self.enable_checkpoints:
-                    self._save_checkpoint()
+                    self._write_base()
 
                 return True
 
@@ -227,63 +258,72 @@ class IncrementalBM25Retriever(BM25Retriever):
     def fragmentation_ratio(self) -> float:
         """Calculate index fragmentation ratio.
 
+        Tombstoned documents stay in ``doc_ids`` until compaction, so this
+        is the share of stored slots that are removed or superseded.
+
         Returns:
             Ratio of deleted to total documents (0.0-1.0)
         """
-        if not self.doc_ids:
+        if self.index is None or not self.index.num_slots:
             return 0.0
 
-        return len(self.deleted_ids) / (len(self.doc_ids) + len(self.deleted_ids))
+        return self.index.num_deleted / self.index.num_slots
 
-    def search(
-        self,
-        query: str,
-        top_k: int = 5,
-    ) -> list[tuple[str, str, float, dict[str, Any]]]:
-        """Search, filtering out deleted documents.
+    def _reindex_corpus(self) -> None:
+        """Rebuild the index from the stored corpus and re-apply tombstones."""
+        documents, doc_ids, metadatas = self.documents, self.doc_ids, self.metadatas
+        self.documents, self.doc_ids, self.metadatas = [], [], []
+        self._slots = {}
+        self.index = None
 
-        Args:
-            query: Search query
-            top_k: Number of results
+        if documents:
+            self.index = BM25Index()
+            self._append(documents, doc_ids, metadatas)
+            self._delete(list(self.deleted_ids))
 
-        Returns:
-            List of results excluding deleted documents
-        """
-        # Get results from parent
-        results = super().search(query, top_k + len(self.deleted_ids))
+    def _base_dir(self, version: int) -> Path:
+        return self.checkpoint_dir / f"bm25_base_v{version}"
 
-        # Filter deleted
-        filtered = [
-            (doc_id, doc, score, meta)
-            for doc_id, doc, score, meta in results
-            if doc_id not in self.deleted_ids
-        ]
+    def _wal_path(self, version: int) -> Path:
+        return self.checkpoint_dir / f"bm25_wal_v{version}.jsonl"
 
-        return filtered[:top_k]
+    def _committed_bases(self) -> list[int]:
+        """Versions of complete base snapshots, oldest first."""
+        versions = []
+        for path in self.checkpoint_dir.glob("bm25_base_v*"):
+            match = _BASE_PATTERN.match(path.name)
+            if match and (path / "checkpoint.json").exists():
+                versions.append(int(match.group(1)))
+        return sorted(versions)
 
-    def _save_checkpoint(self) -> None:
-        """Save checkpoint to disk using safe JSON serialization.
+    def _write_base(self) -> None:
+        """Snapshot the current state as a new base and start an empty log.
 
-        Security: Replaced pickle with JSON (v0.2.10 FEAT-SEC-001) to prevent arbitrary code execution.
+        The base is committed once ``checkpoint.json`` is written, so a crash
+        mid-snapshot leaves the previous base and log in charge.
         """
-        if not self.enable_checkpoints:
-            return
-
-        checkpoint_data = {
-            "documents": self.documents,
-            "doc_ids": self.doc_ids,
-            "metadatas": self.metadatas,
-            "deleted_ids": list(self.deleted_ids),  # Convert set to list for JSON
-            "timestamp": time.time(),
-            "version": self.version,
-        }
-
-        checkpoint_path = self.checkpoint_dir / f"bm25_checkpoint_v{self.version}.json"
+        base_dir = self._base_dir(self.version)
 
         try:
-            save_json(checkpoint_data, checkpoint_path)
+            marker = base_dir / "checkpoint.json"
+            if marker.exists():
+                marker.unlink()
+
+            self.save(base_dir)
+            save_json(
+                {
+                    "version": self.version,
+                    "deleted_ids": list(self.deleted_ids),
+                    "timestamp": time.time(),
+                },
+                marker,
+            )
+            self._wal_path(self.version).write_text("", encoding="utf-8")
+
+            self._base_version = self.version
+            self._wal_entries = 0
 
-            logger.debug(f"Saved checkpoint: {checkpoint_path}")
+            logger.debug(f"Saved base checkpoint: {base_dir}")
 
             # Clean old checkpoints (keep last 3)
             self._cleanup_old_checkpoints(keep=3)
@@ -291,38 +331,106 @@ class IncrementalBM25Retriever(BM25Retriever):
         except Exception as e:
             logger.error(f"Failed to save checkpoint: {e}")
 
-    def _cleanup_old_checkpoints(self, keep: int = 3) -> None:
-        """Remove old checkpoint files.
+    def _log_operation(self, entry: dict[str, Any]) -> None:
+        """Append an operation to the write-ahead log.
 
-        Args:
-            keep: Number of recent checkpoints to keep
+        Cost is proportional to the operation itself. A new base is written
+        when none exists yet or every ``snapshot_interval`` operations.
 
-        Note: v0.2.10 migrated from .pkl to .json files for security.
+        Args:
+            entry: Operation record (``op`` plus its arguments)
         """
+        if self._base_version is None or self._wal_entries + 1 >= self.snapshot_interval:
+            self._write_base()
+            return
+
         try:
-            # Clean both JSON (current) and legacy .pkl files
-            json_checkpoints = sorted(
-                self.checkpoint_dir.glob("bm25_checkpoint_v*.json"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True
-            )
-            pkl_checkpoints = list(self.checkpoint_dir.glob("bm25_checkpoint_v*.pkl"))
+            line = json.dumps({**entry, "version": self.version}, default=str)
+            with open(self._wal_path(self._base_version), "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._wal_entries += 1
+
+        except Exception as e:
+            logger.error(f"Failed to append to checkpoint log: {e}")
+
+    def _replay_log(self, wal_path: Path, target: int | None) -> bool:
+        """Apply logged operations on top of the loaded base.
+
+        Args:
+            wal_path: Log file to replay
+            target: Stop after this version (None = replay everything)
+
+        Returns:
+            True if the log holds entries beyond ``target`` that were skipped
+        """
+        if not wal_path.exists():
+            return False
+
+        with open(wal_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring torn entry at end of {wal_path}")
+                    break
+
+                if target is not None and entry["version"] > target:
+                    return True
+
+                if entry["op"] == "add":
+                    self.deleted_ids.difference_update(entry["doc_ids"])
+                    BM25Retriever.add_documents(
+                        self, entry["documents"], entry["doc_ids"], entry["metadatas"]
+                    )
+                elif entry["op"] == "remove":
+                    self.deleted_ids.update(entry["doc_ids"])
+                    self._delete(entry["doc_ids"])
+
+                self.version = entry["version"]
+                self._wal_entries += 1
 
-            # Keep specified number of JSON checkpoints
-            for old_checkpoint in json_checkpoints[keep:]:
-                old_checkpoint.unlink()
-                logger.debug(f"Removed old checkpoint: {old_checkpoint}")
+        return False
+
+    def _cleanup_old_checkpoints(self, keep: int = 3) -> None:
+        """Remove old base snapshots, their logs and legacy checkpoint files.
 
-            # Remove all legacy .pkl files (migrated to .json)
-            for old_checkpoint in pkl_checkpoints:
-                old_checkpoint.unlink()
-                logger.debug(f"Removed legacy pickle checkpoint: {old_checkpoint}")
+        Args:
+            keep: Number of recent base snapshots to keep
+
+        Note: v0.2.10 migrated from .pkl to .json files for security; both are
+        superseded by base snapshots and removed once a base exists.
+        """
+        try:
+            for version in self._committed_bases()[:-keep]:
+                shutil.rmtree(self._base_dir(version))
+                self._wal_path(version).unlink(missing_ok=True)
+                logger.debug(f"Removed old checkpoint v{version}")
+
+            for legacy in [
+                *self.checkpoint_dir.glob("bm25_checkpoint_v*.json"),
+                *self.checkpoint_dir.glob("bm25_checkpoint_v*.pkl"),
+            ]:
+                legacy.unlink()
+                logger.debug(f"Removed legacy checkpoint: {legacy}")
 
         except Exception as e:
             logger.error(f"Failed to cleanup checkpoints: {e}")
 
+    def _discard_checkpoints_after(self, version: int) -> None:
+        """Drop bases newer than ``version`` after rolling back to it."""
+        for newer in self._committed_bases():
+            if newer > version:
+                shutil.rmtree(self._base_dir(newer))
+                self._wal_path(newer).unlink(missing_ok=True)
+
     def load_checkpoint(self, version: int | None = None) -> bool:
-        """Load checkpoint from disk using safe JSON deserialization.
+        """Load checkpoint from disk by replaying base snapshot + log.
+
+        The base is memory-mapped, so recovery costs O(log size) rather than
+        re-tokenizing the corpus. Loading an older version discards later
+        checkpoints so subsequent updates extend the restored history.
 
         Args:
             version: Specific version to load (None = latest)
@@ -330,97 +438,136 @@ class IncrementalBM25Retriever(BM25Retriever):
         Returns:
             True if checkpoint loaded successfully
 
-        Security: Replaced pickle with JSON (v0.2.10 FEAT-SEC-001) to prevent arbitrary code execution.
+        Security: Checkpoints use JSON and ``.npy`` files with pickling disabled.
         """
         if not self.enable_checkpoints:
             logger.warning("Checkpoints disabled, cannot load")
             return False
 
         try:
-            # Find checkpoint file (prioritize JSON, fallback to legacy .pkl for migration)
+            bases = self._committed_bases()
             if version is not None:
-                checkpoint_path = self.checkpoint_dir / f"bm25_checkpoint_v{version}.json"
-                # Fallback to .pkl if .json doesn't exist (legacy migration)
-                if not checkpoint_path.exists():
-                    pkl_path = self.checkpoint_dir / f"bm25_checkpoint_v{version}.pkl"
-                    if pkl_path.exists():
-                        logger.warning(
-                            f"Loading legacy pickle checkpoint v{version}. "
-                            "Consider migrating to JSON format."
-                        )
-                        checkpoint_path = pkl_path
-            else:
-                # Load latest (prefer JSON)
-                json_checkpoints = sorted(
-                    self.checkpoint_dir.glob("bm25_checkpoint_v*.json"),
-                    key=lambda p: p.stat().st_mtime,
-                    reverse=True
-                )
-                pkl_checkpoints = sorted(
-                    self.checkpoint_dir.glob("bm25_checkpoint_v*.pkl"),
-                    key=lambda p: p.stat().st_mtime,
-                    reverse=True
-                )
+                bases = [v for v in bases if v <= version]
 
-                if json_checkpoints:
-                    checkpoint_path = json_checkpoints[0]
-                elif pkl_checkpoints:
-                    checkpoint_path = pkl_checkpoints[0]
-                    logger.warning(
-                        "Loading legacy pickle checkpoint. Consider migrating to JSON format."
-                    )
-                else:
-                    logger.warning("No checkpoints found")
-                    return False
+            if not bases:
+                return self._load_legacy_checkpoint(version)
 
-            # Load checkpoint based on file type
-            if checkpoint_path.suffix == ".json":
-                checkpoint_data = load_json(checkpoint_path)
-            else:
-                # Legacy pickle migration (temporary for backward compatibility)
-                import pickle
-                with open(checkpoint_path, 'rb') as f:
-                    checkpoint_obj: IndexCheckpoint = pickle.load(f)  # noqa: S301
-                # Convert to dict format
-                checkpoint_data = {
-                    "documents": checkpoint_obj.documents,
-                    "doc_ids": checkpoint_obj.doc_ids,
-                    "metadatas": checkpoint_obj.metadatas,
-                    "deleted_ids": list(checkpoint_obj.deleted_ids),
-                    "timestamp": checkpoint_obj.timestamp,
-                    "version": checkpoint_obj.version,
-                }
+            base_version = bases[-1]
+            base_dir = self._base_dir(base_version)
 
             with self._lock:
-                self.documents = checkpoint_data["documents"]
-                self.doc_ids = checkpoint_data["doc_ids"]
-                self.metadatas = checkpoint_data["metadatas"]
-                self.deleted_ids = set(checkpoint_data["deleted_ids"])  # Convert list back to set
-                self.version = checkpoint_data["version"]
-
-                # Rebuild index
-                if self.documents:
-                    tokenized_corpus = [doc.lower().split() for doc in self.documents]
-                    self.index = BM25Okapi(tokenized_corpus)
-                else:
-                    self.index = None
+                state = load_json(base_dir / "checkpoint.json")
+                self.clear()
+                self.load(base_dir)
+                self.deleted_ids = set(state["deleted_ids"])
+                self.version = state["version"]
+                self._base_version = base_version
+                self._wal_entries = 0
+
+                truncated = self._replay_log(self._wal_path(base_version), version)
+                if version is not None:
+                    self._discard_checkpoints_after(self.version)
+                if truncated:
+                    self._write_base()
 
             logger.info(
-                f"Loaded checkpoint v{self.version} from {checkpoint_path} "
-                f"({len(self.documents)} documents, {len(self.deleted_ids)} deleted)"
+                f"Loaded checkpoint v{self.version} from {base_dir} "
+                f"(+{self._wal_entries} logged operations, {len(self.doc_ids)} documents, "
+                f"{len(self.deleted_ids)} deleted)"
             )
 
-            # Auto-migrate: Save as JSON if we loaded from .pkl
-            if checkpoint_path.suffix == ".pkl":
-                logger.info("Auto-migrating legacy pickle checkpoint to JSON...")
-                self._save_checkpoint()
-
             return True
 
         except Exception as e:
             logger.error(f"Failed to load checkpoint: {e}")
             return False
 
+    def _load_legacy_checkpoint(self, version: int | None = None) -> bool:
+        """Load a pre-v0.5.2 full-corpus JSON (or pickle) checkpoint.
+
+        The loaded state is immediately re-saved as a base snapshot.
+
+        Args:
+            version: Specific version to load (None = latest)
+
+        Returns:
+            True if checkpoint loaded successfully
+        """
+        # Find checkpoint file (prioritize JSON, fallback to legacy .pkl for migration)
+        if version is not None:
+            checkpoint_path = self.checkpoint_dir / f"bm25_checkpoint_v{version}.json"
+            # Fallback to .pkl if .json doesn't exist (legacy migration)
+            if not checkpoint_path.exists():
+                pkl_path = self.checkpoint_dir / f"bm25_checkpoint_v{version}.pkl"
+                if pkl_path.exists():
+                    logger.warning(
+                        f"Loading legacy pickle checkpoint v{version}. "
+                        "Consider migrating to JSON format."
+                    )
+                    checkpoint_path = pkl_path
+        else:
+            # Load latest (prefer JSON)
+            json_checkpoints = sorted(
+                self.checkpoint_dir.glob("bm25_checkpoint_v*.json"),
+                key=lambda p: p.stat().st_mtime,
+                reverse=True
+            )
+            pkl_checkpoints = sorted(
+                self.checkpoint_dir.glob("bm25_checkpoint_v*.pkl"),
+                key=lambda p: p.stat().st_mtime,
+                reverse=True
+            )
+
+            if json_checkpoints:
+                checkpoint_path = json_checkpoints[0]
+            elif pkl_checkpoints:
+                checkpoint_path = pkl_checkpoints[0]
+                logger.warning(
+                    "Loading legacy pickle checkpoint. Consider migrating to JSON format."
+                )
+            else:
+                logger.warning("No checkpoints found")
+                return False
+
+        # Load checkpoint based on file type
+        if checkpoint_path.suffix == ".json":
+            checkpoint_data = load_json(checkpoint_path)
+        else:
+            # Legacy pickle migration (temporary for backward compatibility)
+            import pickle
+            with open(checkpoint_path, 'rb') as f:
+                checkpoint_obj: IndexCheckpoint = pickle.load(f)  # noqa: S301
+            # Convert to dict format
+            checkpoint_data = {
+                "documents": checkpoint_obj.documents,
+                "doc_ids": checkpoint_obj.doc_ids,
+                "metadatas": checkpoint_obj.metadatas,
+                "deleted_ids": list(checkpoint_obj.deleted_ids),
+                "timestamp": checkpoint_obj.timestamp,
+                "version": checkpoint_obj.version,
+            }
+
+        with self._lock:
+            self.documents = checkpoint_data["documents"]
+            self.doc_ids = checkpoint_data["doc_ids"]
+            self.metadatas = checkpoint_data["metadatas"]
+            self.deleted_ids = set(checkpoint_data["deleted_ids"])  # Convert list back to set
+            self.version = checkpoint_data["version"]
+
+            # Rebuild index
+            self._reindex_corpus()
+
+            logger.info(
+                f"Loaded legacy checkpoint v{self.version} from {checkpoint_path} "
+                f"({len(self.documents)} documents, {len(self.deleted_ids)} deleted)"
+            )
+
+            # Auto-migrate to a base snapshot
+            logger.info("Auto-migrating legacy checkpoint to base snapshot...")
+            self._write_base()
+
+        return True
+
     def rebuild_index(self) -> None:
         """Force full index rebuild (compacts and reindexes).
 
@@ -435,14 +582,13 @@ class IncrementalBM25Retriever(BM25Retriever):
 
             # Rebuild index
             if self.documents:
-                tokenized_corpus = [doc.lower().split() for doc in self.documents]
-                self.index = BM25Okapi(tokenized_corpus)
+                self._reindex_corpus()
                 self.version += 1
 
                 logger.info(f"Index rebuilt: {len(self.documents)} documents, version {self.version}")
 
                 if self.enable_checkpoints:
-                    self._save_checkpoint()
+                    self._write_base()
 
     def get_stats(self) -> dict[str, Any]:
         """Get index statistics.
@@ -452,13 +598,14 @@ class IncrementalBM25Retriever(BM25Retriever):
         """
         return {
             "total_documents": len(self.doc_ids),
-            "active_documents": len(self.doc_ids) - len(self.deleted_ids),
+            "active_documents": self.index.num_live if self.index is not None else 0,
             "deleted_documents": len(self.deleted_ids),
             "fragmentation_ratio": self.fragmentation_ratio(),
             "version": self.version,
             "compaction_in_progress": self.compaction_in_progress,
             "last_compaction_time": self.last_compaction_time,
             "checkpoints_enabled": self.enable_checkpoints,
+            "checkpoint_log_entries": self._wal_entries,
         }
 
     def clear(self) -> None:
@@ -467,3 +614,5 @@ class IncrementalBM25Retriever(BM25Retriever):
         with self._lock:
             self.deleted_ids.clear()
             self.version = 0
+            self._base_version = None
+            self._wal_entries = 0
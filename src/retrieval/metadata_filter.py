@@ -520,44 +520,43 @@ class FacetedSearch:
     Faceted search interface for exploring available filter values.
 
     Provides statistics on metadata fields to help users discover
-    what filters are available.
+    what filters are available. Counts come from the facet index the
+    vector store maintains on every write, so they cost O(distinct
+    values) rather than a scan of the collection.
     """
 
     @staticmethod
     def get_facets(
         vector_store: Any,
         fields: list[str] | None = None,
+        limit: int | None = None,
     ) -> dict[str, list[Any]]:
         """
         Get available values for metadata fields (facets).
 
         Args:
             vector_store: Vector store instance
-            fields: Specific fields to get facets for (None = all fields)
+            fields: Specific fields to get facets for (None = all counted fields)
+            limit: Maximum values per field, most frequent first (None = all)
 
         Returns:
-            Dictionary mapping field names to lists of unique values
+            Dictionary mapping field names to lists of values, most frequent first
+
+        Raises:
+            MetadataFilterSecurityError: If a field name is not allowed
 
         Example:
             >>> facets = FacetedSearch.get_facets(vector_store, fields=["tag", "author"])
             >>> print(f"Available tags: {facets['tag']}")
             >>> print(f"Available authors: {facets['author']}")
-
-        TODO: Implement facet extraction from vector store metadata
         """
-        # Placeholder for v0.3.7d
-        # Will need vector store API to extract unique metadata values
-        facets: dict[str, list[Any]] = {}
+        if fields is None:
+            fields = vector_store.facet_fields() if hasattr(vector_store, "facet_fields") else []
 
-        # Common facets (placeholders)
-        if fields is None or "tag" in fields:
-            facets["tag"] = []
-        if fields is None or "author" in fields:
-            facets["author"] = []
-        if fields is None or "file_type" in fields:
-            facets["file_type"] = []
-
-        return facets
+        return {
+            field: list(FacetedSearch.count_facet_values(vector_store, field))[:limit]
+            for field in fields
+        }
 
     @staticmethod
     def count_facet_values(
@@ -572,17 +571,24 @@ class FacetedSearch:
             field: Metadata field to count
 
         Returns:
-            Dictionary mapping values to counts
+            Dictionary mapping values to chunk counts, most frequent first
+            (empty if the store does not maintain facet counts)
+
+        Raises:
+            MetadataFilterSecurityError: If the field name is not allowed
 
         Example:
             >>> counts = FacetedSearch.count_facet_values(vector_store, "tag")
             >>> for tag, count in counts.items():
-            ...     print(f"{tag}: {count} documents")
-
-        TODO: Implement facet counting from vector store metadata
+            ...     print(f"{tag}: {count} chunks")
         """
-        # Placeholder for v0.3.7d
-        return {}
+        field = validate_field_name(field)
+
+        if not hasattr(vector_store, "facet_counts"):
+            logger.debug(f"{type(vector_store).__name__} does not maintain facet counts")
+            return {}
+
+        return dict(vector_store.facet_counts(field))
 
 
 # Convenience function for quick filter creation
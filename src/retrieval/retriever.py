@@ -4,6 +4,8 @@ Document retrieval using vector similarity search.
 Handles query processing, embedding, and retrieval of relevant document chunks.
 """
 
+import asyncio
+import functools
 from dataclasses import dataclass
 from typing import Any
 
@@ -124,8 +126,28 @@ class Retriever:
             where=filter_metadata,
         )
 
-        # Parse results into RetrievedChunk objects
-        chunks = []
+        chunks = self._parse_results(results, min_score)
+
+        logger.info(f"Retrieved {len(chunks)} chunks")
+
+        # v0.2.9: Store in cache if enabled
+        if self.query_cache:
+            self.query_cache.set(
+                query,
+                chunks,
+                k=k,
+                filter_metadata=str(filter_metadata) if filter_metadata else None,
+                min_score=min_score,
+            )
+            logger.debug(f"Cached {len(chunks)} chunks for future queries")
+
+        return chunks
+
+    def _parse_results(
+        self, results: dict[str, Any] | None, min_score: float | None
+    ) -> list[RetrievedChunk]:
+        """Parse a vector store query response into RetrievedChunk objects."""
+        chunks: list[RetrievedChunk] = []
         if results and results.get("ids") and len(results["ids"]) > 0:
             # ChromaDB returns lists within lists
             ids = results["ids"][0] if isinstance(results["ids"][0], list) else results["ids"]
@@ -153,18 +175,64 @@ class Retriever:
                 )
                 chunks.append(chunk)
 
-        logger.info(f"Retrieved {len(chunks)} chunks")
+        return chunks
+
+    async def retrieve_async(
+        self,
+        query: str,
+        k: int = 5,
+        filter_metadata: dict[str, Any] | None = None,
+        min_score: float | None = None,
+    ) -> list[RetrievedChunk]:
+        """
+        Retrieve relevant chunks without blocking the event loop.
+
+        v0.5.2: Embeds through the embedder's async API and runs the vector
+        store query in the loop's executor. Shares the query cache with
+        :meth:`retrieve`.
+
+        Args:
+            query: Query string
+            k: Number of chunks to retrieve
+            filter_metadata: Optional metadata filter
+            min_score: Optional minimum similarity score threshold
+
+        Returns:
+            List of retrieved chunks ordered by relevance
+        """
+        cache_params = {
+            "k": k,
+            "filter_metadata": str(filter_metadata) if filter_metadata else None,
+            "min_score": min_score,
+        }
 
-        # v0.2.9: Store in cache if enabled
         if self.query_cache:
-            self.query_cache.set(
-                query,
-                chunks,
+            cached_result = self.query_cache.get(query, **cache_params)
+            if cached_result is not None:
+                logger.info(f"Cache hit! Returning {len(cached_result)} cached chunks")
+                return cached_result
+
+        logger.info(f"Retrieving top {k} chunks for query (cache miss)")
+
+        query_embedding = await self.embedder.embed_text_async(query)
+
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.vector_store.query,
+                query_embedding=query_embedding,
                 k=k,
-                filter_metadata=str(filter_metadata) if filter_metadata else None,
-                min_score=min_score,
-            )
-            logger.debug(f"Cached {len(chunks)} chunks for future queries")
+                where=filter_metadata,
+            ),
+        )
+
+        chunks = self._parse_results(results, min_score)
+
+        logger.info(f"Retrieved {len(chunks)} chunks")
+
+        if self.query_cache:
+            self.query_cache.set(query, chunks, **cache_params)
 
         return chunks
 
@@ -8,6 +8,7 @@ and metadata serialization.
 v0.3.6: Refactored to implement VectorStore interface for multi-backend support.
 """
 
+import builtins
 import os
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urlparse
@@ -19,6 +20,8 @@ os.environ['ANONYMIZED_TELEMETRY'] = 'FALSE'
 
 if TYPE_CHECKING:
     import chromadb
+
+    from src.storage.facet_index import FacetIndex
 else:
     try:
         import chromadb
@@ -39,6 +42,9 @@ from src.utils.retry import with_retry
 logger = get_logger(__name__)
 
 
+# Chunks read per request when recounting facets from the collection
+FACET_REBUILD_PAGE_SIZE = 10000
+
 # v0.2.9: Circuit breaker for ChromaDB protection
 _chroma_circuit_breaker = CircuitBreaker(
     name="chromadb",
@@ -70,6 +76,7 @@ class ChromaDBStore(VectorStore):
         collection_name: str = "ragged_documents",
         host: str | None = None,
         port: int | None = None,
+        facet_index: "FacetIndex | None" = None,
     ):
         """
         Initialize ChromaDB vector store connection.
@@ -78,6 +85,8 @@ class ChromaDBStore(VectorStore):
             collection_name: Name of the ChromaDB collection
             host: ChromaDB server host (defaults to settings)
             port: ChromaDB server port (defaults to settings)
+            facet_index: Facet counts to maintain (defaults to the
+                configured facet index, opened on first use)
 
         Raises:
             ImportError: If chromadb is not installed
@@ -86,6 +95,7 @@ class ChromaDBStore(VectorStore):
             raise ImportError("chromadb required: pip install chromadb")
 
         self._collection_name = collection_name
+        self._facet_index = facet_index
 
         settings = get_settings()
 
@@ -109,6 +119,15 @@ class ChromaDBStore(VectorStore):
 
         logger.info(f"Using collection: {collection_name}")
 
+    @property
+    def facets(self) -> "FacetIndex":
+        """Facet counts of this store's metadata, maintained on every write."""
+        if self._facet_index is None:
+            from src.storage.facet_index import FacetIndex
+
+            self._facet_index = FacetIndex()
+        return self._facet_index
+
     def health_check(self) -> bool:
         """
         Check if ChromaDB is accessible.
@@ -144,12 +163,21 @@ class ChromaDBStore(VectorStore):
         # Serialise metadata for ChromaDB compatibility
         serialized_metadatas = serialize_batch_metadata(metadatas)
 
+        # ChromaDB ignores ids it already holds, so only new ids are counted
+        existing = set(self.collection.get(ids=ids, include=[]).get("ids") or [])
         self.collection.add(
             ids=ids,
             embeddings=embeddings_list,
             documents=documents,
             metadatas=serialized_metadatas,  # type: ignore[arg-type]
         )
+        added = [
+            metadata
+            for chunk_id, metadata in zip(ids, serialized_metadatas, strict=True)
+            if chunk_id not in existing
+        ]
+        # Count metadata as it will read back, so deletes uncount the same values
+        self.facets.add(self._collection_name, deserialize_batch_metadata(added))
         logger.info(f"Added {len(ids)} embeddings to collection {self._collection_name}")
 
     @with_retry(max_attempts=3, base_delay=1.0, retryable_exceptions=(ConnectionError, TimeoutError, VectorStoreConnectionError))
@@ -248,11 +276,16 @@ class ChromaDBStore(VectorStore):
             where: Metadata filter for deletion
         """
         if ids:
+            removed = self._stored_metadatas(ids=ids)
             self.collection.delete(ids=ids)
             logger.info(f"Deleted {len(ids)} embeddings by ID")
         elif where:
+            removed = self._stored_metadatas(where=where)
             self.collection.delete(where=where)
             logger.info(f"Deleted embeddings matching filter: {where}")
+        else:
+            return
+        self.facets.remove(self._collection_name, removed)
 
     def update_metadata(
         self,
@@ -275,12 +308,23 @@ class ChromaDBStore(VectorStore):
         # Serialise metadata for ChromaDB
         serialized_metadatas = serialize_batch_metadata(metadatas)
 
+        previous = self._stored_metadatas(ids=ids)
         self.collection.update(
             ids=ids,
             metadatas=serialized_metadatas,  # type: ignore[arg-type]
         )
+        self.facets.replace(self._collection_name, previous, deserialize_batch_metadata(serialized_metadatas))
         logger.info(f"Updated metadata for {len(ids)} embeddings")
 
+    def _stored_metadatas(
+        self,
+        ids: list[str] | None = None,
+        where: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch the current metadata of chunks about to change."""
+        results = self.collection.get(ids=ids, where=where, include=["metadatas"])
+        return deserialize_batch_metadata(cast(list[dict[str, Any]], results.get("metadatas") or []))
+
     def get_documents_by_metadata(self, where: dict[str, Any]) -> dict[str, Any]:
         """
         Get documents from ChromaDB matching metadata filter.
@@ -313,54 +357,77 @@ class ChromaDBStore(VectorStore):
         limit: int = 100,
         offset: int = 0,
         where: dict[str, Any] | None = None,
+        include: builtins.list[str] | None = None,
+        cursor: str | None = None,
+        with_total: bool = True,
     ) -> dict[str, Any]:
         """
         List documents from ChromaDB with pagination.
 
+        The cursor is an offset into ChromaDB's (insertion) order, not a
+        keyset: ChromaDB's ``get`` cannot order results by a key, and chunks
+        stored so far carry no monotonic field to filter on with ``$gt``.
+        ChromaDB therefore still skips the rows before each page, and a page
+        can skip or repeat chunks if matching chunks are added or deleted
+        while paging.
+
         Args:
             limit: Maximum number of documents to return
-            offset: Number of documents to skip
+            offset: Number of documents to skip (ignored with a cursor)
             where: Optional metadata filter
+            include: Fields to fetch besides ids, from "documents" and
+                "metadatas" (default: both)
+            cursor: ``next_cursor`` of the previous page
+            with_total: Count all matching documents (skip when paging
+                with cursors to avoid the extra request)
 
         Returns:
-            Dict with 'ids', 'documents', 'metadatas', 'total'
+            Dict with 'ids', the included fields, 'next_cursor' (None on
+            the last page) and 'total' (None without ``with_total``)
         """
+        include = ["documents", "metadatas"] if include is None else include
         try:
-            # Get total count first
-            if where:
-                # ChromaDB doesn't provide count with filter, so get all and count
-                all_results = self.collection.get(where=where)
-                total = len(all_results.get("ids", []))
-            else:
-                total = self.collection.count()
+            if cursor is not None:
+                offset = int(cursor)
+            total = self.count(where) if with_total else None
 
-            # Get paginated results
+            # One extra row tells whether another page follows
             results = self.collection.get(
                 where=where,
-                limit=limit,
+                limit=limit + 1,
                 offset=offset,
+                include=include,
             )
+            results = {key: results.get(key) or [] for key in ["ids", *include]}
+            has_more = len(results["ids"]) > limit
+            results = {key: values[:limit] for key, values in results.items()}
 
             # Deserialise metadata
-            if results and results.get("metadatas"):
-                results["metadatas"] = deserialize_batch_metadata(results["metadatas"])  # type: ignore[arg-type, typeddict-item]
-
-            # Add total count
-            results["total"] = total  # type: ignore[typeddict-item]
+            if results.get("metadatas"):
+                results["metadatas"] = deserialize_batch_metadata(results["metadatas"])
 
-            return cast(dict[str, Any], results)
+            results["next_cursor"] = str(offset + limit) if has_more else None
+            results["total"] = total
+            return results
         except (ConnectionError, TimeoutError, KeyError, ValueError, TypeError) as e:
             logger.error(f"Failed to list documents: {e}")
-            return {"ids": [], "documents": [], "metadatas": [], "total": 0}
+            empty: dict[str, Any] = {key: [] for key in ["ids", *include]}
+            return {**empty, "next_cursor": None, "total": 0}
 
-    def count(self) -> int:
+    def count(self, where: dict[str, Any] | None = None) -> int:
         """
         Get count of embeddings in ChromaDB collection.
 
+        Args:
+            where: Optional metadata filter
+
         Returns:
-            Number of embeddings
+            Number of embeddings (matching the filter)
         """
-        return self.collection.count()
+        if not where:
+            return self.collection.count()
+        # ChromaDB has no filtered count; fetch ids only, not documents
+        return len(self.collection.get(where=where, include=[]).get("ids") or [])
 
     def clear(self) -> None:
         """
@@ -377,11 +444,68 @@ class ChromaDBStore(VectorStore):
                 name=self._collection_name,
                 metadata={"description": "ragged document chunks"}
             )
+            self.facets.clear(self._collection_name)
             logger.info(f"Cleared collection {self._collection_name}")
         except (ConnectionError, TimeoutError, ValueError, AttributeError) as e:
             logger.error(f"Failed to clear collection: {e}")
             raise VectorStoreError(f"Failed to clear collection: {e}")
 
+    def facet_counts(self, field: str) -> dict[Any, int]:
+        """
+        Count chunks per value of a metadata field.
+
+        Reads the maintained facet index, so the cost depends on the number
+        of distinct values rather than the size of the collection.
+
+        Args:
+            field: Metadata field
+
+        Returns:
+            Dictionary mapping values to chunk counts, most frequent first
+        """
+        return self.facets.counts(self._collection_name, field)
+
+    def facet_fields(self) -> builtins.list[str]:
+        """
+        List metadata fields that have facet counts.
+
+        Returns:
+            Sorted field names
+        """
+        return self.facets.field_names(self._collection_name)
+
+    def facets_stale(self) -> bool:
+        """
+        Check whether facet counts cover a different number of chunks than
+        the collection holds (e.g. data stored before facets were tracked).
+
+        Returns:
+            True if the facet index should be rebuilt
+        """
+        return self.facets.total(self._collection_name) != self.count()
+
+    def rebuild_facets(self) -> int:
+        """
+        Recount facets from every chunk's metadata in the collection.
+
+        Returns:
+            Number of chunks counted
+        """
+        metadatas: list[dict[str, Any]] = []
+        offset = 0
+        while True:
+            page = self.collection.get(
+                include=["metadatas"], limit=FACET_REBUILD_PAGE_SIZE, offset=offset
+            )
+            page_metadatas = page.get("metadatas") or []
+            metadatas.extend(deserialize_batch_metadata(cast(list[dict[str, Any]], page_metadatas)))
+            if len(page_metadatas) < FACET_REBUILD_PAGE_SIZE:
+                break
+            offset += FACET_REBUILD_PAGE_SIZE
+
+        self.facets.rebuild(self._collection_name, metadatas)
+        return len(metadatas)
+
     def get_collection_info(self) -> dict[str, Any]:
         """
         Get information about the ChromaDB collection.
@@ -0,0 +1,192 @@
+"""Persistent facet counts for vector store metadata.
+
+Keeps a value -> count table per collection and metadata field, updated as
+chunks are added, re-tagged and deleted, so facet queries cost
+O(distinct values) instead of a scan over every stored chunk.
+"""
+
+import json
+import sqlite3
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from src.retrieval.metadata_filter import ALLOWED_METADATA_FIELDS
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class FacetIndex:
+    """SQLite-backed facet counts, keyed by collection, field and value.
+
+    Counts are per stored chunk. List values count once per element. Only
+    the filterable metadata fields are counted by default, which keeps
+    per-chunk bookkeeping fields (hashes, positions) out of the table.
+
+    Example:
+        >>> facets = FacetIndex()
+        >>> facets.add("docs", [{"tag": "python"}, {"tag": "python"}])
+        >>> facets.counts("docs", "tag")
+        {'python': 2}
+    """
+
+    def __init__(self, db_path: Path | None = None, fields: Iterable[str] | None = None):
+        """
+        Initialize facet index with SQLite database.
+
+        Args:
+            db_path: Path to SQLite database file.
+                     Defaults to the configured facet index path
+            fields: Metadata fields to count (default: the fields
+                    metadata filters accept)
+        """
+        if db_path is None:
+            from src.config.settings import get_settings
+            db_path = get_settings().facet_index_path
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.fields = frozenset(fields) if fields is not None else frozenset(ALLOWED_METADATA_FIELDS)
+
+        self._init_database()
+        logger.debug(f"Facet index at {self.db_path}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the facet database."""
+        return sqlite3.connect(self.db_path, timeout=30.0)
+
+    def _init_database(self) -> None:
+        """Create database schema if not exists."""
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS facet_counts (
+                    collection TEXT NOT NULL,
+                    field TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (collection, field, value)
+                )
+            """)
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS facet_totals (
+                    collection TEXT PRIMARY KEY,
+                    chunks INTEGER NOT NULL
+                )
+            """)
+
+            conn.commit()
+
+    def _tally(self, metadatas: Iterable[dict[str, Any]]) -> Counter[tuple[str, str]]:
+        """Count (field, encoded value) pairs in a batch of metadata."""
+        tally: Counter[tuple[str, str]] = Counter()
+        for metadata in metadatas:
+            for field, value in (metadata or {}).items():
+                if field not in self.fields or value is None:
+                    continue
+                for item in value if isinstance(value, (list, tuple)) else [value]:
+                    tally[(field, json.dumps(item, default=str))] += 1
+        return tally
+
+    def _apply(
+        self,
+        collection: str,
+        added: list[dict[str, Any]],
+        removed: list[dict[str, Any]],
+    ) -> None:
+        """Adjust counts by one batch of added and removed chunks."""
+        delta = self._tally(added)
+        delta.subtract(self._tally(removed))
+        chunks = len(added) - len(removed)
+
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO facet_counts (collection, field, value, count)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (collection, field, value) DO UPDATE SET count = count + excluded.count
+                """,
+                [(collection, field, value, count) for (field, value), count in delta.items() if count],
+            )
+            conn.execute(
+                "DELETE FROM facet_counts WHERE collection = ? AND count <= 0", (collection,)
+            )
+            conn.execute(
+                """
+                INSERT INTO facet_totals (collection, chunks) VALUES (?, MAX(?, 0))
+                ON CONFLICT (collection) DO UPDATE SET chunks = MAX(chunks + ?, 0)
+                """,
+                (collection, chunks, chunks),
+            )
+            conn.commit()
+
+    def add(self, collection: str, metadatas: list[dict[str, Any]]) -> None:
+        """Count the metadata of chunks being stored."""
+        self._apply(collection, metadatas, [])
+
+    def remove(self, collection: str, metadatas: list[dict[str, Any]]) -> None:
+        """Uncount the metadata of chunks being deleted."""
+        self._apply(collection, [], metadatas)
+
+    def replace(
+        self,
+        collection: str,
+        old_metadatas: list[dict[str, Any]],
+        new_metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Move counts from chunks' previous metadata to their new metadata."""
+        self._apply(collection, new_metadatas, old_metadatas)
+
+    def clear(self, collection: str) -> None:
+        """Drop all counts of a collection."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM facet_counts WHERE collection = ?", (collection,))
+            conn.execute("DELETE FROM facet_totals WHERE collection = ?", (collection,))
+            conn.commit()
+
+    def rebuild(self, collection: str, metadatas: Iterable[dict[str, Any]]) -> None:
+        """Recount a collection from the metadata of all its chunks."""
+        metadatas = list(metadatas)
+        self.clear(collection)
+        self.add(collection, metadatas)
+        logger.info(f"Rebuilt facet counts for {collection} from {len(metadatas)} chunks")
+
+    def counts(self, collection: str, field: str) -> dict[Any, int]:
+        """Value counts of a field, most frequent first.
+
+        Args:
+            collection: Collection name
+            field: Metadata field
+
+        Returns:
+            Dictionary mapping values to chunk counts
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT value, count FROM facet_counts
+                WHERE collection = ? AND field = ?
+                ORDER BY count DESC, value
+                """,
+                (collection, field),
+            ).fetchall()
+        return {json.loads(value): count for value, count in rows}
+
+    def field_names(self, collection: str) -> list[str]:
+        """Fields with at least one counted value."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT field FROM facet_counts WHERE collection = ? ORDER BY field",
+                (collection,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def total(self, collection: str) -> int:
+        """Number of chunks counted for a collection."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT chunks FROM facet_totals WHERE collection = ?", (collection,)
+            ).fetchone()
+        return row[0] if row else 0
@@ -8,6 +8,7 @@ Qdrant, Weaviate, etc.) with zero code changes.
 v0.3.6: Initial abstraction layer for multi-backend support.
 """
 
+import builtins
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -192,41 +193,68 @@ class VectorStore(ABC):
         limit: int = 100,
         offset: int = 0,
         where: dict[str, Any] | None = None,
+        include: builtins.list[str] | None = None,
+        cursor: str | None = None,
+        with_total: bool = True,
     ) -> dict[str, Any]:
         """
         List documents with pagination support.
 
+        Pages can be walked with offsets or by passing each page's
+        ``next_cursor`` to the next call. A cursor is opaque to callers, but
+        backends may implement it as an offset, in which case each page
+        still costs a scan of the rows before it, and pages shift if
+        matching documents are added or deleted while walking.
+
         Args:
             limit: Maximum number of documents to return (default: 100)
-            offset: Number of documents to skip (default: 0)
+            offset: Number of documents to skip (default: 0, ignored with
+                a cursor)
             where: Optional metadata filter
+            include: Fields to fetch besides ids, from "documents" and
+                "metadatas" (default: both)
+            cursor: Opaque ``next_cursor`` returned with the previous page
+            with_total: Count all matching documents (default: True)
 
         Returns:
             Dictionary containing:
                 - ids: List of document IDs
-                - documents: List of document texts
-                - metadatas: List of metadata dictionaries
-                - total: Total number of matching documents
+                - documents: List of document texts (if included)
+                - metadatas: List of metadata dictionaries (if included)
+                - next_cursor: Cursor of the next page, None on the last page
+                - total: Total number of matching documents (None without
+                  ``with_total``)
 
         Example:
             >>> # Get first page
             >>> page1 = store.list(limit=50, offset=0)
             >>> # Get second page
             >>> page2 = store.list(limit=50, offset=50)
+            >>> # Walk metadata only, without counting or fetching text
+            >>> page = store.list(limit=50, include=["metadatas"], with_total=False)
+            >>> while page["next_cursor"]:
+            ...     page = store.list(
+            ...         limit=50, include=["metadatas"], cursor=page["next_cursor"], with_total=False
+            ...     )
         """
         pass
 
     @abstractmethod
-    def count(self) -> int:
+    def count(self, where: dict[str, Any] | None = None) -> int:
         """
         Get the total number of documents in the vector store.
 
+        Args:
+            where: Optional metadata filter; only matching documents are
+                counted
+
         Returns:
             Total count of documents
 
         Example:
             >>> total = store.count()
             >>> print(f"Vector store contains {total} documents")
+            >>> pdfs = store.count(where={"file_type": "pdf"})
         """
         pass
 
@@ -8,7 +8,8 @@ import functools
 import threading
 import time
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 from src.exceptions import RaggedError
 from src.utils.logging import get_logger
@@ -206,26 +207,8 @@ class CircuitBreaker:
                 if elapsed >= self.recovery_timeout:
                     self._transition_to_half_open()
 
-    def call(self, func: Callable, *args, **kwargs):
-        """
-        Execute function with circuit breaker protection.
-
-        Args:
-            func: Function to call
-            *args: Positional arguments for func
-            **kwargs: Keyword arguments for func
-
-        Returns:
-            Result from func
-
-        Raises:
-            CircuitBreakerOpenError: If circuit is open
-            Exception: Any exception from func
-
-        Example:
-            >>> breaker = CircuitBreaker(name="api")
-            >>> result = breaker.call(api_request, "GET", "/users")
-        """
+    def _before_call(self) -> None:
+        """Reject the call if the circuit is open or half-open and saturated."""
         # Check if we should try recovery
         if self._state == CircuitState.OPEN:
             self._check_recovery()
@@ -249,6 +232,28 @@ class CircuitBreaker:
                     )
                 self._half_open_calls += 1
 
+    def call(self, func: Callable, *args, **kwargs):
+        """
+        Execute function with circuit breaker protection.
+
+        Args:
+            func: Function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result from func
+
+        Raises:
+            CircuitBreakerOpenError: If circuit is open
+            Exception: Any exception from func
+
+        Example:
+            >>> breaker = CircuitBreaker(name="api")
+            >>> result = breaker.call(api_request, "GET", "/users")
+        """
+        self._before_call()
+
         # Execute function
         try:
             result = func(*args, **kwargs)
@@ -258,6 +263,34 @@ class CircuitBreaker:
             self._record_failure(e)
             raise
 
+    async def call_async(self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """
+        Await a coroutine function with circuit breaker protection.
+
+        v0.5.2: Same state machine as :meth:`call`, shared with sync callers.
+
+        Args:
+            func: Coroutine function to await
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result from func
+
+        Raises:
+            CircuitBreakerOpenError: If circuit is open
+            Exception: Any exception from func
+        """
+        self._before_call()
+
+        try:
+            result = await func(*args, **kwargs)
+            self._record_success()
+            return result
+        except Exception as e:
+            self._record_failure(e)
+            raise
+
     def protect(self, func: Callable) -> Callable:
         """
         Decorator to protect a function with circuit breaker.
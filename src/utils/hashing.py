@@ -4,6 +4,7 @@ Provides consistent SHA-256 hashing functions used throughout the codebase.
 """
 
 import hashlib
+from pathlib import Path
 
 
 def hash_content(content: str | bytes, encoding: str = "utf-8") -> str:
@@ -60,6 +61,24 @@ def hash_file_content(content: str, sample_size: int = 1024) -> str:
     return hashlib.sha256(first_sample + last_sample).hexdigest()
 
 
+def hash_file(file_path: Path) -> str:
+    """Generate SHA-256 hash of a file's raw bytes.
+
+    The file is streamed in blocks, so memory use does not grow with file size.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hexadecimal SHA-256 hash string
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
 def hash_query(query: str) -> str:
     """Generate cache key hash for query strings.
 
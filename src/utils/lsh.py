@@ -0,0 +1,165 @@
+"""Locality-sensitive hashing for near-duplicate detection.
+
+Finds candidate pairs of similar items without comparing every pair:
+
+- HammingLSH buckets fixed-width integer hashes (e.g. dHash) by bands of
+  bits, so hashes within a Hamming distance share a bucket
+- MinHashLSH buckets MinHash signatures of shingle sets by bands, so sets
+  above a Jaccard threshold share a bucket with high probability
+
+Candidates still need exact verification; the indexes only make sure
+similar items collide while dissimilar ones rarely do.
+"""
+
+import zlib
+from collections import defaultdict
+from collections.abc import Iterable
+from itertools import combinations
+
+import numpy as np
+
+# Prime just above 2**32, so (a * x + b) of 32-bit values fits in uint64
+MINHASH_PRIME = 4_294_967_311
+# Probability that a pair exactly at the threshold becomes a candidate
+MINHASH_TARGET_RECALL = 0.999
+
+
+def hamming_distance(hash1: int, hash2: int) -> int:
+    """Number of differing bits between two integer hashes."""
+    return (hash1 ^ hash2).bit_count()
+
+
+def word_shingles(text: str, size: int = 3) -> set[str]:
+    """Overlapping runs of ``size`` words in normalised text.
+
+    Texts shorter than ``size`` words form a single shingle.
+
+    Args:
+        text: Text to shingle
+        size: Words per shingle
+
+    Returns:
+        Set of shingles (empty for blank text)
+    """
+    words = text.lower().split()
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+def jaccard(set1: set, set2: set) -> float:
+    """Jaccard similarity of two sets (1.0 for two empty sets)."""
+    if not set1 and not set2:
+        return 1.0
+    return len(set1 & set2) / len(set1 | set2)
+
+
+def _bucket_pairs(buckets: Iterable[list[int]]) -> set[tuple[int, int]]:
+    """Pairs of keys sharing a bucket, smaller key first."""
+    pairs: set[tuple[int, int]] = set()
+    for keys in buckets:
+        for key1, key2 in combinations(keys, 2):
+            pairs.add((key1, key2) if key1 < key2 else (key2, key1))
+    return pairs
+
+
+class HammingLSH:
+    """Banded index of integer hashes for Hamming-distance candidates.
+
+    The hash is split into ``max_distance + 1`` bands. Two hashes differing
+    in at most ``max_distance`` bits must agree on at least one band
+    (pigeonhole), so no pair within the distance is missed.
+
+    Example:
+        >>> index = HammingLSH(bits=64, max_distance=3)
+        >>> index.add(1, 0xF0F0F0F0F0F0F0F0)
+        >>> index.add(2, 0xF0F0F0F0F0F0F0F1)
+        >>> index.candidates()
+        {(1, 2)}
+    """
+
+    def __init__(self, bits: int, max_distance: int):
+        """
+        Initialise the index.
+
+        Args:
+            bits: Width of the hashes
+            max_distance: Largest Hamming distance that must be found
+        """
+        bands = max(1, min(bits, max_distance + 1))
+        bounds = [round(band * bits / bands) for band in range(bands + 1)]
+        # (shift, mask) selecting each band's bits
+        self._bands = [(start, (1 << (end - start)) - 1) for start, end in zip(bounds[:-1], bounds[1:], strict=True)]
+        self._buckets: dict[tuple[int, int], list[int]] = defaultdict(list)
+
+    def add(self, key: int, value: int) -> None:
+        """Index a hash under a key."""
+        for band, (shift, mask) in enumerate(self._bands):
+            self._buckets[(band, (value >> shift) & mask)].append(key)
+
+    def candidates(self) -> set[tuple[int, int]]:
+        """Pairs of keys whose hashes agree on at least one band."""
+        return _bucket_pairs(self._buckets.values())
+
+
+class MinHashLSH:
+    """Banded MinHash index of shingle sets for Jaccard-similarity candidates.
+
+    Bands are chosen so that a pair exactly at the threshold collides with
+    probability MINHASH_TARGET_RECALL, using as many rows per band as that
+    allows to keep dissimilar pairs apart.
+
+    Example:
+        >>> index = MinHashLSH(threshold=0.9)
+        >>> index.add(1, word_shingles("the quick brown fox jumps over the lazy dog"))
+        >>> index.add(2, word_shingles("the quick brown fox jumps over the lazy dog"))
+        >>> index.candidates()
+        {(1, 2)}
+    """
+
+    def __init__(self, threshold: float, num_perm: int = 64, seed: int = 0):
+        """
+        Initialise the index.
+
+        Args:
+            threshold: Jaccard similarity candidates should reach
+            num_perm: Number of hash functions in each signature
+            seed: Seed for the hash functions
+        """
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+        self.rows = self._rows_per_band(threshold, num_perm)
+        self._buckets: dict[tuple[int, bytes], list[int]] = defaultdict(list)
+
+    @staticmethod
+    def _rows_per_band(threshold: float, num_perm: int) -> int:
+        """Most rows per band that still reach the target recall at the threshold."""
+        rows = 1
+        for candidate in range(1, num_perm + 1):
+            if num_perm % candidate:
+                continue
+            recall = 1.0 - (1.0 - threshold**candidate) ** (num_perm // candidate)
+            if recall >= MINHASH_TARGET_RECALL:
+                rows = candidate
+        return rows
+
+    def signature(self, shingles: set[str]) -> np.ndarray:
+        """MinHash signature of a non-empty shingle set."""
+        values = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        hashed = (self._a[:, None] * values[None, :] + self._b[:, None]) % np.uint64(MINHASH_PRIME)
+        return hashed.min(axis=1)
+
+    def add(self, key: int, shingles: set[str]) -> None:
+        """Index a non-empty shingle set under a key."""
+        signature = self.signature(shingles)
+        for band, start in enumerate(range(0, len(signature), self.rows)):
+            self._buckets[(band, signature[start : start + self.rows].tobytes())].append(key)
+
+    def candidates(self) -> set[tuple[int, int]]:
+        """Pairs of keys whose signatures agree on at least one band."""
+        return _bucket_pairs(self._buckets.values())
@@ -2,6 +2,8 @@
 
 v0.2.9: Three-tier caching strategy for 30-50x performance improvement.
 v0.2.10: Replaced pickle with safe JSON serialization (FEAT-SEC-001).
+v0.5.2: L2 stores embeddings in a memory-mapped slab file instead of one JSON
+        file per entry.
 
 Tiers:
 - L1: Query embedding cache (fast, small, in-memory)
@@ -9,8 +11,11 @@ Tiers:
 - L3: Retrieved results cache (comprehensive, existing QueryCache)
 """
 
+import json
+import os
 import threading
 from collections import OrderedDict
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -21,11 +26,18 @@ import numpy as np
 from src.retrieval.cache import QueryCache
 from src.utils.hashing import hash_content
 from src.utils.logging import get_logger
-from src.utils.serialization import list_to_numpy_array, load_json, numpy_array_to_list, save_json
+from src.utils.serialization import list_to_numpy_array, load_json, save_json
 
 logger = get_logger(__name__)
 
 
+def _stack(embeddings: list[np.ndarray]) -> np.ndarray:
+    """Stack cached embeddings into a ``(n, dim)`` array (``(0, 0)`` if empty)."""
+    if not embeddings:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.stack([np.asarray(e).reshape(-1) for e in embeddings])
+
+
 @dataclass
 class EmbeddingCacheEntry:
     """Cache entry for embeddings."""
@@ -123,6 +135,62 @@ class L1QueryEmbeddingCache:
                 f"(shape={embedding.shape})"
             )
 
+    def get_many(self, queries: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Look up several query embeddings under a single lock.
+
+        Args:
+            queries: Query strings
+
+        Returns:
+            Tuple of (boolean hit mask aligned with ``queries``, array of shape
+            ``(hits, dim)`` holding the cached embeddings in input order)
+        """
+        keys = [hash_content(query) for query in queries]
+        hits = np.zeros(len(keys), dtype=bool)
+        found = []
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                entry = self._cache.get(key)
+                if entry is None:
+                    continue
+
+                hits[i] = True
+                self._cache.move_to_end(key)  # Update LRU order
+                entry.touch()
+                found.append(entry.embedding)
+
+            self._hits += len(found)
+            self._misses += len(keys) - len(found)
+
+        logger.debug(f"L1 batch lookup: {len(found)}/{len(keys)} hits")
+        return hits, _stack(found)
+
+    def set_many(self, queries: Sequence[str], embeddings: np.ndarray) -> None:
+        """Store several query embeddings under a single lock.
+
+        Args:
+            queries: Query strings
+            embeddings: Array of shape ``(len(queries), dim)``
+        """
+        if len(embeddings) != len(queries):
+            raise ValueError(
+                f"Got {len(embeddings)} embeddings for {len(queries)} queries"
+            )
+
+        keys = [hash_content(query) for query in queries]
+
+        with self._lock:
+            for key, embedding in zip(keys, embeddings, strict=True):
+                # Evict oldest if at capacity
+                if len(self._cache) >= self.maxsize and key not in self._cache:
+                    del self._cache[next(iter(self._cache))]
+
+                self._cache[key] = EmbeddingCacheEntry(key=key, embedding=embedding)
+                self._cache.move_to_end(key)
+
+        logger.debug(f"L1 cached {len(keys)} query embeddings")
+
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
@@ -158,19 +226,34 @@ class L2DocumentEmbeddingCache:
     """L2: Disk-backed cache for document embeddings.
 
     Characteristics:
-    - Medium speed (disk I/O with in-memory index)
-    - Medium size (1000-10000 documents)
+    - Fast (memory-mapped slab file)
+    - Medium size (1000-100000 documents)
     - Persistent across restarts
-    - LRU eviction policy
+    - LRU eviction policy with free-slot reuse
+
+    Storage (v0.5.2, replaces one JSON file per embedding):
+    - ``l2_slab.bin``: fixed-dimension float32/float16 rows, memory-mapped
+    - ``l2_index.jsonl``: append-only key -> slot journal, compacted when it
+      grows well past the number of live entries. Batches are fsynced as they
+      are stored; single sets are buffered and fsynced every
+      ``JOURNAL_SYNC_RECORDS`` records or on :meth:`flush`/:meth:`close`
+    - ``l2_meta.json``: slab dimension, dtype and capacity
+
+    Embeddings returned by :meth:`get` are copies: slab rows are reused after
+    eviction, so a view would silently change to another entry's data.
 
     Use case: Frequently accessed documents, stable corpus.
     """
 
+    FORMAT_VERSION = "2.0"
+    JOURNAL_SYNC_RECORDS = 64
+
     def __init__(
         self,
         cache_dir: Path,
         maxsize: int = 5000,
-        memory_index_size: int = 1000
+        memory_index_size: int = 1000,
+        dtype: str = "float32",
     ):
         """Initialize L2 cache.
 
@@ -178,19 +261,33 @@ class L2DocumentEmbeddingCache:
             cache_dir: Directory for cache files
             maxsize: Maximum number of document embeddings
             memory_index_size: Number of hot entries to keep in memory
+            dtype: Storage dtype for embeddings ("float32" or "float16")
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         self.maxsize = maxsize
         self.memory_index_size = memory_index_size
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float16):
+            raise ValueError(f"Unsupported L2 cache dtype: {dtype}")
 
-        # In-memory hot cache (subset of disk cache)
+        # Hot entries (views into the slab)
         self._hot_cache: OrderedDict[str, np.ndarray] = OrderedDict()
 
-        # Disk index tracking all entries (v0.2.10: migrated from .pkl to .json)
-        self._index_path = self.cache_dir / "l2_index.json"
-        self._index: OrderedDict[str, dict[str, Any]] = self._load_index()
+        self._meta_path = self.cache_dir / "l2_meta.json"
+        self._slab_path = self.cache_dir / "l2_slab.bin"
+        self._journal_path = self.cache_dir / "l2_index.jsonl"
+        self._legacy_index_path = self.cache_dir / "l2_index.json"
+        self._legacy_pickle_index_path = self.cache_dir / "l2_index.pkl"
+
+        self._slab: np.memmap | None = None
+        self._dim: int | None = None
+        self._capacity = 0
+        self._next_slot = 0
+        self._free_slots: list[int] = []
+        self._journal_lines = 0
+        self._pending_records: list[dict[str, Any]] = []
 
         self._lock = threading.RLock()
         self._hits = 0
@@ -198,95 +295,299 @@ class L2DocumentEmbeddingCache:
         self._disk_reads = 0
         self._disk_writes = 0
 
+        # Index of all entries in LRU order: key -> {doc_id, slot, ...}
+        self._index: OrderedDict[str, dict[str, Any]] = self._load_index()
+
         logger.info(
             f"Initialized L2 document embedding cache "
             f"(maxsize={maxsize}, hot={memory_index_size}, dir={cache_dir})"
         )
 
     def _load_index(self) -> OrderedDict:
-        """Load disk index if exists.
+        """Open the slab and replay the key -> slot journal.
 
-        Security: Replaced pickle with JSON (v0.2.10 FEAT-SEC-001).
-        Automatically migrates legacy .pkl index files to .json.
+        Legacy per-entry caches (JSON from v0.2.10, pickle from earlier) are
+        migrated into the slab.
         """
-        # Try loading JSON index first
-        if self._index_path.exists():
+        index: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+        if self._meta_path.exists():
             try:
-                data = load_json(self._index_path)
-                # Convert to OrderedDict (JSON loads as regular dict)
-                index = OrderedDict(data.get("entries", {}))
+                meta = load_json(self._meta_path)
+                if meta.get("version") != self.FORMAT_VERSION or meta["dtype"] != self.dtype.name:
+                    logger.info("L2 slab format or dtype changed, starting empty")
+                    self._remove_files()
+                    return index
+
+                self._dim = meta["dim"]
+                self._capacity = meta["capacity"]
+                self._slab = np.memmap(
+                    self._slab_path, dtype=self.dtype, mode="r+", shape=(self._capacity, self._dim)
+                )
+                index = self._replay_journal()
                 logger.info(f"Loaded L2 index: {len(index)} entries")
                 return index
             except Exception as e:
-                logger.warning(f"Failed to load L2 JSON index: {e}")
-
-        # Try loading legacy pickle index for migration
-        pkl_index_path = self.cache_dir / "l2_index.pkl"
-        if pkl_index_path.exists():
-            try:
+                logger.warning(f"Failed to load L2 slab cache: {e}")
+                self._remove_files()
+                self._slab = None
+                self._dim = None
+                self._capacity = 0
+                return OrderedDict()
+
+        if self._legacy_index_path.exists() or self._legacy_pickle_index_path.exists():
+            self._index = index
+            self._migrate_legacy_cache()
+
+        return index
+
+    def _replay_journal(self) -> OrderedDict:
+        """Rebuild the LRU index and free-slot list from the journal."""
+        index: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+        if self._journal_path.exists():
+            with open(self._journal_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning("Ignoring torn entry at end of L2 journal")
+                        break
+
+                    self._journal_lines += 1
+                    if record["op"] == "set":
+                        index.pop(record["key"], None)
+                        index[record["key"]] = {
+                            "doc_id": record["doc_id"],
+                            "slot": record["slot"],
+                            "created_at": datetime.fromtimestamp(record["time"]),
+                            "accessed_at": datetime.fromtimestamp(record["time"]),
+                            "access_count": 0,
+                        }
+                    else:
+                        index.pop(record["key"], None)
+
+        used = {entry["slot"] for entry in index.values()}
+        self._next_slot = max(used) + 1 if used else 0
+        self._free_slots = [slot for slot in range(self._next_slot) if slot not in used]
+
+        return index
+
+    def _load_legacy_embedding(self, key: str) -> np.ndarray | None:
+        """Read one legacy per-entry embedding file (JSON, or pickle before v0.2.10)."""
+        json_path = self.cache_dir / f"{key}.json"
+        if json_path.exists():
+            return list_to_numpy_array(load_json(json_path)["embedding"])
+
+        pkl_path = self.cache_dir / f"{key}.pkl"
+        if pkl_path.exists():
+            import pickle
+            with open(pkl_path, "rb") as f:
+                return np.asarray(pickle.load(f))  # noqa: S301 (migration only)
+
+        return None
+
+    def _migrate_legacy_cache(self) -> None:
+        """Move per-entry JSON (v0.2.10) and pickle (earlier) embeddings into the slab."""
+        try:
+            entries: dict[str, Any] = {}
+            if self._legacy_pickle_index_path.exists():
                 import pickle
-                with open(pkl_index_path, "rb") as f:
-                    index = pickle.load(f)  # noqa: S301 (migration only)
-                logger.info(f"Loaded legacy L2 pickle index: {len(index)} entries")
-                logger.info("Auto-migrating L2 index from pickle to JSON...")
-                # Save as JSON and remove legacy pkl
-                self._index = index
-                self._save_index()
-                pkl_index_path.unlink()
-                logger.info("L2 index migration complete")
-                return index
-            except Exception as e:
-                logger.warning(f"Failed to load legacy L2 pickle index: {e}")
-
-        return OrderedDict()
+                with open(self._legacy_pickle_index_path, "rb") as f:
+                    entries.update(pickle.load(f))  # noqa: S301 (migration only)
+            if self._legacy_index_path.exists():
+                entries.update(load_json(self._legacy_index_path).get("entries", {}))
+            logger.info(f"Migrating {len(entries)} legacy L2 entries to slab storage...")
+
+            for key, entry in entries.items():
+                try:
+                    embedding = self._load_legacy_embedding(key)
+                except Exception as e:
+                    logger.warning(f"Skipping unreadable legacy L2 entry {key[:16]}...: {e}")
+                    embedding = None
+
+                if embedding is not None:
+                    doc_id = entry.get("doc_id", key) if isinstance(entry, dict) else key
+                    self._store(key, doc_id, embedding)
+
+                for suffix in (".json", ".pkl"):
+                    (self.cache_dir / f"{key}{suffix}").unlink(missing_ok=True)
+
+            self._legacy_index_path.unlink(missing_ok=True)
+            self._legacy_pickle_index_path.unlink(missing_ok=True)
+            self._sync_journal()
+            logger.info("L2 cache migration complete")
+        except Exception as e:
+            logger.warning(f"Failed to migrate legacy L2 cache: {e}")
+
+    def _write_meta(self) -> None:
+        save_json(
+            {
+                "version": self.FORMAT_VERSION,
+                "dim": self._dim,
+                "dtype": self.dtype.name,
+                "capacity": self._capacity,
+            },
+            self._meta_path,
+        )
 
-    def _save_index(self) -> None:
-        """Save disk index using safe JSON serialization.
+    def _remove_files(self) -> None:
+        for path in (self._meta_path, self._slab_path, self._journal_path):
+            if path.exists():
+                path.unlink()
 
-        Security: Replaced pickle with JSON (v0.2.10 FEAT-SEC-001).
-        """
-        try:
-            # Convert datetime objects to ISO strings for JSON compatibility
-            serializable_index = {}
-            for key, value in self._index.items():
-                serializable_entry = value.copy()
-                if "created_at" in serializable_entry:
-                    serializable_entry["created_at"] = serializable_entry["created_at"].isoformat()
-                if "accessed_at" in serializable_entry:
-                    serializable_entry["accessed_at"] = serializable_entry["accessed_at"].isoformat()
-                if "shape" in serializable_entry:
-                    serializable_entry["shape"] = list(serializable_entry["shape"])
-                serializable_index[key] = serializable_entry
-
-            data = {"version": "1.0", "entries": serializable_index}
-            save_json(data, self._index_path)
-        except Exception as e:
-            logger.error(f"Failed to save L2 index: {e}")
+    def _ensure_slab(self, dim: int) -> None:
+        """Create the slab on first write, or reset it if the dimension changed."""
+        if self._slab is not None and dim == self._dim:
+            return
 
-    def _get_cache_path(self, key: str) -> Path:
-        """Get cache file path for key.
+        if self._slab is not None:
+            logger.warning(
+                f"L2 embedding dimension changed ({self._dim} -> {dim}), clearing cache"
+            )
+            self.clear()
 
-        Note: v0.2.10 migrated from .pkl to .json for security.
-        """
-        return self.cache_dir / f"{key}.json"
+        self._dim = dim
+        self._resize(min(self.maxsize, 64))
+        self._journal_path.write_text("", encoding="utf-8")
+        self._journal_lines = 0
 
-    def _save_embedding_to_disk(self, key: str, embedding: np.ndarray) -> None:
-        """Save embedding to disk as JSON.
+    def _resize(self, capacity: int) -> None:
+        """Grow (or create) the slab file to hold ``capacity`` rows."""
+        assert self._dim is not None
+        if self._slab is not None:
+            self._slab.flush()
+            self._slab = None
 
-        Args:
-            key: Cache key
-            embedding: Numpy array to save
+        with open(self._slab_path, "ab") as f:
+            f.truncate(capacity * self._dim * self.dtype.itemsize)
 
-        Security: Replaced pickle with JSON (v0.2.10 FEAT-SEC-001).
-        """
-        cache_path = self._get_cache_path(key)
-        data = {
-            "version": "1.0",
-            "embedding": numpy_array_to_list(embedding),
-            "dtype": str(embedding.dtype),
-            "shape": list(embedding.shape),
+        self._slab = np.memmap(
+            self._slab_path, dtype=self.dtype, mode="r+", shape=(capacity, self._dim)
+        )
+        self._capacity = capacity
+        self._write_meta()
+
+        # Hot views point at the previous mapping
+        self._hot_cache.clear()
+
+    def _allocate_slot(self) -> int:
+        """Reuse a freed slot or take the next one, growing the slab if needed."""
+        if self._free_slots:
+            return self._free_slots.pop()
+
+        if self._next_slot >= self._capacity:
+            self._resize(min(self.maxsize, max(self._capacity * 2, 64)))
+
+        slot = self._next_slot
+        self._next_slot += 1
+        return slot
+
+    def _view(self, slot: int) -> np.ndarray:
+        """Read-only zero-copy view of a slab row."""
+        assert self._slab is not None
+        view = self._slab[slot]
+        view.flags.writeable = False
+        return view
+
+    def _append_journal(self, records: list[dict[str, Any]], sync: bool = True) -> None:
+        """Queue index changes, writing them out now or once enough are buffered."""
+        self._pending_records.extend(records)
+        if sync or len(self._pending_records) >= self.JOURNAL_SYNC_RECORDS:
+            self._sync_journal()
+
+    def _sync_journal(self) -> None:
+        """Durably append buffered index changes, compacting the journal when it gets long."""
+        if not self._pending_records:
+            return
+
+        # Rows the records point at reach disk before the records do
+        if self._slab is not None:
+            self._slab.flush()
+
+        with open(self._journal_path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(record) + "\n" for record in self._pending_records)
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_lines += len(self._pending_records)
+        self._pending_records = []
+
+        if self._journal_lines > 2 * max(len(self._index), 64):
+            self._rewrite_journal()
+
+    def _rewrite_journal(self) -> None:
+        """Rewrite the journal as one ``set`` record per live entry."""
+        tmp_path = self._journal_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for key, entry in self._index.items():
+                record = {
+                    "op": "set",
+                    "key": key,
+                    "slot": entry["slot"],
+                    "doc_id": entry["doc_id"],
+                    "time": entry["created_at"].timestamp(),
+                }
+                f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._journal_path)
+        self._journal_lines = len(self._index)
+
+    def _remember_hot(self, key: str, embedding: np.ndarray) -> None:
+        self._hot_cache[key] = embedding
+        self._hot_cache.move_to_end(key)
+
+        # Evict from hot cache if needed
+        if len(self._hot_cache) > self.memory_index_size:
+            oldest_hot_key = next(iter(self._hot_cache))
+            del self._hot_cache[oldest_hot_key]
+
+    def _evict(self, key: str) -> dict[str, Any]:
+        """Drop an entry from the index and free its slot."""
+        entry = self._index.pop(key)
+        self._free_slots.append(entry["slot"])
+        self._hot_cache.pop(key, None)
+        return {"op": "del", "key": key}
+
+    def _place(self, key: str, doc_id: str, now: datetime) -> tuple[int, list[dict[str, Any]]]:
+        """Assign a slot to ``key`` and return it with the journal records."""
+        records = []
+        entry = self._index.get(key)
+        if entry is None:
+            # Evict oldest if at capacity
+            if len(self._index) >= self.maxsize:
+                oldest_key = next(iter(self._index))
+                records.append(self._evict(oldest_key))
+                logger.debug(f"L2 evicting oldest: {oldest_key[:16]}...")
+            slot = self._allocate_slot()
+        else:
+            slot = entry["slot"]
+
+        self._index[key] = {
+            "doc_id": doc_id,
+            "slot": slot,
+            "created_at": now,
+            "accessed_at": now,
+            "access_count": 0,
         }
-        save_json(data, cache_path)
+        self._index.move_to_end(key)
+        records.append(
+            {"op": "set", "key": key, "slot": slot, "doc_id": doc_id, "time": now.timestamp()}
+        )
+        return slot, records
+
+    def _store(self, key: str, doc_id: str, embedding: np.ndarray) -> None:
+        """Write an embedding into its slot and journal the index change."""
+        vector = np.asarray(embedding).reshape(-1)
+        self._ensure_slab(vector.shape[0])
+        assert self._slab is not None
+
+        slot, records = self._place(key, doc_id, datetime.now())
+        self._slab[slot] = vector
+        self._disk_writes += 1
+        self._append_journal(records, sync=False)
+
+        self._remember_hot(key, self._view(slot))
 
     def get(self, doc_id: str) -> np.ndarray | None:
         """Get cached document embedding.
@@ -295,81 +596,40 @@ class L2DocumentEmbeddingCache:
             doc_id: Document identifier
 
         Returns:
-            Cached embedding or None if not found
+            Copy of the cached embedding, or None if not found
         """
         key = hash_content(doc_id)
 
         with self._lock:
-            # Check hot cache first
-            if key in self._hot_cache:
-                self._hits += 1
-                self._hot_cache.move_to_end(key)
-                logger.debug(f"L2 hot cache hit: {doc_id[:50]}...")
-                return self._hot_cache[key]
-
-            # Check disk index
-            if key not in self._index:
+            entry = self._index.get(key)
+            if entry is None:
                 self._misses += 1
                 logger.debug(f"L2 cache miss: {doc_id[:50]}...")
                 return None
 
-            # Load from disk (try JSON first, fallback to legacy .pkl for migration)
-            cache_path = self._get_cache_path(key)
-            pkl_cache_path = self.cache_dir / f"{key}.pkl"
-
-            if not cache_path.exists() and not pkl_cache_path.exists():
-                logger.warning(f"L2 index inconsistency: {key} not on disk")
-                del self._index[key]
-                self._misses += 1
-                return None
-
-            try:
-                # Try loading JSON cache file
-                if cache_path.exists():
-                    data = load_json(cache_path)
-                    embedding = list_to_numpy_array(data["embedding"])
-                # Fallback to legacy pickle for migration
-                elif pkl_cache_path.exists():
-                    import pickle
-                    with open(pkl_cache_path, "rb") as f:
-                        embedding = pickle.load(f)  # noqa: S301 (migration only)
-                    logger.debug(f"Auto-migrating embedding {key[:16]}... from pickle to JSON")
-                    # Save as JSON and remove legacy pkl
-                    self._save_embedding_to_disk(key, embedding)
-                    pkl_cache_path.unlink()
-                else:
-                    # Should not reach here due to earlier check
-                    self._misses += 1
-                    return None
+            self._hits += 1
 
-                self._disk_reads += 1
-                self._hits += 1
+            # Update index LRU
+            self._index.move_to_end(key)
+            entry["accessed_at"] = datetime.now()
+            entry["access_count"] += 1
 
-                # Update index LRU
-                self._index.move_to_end(key)
-                self._index[key]["accessed_at"] = datetime.now()
-                self._index[key]["access_count"] += 1
-
-                # Add to hot cache
-                self._hot_cache[key] = embedding
+            # Check hot cache first
+            if key in self._hot_cache:
                 self._hot_cache.move_to_end(key)
+                logger.debug(f"L2 hot cache hit: {doc_id[:50]}...")
+                return self._hot_cache[key].copy()
 
-                # Evict from hot cache if needed
-                if len(self._hot_cache) > self.memory_index_size:
-                    oldest_hot_key = next(iter(self._hot_cache))
-                    del self._hot_cache[oldest_hot_key]
+            embedding = self._view(entry["slot"])
+            self._disk_reads += 1
+            self._remember_hot(key, embedding)
 
-                logger.debug(
-                    f"L2 disk cache hit: {doc_id[:50]}... "
-                    f"(accessed {self._index[key]['access_count']} times)"
-                )
+            logger.debug(
+                f"L2 disk cache hit: {doc_id[:50]}... "
+                f"(accessed {entry['access_count']} times)"
+            )
 
-                return embedding
-
-            except Exception as e:
-                logger.error(f"Failed to load L2 cache entry: {e}")
-                self._misses += 1
-                return None
+            return embedding.copy()
 
     def set(self, doc_id: str, embedding: np.ndarray) -> None:
         """Store document embedding in cache.
@@ -381,70 +641,161 @@ class L2DocumentEmbeddingCache:
         key = hash_content(doc_id)
 
         with self._lock:
-            # Evict oldest from disk if at capacity
-            if len(self._index) >= self.maxsize and key not in self._index:
-                oldest_key = next(iter(self._index))
-                oldest_path = self._get_cache_path(oldest_key)
+            try:
+                self._store(key, doc_id, embedding)
 
-                if oldest_path.exists():
-                    oldest_path.unlink()
+                logger.debug(
+                    f"L2 cached document embedding: {doc_id[:50]}... "
+                    f"(shape={embedding.shape})"
+                )
 
-                del self._index[oldest_key]
+            except Exception as e:
+                logger.error(f"Failed to save L2 cache entry: {e}")
 
-                # Remove from hot cache if present
-                if oldest_key in self._hot_cache:
-                    del self._hot_cache[oldest_key]
+    def get_many(self, doc_ids: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Look up several document embeddings under a single lock.
 
-                logger.debug(f"L2 evicting oldest: {oldest_key[:16]}...")
+        Hits are gathered from the slab in one fancy-indexing read instead of
+        one view per entry.
 
-            # Save to disk using safe JSON serialization
-            try:
-                self._save_embedding_to_disk(key, embedding)
+        Args:
+            doc_ids: Document identifiers
 
-                self._disk_writes += 1
+        Returns:
+            Tuple of (boolean hit mask aligned with ``doc_ids``, array of shape
+            ``(hits, dim)`` holding the cached embeddings in input order)
+        """
+        keys = [hash_content(doc_id) for doc_id in doc_ids]
+        hits = np.zeros(len(keys), dtype=bool)
 
-                # Update index
-                self._index[key] = {
-                    "doc_id": doc_id,
-                    "created_at": datetime.now(),
-                    "accessed_at": datetime.now(),
-                    "access_count": 0,
-                    "shape": embedding.shape,
-                }
+        with self._lock:
+            now = datetime.now()
+            slots = []
+            for i, key in enumerate(keys):
+                entry = self._index.get(key)
+                if entry is None:
+                    continue
+
+                hits[i] = True
                 self._index.move_to_end(key)
-                self._save_index()
+                entry["accessed_at"] = now
+                entry["access_count"] += 1
+                slots.append(entry["slot"])
+                if key in self._hot_cache:
+                    self._hot_cache.move_to_end(key)
+                else:
+                    self._disk_reads += 1
 
-                # Add to hot cache
-                self._hot_cache[key] = embedding
-                self._hot_cache.move_to_end(key)
+            self._hits += len(slots)
+            self._misses += len(keys) - len(slots)
+
+            if self._slab is None:
+                embeddings = np.empty((0, self._dim or 0), dtype=self.dtype)
+            else:
+                embeddings = self._slab[np.asarray(slots, dtype=np.intp)]
+
+        logger.debug(f"L2 batch lookup: {len(slots)}/{len(keys)} hits")
+        return hits, np.asarray(embeddings)
 
-                # Evict from hot cache if needed
-                if len(self._hot_cache) > self.memory_index_size:
-                    oldest_hot_key = next(iter(self._hot_cache))
-                    del self._hot_cache[oldest_hot_key]
+    def set_many(self, doc_ids: Sequence[str], embeddings: np.ndarray) -> None:
+        """Store several document embeddings with one journal append.
+
+        Args:
+            doc_ids: Document identifiers
+            embeddings: Array of shape ``(len(doc_ids), dim)``
+        """
+        vectors = np.asarray(embeddings)
+        if vectors.ndim != 2 or vectors.shape[0] != len(doc_ids):
+            raise ValueError(
+                f"Expected embeddings of shape ({len(doc_ids)}, dim), got {vectors.shape}"
+            )
+        if len(doc_ids) == 0:
+            return
+
+        with self._lock:
+            try:
+                self._ensure_slab(vectors.shape[1])
+
+                now = datetime.now()
+                keys = []
+                slots = []
+                records: list[dict[str, Any]] = []
+                for doc_id in doc_ids:
+                    key = hash_content(doc_id)
+                    slot, placed = self._place(key, doc_id, now)
+                    keys.append(key)
+                    slots.append(slot)
+                    records.extend(placed)
+
+                assert self._slab is not None
+                self._slab[np.asarray(slots, dtype=np.intp)] = vectors
+                self._disk_writes += len(slots)
+                self._append_journal(records)
+
+                for key, slot in zip(keys, slots, strict=True):
+                    if key in self._index:
+                        self._remember_hot(key, self._view(slot))
 
                 logger.debug(
-                    f"L2 cached document embedding: {doc_id[:50]}... "
-                    f"(shape={embedding.shape})"
+                    f"L2 cached {len(doc_ids)} document embeddings "
+                    f"(shape={vectors.shape})"
                 )
 
             except Exception as e:
-                logger.error(f"Failed to save L2 cache entry: {e}")
+                logger.error(f"Failed to save L2 cache entries: {e}")
+
+    def delete(self, doc_id: str) -> bool:
+        """Remove a document embedding from the cache.
+
+        Args:
+            doc_id: Document identifier
+
+        Returns:
+            True if an entry was removed
+        """
+        key = hash_content(doc_id)
+
+        with self._lock:
+            if key not in self._index:
+                return False
+
+            self._append_journal([self._evict(key)])
+            return True
+
+    def flush(self) -> None:
+        """Write buffered journal records and the slab rows they point at to disk."""
+        with self._lock:
+            try:
+                self._sync_journal()
+            except Exception as e:
+                logger.error(f"Failed to flush L2 cache journal: {e}")
+
+    def close(self) -> None:
+        """Flush pending writes; the cache stays usable afterwards."""
+        self.flush()
+
+    def __del__(self) -> None:
+        # Best effort for caches that are never closed explicitly
+        if getattr(self, "_pending_records", None):
+            self.close()
 
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
-            # Clear disk files
-            for key in self._index.keys():
-                cache_path = self._get_cache_path(key)
-                if cache_path.exists():
-                    cache_path.unlink()
+            count = len(self._index)
+
+            self._slab = None
+            self._remove_files()
 
             # Clear index
-            count = len(self._index)
             self._index.clear()
             self._hot_cache.clear()
-            self._save_index()
+            self._dim = None
+            self._capacity = 0
+            self._next_slot = 0
+            self._free_slots = []
+            self._journal_lines = 0
+            self._pending_records = []
 
             self._hits = 0
             self._misses = 0
@@ -476,6 +827,9 @@ class L2DocumentEmbeddingCache:
                 "disk_reads": self._disk_reads,
                 "disk_writes": self._disk_writes,
                 "utilization": len(self._index) / self.maxsize,
+                "dimension": self._dim,
+                "dtype": self.dtype.name,
+                "slab_capacity": self._capacity,
             }
 
 
@@ -577,6 +931,34 @@ class MultiTierCache:
         if self.l1 is not None:
             self.l1.set(query, embedding)
 
+    def get_many_query_embeddings(
+        self, queries: Sequence[str]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get cached query embeddings for several queries from L1.
+
+        Args:
+            queries: Query strings
+
+        Returns:
+            Tuple of (hit mask, stacked embeddings for the hits)
+        """
+        if self.l1 is None:
+            return np.zeros(len(queries), dtype=bool), _stack([])
+
+        return self.l1.get_many(queries)
+
+    def set_many_query_embeddings(
+        self, queries: Sequence[str], embeddings: np.ndarray
+    ) -> None:
+        """Store several query embeddings in L1.
+
+        Args:
+            queries: Query strings
+            embeddings: Array of shape ``(len(queries), dim)``
+        """
+        if self.l1 is not None:
+            self.l1.set_many(queries, embeddings)
+
     # L2 operations
     def get_document_embedding(self, doc_id: str) -> np.ndarray | None:
         """Get cached document embedding from L2.
@@ -602,6 +984,39 @@ class MultiTierCache:
         if self.l2 is not None:
             self.l2.set(doc_id, embedding)
 
+    def get_many_document_embeddings(
+        self, doc_ids: Sequence[str]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get cached document embeddings for several documents from L2.
+
+        Typical use is to embed only the misses::
+
+            hits, cached = cache.get_many_document_embeddings(ids)
+            fresh = embedder.embed_batch([t for t, hit in zip(texts, hits) if not hit])
+
+        Args:
+            doc_ids: Document identifiers
+
+        Returns:
+            Tuple of (hit mask, stacked embeddings for the hits)
+        """
+        if self.l2 is None:
+            return np.zeros(len(doc_ids), dtype=bool), _stack([])
+
+        return self.l2.get_many(doc_ids)
+
+    def set_many_document_embeddings(
+        self, doc_ids: Sequence[str], embeddings: np.ndarray
+    ) -> None:
+        """Store several document embeddings in L2.
+
+        Args:
+            doc_ids: Document identifiers
+            embeddings: Array of shape ``(len(doc_ids), dim)``
+        """
+        if self.l2 is not None:
+            self.l2.set_many(doc_ids, embeddings)
+
     # L3 operations (delegate to QueryCache)
     def get_query_result(
         self,
@@ -657,6 +1072,60 @@ class MultiTierCache:
                 top_k=top_k
             )
 
+    def get_many_query_results(
+        self,
+        queries: Sequence[str],
+        collection: str = "default",
+        method: str = "hybrid",
+        top_k: int = 5
+    ) -> tuple[np.ndarray, list[Any]]:
+        """Get cached query results for several queries from L3.
+
+        Args:
+            queries: Query strings
+            collection: Collection name
+            method: Retrieval method
+            top_k: Number of results
+
+        Returns:
+            Tuple of (hit mask, cached results for the hits)
+        """
+        if self.l3 is None:
+            return np.zeros(len(queries), dtype=bool), []
+
+        return self.l3.get_results(
+            queries,
+            collection=collection,
+            method=method,
+            top_k=top_k
+        )
+
+    def set_many_query_results(
+        self,
+        queries: Sequence[str],
+        results: Sequence[Any],
+        collection: str = "default",
+        method: str = "hybrid",
+        top_k: int = 5
+    ) -> None:
+        """Store several query results in L3.
+
+        Args:
+            queries: Query strings
+            results: Results to cache, aligned with ``queries``
+            collection: Collection name
+            method: Retrieval method
+            top_k: Number of results
+        """
+        if self.l3 is not None:
+            self.l3.set_results(
+                queries,
+                results,
+                collection=collection,
+                method=method,
+                top_k=top_k
+            )
+
     # Cache coherency
     def invalidate_document(self, doc_id: str) -> None:
         """Invalidate all cache entries related to a document.
@@ -668,18 +1137,7 @@ class MultiTierCache:
         """
         # Invalidate L2 document embedding
         if self.l2 is not None:
-            key = hash_content(doc_id)
-            with self.l2._lock:
-                if key in self.l2._index:
-                    cache_path = self.l2._get_cache_path(key)
-                    if cache_path.exists():
-                        cache_path.unlink()
-                    del self.l2._index[key]
-
-                if key in self.l2._hot_cache:
-                    del self.l2._hot_cache[key]
-
-                self.l2._save_index()
+            self.l2.delete(doc_id)
 
         # L3 invalidation handled separately (invalidate_collection)
         logger.info(f"Invalidated cache for document: {doc_id[:50]}...")
@@ -697,6 +1155,11 @@ class MultiTierCache:
 
         # L1 and L2 not collection-specific, so no action needed
 
+    def flush(self) -> None:
+        """Write buffered L2 journal records to disk."""
+        if self.l2 is not None:
+            self.l2.flush()
+
     def clear_all(self) -> None:
         """Clear all cache tiers."""
         if self.l1 is not None:
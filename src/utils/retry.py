@@ -3,9 +3,12 @@
 v0.2.9: Automatic retry logic for transient failures, achieving >98% recovery success.
 """
 
+import asyncio
 import functools
+import inspect
 import time
 from collections.abc import Callable
+from typing import Any
 
 from src.exceptions import (
     EmbeddingError,
@@ -109,6 +112,7 @@ def with_retry(
     Decorator to add retry logic with exponential backoff.
 
     v0.2.9: Automatically retries transient failures for resilient operations.
+    v0.5.2: Also decorates ``async def`` functions.
 
     Args:
         max_attempts: Maximum number of attempts (including first try)
@@ -128,63 +132,72 @@ def with_retry(
         >>> result = fetch_embeddings("hello")  # Auto-retries on failure
     """
 
+    exceptions_to_retry = (
+        retryable_exceptions
+        if retryable_exceptions is not None
+        else RETRYABLE_EXCEPTIONS
+    )
+
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            last_exception = None
+        def next_delay(e: Exception, attempt: int) -> float:
+            """Return the backoff before the next attempt, or re-raise ``e``."""
+            # Check if we should retry this exception
+            if not isinstance(e, exceptions_to_retry):
+                logger.debug(
+                    f"{func.__name__}: Non-retryable exception {type(e).__name__}, "
+                    f"not retrying"
+                )
+                raise e
+
+            # Check if we have more attempts
+            if attempt >= max_attempts - 1:
+                logger.warning(
+                    f"{func.__name__}: Max retry attempts ({max_attempts}) reached"
+                )
+                raise e
+
+            # Calculate backoff delay
+            delay = exponential_backoff(
+                attempt, base_delay=base_delay, max_delay=max_delay
+            )
 
-            for attempt in range(max_attempts):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
+            logger.info(
+                f"{func.__name__}: Attempt {attempt + 1}/{max_attempts} failed "
+                f"with {type(e).__name__}, retrying in {delay:.2f}s..."
+            )
 
-                    # Check if we should retry this exception
-                    exceptions_to_retry = (
-                        retryable_exceptions
-                        if retryable_exceptions is not None
-                        else RETRYABLE_EXCEPTIONS
+            # Call retry callback if provided
+            if on_retry:
+                try:
+                    on_retry(e, attempt + 1)
+                except Exception as callback_error:
+                    logger.warning(
+                        f"Retry callback failed: {callback_error}"
                     )
 
-                    if not isinstance(e, exceptions_to_retry):
-                        logger.debug(
-                            f"{func.__name__}: Non-retryable exception {type(e).__name__}, "
-                            f"not retrying"
-                        )
-                        raise
-
-                    # Check if we have more attempts
-                    if attempt >= max_attempts - 1:
-                        logger.warning(
-                            f"{func.__name__}: Max retry attempts ({max_attempts}) reached"
-                        )
-                        raise
-
-                    # Calculate backoff delay
-                    delay = exponential_backoff(
-                        attempt, base_delay=base_delay, max_delay=max_delay
-                    )
+            return delay
 
-                    logger.info(
-                        f"{func.__name__}: Attempt {attempt + 1}/{max_attempts} failed "
-                        f"with {type(e).__name__}, retrying in {delay:.2f}s..."
-                    )
+        if inspect.iscoroutinefunction(func):
+            # v0.5.2: Coroutines back off with asyncio.sleep so the event
+            # loop keeps serving other requests between attempts
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                for attempt in range(max_attempts):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        await asyncio.sleep(next_delay(e, attempt))
 
-                    # Call retry callback if provided
-                    if on_retry:
-                        try:
-                            on_retry(e, attempt + 1)
-                        except Exception as callback_error:
-                            logger.warning(
-                                f"Retry callback failed: {callback_error}"
-                            )
+            return async_wrapper
 
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
                     # Wait before retrying
-                    time.sleep(delay)
-
-            # This should never be reached, but just in case
-            if last_exception:
-                raise last_exception
+                    time.sleep(next_delay(e, attempt))
 
         return wrapper
 
@@ -15,8 +15,9 @@ Security: This module addresses CRITICAL-001 from the baseline security audit.
 """
 
 import json
+from collections.abc import Iterable, Iterator, Sequence
 from pathlib import Path
-from typing import Any
+from typing import Any, overload
 
 import numpy as np
 import numpy.typing as npt
@@ -94,6 +95,133 @@ def load_json(filepath: Path) -> Any:
         return json.load(f)
 
 
+def save_arrays(arrays: dict[str, npt.NDArray[Any]], directory: Path) -> None:
+    """Save numeric arrays as ``.npy`` files in a directory.
+
+    Arrays are written with ``allow_pickle=False`` so object arrays are rejected
+    rather than silently pickled.
+
+    Args:
+        arrays: Mapping of array name to numeric array
+        directory: Directory to write ``<name>.npy`` files into
+
+    Raises:
+        OSError: If files cannot be written
+        ValueError: If an array has object dtype
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(directory / f"{name}.npy", np.ascontiguousarray(array), allow_pickle=False)
+
+
+def load_arrays(
+    directory: Path,
+    names: Iterable[str],
+    mmap: bool = True,
+) -> dict[str, npt.NDArray[Any]]:
+    """Load ``.npy`` arrays saved by :func:`save_arrays`.
+
+    Args:
+        directory: Directory containing ``<name>.npy`` files
+        names: Array names to load
+        mmap: Memory-map the files read-only instead of reading them into memory
+
+    Returns:
+        Mapping of array name to array
+
+    Raises:
+        FileNotFoundError: If an array file doesn't exist
+        ValueError: If a file contains pickled objects
+
+    Security: ``allow_pickle=False`` prevents arbitrary code execution  # noqa: S301
+    """
+    mmap_mode = "r" if mmap else None
+    return {
+        name: np.load(directory / f"{name}.npy", mmap_mode=mmap_mode, allow_pickle=False)
+        for name in names
+    }
+
+
+class MappedStringColumn(Sequence[str]):
+    """Read-only sequence of strings backed by a UTF-8 blob and an offsets array.
+
+    Strings are decoded on access, so opening a column costs O(1) regardless
+    of how much text it holds.
+    """
+
+    def __init__(self, blob: npt.NDArray[np.uint8], offsets: npt.NDArray[np.int64]) -> None:
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("string column index out of range")
+        start, end = int(self.offsets[index]), int(self.offsets[index + 1])
+        return self.blob[start:end].tobytes().decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(len(self)):
+            yield self[i]
+
+
+def save_string_column(strings: Iterable[str], directory: Path, name: str) -> None:
+    """Save strings as a ``<name>.bin`` UTF-8 blob plus ``<name>_offsets.npy``.
+
+    Args:
+        strings: Strings to save
+        directory: Target directory
+        name: Column name
+
+    Raises:
+        OSError: If files cannot be written
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    offsets = [0]
+
+    with open(directory / f"{name}.bin", "wb") as f:
+        for text in strings:
+            encoded = text.encode("utf-8")
+            f.write(encoded)
+            offsets.append(offsets[-1] + len(encoded))
+
+    np.save(directory / f"{name}_offsets.npy", np.array(offsets, dtype=np.int64), allow_pickle=False)
+
+
+def load_string_column(directory: Path, name: str) -> MappedStringColumn:
+    """Memory-map a string column saved by :func:`save_string_column`.
+
+    Args:
+        directory: Directory containing the column files
+        name: Column name
+
+    Returns:
+        Lazily decoded string column
+
+    Raises:
+        FileNotFoundError: If the column files don't exist
+    """
+    offsets = np.load(directory / f"{name}_offsets.npy", mmap_mode="r", allow_pickle=False)
+    blob_path = directory / f"{name}.bin"
+    if blob_path.stat().st_size == 0:
+        blob: npt.NDArray[np.uint8] = np.zeros(0, dtype=np.uint8)
+    else:
+        blob = np.memmap(blob_path, dtype=np.uint8, mode="r")
+    return MappedStringColumn(blob, offsets)
+
+
 def save_bm25_index(
     corpus_processed: list[list[str]],
     idf: dict[str, float],
@@ -104,6 +232,8 @@ def save_bm25_index(
     """Save BM25 index data to JSON file.
 
     This replaces pickle serialization for BM25 checkpoints in incremental_index.py.
+    Deprecated: BM25Index/BM25Retriever now persist binary segments via
+    :func:`save_arrays` and :func:`save_string_column`.
 
     Args:
         corpus_processed: Tokenized corpus (list of token lists)
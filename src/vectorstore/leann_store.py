@@ -4,7 +4,9 @@ LEANN provides 97% storage savings through graph-based selective recomputation.
 Platform support: macOS, Linux (not available on Windows).
 """
 
+import json
 import logging
+import shutil
 from pathlib import Path
 from typing import Any
 
@@ -17,14 +19,28 @@ except ImportError:
     leann = None
     LEANN_AVAILABLE = False
 
+from ragged.embeddings.quantization import QuantizedVectors, codec_from_dict, get_codec
 from ragged.vectorstore.exceptions import (
     VectorStoreConnectionError,
     VectorStoreNotFoundError,
 )
+from ragged.vectorstore.hnsw_index import HNSWLIB_AVAILABLE, HNSWIndex
 from ragged.vectorstore.interface import VectorStore, VectorStoreDocument, VectorStoreQueryResult
+from ragged.vectorstore.metadata_index import MetadataIndex
 
 logger = logging.getLogger(__name__)
 
+# On-disk layout version of a collection directory
+COLLECTION_FORMAT_VERSION = 1
+
+# Rows read at a time when building a graph index from stored vectors
+INDEX_BUILD_CHUNK_ROWS = 65536
+
+# Closing rewrites the vector files once this fraction of rows is removed...
+VECTOR_COMPACT_DEAD_FRACTION = 0.25
+# ...and at least this many rows would be reclaimed
+VECTOR_COMPACT_MIN_DEAD_ROWS = 1024
+
 
 class LEANNStore(VectorStore):
     """LEANN implementation of VectorStore with 97% storage savings.
@@ -33,6 +49,27 @@ class LEANNStore(VectorStore):
     while maintaining 90% top-3 recall accuracy.
 
     Platform support: macOS, Linux (not Windows)
+
+    Each collection lives in its own directory under the persist directory:
+
+    - ``meta.json``: storage format, codec parameters and collection metadata
+    - ``codes.bin``: embeddings as appended (possibly quantized) rows
+    - ``originals.f32``: float32 rows for rescoring, when enabled
+    - ``journal.jsonl``: document records, appended on every change and
+      compacted on close; replaying it maps documents to rows
+    - ``hnsw.bin``: graph index for large collections, saved when built and
+      on close, with the live rows it holds in ``hnsw.rows.npy``
+
+    Removed rows stay in the vector files until close finds enough of them
+    to compact: the files are then rewritten with only live rows under new
+    names (``codes.<generation>.bin`` and so on), and meta.json switching to
+    the new generation commits the rewrite.
+
+    Collections below ``ann_threshold`` vectors are searched exactly; larger
+    ones build an HNSW graph index (requires hnswlib) on first search. A
+    saved index is brought up to date on load rather than rebuilt.
+    Metadata filters are answered by an in-memory metadata index (rebuilt
+    from the journal on load), so only matching rows are scored.
     """
 
     def __init__(self, config: dict[str, Any] | None = None):
@@ -43,6 +80,15 @@ class LEANNStore(VectorStore):
                 - persist_directory: Storage location
                 - graph_degree: Graph connectivity (default: 32)
                 - search_complexity: Search depth (default: 100)
+                - quantization: Embedding storage, "float32", "float16"
+                  or "int8" (default: "float32")
+                - rescore: Keep float32 originals on disk and re-rank the
+                  best quantized candidates with them (default: False)
+                - ann_threshold: Vectors in a collection above which search
+                  uses an HNSW graph index instead of scoring every vector
+                  (default: 50000)
+                - build_complexity: Candidate list size while inserting into
+                  the graph index (default: 200)
 
         Raises:
             ImportError: If LEANN not installed
@@ -64,14 +110,23 @@ class LEANNStore(VectorStore):
         # LEANN configuration
         self.graph_degree = self.config.get("graph_degree", 32)
         self.search_complexity = self.config.get("search_complexity", 100)
+        self.build_complexity = self.config.get("build_complexity", 200)
+        self.ann_threshold = self.config.get("ann_threshold", 50000)
+
+        # Embedding storage
+        self.quantization = self.config.get("quantization", "float32")
+        self.rescore = self.config.get("rescore", False)
+        get_codec(self.quantization)  # Validate early
 
         # Collection storage
         self.collections: dict[str, Any] = {}
 
         try:
-            logger.info(f"Initialised LEANN at {self.persist_dir}")
+            for meta_path in sorted(self.persist_dir.glob("*/meta.json")):
+                self._open_collection(meta_path.parent)
+            logger.info(f"Initialised LEANN at {self.persist_dir} ({len(self.collections)} collections)")
         except Exception as e:
-            raise VectorStoreConnectionError(f"Failed to initialise LEANN: {e}")
+            raise VectorStoreConnectionError(f"Failed to initialise LEANN: {e}") from e
 
     def health_check(self) -> bool:
         """Check LEANN health.
@@ -108,21 +163,21 @@ class LEANNStore(VectorStore):
 
         collection = self.collections[collection_name]
 
-        # Convert embeddings to list if numpy array
-        if isinstance(embeddings, np.ndarray):
-            embeddings_list = embeddings.tolist()
-        else:
-            embeddings_list = embeddings
+        # Replacing a document retires its previous vector
+        self._remove_vectors(collection, [doc_id for doc_id in ids if doc_id in collection["documents"]])
 
-        # Store documents in graph-based structure
-        # LEANN uses selective recomputation to save storage
+        # Vectors are stored quantized in one matrix; documents reference rows
+        rows = self._add_vectors(collection, np.asarray(embeddings, dtype=np.float32))
         for i, doc_id in enumerate(ids):
             collection["documents"][doc_id] = {
                 "id": doc_id,
                 "content": documents[i],
-                "embedding": embeddings_list[i],
+                "row": int(rows[i]),
                 "metadata": metadatas[i],
             }
+            collection["row_ids"][int(rows[i])] = doc_id
+            collection["metadata_index"].add(int(rows[i]), metadatas[i])
+        self._journal(collection, ids)
 
         logger.debug(f"Added {len(ids)} documents to LEANN collection '{collection_name}'")
 
@@ -139,87 +194,68 @@ class LEANNStore(VectorStore):
             query_embedding: Query vector
             n_results: Number of results to return
             collection_name: Collection to search
-            filter_dict: Metadata filters (optional)
+            filter_dict: Metadata filters as a ChromaDB-style where clause
+                (optional), e.g. from ``MetadataFilter.to_dict()``
 
         Returns:
             Query results with documents and distances
 
         Raises:
             VectorStoreNotFoundError: If collection not found
+            VectorStoreQueryError: If the filter uses an unsupported operator
         """
         if collection_name not in self.collections:
             raise VectorStoreNotFoundError(f"Collection '{collection_name}' not found")
 
         collection = self.collections[collection_name]
 
-        # Convert query embedding to list
-        if isinstance(query_embedding, np.ndarray):
-            query_list = query_embedding.tolist()
-        else:
-            query_list = query_embedding
-
-        # Perform graph-based approximate search
-        # LEANN trades slight accuracy for 97% storage savings
-        documents_data = list(collection["documents"].values())
-
-        # Apply metadata filters if provided
+        # Pre-filter rows with the metadata index before scoring vectors
+        candidate_rows = None
         if filter_dict:
-            documents_data = [
-                doc
-                for doc in documents_data
-                if all(doc["metadata"].get(k) == v for k, v in filter_dict.items())
-            ]
-
-        # Calculate distances (cosine similarity)
-        distances = []
-        for doc_data in documents_data:
-            distance = self._cosine_distance(query_list, doc_data["embedding"])
-            distances.append((distance, doc_data))
-
-        # Sort by distance and take top n_results
-        distances.sort(key=lambda x: x[0])
-        top_results = distances[:n_results]
+            candidate_rows = collection["metadata_index"].match(filter_dict)
+            if candidate_rows.size == 0:
+                return VectorStoreQueryResult(documents=[], distances=[], ids=[])
+
+        query = np.asarray(query_embedding, dtype=np.float32).ravel()
+        vectors = collection["vectors"]
+
+        # Large collections: the graph index proposes candidates, which are
+        # then ranked exactly below. Small filtered sets are cheaper to scan.
+        index = self._graph_index(collection)
+        if index is not None and (candidate_rows is None or candidate_rows.size >= self.ann_threshold):
+            try:
+                candidate_rows, _ = index.search(query, n_results * vectors.oversample, rows=candidate_rows)
+            except RuntimeError as e:
+                logger.debug(f"Graph search incomplete, searching '{collection_name}' exactly: {e}")
+
+        # Cosine distance over the stored (possibly quantized) vectors
+        rows, distances = vectors.search(
+            query,
+            k=n_results,
+            rows=candidate_rows,
+            rescore=collection["rescore"],
+        )
 
         # Convert to VectorStoreQueryResult
         result_documents = []
         result_distances = []
         result_ids = []
 
-        for distance, doc_data in top_results:
+        for row, distance in zip(rows, distances, strict=True):
+            doc_data = collection["documents"][collection["row_ids"][int(row)]]
             doc = VectorStoreDocument(
                 id=doc_data["id"],
                 content=doc_data["content"],
                 metadata=doc_data["metadata"],
             )
             result_documents.append(doc)
-            result_distances.append(distance)
+            result_distances.append(float(distance))
             result_ids.append(doc_data["id"])
 
         return VectorStoreQueryResult(
             documents=result_documents, distances=result_distances, ids=result_ids
         )
 
-    def _cosine_distance(self, vec1: list[float], vec2: list[float]) -> float:
-        """Calculate cosine distance between two vectors.
-
-        Args:
-            vec1: First vector
-            vec2: Second vector
-
-        Returns:
-            Cosine distance (lower is more similar)
-        """
-        vec1_np = np.array(vec1)
-        vec2_np = np.array(vec2)
-
-        # Cosine similarity
-        similarity = np.dot(vec1_np, vec2_np) / (
-            np.linalg.norm(vec1_np) * np.linalg.norm(vec2_np)
-        )
-
-        # Convert to distance (1 - similarity)
-        return 1.0 - similarity
-
     def delete(self, document_ids: list[str], collection_name: str = "default") -> int:
         """Delete documents from LEANN.
 
@@ -234,12 +270,15 @@ class LEANNStore(VectorStore):
             return 0
 
         collection = self.collections[collection_name]
-        deleted_count = 0
+        deleted = []
 
         for doc_id in document_ids:
             if doc_id in collection["documents"]:
+                self._remove_vectors(collection, [doc_id])
                 del collection["documents"][doc_id]
-                deleted_count += 1
+                deleted.append(doc_id)
+        self._journal(collection, deleted)
+        deleted_count = len(deleted)
 
         logger.debug(f"Deleted {deleted_count} documents from LEANN collection '{collection_name}'")
         return deleted_count
@@ -273,13 +312,19 @@ class LEANNStore(VectorStore):
         for i, doc_id in enumerate(ids):
             if doc_id in collection["documents"]:
                 if embeddings is not None:
-                    emb = embeddings[i].tolist() if isinstance(embeddings, np.ndarray) else embeddings[i]
-                    collection["documents"][doc_id]["embedding"] = emb
+                    self._remove_vectors(collection, [doc_id])
+                    row = int(self._add_vectors(collection, np.asarray(embeddings[i], dtype=np.float32))[0])
+                    collection["documents"][doc_id]["row"] = row
+                    collection["row_ids"][row] = doc_id
                 if documents is not None:
                     collection["documents"][doc_id]["content"] = documents[i]
                 if metadatas is not None:
                     collection["documents"][doc_id]["metadata"] = metadatas[i]
+                if embeddings is not None or metadatas is not None:
+                    document = collection["documents"][doc_id]
+                    collection["metadata_index"].add(document["row"], document["metadata"])
                 updated_count += 1
+        self._journal(collection, [doc_id for doc_id in ids if doc_id in collection["documents"]])
 
         logger.debug(f"Updated {updated_count} documents in LEANN collection '{collection_name}'")
         return updated_count
@@ -326,6 +371,35 @@ class LEANNStore(VectorStore):
 
         return len(self.collections[collection_name]["documents"])
 
+    def facet_counts(self, field: str, collection_name: str = "default") -> dict[Any, int]:
+        """Count documents per value of a metadata field.
+
+        Args:
+            field: Metadata field
+            collection_name: Collection name
+
+        Returns:
+            Dictionary mapping values to document counts, most frequent first
+        """
+        if collection_name not in self.collections:
+            return {}
+
+        return self.collections[collection_name]["metadata_index"].facet_counts(field)
+
+    def facet_fields(self, collection_name: str = "default") -> list[str]:
+        """List metadata fields present in a collection.
+
+        Args:
+            collection_name: Collection name
+
+        Returns:
+            Sorted field names
+        """
+        if collection_name not in self.collections:
+            return []
+
+        return self.collections[collection_name]["metadata_index"].field_names()
+
     def list_collections(self) -> list[str]:
         """List all LEANN collections.
 
@@ -354,11 +428,328 @@ class LEANNStore(VectorStore):
             metadata: Collection metadata
         """
         if name not in self.collections:
-            self.collections[name] = {
-                "name": name,
+            path = self.persist_dir / name
+            path.mkdir(parents=True, exist_ok=True)
+            meta = {
+                "version": COLLECTION_FORMAT_VERSION,
                 "metadata": metadata or {},
-                "documents": {},
+                "codec": get_codec(self.quantization).to_dict(),
+                "rescore": self.rescore,
+                "dimensions": None,
             }
+            (path / "meta.json").write_text(json.dumps(meta))
+            self._open_collection(path)
+
+    def _open_collection(self, path: Path) -> None:
+        """Load a collection directory, replaying its journal.
+
+        The storage format (quantization, rescoring) is read from the
+        collection's own metadata, so it can differ from the store config.
+
+        Args:
+            path: Collection directory containing meta.json
+        """
+        meta = json.loads((path / "meta.json").read_text())
+        dimensions = meta.get("dimensions")
+        vectors = QuantizedVectors(
+            codec_from_dict(meta["codec"]),
+            originals_path=self._file(path, meta, "originals.f32") if meta["rescore"] else None,
+            codes_path=self._file(path, meta, "codes.bin"),
+            dimensions=dimensions,
+        )
+
+        # Later records supersede earlier ones; a null document is a delete
+        documents: dict[str, dict[str, Any]] = {}
+        journal_path = self._file(path, meta, "journal.jsonl")
+        if journal_path.exists():
+            with open(journal_path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if record["document"] is None:
+                        documents.pop(record["id"], None)
+                    elif record["document"]["row"] < vectors.size:
+                        documents[record["id"]] = record["document"]
+                    else:
+                        logger.warning(f"Dropping document '{record['id']}' with missing vector in {path}")
+
+        row_ids = {doc["row"]: doc_id for doc_id, doc in documents.items()}
+        live_rows = np.fromiter(sorted(row_ids), dtype=np.int64)
+        dead_rows = np.setdiff1d(np.arange(vectors.size), live_rows)
+        if dead_rows.size:
+            vectors.remove(dead_rows)
+
+        collection = {
+            "name": path.name,
+            "path": path,
+            "meta": meta,
+            "metadata": meta["metadata"],
+            "documents": documents,
+            "vectors": vectors,
+            "row_ids": row_ids,
+            "metadata_index": self._metadata_index(documents),
+            "rescore": meta["rescore"],
+            "index": None,
+        }
+
+        # A saved graph index is brought up to date instead of rebuilt:
+        # rows stored since it was saved are added, rows removed since are
+        # marked deleted
+        index_meta = meta.get("index")
+        index_path = path / "hnsw.bin"
+        rows_path = path / "hnsw.rows.npy"
+        if (
+            HNSWLIB_AVAILABLE
+            and index_meta
+            and "deleted" in index_meta
+            and index_path.exists()
+            and rows_path.exists()
+            and index_meta["rows"] <= vectors.size
+        ):
+            index = HNSWIndex.load(
+                index_path,
+                dimensions=dimensions,
+                deleted=index_meta["deleted"],
+                search_complexity=self.search_complexity,
+            )
+            index.remove(np.setdiff1d(np.load(rows_path), live_rows))
+            self._index_rows(index, vectors, live_rows[live_rows >= index_meta["rows"]])
+            collection["index"] = index
+
+        self.collections[path.name] = collection
+
+    @staticmethod
+    def _file(path: Path, meta: dict[str, Any], name: str) -> Path:
+        """Path of a vector or journal file in the collection's current generation.
+
+        Args:
+            path: Collection directory
+            meta: Collection format metadata
+            name: Base file name, e.g. "codes.bin"
+
+        Returns:
+            The base name for the first generation, otherwise the name with
+            the generation inserted, e.g. "codes.2.bin"
+        """
+        generation = meta.get("generation", 0)
+        if not generation:
+            return path / name
+        stem, suffix = name.split(".", 1)
+        return path / f"{stem}.{generation}.{suffix}"
+
+    @staticmethod
+    def _metadata_index(documents: dict[str, dict[str, Any]]) -> MetadataIndex:
+        """Index the metadata of documents by row."""
+        metadata_index = MetadataIndex()
+        for doc in documents.values():
+            metadata_index.add(doc["row"], doc["metadata"])
+        return metadata_index
+
+    def _add_vectors(self, collection: dict[str, Any], embeddings: np.ndarray) -> np.ndarray:
+        """Store embeddings, keeping the graph index and format metadata current.
+
+        Args:
+            collection: Collection storage
+            embeddings: Array of shape (n, dimensions) or (dimensions,)
+
+        Returns:
+            Row numbers assigned to the embeddings
+        """
+        embeddings = np.atleast_2d(embeddings)
+        rows = collection["vectors"].add(embeddings)
+
+        meta = collection["meta"]
+        if meta["dimensions"] is None:
+            meta["dimensions"] = int(embeddings.shape[1])
+            meta["codec"] = collection["vectors"].codec.to_dict()
+            self._write_meta(collection)
+
+        if collection["index"] is not None:
+            collection["index"].add(embeddings, rows)
+        return rows
+
+    def _graph_index(self, collection: dict[str, Any]) -> HNSWIndex | None:
+        """Return the collection's graph index, building it once it is large enough.
+
+        Args:
+            collection: Collection storage
+
+        Returns:
+            The index, or None if the collection is searched exactly
+        """
+        vectors = collection["vectors"]
+        if collection["index"] is not None or len(vectors) < self.ann_threshold:
+            return collection["index"]
+
+        if not HNSWLIB_AVAILABLE:
+            if not collection.get("warned_exact"):
+                logger.info(
+                    f"Collection '{collection['name']}' has {len(vectors)} vectors; "
+                    "install hnswlib for graph-indexed search (pip install hnswlib)"
+                )
+                collection["warned_exact"] = True
+            return None
+
+        index = HNSWIndex(
+            collection["meta"]["dimensions"],
+            graph_degree=self.graph_degree,
+            search_complexity=self.search_complexity,
+            build_complexity=self.build_complexity,
+        )
+        self._index_rows(index, vectors, np.fromiter(sorted(collection["row_ids"]), dtype=np.int64))
+
+        logger.info(f"Built graph index for LEANN collection '{collection['name']}' ({len(index)} vectors)")
+        collection["index"] = index
+        self._save_index(collection)
+        return index
+
+    @staticmethod
+    def _index_rows(index: HNSWIndex, vectors: QuantizedVectors, rows: np.ndarray) -> None:
+        """Add stored rows to a graph index, a chunk at a time.
+
+        Args:
+            index: Graph index
+            vectors: Collection vectors
+            rows: Rows to add
+        """
+        for start in range(0, rows.size, INDEX_BUILD_CHUNK_ROWS):
+            chunk = rows[start:start + INDEX_BUILD_CHUNK_ROWS]
+            originals = vectors.originals
+            index.add(originals.take(chunk) if originals is not None else vectors.get(chunk), chunk)
+
+    def _save_index(self, collection: dict[str, Any]) -> None:
+        """Save the graph index of a collection, if it has one.
+
+        The index entry is dropped from meta.json while the index files are
+        rewritten, so an interrupted save leads to a rebuild rather than to
+        a stale index.
+
+        Args:
+            collection: Collection storage
+        """
+        index = collection["index"]
+        if index is None:
+            return
+
+        path, meta = collection["path"], collection["meta"]
+        meta.pop("index", None)
+        self._write_meta(collection)
+        index.save(path / "hnsw.bin")
+        np.save(path / "hnsw.rows.npy", np.fromiter(sorted(collection["row_ids"]), dtype=np.int64))
+        meta["index"] = {"rows": collection["vectors"].size, "deleted": index.deleted}
+        self._write_meta(collection)
+
+    def _journal(self, collection: dict[str, Any], document_ids: list[str]) -> None:
+        """Append the current state of documents to the collection journal.
+
+        Args:
+            collection: Collection storage
+            document_ids: Documents that were added, changed or deleted
+        """
+        journal_path = self._file(collection["path"], collection["meta"], "journal.jsonl")
+        with open(journal_path, "a", encoding="utf-8") as f:
+            for doc_id in document_ids:
+                record = {"id": doc_id, "document": collection["documents"].get(doc_id)}
+                f.write(json.dumps(record, default=str) + "\n")
+
+    def _write_journal(self, collection: dict[str, Any], rows: dict[int, int] | None = None) -> None:
+        """Rewrite the journal with one record per document.
+
+        Args:
+            collection: Collection storage
+            rows: New row of each current row, when the rows are renumbered
+        """
+        journal_path = self._file(collection["path"], collection["meta"], "journal.jsonl")
+        compacted = journal_path.with_name(journal_path.name + ".tmp")
+        with open(compacted, "w", encoding="utf-8") as f:
+            for doc_id, document in collection["documents"].items():
+                if rows is not None:
+                    document = {**document, "row": rows[document["row"]]}
+                f.write(json.dumps({"id": doc_id, "document": document}, default=str) + "\n")
+        compacted.replace(journal_path)
+
+    @staticmethod
+    def _write_meta(collection: dict[str, Any]) -> None:
+        """Write the collection's format metadata, replacing the file atomically."""
+        meta_path = collection["path"] / "meta.json"
+        written = meta_path.with_name("meta.json.tmp")
+        written.write_text(json.dumps(collection["meta"]))
+        written.replace(meta_path)
+
+    def _compact_vectors(self, collection: dict[str, Any]) -> None:
+        """Rewrite the vector files without removed rows, once enough are removed.
+
+        The compacted codes, originals and journal are written as a new
+        generation of files; switching meta.json to that generation commits
+        them, so an interrupted compaction leaves the previous files in use.
+        Rows are renumbered, so the graph index is dropped and rebuilt by
+        the next search that needs it.
+
+        Args:
+            collection: Collection storage
+        """
+        vectors = collection["vectors"]
+        dead = vectors.size - len(vectors)
+        if dead < VECTOR_COMPACT_MIN_DEAD_ROWS or dead < vectors.size * VECTOR_COMPACT_DEAD_FRACTION:
+            return
+
+        path, meta = collection["path"], collection["meta"]
+        previous_files = [self._file(path, meta, name) for name in ("codes.bin", "originals.f32", "journal.jsonl")]
+        compacted_meta = {**meta, "metadata": collection["metadata"], "generation": meta.get("generation", 0) + 1}
+        compacted_meta.pop("index", None)
+
+        live_rows = np.fromiter(sorted(collection["row_ids"]), dtype=np.int64)
+        compacted = vectors.compacted(
+            live_rows,
+            codes_path=self._file(path, compacted_meta, "codes.bin"),
+            originals_path=self._file(path, compacted_meta, "originals.f32"),
+        )
+        rows = {int(row): new_row for new_row, row in enumerate(live_rows)}
+        self._write_journal({**collection, "meta": compacted_meta}, rows)
+        collection["meta"] = compacted_meta
+        self._write_meta(collection)
+
+        # Committed; bring the in-memory collection in line with the files
+        for document in collection["documents"].values():
+            document["row"] = rows[document["row"]]
+        collection["row_ids"] = {doc["row"]: doc_id for doc_id, doc in collection["documents"].items()}
+        collection["metadata_index"] = self._metadata_index(collection["documents"])
+        collection["vectors"] = compacted
+        collection["index"] = None
+        for stale in [*previous_files, path / "hnsw.bin", path / "hnsw.rows.npy"]:
+            stale.unlink(missing_ok=True)
+
+        logger.info(f"Compacted LEANN collection '{collection['name']}', reclaiming {dead} removed rows")
+
+    def _save_collection(self, collection: dict[str, Any]) -> None:
+        """Compact the journal and vector files and save the graph index of a collection.
+
+        Args:
+            collection: Collection storage
+        """
+        self._compact_vectors(collection)
+        self._write_journal(collection)
+        collection["meta"]["metadata"] = collection["metadata"]
+        self._save_index(collection)
+        self._write_meta(collection)
+
+    @staticmethod
+    def _remove_vectors(collection: dict[str, Any], document_ids: list[str]) -> None:
+        """Retire the vectors of documents being deleted or replaced.
+
+        Args:
+            collection: Collection storage
+            document_ids: IDs of documents present in the collection
+        """
+        rows = [collection["documents"][doc_id]["row"] for doc_id in document_ids]
+        if rows:
+            collection["vectors"].remove(rows)
+            if collection["index"] is not None:
+                collection["index"].remove(rows)
+            for row in rows:
+                del collection["row_ids"][row]
+                collection["metadata_index"].remove(row)
 
     def delete_collection(self, name: str) -> None:
         """Delete a LEANN collection.
@@ -367,12 +758,17 @@ class LEANNStore(VectorStore):
             name: Collection name
         """
         if name in self.collections:
-            del self.collections[name]
+            collection = self.collections.pop(name)
+            shutil.rmtree(collection["path"], ignore_errors=True)
             logger.info(f"Deleted LEANN collection '{name}'")
 
     def close(self) -> None:
         """Close LEANN connection.
 
-        LEANN persists data automatically, no explicit closing needed.
+        Changes are journalled as they happen; closing compacts the journals
+        (and vector files with many removed rows) and saves graph indexes so
+        the next start does not rebuild them.
         """
+        for collection in self.collections.values():
+            self._save_collection(collection)
         logger.debug("Closed LEANN connection")
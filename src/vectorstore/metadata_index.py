@@ -0,0 +1,222 @@
+"""In-process metadata index for pre-filtering local vector search.
+
+Evaluates ChromaDB-style ``where`` clauses, as produced by
+``MetadataFilter.to_dict()``, against row numbers without scanning every
+document's metadata: equality and membership use inverted postings per
+(field, value), and range operators binary-search sorted value columns.
+Conditions are combined as boolean row bitmaps, so a selective filter
+narrows the rows before any vector is scored.
+"""
+
+from collections import defaultdict
+from typing import Any
+
+import numpy as np
+from ragged.vectorstore.exceptions import VectorStoreQueryError
+
+# Range operators and the searchsorted bounds selecting matching values
+RANGE_OPERATORS: dict[str, tuple[str, str]] = {
+    "$gt": ("right", "end"),
+    "$gte": ("left", "end"),
+    "$lt": ("start", "left"),
+    "$lte": ("start", "right"),
+}
+
+
+class _SortedColumn:
+    """Values of one field and kind (numbers or strings), sorted on demand."""
+
+    def __init__(self) -> None:
+        self.values: dict[int, Any] = {}
+        self._sorted: tuple[np.ndarray, np.ndarray] | None = None
+
+    def set(self, row: int, value: Any) -> None:
+        self.values[row] = value
+        self._sorted = None
+
+    def discard(self, row: int) -> None:
+        if self.values.pop(row, None) is not None:
+            self._sorted = None
+
+    def range(self, operator: str, value: Any) -> np.ndarray:
+        """Rows whose value satisfies ``<value> <operator> value``."""
+        if self._sorted is None:
+            rows = np.fromiter(self.values, dtype=np.int64, count=len(self.values))
+            values = np.array(list(self.values.values()))
+            order = np.argsort(values, kind="stable")
+            self._sorted = (values[order], rows[order])
+
+        values, rows = self._sorted
+        lower, upper = RANGE_OPERATORS[operator]
+        start = 0 if lower == "start" else int(np.searchsorted(values, value, side=lower))
+        end = len(values) if upper == "end" else int(np.searchsorted(values, value, side=upper))
+        return rows[start:end]
+
+
+def _kind(value: Any) -> str | None:
+    """Column a value is range-indexed in (None if not orderable)."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    return None
+
+
+class MetadataIndex:
+    """Inverted and sorted indexes over document metadata, keyed by row.
+
+    List values are indexed per element, so equality on a ``tags`` list
+    matches any tag. As in ChromaDB, negative operators (``$ne``, ``$nin``)
+    only match rows that have the field.
+
+    Example:
+        >>> index = MetadataIndex()
+        >>> index.add(0, {"tag": "python", "confidence": 0.95})
+        >>> index.match({"$and": [{"tag": "python"}, {"confidence": {"$gt": 0.9}}]})
+        array([0])
+    """
+
+    def __init__(self) -> None:
+        self._metadata: dict[int, dict[str, Any]] = {}
+        self._postings: dict[str, dict[Any, set[int]]] = defaultdict(lambda: defaultdict(set))
+        self._columns: dict[tuple[str, str], _SortedColumn] = defaultdict(_SortedColumn)
+        self._live = np.zeros(0, dtype=bool)
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of indexed rows."""
+        return len(self._metadata)
+
+    def add(self, row: int, metadata: dict[str, Any]) -> None:
+        """Index the metadata of a row, replacing any previous entry.
+
+        Args:
+            row: Row number of the document's vector
+            metadata: Document metadata
+        """
+        self.remove(row)
+        self._metadata[row] = metadata
+        if row >= self._live.size:
+            live = np.zeros(max(row + 1, self._live.size * 2), dtype=bool)
+            live[: self._live.size] = self._live
+            self._live = live
+        self._live[row] = True
+        self._size = max(self._size, row + 1)
+        for field, value in metadata.items():
+            for item in value if isinstance(value, (list, tuple)) else [value]:
+                try:
+                    self._postings[field][item].add(row)
+                except TypeError:
+                    continue  # Unhashable values cannot be matched exactly
+                kind = _kind(item)
+                if kind is not None and not isinstance(value, (list, tuple)):
+                    self._columns[(field, kind)].set(row, item)
+
+    def remove(self, row: int) -> None:
+        """Drop a row from the index (no-op if it is not indexed)."""
+        metadata = self._metadata.pop(row, None)
+        if metadata is None:
+            return
+        self._live[row] = False
+        for field, value in metadata.items():
+            for item in value if isinstance(value, (list, tuple)) else [value]:
+                try:
+                    postings = self._postings[field][item]
+                except TypeError:
+                    continue
+                postings.discard(row)
+                if not postings:
+                    del self._postings[field][item]
+                kind = _kind(item)
+                if kind is not None:
+                    self._columns[(field, kind)].discard(row)
+
+    def field_names(self) -> list[str]:
+        """Indexed metadata fields."""
+        return sorted(field for field, postings in self._postings.items() if postings)
+
+    def facet_counts(self, field: str) -> dict[Any, int]:
+        """Rows per value of a field, most frequent first.
+
+        Reads the postings sizes, so the cost is O(distinct values).
+
+        Args:
+            field: Metadata field
+
+        Returns:
+            Dictionary mapping values to row counts
+        """
+        postings = self._postings.get(field, {})
+        return dict(sorted(((value, len(rows)) for value, rows in postings.items()), key=lambda item: -item[1]))
+
+    def match(self, where: dict[str, Any]) -> np.ndarray:
+        """Rows matching a where clause.
+
+        Args:
+            where: ``{"field": value}``, ``{"field": {"$op": value}}``, or
+                ``{"$and": [...]}`` / ``{"$or": [...]}`` of clauses; several
+                keys in one dict are combined with AND
+
+        Returns:
+            Sorted array of matching row numbers
+
+        Raises:
+            VectorStoreQueryError: If the clause uses an unsupported operator
+        """
+        return np.flatnonzero(self._evaluate(where))
+
+    def _evaluate(self, where: dict[str, Any]) -> np.ndarray:
+        """Boolean bitmap over rows for a where clause."""
+        bitmap = self._live[: self._size].copy()
+        for key, condition in where.items():
+            if key == "$and":
+                for clause in condition:
+                    bitmap &= self._evaluate(clause)
+            elif key == "$or":
+                combined = np.zeros(self._size, dtype=bool)
+                for clause in condition:
+                    combined |= self._evaluate(clause)
+                bitmap &= combined
+            elif isinstance(condition, dict):
+                for operator, value in condition.items():
+                    bitmap &= self._field_bitmap(key, operator, value)
+            else:
+                bitmap &= self._field_bitmap(key, "$eq", condition)
+        return bitmap
+
+    def _field_bitmap(self, field: str, operator: str, value: Any) -> np.ndarray:
+        """Boolean bitmap of rows where one field satisfies one operator."""
+        bitmap = np.zeros(self._size, dtype=bool)
+        postings = self._postings.get(field, {})
+
+        if operator in ("$eq", "$in", "$ne", "$nin"):
+            values = value if operator in ("$in", "$nin") else [value]
+            for item in values:
+                bitmap[list(postings.get(item, ()))] = True
+            if operator in ("$ne", "$nin"):
+                bitmap = ~bitmap & self._has_field(field)
+        elif operator in RANGE_OPERATORS:
+            kind = _kind(value)
+            if kind is None:
+                raise VectorStoreQueryError(f"Cannot compare '{field}' with {value!r}")
+            column = self._columns.get((field, kind))
+            if column is not None:
+                bitmap[column.range(operator, value)] = True
+        elif operator == "$contains":
+            # Case-insensitive substring over the field's distinct values
+            needle = str(value).lower()
+            for item, rows in postings.items():
+                if needle in str(item).lower():
+                    bitmap[list(rows)] = True
+        else:
+            raise VectorStoreQueryError(f"Unsupported metadata filter operator '{operator}'")
+        return bitmap
+
+    def _has_field(self, field: str) -> np.ndarray:
+        """Boolean bitmap of rows with a value for a field."""
+        bitmap = np.zeros(self._size, dtype=bool)
+        for rows in self._postings.get(field, {}).values():
+            bitmap[list(rows)] = True
+        return bitmap
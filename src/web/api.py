@@ -1,29 +1,35 @@
 """FastAPI application for ragged v0.2."""
 
+import asyncio
 import json
-import tempfile
 import time
 from pathlib import Path
 from typing import Any, Literal
 
-from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi import FastAPI, File, HTTPException, Query, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 
 from src.chunking.splitters import chunk_document
+from src.config.constants import UPLOAD_PROGRESS_BATCH_CHUNKS, UPLOAD_READ_CHUNK_BYTES
 from src.config.settings import Settings, get_settings
 from src.embeddings.base import BaseEmbedder
 from src.embeddings.factory import get_embedder
 from src.generation.ollama_client import OllamaClient
 from src.generation.prompts import RAG_SYSTEM_PROMPT, build_rag_prompt
+from src.ingestion.jobs import IngestionJob, IngestionJobQueue, ProgressCallback
 from src.ingestion.loaders import load_document
 from src.retrieval.bm25 import BM25Retriever
 from src.retrieval.hybrid import HybridRetriever
+from src.retrieval.metadata_filter import FacetedSearch, MetadataFilterSecurityError
 from src.retrieval.retriever import Retriever
 from src.storage.vector_store import VectorStore
 from src.utils.logging import get_logger
 from src.web.models import (
+    FacetsResponse,
+    FacetValue,
     HealthResponse,
+    JobResponse,
     QueryRequest,
     QueryResponse,
     Source,
@@ -53,12 +59,13 @@ _embedder: BaseEmbedder | None = None
 _vector_store: VectorStore | None = None
 _hybrid_retriever: HybridRetriever | None = None
 _llm_client: OllamaClient | None = None
+_ingestion_jobs: IngestionJobQueue | None = None
 
 
 @app.on_event("startup")
 async def startup_event() -> None:
     """Initialise retrievers and LLM client on startup."""
-    global _settings, _embedder, _vector_store, _hybrid_retriever, _llm_client
+    global _settings, _embedder, _vector_store, _hybrid_retriever, _llm_client, _ingestion_jobs
 
     try:
         logger.info("Initialising ragged API services...")
@@ -77,13 +84,26 @@ async def startup_event() -> None:
 
         # Initialise retrievers
         vector_retriever = Retriever(vector_store=_vector_store, embedder=_embedder)
-        bm25_retriever = BM25Retriever()
+        # Open the persisted keyword index (memory-mapped, no re-tokenizing)
+        bm25_retriever = BM25Retriever(index_dir=_settings.bm25_index_dir)
         _hybrid_retriever = HybridRetriever(
             vector_retriever=vector_retriever,
             bm25_retriever=bm25_retriever
         )
         logger.info("Hybrid retriever initialised")
 
+        # Recover keyword search from chunks stored or deleted elsewhere
+        await asyncio.to_thread(_hybrid_retriever.sync_bm25_index)
+
+        # Start ingesting uploads in the background (resumes unfinished jobs)
+        _ingestion_jobs = IngestionJobQueue(
+            _ingest_upload,
+            upload_dir=_settings.upload_dir,
+            workers=_settings.upload_workers,
+        )
+        await _ingestion_jobs.start()
+        logger.info(f"Ingestion job queue started with {_settings.upload_workers} worker(s)")
+
         # Initialise LLM client
         _llm_client = OllamaClient()
         logger.info(f"LLM client initialised: {_settings.llm_model}")
@@ -95,6 +115,13 @@ async def startup_event() -> None:
         # Services will be None, API will return appropriate errors
 
 
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Stop ingestion workers; unfinished jobs resume on the next startup."""
+    if _ingestion_jobs:
+        await _ingestion_jobs.stop()
+
+
 @app.get("/api/health", response_model=HealthResponse)
 async def health() -> HealthResponse:
     """Health check endpoint."""
@@ -119,7 +146,8 @@ async def query(request: QueryRequest) -> StreamingResponse | QueryResponse:
     """Query endpoint with optional SSE streaming.
 
     Retrieves relevant documents using hybrid search and generates
-    an answer using the LLM.
+    an answer using the LLM. Retrieval, embedding and generation are awaited
+    so one slow query never blocks other clients.
     """
     # Check if services are initialized
     if not _hybrid_retriever or not _llm_client:
@@ -150,7 +178,7 @@ async def query(request: QueryRequest) -> StreamingResponse | QueryResponse:
                     yield f"data: {json.dumps({'message': 'Retrieving documents...'})}\n\n"
 
                     # Retrieve relevant chunks
-                    results = _hybrid_retriever.retrieve(
+                    results = await _hybrid_retriever.retrieve_async(
                         query=request.query,
                         top_k=request.top_k
                     )
@@ -174,12 +202,12 @@ async def query(request: QueryRequest) -> StreamingResponse | QueryResponse:
                     yield f"data: {json.dumps({'message': 'Generating answer...'})}\n\n"
 
                     # Generate answer (streaming)
-                    answer_stream = _llm_client.generate_stream(
+                    answer_stream = _llm_client.generate_stream_async(
                         prompt=prompt,
                         system=RAG_SYSTEM_PROMPT
                     )
 
-                    for token in answer_stream:
+                    async for token in answer_stream:
                         yield "event: token\n"
                         yield f"data: {json.dumps({'token': token})}\n\n"
 
@@ -212,7 +240,7 @@ async def query(request: QueryRequest) -> StreamingResponse | QueryResponse:
         else:
             # Non-streaming response
             # Retrieve relevant chunks
-            results = _hybrid_retriever.retrieve(
+            results = await _hybrid_retriever.retrieve_async(
                 query=request.query,
                 top_k=request.top_k
             )
@@ -229,7 +257,7 @@ async def query(request: QueryRequest) -> StreamingResponse | QueryResponse:
             prompt = build_rag_prompt(request.query, results)
 
             # Generate answer
-            answer = _llm_client.generate(
+            answer = await _llm_client.generate_async(
                 prompt=prompt,
                 system=RAG_SYSTEM_PROMPT
             )
@@ -263,14 +291,86 @@ async def query(request: QueryRequest) -> StreamingResponse | QueryResponse:
         ) from e
 
 
-@app.post("/api/upload", response_model=UploadResponse)
+async def _ingest_upload(job: IngestionJob, report: ProgressCallback) -> None:
+    """Load, chunk, embed and store one uploaded document.
+
+    Parsing and vector store writes run in worker threads, and chunks are
+    embedded and stored in batches so the job reports progress as it goes.
+    """
+    if not _embedder or not _vector_store:
+        raise RuntimeError("Services not initialised")
+
+    report("loading", None, None)
+    document = await asyncio.to_thread(load_document, job.path)
+    # Ids follow from the job, so a resumed job rewrites its own chunks
+    # instead of storing them a second time
+    document.document_id = job.job_id
+
+    report("chunking", None, None)
+    document = await asyncio.to_thread(chunk_document, document)
+    chunks = document.chunks
+
+    if not chunks:
+        raise ValueError(f"No content could be extracted from {job.filename}")
+
+    texts = [chunk.text for chunk in chunks]
+    metadatas = [chunk.metadata.model_dump() for chunk in chunks]
+    doc_ids = [f"{job.job_id}-{chunk.position}" for chunk in chunks]
+
+    report("embedding", 0, len(chunks))
+    for start in range(0, len(chunks), UPLOAD_PROGRESS_BATCH_CHUNKS):
+        end = start + UPLOAD_PROGRESS_BATCH_CHUNKS
+        embeddings = await _embedder.embed_batch_async(texts[start:end])
+        await asyncio.to_thread(
+            _vector_store.add,
+            ids=doc_ids[start:end],
+            embeddings=embeddings,
+            documents=texts[start:end],
+            metadatas=metadatas[start:end],
+        )
+        report("embedding", min(end, len(chunks)), None)
+
+    # Append the new chunks to the persisted keyword index
+    if _hybrid_retriever:
+        report("indexing", None, None)
+        await asyncio.to_thread(_hybrid_retriever.update_bm25_index, texts, doc_ids, metadatas)
+
+
+async def _spool_upload(file: UploadFile, path: Path, max_bytes: int) -> int:
+    """Copy an upload to disk in chunks, never holding the whole file in memory.
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        HTTPException: If the upload is larger than max_bytes
+    """
+    size = 0
+    try:
+        with open(path, "wb") as spooled:
+            while chunk := await file.read(UPLOAD_READ_CHUNK_BYTES):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File too large. Maximum size: {max_bytes // (1024 * 1024)} MB"
+                    )
+                spooled.write(chunk)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return size
+
+
+@app.post("/api/upload", response_model=UploadResponse, status_code=202)
 async def upload(file: UploadFile = File(...)) -> UploadResponse:
     """Document upload endpoint.
 
-    Accepts PDF, TXT, MD, HTML files and ingests them into the collection.
+    Accepts PDF, TXT, MD, HTML files, spools them to disk and queues them
+    for background ingestion. Track progress with ``GET /api/jobs/{job_id}``.
     """
     # Check if services are initialized
-    if not _embedder or not _vector_store:
+    if not _embedder or not _vector_store or not _ingestion_jobs:
         raise HTTPException(
             status_code=503,
             detail="Services not initialised. Please wait for startup to complete."
@@ -287,76 +387,75 @@ async def upload(file: UploadFile = File(...)) -> UploadResponse:
             detail=f"Unsupported file type: {file_ext}. Allowed: {allowed_extensions}"
         )
 
-    # Read file content
-    content = await file.read()
+    job_id = _ingestion_jobs.new_job_id()
+    upload_path = _ingestion_jobs.upload_dir / f"{job_id}{file_ext}"
+    max_bytes = get_settings().max_file_size_mb * 1024 * 1024
+    size = await _spool_upload(file, upload_path, max_bytes)
 
-    # Save to temporary file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
-        temp_file.write(content)
-        temp_path = Path(temp_file.name)
+    job = await _ingestion_jobs.submit(filename, upload_path, size, job_id=job_id)
 
-    try:
-        # Load document
-        logger.info(f"Loading document: {file.filename}")
-        document = load_document(temp_path)
-
-        # Chunk document
-        logger.info(f"Chunking document: {file.filename}")
-        document = chunk_document(document)
-        chunks = document.chunks
-
-        if not chunks:
-            raise HTTPException(
-                status_code=400,
-                detail=f"No content could be extracted from {file.filename}"
-            )
+    return UploadResponse(
+        filename=filename,
+        size=size,
+        status=job.status.value,
+        message=f"Queued {filename} for ingestion",
+        job_id=job.job_id,
+    )
 
-        # Generate embeddings
-        logger.info(f"Generating embeddings for {len(chunks)} chunks")
-        texts = [chunk.text for chunk in chunks]
-        embeddings = _embedder.embed_batch(texts)
-
-        # Store in vector database
-        logger.info(f"Storing {len(chunks)} chunks in vector store")
-        metadatas = [chunk.metadata.model_dump() for chunk in chunks]
-        doc_ids = [chunk.chunk_id for chunk in chunks]
-        _vector_store.add(
-            ids=doc_ids,
-            embeddings=embeddings,
-            documents=texts,
-            metadatas=metadatas
+
+@app.get("/api/jobs/{job_id}", response_model=JobResponse)
+async def job_status(job_id: str) -> JobResponse:
+    """Progress of a background ingestion job."""
+    if not _ingestion_jobs:
+        raise HTTPException(
+            status_code=503,
+            detail="Services not initialised. Please wait for startup to complete."
         )
 
-        # Update hybrid retriever with new data
-        if _hybrid_retriever:
-            _hybrid_retriever.update_bm25_index(
-                documents=texts,
-                doc_ids=doc_ids,
-                metadatas=metadatas
-            )
+    job = await _ingestion_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+
+    return JobResponse(
+        job_id=job.job_id,
+        filename=job.filename,
+        size=job.size,
+        status=job.status.value,
+        stage=job.stage,
+        chunks_total=job.chunks_total,
+        chunks_done=job.chunks_done,
+        throughput=job.throughput,
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
 
-        logger.info(f"Successfully ingested {filename}")
 
-        return UploadResponse(
-            filename=filename,
-            size=len(content),
-            status="success",
-            message=f"Successfully ingested {len(chunks)} chunks from {filename}"
+@app.get("/api/facets", response_model=FacetsResponse)
+async def facets(
+    field: list[str] | None = Query(default=None, description="Metadata fields (default: all counted)"),
+    limit: int = Query(default=20, ge=1, le=1000, description="Maximum values per field"),
+) -> FacetsResponse:
+    """Facet counts: metadata values and how many chunks have each."""
+    if not _vector_store:
+        raise HTTPException(
+            status_code=503,
+            detail="Services not initialised. Please wait for startup to complete."
         )
 
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
-    except Exception as e:  # noqa: BLE001 - Convert to HTTP exception
-        logger.exception(f"Error ingesting {filename}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error ingesting document: {str(e)}"
-        ) from e
-    finally:
-        # Clean up temporary file
-        if temp_path.exists():
-            temp_path.unlink()
+    try:
+        fields = field or _vector_store.facet_fields()
+        counts = {name: FacetedSearch.count_facet_values(_vector_store, name) for name in fields}
+    except MetadataFilterSecurityError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return FacetsResponse(
+        facets={
+            name: [FacetValue(value=value, count=count) for value, count in list(values.items())[:limit]]
+            for name, values in counts.items()
+        }
+    )
 
 
 @app.get("/api/collections")
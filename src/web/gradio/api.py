@@ -21,6 +21,7 @@ API_BASE_URL = os.getenv("RAGGED_API_URL", "http://localhost:8000")
 API_HEALTH = f"{API_BASE_URL}/api/health"
 API_QUERY = f"{API_BASE_URL}/api/query"
 API_UPLOAD = f"{API_BASE_URL}/api/upload"
+API_JOBS = f"{API_BASE_URL}/api/jobs"
 API_COLLECTIONS = f"{API_BASE_URL}/api/collections"
 
 
@@ -1,12 +1,33 @@
 """Document upload functionality for Gradio UI."""
 
+import time
 from pathlib import Path
 from typing import Any
 
 import requests  # type: ignore[import-untyped]
 
-from src.config.constants import LONG_API_TIMEOUT
-from src.web.gradio.api import API_UPLOAD
+from src.config.constants import LONG_API_TIMEOUT, SHORT_API_TIMEOUT, UPLOAD_JOB_POLL_INTERVAL
+from src.web.gradio.api import API_JOBS, API_UPLOAD
+
+
+def wait_for_job(job_id: str, timeout: float = LONG_API_TIMEOUT * 10) -> dict[str, Any]:
+    """Poll an ingestion job until it finishes or the timeout passes.
+
+    Args:
+        job_id: Job returned by the upload endpoint
+        timeout: Longest time to wait (seconds)
+
+    Returns:
+        Last reported job status
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        response = requests.get(f"{API_JOBS}/{job_id}", timeout=SHORT_API_TIMEOUT)
+        response.raise_for_status()
+        job: dict[str, Any] = response.json()
+        if job.get("status") in ("succeeded", "failed") or time.monotonic() >= deadline:
+            return job
+        time.sleep(UPLOAD_JOB_POLL_INTERVAL)
 
 
 def upload_document(file: Any) -> str:
@@ -34,6 +55,19 @@ def upload_document(file: Any) -> str:
         status = data.get("status", "unknown")
         message = data.get("message", "")
 
+        # Uploads are ingested in the background; wait for the job to finish
+        if status == "queued" and data.get("job_id"):
+            job = wait_for_job(data["job_id"])
+            status = job.get("status", "unknown")
+            if status == "succeeded":
+                return f"✅ Successfully ingested {job.get('chunks_done', 0)} chunks from {job.get('filename')}"
+            if status == "failed":
+                return f"❌ Ingestion failed: {job.get('error')}"
+            return (
+                f"⏳ Still ingesting {job.get('filename')} ({job.get('stage')}, "
+                f"{job.get('chunks_done', 0)}/{job.get('chunks_total', 0)} chunks)"
+            )
+
         if status == "success":
             return f"✅ {message}"
         else:
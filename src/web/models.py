@@ -1,6 +1,6 @@
 """Pydantic models for API requests and responses."""
 
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -44,6 +44,24 @@ class UploadResponse(BaseModel):
     size: int
     status: str
     message: str | None = None
+    job_id: str | None = Field(default=None, description="Ingestion job to poll for progress")
+
+
+class JobResponse(BaseModel):
+    """Progress of a background ingestion job."""
+
+    job_id: str
+    filename: str
+    size: int
+    status: Literal["queued", "running", "succeeded", "failed"]
+    stage: str
+    chunks_total: int
+    chunks_done: int
+    throughput: float = Field(..., description="Chunks stored per second")
+    error: str | None = None
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
 
 
 class HealthResponse(BaseModel):
@@ -60,3 +78,16 @@ class ErrorResponse(BaseModel):
     error: str
     detail: str | None = None
     status_code: int
+
+
+class FacetValue(BaseModel):
+    """Metadata value with the number of chunks that have it."""
+
+    value: Any
+    count: int
+
+
+class FacetsResponse(BaseModel):
+    """Facet counts per metadata field."""
+
+    facets: dict[str, list[FacetValue]] = Field(default_factory=dict)
@@ -10,6 +10,7 @@ from src.chunking.splitters.page_tracking import (
     build_clean_to_orig_map,
     map_chunks_to_pages,
     estimate_page_from_position,
+    PageMarkerIndex,
 )
 
 
@@ -177,6 +178,37 @@ class TestBuildCleanToOrigMap:
         assert len(mapping) == len("TextMore text")
 
 
+class TestPageMarkerIndex:
+    """Tests for PageMarkerIndex."""
+
+    CONTENT = "A<!-- PAGE 1 -->\nBB<!-- PAGE 2 --><!-- PAGE 3 -->\nCCC"
+
+    def test_matches_clean_to_orig_map(self):
+        """Offset translation agrees with the per-character mapping."""
+        markers = PageMarkerIndex(self.CONTENT)
+        mapping = build_clean_to_orig_map(self.CONTENT)
+
+        assert markers.clean_length == len(mapping)
+        assert [markers.to_original(i) for i in range(len(mapping))] == mapping
+
+    def test_strip_markers(self):
+        """Removing markers matches the marker regex substitution."""
+        import re
+
+        markers = PageMarkerIndex(self.CONTENT)
+
+        assert markers.strip_markers(self.CONTENT) == re.sub(r'<!-- PAGE \d+ -->\n?', '', self.CONTENT)
+        assert markers.page_positions == build_page_position_map(self.CONTENT)
+
+    def test_no_markers(self):
+        """Content without markers maps positions to themselves."""
+        markers = PageMarkerIndex("plain text")
+
+        assert markers.page_positions == []
+        assert markers.strip_markers("plain text") == "plain text"
+        assert markers.to_original(5) == 5
+
+
 class TestMapChunksToPages:
     """Tests for map_chunks_to_pages function."""
 
@@ -255,6 +287,20 @@ class TestMapChunksToPages:
         assert page_num is None
         assert page_range is None
 
+    def test_reported_offsets(self):
+        """Chunk offsets from the splitter are used instead of searching."""
+        original_content = "<!-- PAGE 1 -->\nrepeat <!-- PAGE 2 -->\nrepeat"
+        clean_content = "repeat repeat"
+        page_positions = build_page_position_map(original_content)
+
+        # Overlapped text is not a substring of the clean content
+        text_chunks = ["repeat", "at repeat"]
+        result = map_chunks_to_pages(
+            text_chunks, clean_content, original_content, page_positions, chunk_offsets=[(0, 6), (4, 13)]
+        )
+
+        assert result == [(1, None), (1, "1-2")]
+
     def test_empty_chunks(self):
         """Test with empty chunks list."""
         text_chunks = []
@@ -214,6 +214,108 @@ class TestRecursiveSplitting:
         assert len(result) >= 1
 
 
+def _recount_split(text, separators, chunk_size, count):
+    """Reference packer that re-counts every candidate chunk from scratch."""
+    separator, remaining = separators[0], separators[1:]
+    chunks = []
+    current = ""
+    for split in text.split(separator):
+        candidate = current + (separator if current else "") + split
+        if count(candidate) <= chunk_size:
+            current = candidate
+        else:
+            if current:
+                chunks.append(current)
+            if count(split) > chunk_size:
+                chunks.extend(_recount_split(split, remaining, chunk_size, count))
+                current = ""
+            else:
+                current = split
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class TestIncrementalPacking:
+    """Tests for packing chunks from per-piece token counts."""
+
+    @pytest.mark.parametrize("chunk_size", [24, 64, 200])
+    @patch("src.chunking.splitters.recursive_splitter.count_tokens")
+    def test_matches_full_recount(self, mock_count_tokens, chunk_size):
+        """Chunks are identical to re-counting every candidate chunk."""
+        # Rounded character estimate: not additive across joined pieces
+        def token_counter(text):
+            return (len(text) + 3) // 4
+
+        mock_count_tokens.side_effect = token_counter
+
+        separators = ["\n\n", "\n", ". ", " "]
+        splitter = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size, chunk_overlap=0, separators=separators
+        )
+        sentences = [f"Sentence {i} has words {' '.join('w' * (i % 7 + 1) for _ in range(i % 5 + 2))}" for i in range(300)]
+        text = "\n\n".join(
+            "\n".join(". ".join(sentences[j : j + 3]) for j in range(i, i + 9, 3)) for i in range(0, 270, 9)
+        )
+
+        result = splitter.split_text(text)
+
+        assert result == _recount_split(text, separators, chunk_size, token_counter)
+
+    @patch("src.chunking.splitters.recursive_splitter.count_tokens")
+    def test_token_counting_is_linear(self, mock_count_tokens):
+        """Each piece is counted about once rather than once per growing chunk."""
+        mock_count_tokens.side_effect = lambda text: len(text.split())
+
+        splitter = RecursiveCharacterTextSplitter(chunk_size=200, chunk_overlap=0)
+        text = " ".join(f"word{i}" for i in range(5000))
+
+        result = splitter.split_text(text)
+
+        assert len(result) == 25
+        assert mock_count_tokens.call_count < 2 * 5000
+
+
+class TestSplitTextWithOffsets:
+    """Tests for chunk offsets reported by the splitter."""
+
+    @patch("src.chunking.splitters.recursive_splitter.count_tokens")
+    def test_offsets_locate_chunks(self, mock_count_tokens):
+        """Without overlap, each span slices out exactly its chunk."""
+        mock_count_tokens.side_effect = lambda text: len(text.split())
+
+        splitter = RecursiveCharacterTextSplitter(chunk_size=5, chunk_overlap=0)
+        text = "one two three four five six\n\nseven eight\nnine ten eleven twelve thirteen fourteen"
+
+        spans = splitter.split_text_with_offsets(text)
+
+        assert [chunk for _, _, chunk in spans] == splitter.split_text(text)
+        for start, end, chunk in spans:
+            assert text[start:end] == chunk
+
+    @patch("src.chunking.splitters.recursive_splitter.count_tokens")
+    def test_offsets_cover_overlap(self, mock_count_tokens):
+        """With overlap, spans start where the carried-over text begins."""
+        mock_count_tokens.side_effect = lambda text: len(text.split())
+
+        splitter = RecursiveCharacterTextSplitter(chunk_size=4, chunk_overlap=1)
+        text = "aaaa bbbb cccc dddd eeee ffff gggg hhhh"
+
+        spans = splitter.split_text_with_offsets(text)
+
+        assert len(spans) == 2
+        assert spans[0] == (0, 19, "aaaa bbbb cccc dddd")
+        start, end, chunk = spans[1]
+        assert (start, end) == (15, len(text))
+        assert chunk.startswith("dddd ")
+        assert chunk.endswith(" eeee ffff gggg hhhh")
+
+    def test_empty_text(self):
+        """Empty text has no chunks."""
+        splitter = RecursiveCharacterTextSplitter(chunk_size=50, chunk_overlap=0)
+        assert splitter.split_text_with_offsets("") == []
+
+
 class TestEdgeCases:
     """Tests for edge cases and unusual inputs."""
 
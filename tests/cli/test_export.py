@@ -98,6 +98,45 @@ class TestExportBackup:
         result = cli_runner.invoke(export, ["backup", "--output", str(output_file), "--include-config"])
         assert result.exit_code == 0
 
+    @patch("src.ingestion.manifest.IngestionManifest")
+    @patch("src.storage.vector_store.VectorStore")
+    def test_export_backup_int8_round_trip(
+        self, mock_vector_store, mock_manifest, cli_runner: CliRunner, tmp_path
+    ):
+        """Test int8 embeddings are stored compactly and restored as float32."""
+        import json
+
+        import numpy as np
+
+        embeddings = [[0.1, -0.2, 0.3], [0.4, 0.5, -0.6]]
+        store_instance = MagicMock()
+        store_instance._collection_name = "test_collection"
+        store_instance.collection.get.return_value = {
+            "ids": ["chunk1", "chunk2"],
+            "documents": ["doc1 content", "doc2 content"],
+            "metadatas": [{"document_path": "doc1.pdf"}, {"document_path": "doc2.pdf"}],
+            "embeddings": embeddings,
+        }
+        mock_vector_store.return_value = store_instance
+
+        output_file = tmp_path / "backup.json"
+        result = cli_runner.invoke(
+            export, ["backup", "--output", str(output_file), "--embedding-format", "int8"]
+        )
+        assert result.exit_code == 0
+
+        backup = json.loads(output_file.read_text())
+        assert backup["embedding_codec"]["name"] == "int8"
+        assert all(isinstance(chunk["embedding"], str) for chunk in backup["chunks"])
+
+        with patch("src.cli.commands.exportimport.get_settings") as mock_settings:
+            mock_settings.return_value.bm25_index_dir = tmp_path / "bm25"
+            result = cli_runner.invoke(export, ["restore", str(output_file), "--yes", "--clear-existing"])
+        assert result.exit_code == 0
+
+        restored = store_instance.add.call_args.kwargs["embeddings"]
+        np.testing.assert_allclose(restored, embeddings, atol=0.01)
+
 
 class TestExportRestore:
     """Test export restore command."""
@@ -113,6 +152,40 @@ class TestExportRestore:
         result = cli_runner.invoke(export, ["restore", "/nonexistent/backup.json", "--yes"])
         assert result.exit_code != 0  # Should fail
 
+    @patch("src.ingestion.manifest.IngestionManifest")
+    @patch("src.cli.commands.exportimport.get_settings")
+    @patch("src.storage.vector_store.VectorStore")
+    def test_export_restore_clear_rebuilds_keyword_index(
+        self, mock_vector_store, mock_settings, mock_manifest, cli_runner: CliRunner, tmp_path
+    ):
+        """Test --clear-existing also resets BM25 and the manifest, then indexes restored chunks."""
+        import json
+
+        from src.retrieval.bm25 import BM25Retriever
+
+        index_dir = tmp_path / "bm25"
+        stale = BM25Retriever(index_dir=index_dir)
+        stale.add_documents(["stale content"], ["old"])
+        stale.save()
+        mock_settings.return_value.bm25_index_dir = index_dir
+        backup_file = tmp_path / "backup.json"
+        backup_file.write_text(json.dumps({
+            "version": "1.0",
+            "include_embeddings": True,
+            "chunks": [
+                {"id": "chunk1", "document": "restored content", "metadata": {}, "embedding": [0.1, 0.2]},
+            ],
+        }))
+
+        result = cli_runner.invoke(export, ["restore", str(backup_file), "--yes", "--clear-existing"])
+
+        assert result.exit_code == 0
+        mock_vector_store.return_value.clear.assert_called_once()
+        mock_manifest.return_value.clear.assert_called_once()
+        reopened = BM25Retriever(index_dir=index_dir)
+        assert reopened.live_ids() == {"chunk1"}
+        assert [r[0] for r in reopened.search("restored")] == ["chunk1"]
+
     @patch("src.storage.vector_store.VectorStore")
     def test_export_restore_invalid_backup(self, mock_vector_store, cli_runner: CliRunner, tmp_path):
         """Test restoring from invalid backup file."""
@@ -2,7 +2,6 @@
 
 from unittest.mock import MagicMock, patch
 
-import pytest
 from click.testing import CliRunner
 
 from src.cli.commands.metadata import metadata
@@ -279,3 +278,50 @@ class TestMetadataSearch:
         result = cli_runner.invoke(metadata, ["search", "--filter", "invalidformat"])
         assert result.exit_code == 1
         assert "Invalid" in result.output or "key=value" in result.output
+
+
+class TestMetadataFacets:
+    """Test metadata facets command."""
+
+    @patch("src.storage.vector_store.VectorStore")
+    def test_metadata_facets(self, mock_vector_store, cli_runner: CliRunner):
+        """Test facets are read from the facet index."""
+        store_instance = MagicMock()
+        store_instance.facets_stale.return_value = False
+        store_instance.facet_fields.return_value = ["category", "tag"]
+        store_instance.facet_counts.side_effect = lambda field: {
+            "category": {"research": 12},
+            "tag": {"python": 7, "rust": 2},
+        }[field]
+        mock_vector_store.return_value = store_instance
+
+        result = cli_runner.invoke(metadata, ["facets", "--format", "json"])
+        assert result.exit_code == 0
+        assert "research" in result.output
+        assert "python" in result.output
+        store_instance.collection.get.assert_not_called()
+
+    @patch("src.storage.vector_store.VectorStore")
+    def test_metadata_facets_rebuild(self, mock_vector_store, cli_runner: CliRunner):
+        """Test --rebuild recounts before showing facets."""
+        store_instance = MagicMock()
+        store_instance.rebuild_facets.return_value = 3
+        store_instance.facet_counts.return_value = {"Smith": 3}
+        mock_vector_store.return_value = store_instance
+
+        result = cli_runner.invoke(metadata, ["facets", "author", "--rebuild"])
+        assert result.exit_code == 0
+        assert "Recounted facets from 3 chunks" in result.output
+        store_instance.facet_counts.assert_called_once_with("author")
+
+    @patch("src.storage.vector_store.VectorStore")
+    def test_metadata_facets_stale_warning(self, mock_vector_store, cli_runner: CliRunner):
+        """Test a hint is shown when counts do not match the collection."""
+        store_instance = MagicMock()
+        store_instance.facets_stale.return_value = True
+        store_instance.facet_fields.return_value = []
+        mock_vector_store.return_value = store_instance
+
+        result = cli_runner.invoke(metadata, ["facets"])
+        assert result.exit_code == 0
+        assert "--rebuild" in result.output
@@ -0,0 +1,86 @@
+"""Unit tests for DuplicateDetector.
+
+Tests near-duplicate grouping over page fingerprints and the similarity metrics.
+"""
+
+import random
+
+import pytest
+
+from src.correction.detectors.duplicates import DuplicateDetector, PageFingerprint
+from src.utils.lsh import word_shingles
+
+
+def random_text(rng: random.Random, words: int = 200) -> str:
+    return " ".join(f"w{rng.randrange(5000)}" for _ in range(words))
+
+
+class TestDuplicateDetector:
+    """Tests for DuplicateDetector."""
+
+    @pytest.fixture
+    def detector(self):
+        """Create a DuplicateDetector instance."""
+        return DuplicateDetector(similarity_threshold=0.95)
+
+    @pytest.fixture
+    def fingerprints(self):
+        """Fingerprints of 500 distinct pages."""
+        # Seeded so every run builds the same pages; not used for security
+        rng = random.Random(0)  # noqa: S311
+        return [
+            PageFingerprint(
+                page_num=page + 1,
+                quick_hash=f"hash-{page}",
+                dhash=rng.getrandbits(64),
+                shingles=word_shingles(random_text(rng)),
+            )
+            for page in range(500)
+        ]
+
+    def test_exact_duplicates(self, detector, fingerprints):
+        """Pages with the same quick hash are grouped."""
+        fingerprints[9].quick_hash = fingerprints[2].quick_hash
+
+        assert detector._find_exact_duplicates(fingerprints) == [{3, 10}]
+
+    def test_no_near_duplicates(self, detector, fingerprints):
+        """Distinct pages are not grouped."""
+        assert detector._find_near_duplicates(fingerprints) == []
+
+    def test_text_near_duplicates(self, detector, fingerprints):
+        """Pages with similar text and images are grouped."""
+        original = fingerprints[4]
+        for index, flipped_bits in ((40, 0b1), (400, 0b101)):
+            fingerprints[index].dhash = original.dhash ^ flipped_bits
+            fingerprints[index].shingles = set(original.shingles)
+
+        assert detector._find_near_duplicates(fingerprints) == [{5, 41, 401}]
+
+    def test_similar_text_different_image(self, detector, fingerprints):
+        """Both hash and text similarity are required."""
+        fingerprints[40].shingles = set(fingerprints[4].shingles)
+        fingerprints[40].dhash = ~fingerprints[4].dhash & ((1 << 64) - 1)
+
+        assert detector._find_near_duplicates(fingerprints) == []
+
+    def test_pages_without_text(self, detector, fingerprints):
+        """Pages without text are matched on their images alone."""
+        for index in (10, 20, 30):
+            fingerprints[index].shingles = set()
+            fingerprints[index].dhash = 0x0123456789ABCDEF ^ (index & 1)
+        fingerprints[50].shingles = set()
+
+        assert detector._find_near_duplicates(fingerprints) == [{11, 21, 31}]
+
+    def test_compare_hashes(self, detector):
+        """Hash similarity falls with Hamming distance."""
+        assert detector._compare_hashes(0xFF, 0xFF) == 1.0
+        assert detector._compare_hashes(0, 0b1111) == pytest.approx(60 / 64)
+
+    def test_compare_text(self, detector):
+        """Text similarity is the Jaccard index of word shingles."""
+        assert detector._compare_text("The quick brown fox", "the quick brown fox") == 1.0
+        assert detector._compare_text("", "") == 1.0
+        assert detector._compare_text("some text", "") == 0.0
+        assert detector._compare_text("one two three four", "one two three five") == pytest.approx(1 / 3)
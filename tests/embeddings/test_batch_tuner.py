@@ -1,7 +1,6 @@
 """Tests for intelligent batch size tuning."""
 
-import pytest
-from unittest.mock import patch, Mock
+from unittest.mock import patch
 
 from src.embeddings.batch_tuner import BatchTuner
 
@@ -274,3 +273,81 @@ class TestBatchTuner:
 
             # Average size ~3750, should suggest medium batch
             assert 20 <= batch_size <= 50
+
+
+class TestTokenBudget:
+    """Tests for BatchTuner.suggest_token_budget."""
+
+    def test_budget_scales_with_document_length(self):
+        """Budget is batch size times estimated tokens per document."""
+        tuner = BatchTuner()
+
+        assert tuner.suggest_token_budget(["x" * 400] * 4, memory_check=False) == 100 * 100
+        assert tuner.suggest_token_budget(["x" * 8000] * 4, memory_check=False) == 20 * 2000
+
+    def test_budget_shrinks_under_memory_pressure(self):
+        """Memory pressure halves the budget along with the batch size."""
+        tuner = BatchTuner()
+        docs = ["x" * 400] * 4
+
+        with patch("psutil.virtual_memory") as mock_mem:
+            mock_mem.return_value.percent = 90.0
+            budget = tuner.suggest_token_budget(docs, memory_check=True)
+
+        assert budget == 50 * 100
+
+    def test_budget_without_documents(self):
+        """With nothing to sample, the budget uses the current batch size."""
+        tuner = BatchTuner(initial_size=32)
+
+        assert tuner.suggest_token_budget([], memory_check=False) == 32 * 250
+
+
+class TestLengthBuckets:
+    """Tests for BatchTuner.plan_length_buckets."""
+
+    def test_empty_input(self):
+        """No texts, no buckets."""
+        assert BatchTuner().plan_length_buckets([], memory_check=False) == []
+
+    def test_every_text_in_one_bucket(self):
+        """Buckets cover each input position exactly once."""
+        texts = ["x" * (1 + (i * 37) % 900) for i in range(50)]
+
+        buckets = BatchTuner().plan_length_buckets(texts, memory_check=False)
+
+        indices = [i for bucket in buckets for i in bucket.indices]
+        assert sorted(indices) == list(range(50))
+
+    def test_buckets_sorted_and_bounded(self):
+        """No text is padded to more than twice its length."""
+        texts = ["x" * (4 * n) for n in (1, 3, 5, 100, 2, 120, 60, 7)]
+
+        buckets = BatchTuner().plan_length_buckets(texts, memory_check=False)
+
+        previous = 0
+        for bucket in buckets:
+            lengths = [len(texts[i]) // 4 for i in bucket.indices]
+            assert lengths == sorted(lengths)
+            assert lengths[0] > previous
+            assert bucket.max_tokens == lengths[-1]
+            assert bucket.max_tokens < 2 * lengths[0] or lengths[0] == 1
+            previous = bucket.max_tokens
+
+    def test_batch_size_shrinks_with_length(self):
+        """Short texts get larger batches than long ones."""
+        texts = ["x" * 20] * 20 + ["x" * 4000] * 20
+
+        buckets = BatchTuner().plan_length_buckets(texts, memory_check=False)
+
+        assert len(buckets) == 2
+        assert buckets[0].batch_size > buckets[1].batch_size
+
+    def test_batch_size_within_limits(self):
+        """Batch sizes respect the tuner's min and max sizes."""
+        tuner = BatchTuner(min_size=10, max_size=200)
+        texts = ["x"] * 10 + ["x" * 40000] * 2
+
+        buckets = tuner.plan_length_buckets(texts, memory_check=False)
+
+        assert all(10 <= bucket.batch_size <= 200 for bucket in buckets)
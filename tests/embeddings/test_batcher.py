@@ -0,0 +1,178 @@
+"""Tests for the cross-producer embedding micro-batcher."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.embeddings.batch_tuner import BatchTuner
+from src.embeddings.batcher import EmbeddingBatcher, estimate_tokens
+from src.utils.multi_tier_cache import MultiTierCache
+
+
+def encode(text: str) -> list[float]:
+    """Deterministic fake embedding identifying the text."""
+    return [float(len(text)), float(sum(map(ord, text)) % 997)]
+
+
+@pytest.fixture
+def embedder():
+    """Mock embedder returning a vector derived from each text."""
+    mock = MagicMock()
+    mock.embed_batch.side_effect = lambda texts: np.array([encode(t) for t in texts])
+    return mock
+
+
+class TestEmbeddingBatcher:
+    """Tests for EmbeddingBatcher."""
+
+    def test_results_in_submission_order(self, embedder):
+        """Each producer receives its own embeddings in the order it submitted them."""
+        documents = [[f"doc {d} chunk {c}" + "x" * (c * 7 % 30) for c in range(5)] for d in range(4)]
+
+        with EmbeddingBatcher(embedder, token_budget=1000) as batcher:
+            futures = [batcher.submit(texts) for texts in documents]
+            results = [future.result(timeout=5) for future in futures]
+
+        for texts, embeddings in zip(documents, results, strict=True):
+            np.testing.assert_array_equal(embeddings, np.array([encode(t) for t in texts]))
+
+    def test_coalesces_producers(self, embedder):
+        """Texts from several producers share one embed_batch call."""
+        with EmbeddingBatcher(embedder, token_budget=10_000, max_latency=0.2) as batcher:
+            futures = [batcher.submit([f"document {i}"]) for i in range(10)]
+            for future in futures:
+                future.result(timeout=5)
+
+        assert embedder.embed_batch.call_count == 1
+        assert len(embedder.embed_batch.call_args.args[0]) == 10
+
+    def test_cached_texts_skip_the_model(self, embedder, temp_dir):
+        """Only texts missing from the cache are embedded; the rest are read back."""
+        cache = MultiTierCache(temp_dir, enable_l1=False, enable_l3=False)
+        texts = ["second", "third", "first"]
+
+        with EmbeddingBatcher(embedder, token_budget=1000, cache=cache) as batcher:
+            batcher.embed(["first", "second"])
+            embeddings = batcher.embed(texts)
+            cached = batcher.embed(["first"])
+
+        assert embedder.embed_batch.call_count == 2
+        assert embedder.embed_batch.call_args.args[0] == ["third"]
+        np.testing.assert_array_equal(embeddings, np.array([encode(t) for t in texts]))
+        np.testing.assert_array_equal(cached, np.array([encode("first")]))
+        assert batcher.cache_hits == 3
+
+    def test_large_request_split_by_budget(self, embedder):
+        """A request larger than the budget is embedded in several batches."""
+        texts = ["x" * 400] * 10  # 100 tokens each
+
+        with EmbeddingBatcher(embedder, token_budget=300) as batcher:
+            embeddings = batcher.embed(texts)
+
+        assert embeddings.shape == (10, 2)
+        assert all(len(call.args[0]) <= 3 for call in embedder.embed_batch.call_args_list)
+        assert embedder.embed_batch.call_count == 4
+
+    def test_batches_sorted_by_length(self, embedder):
+        """Texts of similar length are padded together."""
+        texts = ["a" * 4, "b" * 400, "c" * 8, "d" * 404]
+
+        with EmbeddingBatcher(embedder, token_budget=210) as batcher:
+            batcher.embed(texts)
+
+        batches = [call.args[0] for call in embedder.embed_batch.call_args_list]
+        assert batches == [["a" * 4, "c" * 8], ["b" * 400, "d" * 404]]
+
+    def test_deadline_flushes_partial_batch(self, embedder):
+        """A lone submission is embedded once max_latency passes."""
+        with EmbeddingBatcher(embedder, token_budget=1_000_000, max_latency=0.01) as batcher:
+            start = time.monotonic()
+            batcher.embed(["only one"])
+            elapsed = time.monotonic() - start
+
+        assert elapsed < 1.0
+
+    def test_full_budget_flushes_before_deadline(self, embedder):
+        """Reaching the budget flushes without waiting for the deadline."""
+        with EmbeddingBatcher(embedder, token_budget=10, max_latency=60.0) as batcher:
+            embeddings = batcher.submit(["x" * 40]).result(timeout=5)
+
+        assert embeddings.shape == (1, 2)
+
+    def test_failure_propagates_to_producers(self, embedder):
+        """An embedding error fails every request in the batch."""
+        embedder.embed_batch.side_effect = RuntimeError("model unavailable")
+
+        with EmbeddingBatcher(embedder, token_budget=1000) as batcher:
+            futures = [batcher.submit(["a"]), batcher.submit(["b"])]
+            for future in futures:
+                with pytest.raises(RuntimeError, match="model unavailable"):
+                    future.result(timeout=5)
+
+    def test_concurrent_producers(self, embedder):
+        """Producers on several threads all receive their embeddings."""
+        results: dict[int, np.ndarray] = {}
+
+        with EmbeddingBatcher(embedder, token_budget=500) as batcher:
+            def produce(i: int) -> None:
+                results[i] = batcher.embed([f"producer {i} text {j}" for j in range(3)])
+
+            threads = [threading.Thread(target=produce, args=(i,)) for i in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        for i, embeddings in results.items():
+            expected = np.array([encode(f"producer {i} text {j}") for j in range(3)])
+            np.testing.assert_array_equal(embeddings, expected)
+
+    def test_empty_submission(self, embedder):
+        """Submitting no texts resolves immediately."""
+        with EmbeddingBatcher(embedder) as batcher:
+            assert batcher.embed([]).shape[0] == 0
+
+        embedder.embed_batch.assert_not_called()
+
+    def test_close_flushes_pending(self, embedder):
+        """Closing embeds what is still waiting for the deadline."""
+        batcher = EmbeddingBatcher(embedder, token_budget=1_000_000, max_latency=60.0)
+        future = batcher.submit(["pending"])
+        batcher.close()
+
+        assert future.result(timeout=0).shape == (1, 2)
+
+    def test_submit_after_close_raises(self, embedder):
+        """A closed batcher rejects new work."""
+        batcher = EmbeddingBatcher(embedder)
+        batcher.close()
+
+        with pytest.raises(RuntimeError):
+            batcher.submit(["late"])
+
+    def test_uses_embedder_tuner(self, embedder):
+        """The embedder's BatchTuner drives the budget when none is given."""
+        tuner = BatchTuner()
+        embedder.batch_tuner = tuner
+
+        with EmbeddingBatcher(embedder) as batcher:
+            assert batcher.tuner is tuner
+            batcher.embed(["short text"] * 5)
+
+        assert batcher.token_budget == tuner.current_size * estimate_tokens("short text")
+
+    def test_tuner_failure_keeps_budget(self, embedder):
+        """A tuner error falls back to the current budget instead of hanging producers."""
+        tuner = BatchTuner()
+        batcher = EmbeddingBatcher(embedder, tuner=tuner)
+        budget = batcher.token_budget
+        tuner.suggest_token_budget = MagicMock(side_effect=RuntimeError("psutil unavailable"))
+
+        with batcher:
+            embeddings = batcher.submit(["a", "b"]).result(timeout=5)
+
+        assert embeddings.shape == (2, 2)
+        assert batcher.token_budget == budget
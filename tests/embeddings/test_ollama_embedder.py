@@ -0,0 +1,225 @@
+"""Tests for OllamaEmbedder batching against a local fake Ollama server."""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+pytest.importorskip("ollama")
+
+from src.embeddings.ollama_embedder import OllamaEmbedder, _ollama_circuit_breaker
+
+
+def fake_embedding(text):
+    """Deterministic 3-d embedding so results can be checked for order."""
+    return [float(len(text)), float(sum(map(ord, text)) % 97), 1.0]
+
+
+def unit(vector):
+    """Scale a vector to unit length, as /api/embed does."""
+    return (np.array(vector) / np.linalg.norm(vector)).tolist()
+
+
+class FakeOllama:
+    """Minimal Ollama HTTP API: /api/tags, /api/embed and /api/embeddings."""
+
+    def __init__(self, batch_endpoint=True, delay=0.0):
+        self.batch_endpoint = batch_endpoint
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                self._reply(200, {"models": [{"model": "fake-embed:latest", "name": "fake-embed:latest"}]})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                with fake._lock:
+                    fake.requests.append((self.path, payload))
+                    fake.in_flight += 1
+                    fake.max_in_flight = max(fake.max_in_flight, fake.in_flight)
+                try:
+                    time.sleep(fake.delay)
+                    if self.path == "/api/embed" and fake.batch_endpoint:
+                        inputs = payload["input"]
+                        if isinstance(inputs, str):
+                            inputs = [inputs]
+                        self._reply(200, {"model": payload["model"], "embeddings": [unit(fake_embedding(t)) for t in inputs]})
+                    elif self.path == "/api/embeddings":
+                        self._reply(200, {"embedding": fake_embedding(payload["prompt"])})
+                    else:
+                        self._reply(404, {"error": "404 page not found"})
+                finally:
+                    with fake._lock:
+                        fake.in_flight -= 1
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def paths(self):
+        return [path for path, _ in self.requests]
+
+
+TEXTS = [f"chunk number {i} " + "x" * (i % 7) for i in range(25)]
+EXPECTED = np.array([unit(fake_embedding(t)) for t in TEXTS], dtype=np.float32)
+
+
+class TestOllamaBatchEmbedding:
+    """Tests for embed_batch request batching and concurrency."""
+
+    def test_uses_multi_input_endpoint(self):
+        """Test texts are sent batch_size at a time to /api/embed."""
+        with FakeOllama() as server:
+            embedder = OllamaEmbedder(model_name="fake-embed", base_url=server.url, batch_size=10)
+            server.requests.clear()
+
+            result = embedder.embed_batch(TEXTS)
+
+            assert server.paths() == ["/api/embed"] * 3
+            assert [len(p["input"]) for _, p in server.requests] == [10, 10, 5]
+            assert np.array_equal(result, EXPECTED)
+            assert embedder.dimensions == 3
+
+    def test_falls_back_to_concurrent_requests(self):
+        """Test servers without /api/embed get bounded concurrent requests in order."""
+        with FakeOllama(batch_endpoint=False, delay=0.02) as server:
+            embedder = OllamaEmbedder(
+                model_name="fake-embed", base_url=server.url, batch_size=10, max_concurrency=4
+            )
+            server.requests.clear()
+            server.max_in_flight = 0
+
+            result = embedder.embed_batch(TEXTS)
+
+            assert np.allclose(result, EXPECTED)
+            assert server.paths().count("/api/embed") == 1
+            assert server.paths().count("/api/embeddings") == len(TEXTS)
+            assert 1 < server.max_in_flight <= 4
+
+    def test_fallback_is_remembered(self):
+        """Test the missing endpoint is only probed once."""
+        with FakeOllama(batch_endpoint=False) as server:
+            embedder = OllamaEmbedder(model_name="fake-embed", base_url=server.url)
+            embedder.embed_batch(TEXTS[:3])
+            server.requests.clear()
+
+            embedder.embed_batch(TEXTS[:3])
+
+            assert "/api/embed" not in server.paths()
+
+    def test_empty_batch(self):
+        """Test an empty batch makes no requests."""
+        with FakeOllama() as server:
+            embedder = OllamaEmbedder(model_name="fake-embed", base_url=server.url)
+            server.requests.clear()
+
+            result = embedder.embed_batch([])
+
+            assert result.shape == (0, 3)
+            assert server.requests == []
+
+    def test_batches_use_circuit_breaker(self):
+        """Test batched requests go through the shared circuit breaker."""
+        with FakeOllama() as server:
+            embedder = OllamaEmbedder(model_name="fake-embed", base_url=server.url, batch_size=10)
+
+            with patch("src.embeddings.ollama_embedder.get_settings") as mock_settings, \
+                    patch.object(_ollama_circuit_breaker, "call", wraps=_ollama_circuit_breaker.call) as call:
+                mock_settings.return_value.feature_flags.enable_advanced_error_recovery = True
+                result = embedder.embed_batch(TEXTS)
+
+            assert call.call_count == 3
+            assert np.array_equal(result, EXPECTED)
+
+    @pytest.mark.parametrize("batch_endpoint", [True, False])
+    def test_queries_match_batched_chunks(self, batch_endpoint):
+        """Test single-text and batched embeddings of a text agree."""
+        with FakeOllama(batch_endpoint=batch_endpoint) as server:
+            embedder = OllamaEmbedder(model_name="fake-embed", base_url=server.url)
+
+            query = embedder.embed_text(TEXTS[3])
+
+            assert np.allclose(query, embedder.embed_batch([TEXTS[3]])[0])
+            assert np.isclose(np.linalg.norm(query), 1.0)
+
+
+class TestOllamaAsyncEmbedding:
+    """Tests for the non-blocking embedding methods."""
+
+    def test_embed_text_async(self):
+        """Test single texts are embedded over the async client."""
+        with FakeOllama() as server:
+            embedder = OllamaEmbedder(model_name="fake-embed", base_url=server.url)
+
+            result = asyncio.run(embedder.embed_text_async("hello"))
+
+            assert np.allclose(result, unit(fake_embedding("hello")))
+
+    def test_embed_batch_async(self):
+        """Test async batches use /api/embed and keep order."""
+        with FakeOllama() as server:
+            embedder = OllamaEmbedder(model_name="fake-embed", base_url=server.url, batch_size=10)
+            server.requests.clear()
+
+            result = asyncio.run(embedder.embed_batch_async(TEXTS))
+
+            assert server.paths() == ["/api/embed"] * 3
+            assert np.array_equal(result, EXPECTED)
+
+    def test_embed_batch_async_fallback_is_bounded(self):
+        """Test async fallback keeps at most max_concurrency requests in flight."""
+        with FakeOllama(batch_endpoint=False, delay=0.02) as server:
+            embedder = OllamaEmbedder(
+                model_name="fake-embed", base_url=server.url, max_concurrency=3
+            )
+            server.max_in_flight = 0
+
+            result = asyncio.run(embedder.embed_batch_async(TEXTS))
+
+            assert np.allclose(result, EXPECTED)
+            assert 1 < server.max_in_flight <= 3
+
+    def test_concurrent_queries_do_not_serialize(self):
+        """Test concurrent embed_text_async calls overlap on one event loop."""
+        with FakeOllama(delay=0.2) as server:
+            embedder = OllamaEmbedder(model_name="fake-embed", base_url=server.url)
+
+            async def run():
+                start = time.perf_counter()
+                await asyncio.gather(*(embedder.embed_text_async(t) for t in TEXTS[:5]))
+                return time.perf_counter() - start
+
+            assert asyncio.run(run()) < 0.2 * 5 * 0.6
@@ -0,0 +1,246 @@
+"""Tests for quantized embedding storage and search."""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from src.embeddings.quantization import (
+    Float16Codec,
+    Float32Codec,
+    Int8Codec,
+    QuantizedVectors,
+    codec_from_dict,
+    get_codec,
+)
+
+
+def unit_vectors(count: int, dimensions: int, seed: int = 0) -> np.ndarray:
+    """Random unit-length embeddings, as the embedders produce."""
+    vectors = np.random.default_rng(seed).normal(size=(count, dimensions)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def vectors():
+    """Random embeddings."""
+    return unit_vectors(200, 16)
+
+
+class TestCodecs:
+    """Tests for embedding codecs."""
+
+    @pytest.mark.parametrize(
+        "name,dtype,tolerance",
+        [("float32", np.float32, 0), ("float16", np.float16, 1e-2), ("int8", np.int8, 5e-2)],
+    )
+    def test_round_trip(self, vectors, name, dtype, tolerance):
+        """Decoded vectors are close to the originals."""
+        codec = get_codec(name)
+
+        codes = codec.encode(vectors)
+
+        assert codes.dtype == dtype
+        np.testing.assert_allclose(codec.decode(codes), vectors, atol=tolerance)
+
+    def test_compression(self, vectors):
+        """float16 halves and int8 quarters the storage of float32."""
+        float32 = Float32Codec().encode(vectors).nbytes
+
+        assert Float16Codec().encode(vectors).nbytes * 2 == float32
+        assert Int8Codec().encode(vectors).nbytes * 4 == float32
+
+    def test_int8_scale_per_dimension(self):
+        """A fitted codec uses the full int8 range in each dimension."""
+        vectors = np.array([[1.0, 100.0], [-0.5, -50.0]], dtype=np.float32)
+
+        codes = Int8Codec().fit(vectors).encode(vectors)
+
+        np.testing.assert_array_equal(codes[0], [127, 127])
+
+    def test_int8_codes_independent_of_first_batch(self, vectors):
+        """Unit vectors encode the same whichever vectors came first."""
+        codec = Int8Codec()
+        codec.encode(vectors[:2] * 0.1)
+
+        codes = codec.encode(vectors)
+
+        np.testing.assert_array_equal(codes, Int8Codec().encode(vectors))
+        np.testing.assert_allclose(codec.decode(codes), vectors, atol=1 / 127)
+
+    def test_int8_clips_later_vectors(self):
+        """Values beyond the fitted range are clipped."""
+        codec = Int8Codec().fit(np.array([[1.0], [-1.0]]))
+
+        codes = codec.encode(np.array([[5.0]]))
+
+        assert codes[0, 0] == 127
+
+    def test_int8_scores_match_decoded(self, vectors):
+        """Scoring with the folded scale equals scoring decoded vectors."""
+        codec = Int8Codec()
+        codes = codec.encode(vectors)
+        query = vectors[0]
+
+        np.testing.assert_allclose(codec.scores(query, codes), codec.decode(codes) @ query, rtol=1e-5)
+
+    def test_serialisation(self, vectors):
+        """Codecs restore from their dict form."""
+        codec = Int8Codec()
+        codes = codec.encode(vectors)
+
+        restored = codec_from_dict(codec.to_dict())
+
+        np.testing.assert_array_equal(restored.decode(codes), codec.decode(codes))
+
+    def test_unknown_codec(self):
+        """Unknown codec names are rejected."""
+        with pytest.raises(ValueError, match="Unknown embedding quantization"):
+            get_codec("int4")
+
+
+class TestQuantizedVectors:
+    """Tests for QuantizedVectors."""
+
+    @pytest.mark.parametrize("name", ["float32", "float16", "int8"])
+    def test_finds_exact_match(self, vectors, name):
+        """A stored vector is its own nearest neighbour."""
+        store = QuantizedVectors(get_codec(name))
+        store.add(vectors)
+
+        rows, distances = store.search(vectors[42], k=5)
+
+        assert rows[0] == 42
+        assert distances[0] == pytest.approx(0.0, abs=1e-2)
+        assert list(distances) == sorted(distances)
+
+    def test_distances_match_float32(self, vectors):
+        """float32 storage gives exact cosine distances."""
+        store = QuantizedVectors(get_codec("float32"))
+        store.add(vectors)
+        query = vectors[3] + 0.1
+
+        rows, distances = store.search(query, k=3)
+
+        for row, distance in zip(rows, distances, strict=True):
+            expected = 1 - vectors[row] @ query / (np.linalg.norm(vectors[row]) * np.linalg.norm(query))
+            assert distance == pytest.approx(expected, abs=1e-5)
+
+    def test_rows_restrict_search(self, vectors):
+        """Only the given rows are searched."""
+        store = QuantizedVectors(get_codec("int8"))
+        store.add(vectors)
+
+        rows, _ = store.search(vectors[0], k=3, rows=np.array([5, 6, 7]))
+
+        assert set(rows) <= {5, 6, 7}
+
+    def test_removed_rows_not_returned(self, vectors):
+        """Removed rows are masked out of results."""
+        store = QuantizedVectors(get_codec("float16"))
+        store.add(vectors)
+
+        store.remove([42])
+        rows, _ = store.search(vectors[42], k=5)
+
+        assert 42 not in rows
+        assert len(store) == len(vectors) - 1
+
+    def test_rows_stable_across_growth(self, vectors):
+        """Row numbers stay valid as storage grows."""
+        store = QuantizedVectors(get_codec("float16"))
+        store.INITIAL_CAPACITY = 8
+        first = store.add(vectors[:10])
+        second = store.add(vectors[10:])
+
+        assert list(first) == list(range(10))
+        assert second[0] == 10
+        np.testing.assert_allclose(store.get([150]), vectors[150:151], atol=1e-2)
+
+    def test_rescoring_uses_originals(self, vectors, tmp_path):
+        """Rescored distances are exact float32 cosine distances."""
+        store = QuantizedVectors(get_codec("int8"), originals_path=tmp_path / "rows.f32")
+        store.add(vectors[:100])
+        store.add(vectors[100:])
+        query = vectors[150] + 0.05
+
+        rows, distances = store.search(query, k=3)
+
+        assert rows[0] == 150
+        expected = 1 - vectors[150] @ query / (np.linalg.norm(vectors[150]) * np.linalg.norm(query))
+        assert distances[0] == pytest.approx(expected, abs=1e-5)
+
+    def test_memory_reduced(self, vectors):
+        """int8 storage uses a quarter of the float32 bytes."""
+        float32 = QuantizedVectors(get_codec("float32"))
+        int8 = QuantizedVectors(get_codec("int8"))
+        float32.add(vectors)
+        int8.add(vectors)
+
+        assert int8.nbytes * 4 == float32.nbytes
+
+    @pytest.mark.parametrize("name", ["float16", "int8"])
+    def test_search_scores_in_chunks(self, name):
+        """Searching never decodes the whole matrix to float32 at once."""
+        store = QuantizedVectors(get_codec(name))
+        store.add(unit_vectors(100_000, 64))
+        query = unit_vectors(1, 64, seed=1)[0]
+
+        tracemalloc.start()
+        try:
+            store.search(query, k=10)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < store.size * 64 * np.dtype(np.float32).itemsize / 2
+
+    def test_empty_search(self):
+        """Searching an empty store returns nothing."""
+        rows, distances = QuantizedVectors(get_codec("int8")).search(np.ones(4), k=5)
+
+        assert rows.size == 0
+        assert distances.size == 0
+
+    def test_resume_from_files(self, vectors, tmp_path):
+        """Codes and originals appended to files are reloaded."""
+        codec = get_codec("int8")
+        paths = {"codes_path": tmp_path / "codes.bin", "originals_path": tmp_path / "rows.f32"}
+        store = QuantizedVectors(codec, **paths)
+        store.add(vectors[:100])
+
+        resumed = QuantizedVectors(codec_from_dict(codec.to_dict()), dimensions=16, **paths)
+        resumed.add(vectors[100:])
+        rows, _ = resumed.search(vectors[150], k=1)
+
+        assert resumed.size == len(vectors)
+        assert rows[0] == 150
+        np.testing.assert_array_equal(resumed.get([5]), store.get([5]))
+
+    def test_compacted_keeps_only_given_rows(self, vectors, tmp_path):
+        """Compaction copies the kept codes and originals unchanged."""
+        store = QuantizedVectors(get_codec("int8"), originals_path=tmp_path / "rows.f32")
+        store.add(vectors)
+        keep = np.arange(0, len(vectors), 3)
+
+        compact = store.compacted(
+            keep, codes_path=tmp_path / "codes.1.bin", originals_path=tmp_path / "rows.1.f32"
+        )
+        resumed = QuantizedVectors(
+            store.codec, codes_path=tmp_path / "codes.1.bin", dimensions=16
+        )
+
+        assert compact.size == len(compact) == keep.size
+        np.testing.assert_array_equal(compact.get(np.arange(keep.size)), store.get(keep))
+        np.testing.assert_array_equal(compact.originals.take(slice(None)), vectors[keep])
+        np.testing.assert_array_equal(resumed.get(np.arange(keep.size)), store.get(keep))
+        rows, _ = compact.search(vectors[keep[5]], k=1, rescore=True)
+        assert rows[0] == 5
+
+    def test_files_reset_without_dimensions(self, vectors, tmp_path):
+        """Opening files without dimensions starts empty."""
+        QuantizedVectors(get_codec("float16"), codes_path=tmp_path / "codes.bin").add(vectors)
+
+        store = QuantizedVectors(get_codec("float16"), codes_path=tmp_path / "codes.bin")
+
+        assert store.size == 0
@@ -1,7 +1,8 @@
 """Tests for Ollama LLM client."""
 
+import asyncio
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from src.generation.ollama_client import OllamaClient
 
 
@@ -134,6 +135,48 @@ class TestOllamaClient:
             client.generate("Test prompt")
 
 
+class TestOllamaClientAsync:
+    """Tests for the non-blocking generation methods."""
+
+    @pytest.fixture
+    def client(self):
+        with patch("src.generation.ollama_client.ollama_module"), \
+                patch.object(OllamaClient, "_verify_model_available"):
+            yield OllamaClient(base_url="http://localhost:11434", model="llama3.2")
+
+    def test_generate_async(self, client):
+        """Test generation awaits the async Ollama client."""
+        client.async_client.chat = AsyncMock(return_value={"message": {"content": "Answer"}})
+
+        response = asyncio.run(client.generate_async("Prompt", system="System", max_tokens=10))
+
+        assert response == "Answer"
+        kwargs = client.async_client.chat.await_args.kwargs
+        assert kwargs["messages"][0] == {"role": "system", "content": "System"}
+        assert kwargs["options"] == {"temperature": 0.7, "num_predict": 10}
+        client.client.chat.assert_not_called()
+
+    def test_generate_stream_async(self, client):
+        """Test streaming yields tokens from an async iterator."""
+        async def stream():
+            for token in ["Hel", "lo", "!"]:
+                yield {"message": {"content": token}}
+
+        client.async_client.chat = AsyncMock(return_value=stream())
+
+        async def collect():
+            return [token async for token in client.generate_stream_async("Prompt")]
+
+        assert asyncio.run(collect()) == ["Hel", "lo", "!"]
+
+    def test_generate_async_wraps_errors(self, client):
+        """Test failures surface as RuntimeError like generate."""
+        client.async_client.chat = AsyncMock(side_effect=ConnectionError("down"))
+
+        with pytest.raises(RuntimeError, match="Failed to generate response"):
+            asyncio.run(client.generate_async("Prompt"))
+
+
 class TestOllamaClientIntegration:
     """Integration tests for OllamaClient (require actual Ollama service)."""
 
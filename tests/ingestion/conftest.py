@@ -0,0 +1,41 @@
+"""Pytest fixtures for ingestion tests."""
+
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+
+from src.ingestion.models import Chunk, ChunkMetadata, Document
+
+
+def fake_chunk(document: Document, lines_per_chunk: int = 2) -> Document:
+    """Chunk a document by lines, without a tokenizer."""
+    lines = document.content.splitlines()
+    texts = ["\n".join(lines[i:i + lines_per_chunk]) for i in range(0, len(lines), lines_per_chunk)]
+    document.chunks = [
+        Chunk(
+            text=text,
+            tokens=len(text.split()),
+            position=position,
+            document_id=document.document_id,
+            metadata=ChunkMetadata(
+                document_id=document.document_id,
+                document_path=document.metadata.file_path,
+                file_hash=document.metadata.file_hash,
+                content_hash=document.metadata.content_hash,
+                chunk_position=position,
+                total_chunks=len(texts),
+                overlap_with_previous=0,
+                overlap_with_next=0,
+            ),
+        )
+        for position, text in enumerate(texts)
+    ]
+    return document
+
+
+@pytest.fixture
+def chunked() -> Generator[None, None, None]:
+    """Patch pipeline chunking so ingestion runs without a tokenizer."""
+    with patch("src.ingestion.pipeline.chunk_document", side_effect=fake_chunk):
+        yield
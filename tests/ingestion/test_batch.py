@@ -1,6 +1,7 @@
 """Tests for batch document ingestion."""
 
 import os
+import numpy as np
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
@@ -265,6 +266,135 @@ class TestBatchIngestion:
         assert summary.duplicates == 0  # Not checking for duplicates
 
 
+class TestManifestIngestion:
+    """Tests for skipping files with the ingestion manifest."""
+
+    @pytest.fixture
+    def manifest(self, temp_dir):
+        from src.ingestion.manifest import IngestionManifest
+
+        return IngestionManifest(db_path=temp_dir / "manifest.db")
+
+    @pytest.fixture
+    def chunked(self):
+        """Patch chunking so ingestion runs without a tokenizer."""
+        with patch("src.ingestion.batch.chunk_document", side_effect=lambda document: document):
+            yield
+
+    def test_unchanged_files_not_loaded(
+        self, console, sample_documents, mock_vector_store, mock_embedder, manifest, chunked
+    ):
+        """A second run skips every file before loading it."""
+        mock_vector_store.get_documents_by_metadata.return_value = {"ids": []}
+        ingester = BatchIngester(console, manifest=manifest, use_resource_governor=False)
+
+        first = ingester.ingest_batch(sample_documents)
+        assert first.successful == 3
+
+        with patch("src.ingestion.batch.load_document") as mock_load:
+            second = ingester.ingest_batch(sample_documents)
+
+        mock_load.assert_not_called()
+        assert second.skipped == 3
+
+    def test_byte_duplicates_not_loaded(
+        self, console, sample_documents, mock_vector_store, mock_embedder, manifest, chunked, temp_dir
+    ):
+        """A copy of an ingested file is a duplicate without being parsed."""
+        mock_vector_store.get_documents_by_metadata.return_value = {"ids": []}
+        ingester = BatchIngester(console, manifest=manifest, use_resource_governor=False)
+        first = ingester.ingest_batch(sample_documents[:1])
+
+        copy = temp_dir / "copy.txt"
+        copy.write_bytes(sample_documents[0].read_bytes())
+        with patch("src.ingestion.batch.load_document") as mock_load:
+            summary = ingester.ingest_batch([copy])
+
+        mock_load.assert_not_called()
+        assert summary.duplicates == 1
+        assert summary.results[0].duplicate_of == first.results[0].document_id
+
+    def test_changed_file_replaces_previous_chunks(
+        self, console, sample_documents, mock_vector_store, mock_embedder, manifest, chunked
+    ):
+        """A modified file is re-ingested and its old chunks removed."""
+        mock_vector_store.get_documents_by_metadata.return_value = {"ids": []}
+        ingester = BatchIngester(console, manifest=manifest, use_resource_governor=False)
+        first = ingester.ingest_batch(sample_documents[:1])
+        previous_id = first.results[0].document_id
+
+        sample_documents[0].write_text("Rewritten content\n" * 20)
+        mock_vector_store.get_documents_by_metadata.side_effect = self.stored_chunks(previous_id)
+        summary = ingester.ingest_batch(sample_documents[:1])
+
+        assert summary.successful == 1
+        mock_vector_store.delete.assert_called_once_with(ids=["old-chunk"])
+        assert summary.results[0].document_id != previous_id
+
+    def test_file_rewritten_as_duplicate_removes_previous_chunks(
+        self, console, sample_documents, mock_vector_store, mock_embedder, manifest, chunked
+    ):
+        """A file rewritten to match another file drops its own old chunks."""
+        mock_vector_store.get_documents_by_metadata.return_value = {"ids": []}
+        ingester = BatchIngester(console, manifest=manifest, use_resource_governor=False)
+        first = ingester.ingest_batch(sample_documents[:2])
+        previous_id = first.results[0].document_id
+
+        sample_documents[0].write_bytes(sample_documents[1].read_bytes())
+        mock_vector_store.get_documents_by_metadata.side_effect = self.stored_chunks(previous_id)
+        summary = ingester.ingest_batch(sample_documents[:1])
+
+        assert summary.duplicates == 1
+        assert summary.results[0].duplicate_of == first.results[1].document_id
+        mock_vector_store.delete.assert_called_once_with(ids=["old-chunk"])
+
+    def test_changed_file_keeps_previous_chunks_until_stored(
+        self, console, sample_documents, mock_vector_store, mock_embedder, manifest, chunked
+    ):
+        """Old chunks survive when storing the new version fails."""
+        mock_vector_store.get_documents_by_metadata.return_value = {"ids": []}
+        ingester = BatchIngester(console, manifest=manifest, use_resource_governor=False)
+        previous_id = ingester.ingest_batch(sample_documents[:1]).results[0].document_id
+
+        sample_documents[0].write_text("Rewritten content\n" * 20)
+        mock_vector_store.get_documents_by_metadata.side_effect = self.stored_chunks(previous_id)
+        mock_vector_store.add.side_effect = OSError("disk full")
+        summary = ingester.ingest_batch(sample_documents[:1])
+
+        assert summary.failed == 1
+        mock_vector_store.delete.assert_not_called()
+        assert manifest.check(sample_documents[0]).document_id == previous_id
+
+    @staticmethod
+    def stored_chunks(document_id):
+        """Vector store lookup holding one chunk of ``document_id``."""
+        def lookup(where):
+            if where.get("document_id") == document_id:
+                return {"ids": ["old-chunk"], "metadatas": [{"document_id": document_id}]}
+            return {"ids": []}
+
+        return lookup
+
+
+class TestEmbeddingCache:
+    """Tests for reusing cached chunk embeddings."""
+
+    def test_only_uncached_chunks_embedded(self, console, temp_dir):
+        """Chunks embedded before are read from the cache in input order."""
+        from src.utils.multi_tier_cache import MultiTierCache
+
+        embedder = MagicMock()
+        embedder.embed_batch.side_effect = lambda texts: np.array([[float(len(t)), 1.0] for t in texts])
+        cache = MultiTierCache(temp_dir / "cache", enable_l1=False, enable_l3=False)
+        ingester = BatchIngester(console, use_resource_governor=False, embedding_cache=cache)
+
+        ingester._embed_chunks(["a", "bb"], embedder)
+        embeddings = ingester._embed_chunks(["bb", "ccc", "a"], embedder)
+
+        assert embedder.embed_batch.call_args.args[0] == ["ccc"]
+        np.testing.assert_array_equal(embeddings, [[2.0, 1.0], [3.0, 1.0], [1.0, 1.0]])
+
+
 class TestIngestionResult:
     """Tests for IngestionResult dataclass."""
 
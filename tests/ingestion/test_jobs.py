@@ -0,0 +1,169 @@
+"""Tests for the background ingestion job queue."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.ingestion.jobs import IngestionJob, IngestionJobQueue, IngestionJobStore, JobStatus
+
+
+@pytest.fixture
+def store(temp_dir):
+    """Create a job store in a temporary directory."""
+    return IngestionJobStore(db_path=temp_dir / "jobs.db")
+
+
+def spool(queue: IngestionJobQueue, name: str = "doc.txt") -> tuple:
+    """Write an upload into the queue's spool directory."""
+    path = queue.upload_dir / name
+    path.write_text("content")
+    return name, path, path.stat().st_size
+
+
+async def wait_until_finished(queue: IngestionJobQueue, job_id: str) -> IngestionJob:
+    """Poll a job until a worker has finished it."""
+    for _ in range(200):
+        job = await queue.get(job_id)
+        if job.finished:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+class TestIngestionJobStore:
+    """Tests for IngestionJobStore."""
+
+    def test_round_trip(self, store, temp_dir):
+        """Saved jobs are read back with their types."""
+        store.insert(IngestionJob("job-1", "doc.pdf", temp_dir / "job-1.pdf", 10, created_at=1.0))
+
+        job = store.get("job-1")
+
+        assert job.status == JobStatus.QUEUED
+        assert job.path == temp_dir / "job-1.pdf"
+        assert job.size == 10
+        assert store.get("missing") is None
+
+    def test_unfinished(self, store, temp_dir):
+        """Only queued and running jobs are unfinished, oldest first."""
+        store.insert(IngestionJob("b", "b.txt", temp_dir / "b", 1, status=JobStatus.RUNNING, created_at=2.0))
+        store.insert(IngestionJob("a", "a.txt", temp_dir / "a", 1, created_at=1.0))
+        store.insert(IngestionJob("c", "c.txt", temp_dir / "c", 1, status=JobStatus.SUCCEEDED, created_at=0.0))
+
+        assert [job.job_id for job in store.unfinished()] == ["a", "b"]
+
+
+class TestIngestionJobQueue:
+    """Tests for IngestionJobQueue."""
+
+    @pytest.mark.asyncio
+    async def test_job_succeeds_with_progress(self, store, temp_dir):
+        """Workers run the ingest function and record its progress."""
+        async def ingest(job, report):
+            report("embedding", 0, 4)
+            report("embedding", 4, None)
+
+        queue = IngestionJobQueue(ingest, upload_dir=temp_dir / "uploads", store=store)
+        await queue.start()
+        try:
+            filename, path, size = spool(queue)
+            job = await queue.submit(filename, path, size)
+            assert job.status == JobStatus.QUEUED
+
+            job = await wait_until_finished(queue, job.job_id)
+        finally:
+            await queue.stop()
+
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.stage == "done"
+        assert (job.chunks_done, job.chunks_total) == (4, 4)
+        assert job.throughput > 0
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_progress_written_on_stage_change(self, store, temp_dir):
+        """Chunk progress is served from memory and stored once per stage."""
+        seen = []
+
+        async def ingest(job, report):
+            report("embedding", 0, 3)
+            for done in range(1, 4):
+                report("embedding", done, None)
+                seen.append((await queue.get(job.job_id)).chunks_done)
+
+        queue = IngestionJobQueue(ingest, upload_dir=temp_dir / "uploads", store=store)
+        with patch.object(store, "save", wraps=store.save) as save:
+            await queue.start()
+            try:
+                job = await queue.submit(*spool(queue))
+                job = await wait_until_finished(queue, job.job_id)
+            finally:
+                await queue.stop()
+
+        assert seen == [1, 2, 3]
+        assert [call.args[0].stage for call in save.call_args_list] == ["queued", "starting", "embedding", "done"]
+        assert job.chunks_done == 3
+
+    @pytest.mark.asyncio
+    async def test_job_failure_is_recorded(self, store, temp_dir):
+        """Exceptions from the ingest function fail the job."""
+        async def ingest(job, report):
+            raise ValueError("No content could be extracted")
+
+        queue = IngestionJobQueue(ingest, upload_dir=temp_dir / "uploads", store=store)
+        await queue.start()
+        try:
+            job = await queue.submit(*spool(queue))
+            job = await wait_until_finished(queue, job.job_id)
+        finally:
+            await queue.stop()
+
+        assert job.status == JobStatus.FAILED
+        assert job.error == "No content could be extracted"
+
+    @pytest.mark.asyncio
+    async def test_worker_limit(self, store, temp_dir):
+        """No more jobs run at once than there are workers."""
+        running, peak = 0, 0
+
+        async def ingest(job, report):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+        queue = IngestionJobQueue(ingest, upload_dir=temp_dir / "uploads", store=store, workers=2)
+        await queue.start()
+        try:
+            jobs = [await queue.submit(*spool(queue, f"doc{i}.txt")) for i in range(5)]
+            for job in jobs:
+                await wait_until_finished(queue, job.job_id)
+        finally:
+            await queue.stop()
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_unfinished_jobs_resume_on_start(self, store, temp_dir):
+        """Jobs left queued or running by a previous process are run again."""
+        ingested = []
+
+        async def ingest(job, report):
+            ingested.append(job.filename)
+
+        queue = IngestionJobQueue(ingest, upload_dir=temp_dir / "uploads", store=store)
+        filename, path, size = spool(queue)
+        store.insert(IngestionJob("interrupted", filename, path, size, status=JobStatus.RUNNING, chunks_done=3))
+        store.insert(IngestionJob("lost", "lost.txt", queue.upload_dir / "lost.txt", 1, created_at=1.0))
+
+        await queue.start()
+        try:
+            job = await wait_until_finished(queue, "interrupted")
+        finally:
+            await queue.stop()
+
+        assert job.status == JobStatus.SUCCEEDED
+        assert ingested == [filename]
+        assert (await queue.get("lost")).status == JobStatus.FAILED
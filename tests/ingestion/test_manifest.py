@@ -0,0 +1,147 @@
+"""Tests for the ingestion fingerprint manifest."""
+
+import os
+
+import pytest
+
+from src.ingestion.manifest import IngestionManifest, ManifestStatus
+
+
+@pytest.fixture
+def manifest(temp_dir):
+    """Create a manifest in a temporary directory."""
+    return IngestionManifest(db_path=temp_dir / "manifest.db")
+
+
+@pytest.fixture
+def doc(temp_dir):
+    """Create a document file."""
+    path = temp_dir / "doc.txt"
+    path.write_text("Original content")
+    return path
+
+
+def touch(path, offset_ns: int = 10**9) -> None:
+    """Move a file's modification time forward without changing its bytes."""
+    stats = path.stat()
+    os.utime(path, ns=(stats.st_atime_ns, stats.st_mtime_ns + offset_ns))
+
+
+class TestCheck:
+    """Tests for IngestionManifest.check."""
+
+    def test_new_file(self, manifest, doc):
+        """Unrecorded files are new."""
+        check = manifest.check(doc)
+
+        assert check.status == ManifestStatus.NEW
+        assert check.document_id is None
+        assert check.fingerprint.size == doc.stat().st_size
+        assert len(check.fingerprint.raw_hash) == 64
+
+    def test_unchanged_file(self, manifest, doc):
+        """Recorded files with matching size and mtime are unchanged."""
+        manifest.record(manifest.check(doc).fingerprint, "doc-1")
+
+        check = manifest.check(doc)
+
+        assert check.status == ManifestStatus.UNCHANGED
+        assert check.document_id == "doc-1"
+
+    def test_touched_file_is_unchanged(self, manifest, doc):
+        """A newer mtime with identical bytes is unchanged and refreshes the entry."""
+        manifest.record(manifest.check(doc).fingerprint, "doc-1")
+        touch(doc)
+
+        assert not manifest.is_unchanged(doc)
+        assert manifest.check(doc).status == ManifestStatus.UNCHANGED
+        assert manifest.is_unchanged(doc)
+
+    def test_changed_file(self, manifest, doc):
+        """Modified bytes are reported with the previous document id."""
+        manifest.record(manifest.check(doc).fingerprint, "doc-1")
+        doc.write_text("Edited content, now longer")
+
+        check = manifest.check(doc)
+
+        assert check.status == ManifestStatus.CHANGED
+        assert check.document_id == "doc-1"
+        assert check.previous_document_id == "doc-1"
+
+    def test_duplicate_file(self, manifest, doc, temp_dir):
+        """Identical bytes under another path are duplicates."""
+        manifest.record(manifest.check(doc).fingerprint, "doc-1")
+        copy = temp_dir / "copy.txt"
+        copy.write_bytes(doc.read_bytes())
+
+        check = manifest.check(copy)
+
+        assert check.status == ManifestStatus.DUPLICATE
+        assert check.document_id == "doc-1"
+        assert check.previous_document_id is None
+
+    def test_changed_into_duplicate_reports_previous_version(self, manifest, doc, temp_dir):
+        """A recorded path rewritten to match another file keeps its own previous id."""
+        other = temp_dir / "other.txt"
+        other.write_text("Other content")
+        manifest.record(manifest.check(doc).fingerprint, "doc-1")
+        manifest.record(manifest.check(other).fingerprint, "doc-2")
+        doc.write_bytes(other.read_bytes())
+
+        check = manifest.check(doc)
+
+        assert check.status == ManifestStatus.DUPLICATE
+        assert check.document_id == "doc-2"
+        assert check.previous_document_id == "doc-1"
+
+    def test_changed_duplicate_keeps_original(self, manifest, doc, temp_dir):
+        """A path recorded as a duplicate never offers the original for removal."""
+        copy = temp_dir / "copy.txt"
+        copy.write_bytes(doc.read_bytes())
+        manifest.record(manifest.check(doc).fingerprint, "doc-1")
+        manifest.record(manifest.check(copy).fingerprint, "doc-1")
+        copy.write_text("Edited copy, now longer")
+
+        check = manifest.check(copy)
+
+        assert check.status == ManifestStatus.CHANGED
+        assert check.previous_document_id is None
+
+    def test_missing_file(self, manifest, temp_dir):
+        """Missing files raise rather than being reported unchanged."""
+        with pytest.raises(FileNotFoundError):
+            manifest.check(temp_dir / "missing.txt")
+
+
+class TestPersistence:
+    """Tests for manifest persistence and maintenance."""
+
+    def test_entries_survive_reopen(self, manifest, doc):
+        """Entries are read back by a new manifest instance."""
+        manifest.record(manifest.check(doc).fingerprint, "doc-1")
+
+        reopened = IngestionManifest(db_path=manifest.db_path)
+
+        assert reopened.count() == 1
+        assert reopened.check(doc).status == ManifestStatus.UNCHANGED
+
+    def test_partition_unchanged(self, manifest, doc, temp_dir):
+        """Only files whose metadata matches are reported unchanged."""
+        other = temp_dir / "other.txt"
+        other.write_text("Other content")
+        manifest.record(manifest.check(doc).fingerprint, "doc-1")
+
+        pending, unchanged = manifest.partition_unchanged([doc, other])
+
+        assert pending == [other]
+        assert unchanged == [doc]
+
+    def test_forget_and_clear(self, manifest, doc):
+        """Forgotten or cleared files are new again."""
+        manifest.record(manifest.check(doc).fingerprint, "doc-1")
+        manifest.forget(doc)
+        assert manifest.check(doc).status == ManifestStatus.NEW
+
+        manifest.record(manifest.check(doc).fingerprint, "doc-1")
+        manifest.clear()
+        assert manifest.count() == 0
@@ -0,0 +1,267 @@
+"""Tests for the staged batch ingestion pipeline."""
+
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import numpy as np
+import pytest
+from rich.console import Console
+
+from src.exceptions import MemoryLimitExceededError
+from src.ingestion.batch import BatchIngester, IngestionStatus
+from src.ingestion.pipeline import IngestionPipeline, prepare_document
+
+# Chunk without a tokenizer
+pytestmark = pytest.mark.usefixtures("chunked")
+
+
+@pytest.fixture
+def console():
+    """Create a mock Rich console."""
+    return Mock(spec=Console)
+
+
+@pytest.fixture(autouse=True)
+def temp_data_dir(temp_dir, monkeypatch):
+    """Set RAGGED_DATA_DIR to temp directory for all tests."""
+    monkeypatch.setenv("RAGGED_DATA_DIR", str(temp_dir / ".ragged"))
+
+
+@pytest.fixture
+def mock_vector_store():
+    """Create a mock vector store with no existing documents."""
+    with patch('src.ingestion.batch.VectorStore') as MockVectorStore:
+        mock_store = MagicMock()
+        mock_store.get_documents_by_metadata.return_value = {"ids": []}
+        MockVectorStore.return_value = mock_store
+        yield mock_store
+
+
+@pytest.fixture
+def mock_embedder():
+    """Create a mock embedder returning one vector per text."""
+    with patch('src.ingestion.batch.get_embedder') as mock_get_embedder:
+        mock_embed = MagicMock()
+        mock_embed.embed_batch.side_effect = lambda texts: np.ones((len(texts), 8))
+        mock_get_embedder.return_value = mock_embed
+        yield mock_embed
+
+
+@pytest.fixture
+def documents(temp_dir):
+    """Create ten distinct documents of eight lines each."""
+    paths = []
+    for i in range(10):
+        path = temp_dir / f"doc{i}.txt"
+        path.write_text("".join(f"Document {i} line {line}\n" for line in range(8)))
+        paths.append(path)
+    return paths
+
+
+def make_pipeline(console, **kwargs) -> IngestionPipeline:
+    """Create a thread-pool pipeline around a fresh ingester."""
+    ingester_kwargs = {"use_resource_governor": False, "workers": 2}
+    for key in ("continue_on_error", "skip_duplicates", "use_resource_governor", "manifest"):
+        if key in kwargs:
+            ingester_kwargs[key] = kwargs.pop(key)
+    ingester = BatchIngester(console, **ingester_kwargs)
+    return IngestionPipeline(ingester, use_process_pool=False, **kwargs)
+
+
+class TestIngestionPipeline:
+    """Tests for IngestionPipeline."""
+
+    def test_all_documents_ingested(self, console, documents, mock_vector_store, mock_embedder):
+        """Every file is reported as stored, in input order."""
+        summary = make_pipeline(console).run(documents)
+
+        assert summary.total == 10
+        assert summary.successful == 10
+        assert summary.total_chunks == 40
+        assert [r.file_path for r in summary.results] == documents
+
+    def test_embeddings_coalesced_across_documents(
+        self, console, documents, mock_vector_store, mock_embedder
+    ):
+        """Chunks from several documents share embed_batch calls."""
+        summary = make_pipeline(console, token_budget=10_000, write_batch_chunks=1000).run(documents)
+
+        embedded = sum(len(call.args[0]) for call in mock_embedder.embed_batch.call_args_list)
+        assert embedded == summary.total_chunks
+        assert mock_embedder.embed_batch.call_count < len(documents)
+
+    def test_writes_batched(self, console, documents, mock_vector_store, mock_embedder):
+        """Several documents are stored with one vector store add."""
+        make_pipeline(console, write_batch_chunks=1000).run(documents)
+
+        added = [call.kwargs for call in mock_vector_store.add.call_args_list]
+        assert len(added) < len(documents)
+        assert sum(len(kwargs["ids"]) for kwargs in added) == 40
+        for kwargs in added:
+            assert kwargs["embeddings"].shape == (len(kwargs["ids"]), 8)
+            assert all(isinstance(m["document_path"], str) for m in kwargs["metadatas"])
+
+    def test_duplicates_within_batch(self, console, documents, mock_vector_store, mock_embedder, temp_dir):
+        """A copy of a file in the same batch is stored once."""
+        copy = temp_dir / "copy.txt"
+        copy.write_text(documents[0].read_text())
+
+        summary = make_pipeline(console).run([documents[0], copy])
+
+        statuses = sorted(r.status for r in summary.results)
+        assert statuses == sorted([IngestionStatus.SUCCESS, IngestionStatus.DUPLICATE])
+        duplicate = next(r for r in summary.results if r.status == IngestionStatus.DUPLICATE)
+        original = next(r for r in summary.results if r.status == IngestionStatus.SUCCESS)
+        assert duplicate.duplicate_of == original.document_id
+
+    def test_failure_isolated(self, console, documents, mock_vector_store, mock_embedder, temp_dir):
+        """A file that cannot be loaded fails without affecting the rest."""
+        missing = temp_dir / "missing.txt"
+
+        summary = make_pipeline(console).run([*documents[:3], missing])
+
+        assert summary.successful == 3
+        assert summary.failed == 1
+        assert summary.results[3].status == IngestionStatus.FAILED
+
+    def test_embedding_failure_reported_per_file(
+        self, console, documents, mock_vector_store, mock_embedder
+    ):
+        """Documents in a failed embedding batch are each reported as failed."""
+        mock_embedder.embed_batch.side_effect = RuntimeError("model unavailable")
+
+        summary = make_pipeline(console).run(documents[:3])
+
+        assert summary.failed == 3
+        assert all(r.error == "model unavailable" for r in summary.results)
+        mock_vector_store.add.assert_not_called()
+
+    def test_stops_on_error(self, console, documents, mock_vector_store, mock_embedder, temp_dir):
+        """With continue_on_error=False no further files are admitted."""
+        missing = temp_dir / "missing.txt"
+
+        pipeline = make_pipeline(console, continue_on_error=False, max_in_flight=1)
+        summary = pipeline.run([missing, *documents])
+
+        assert summary.failed == 1
+        assert summary.total < len(documents) + 1
+
+    def test_resources_released(self, console, documents, mock_vector_store, mock_embedder):
+        """Every resource reservation is released."""
+        pipeline = make_pipeline(console, use_resource_governor=True)
+        governor = MagicMock()
+        governor.request_resources.return_value = True
+        pipeline.ingester.governor = governor
+
+        pipeline.run(documents)
+
+        requested = [call.kwargs["operation_id"] for call in governor.request_resources.call_args_list]
+        released = [call.args[0] for call in governor.release_resources.call_args_list]
+        assert len(requested) == len(documents)
+        assert sorted(released) == sorted(requested)
+
+    def test_admission_failure_drains_submitted(
+        self, console, documents, mock_vector_store, mock_embedder
+    ):
+        """Files admitted before admission fails are still stored and reported."""
+        pipeline = make_pipeline(console)
+        limit_error = MemoryLimitExceededError("document_3", limit_mb=1, usage_mb=2)
+
+        def check_memory(operation):
+            if operation.startswith("document_3"):
+                raise limit_error
+
+        def slow_prepare(file_path):
+            # Still loading when admission fails
+            time.sleep(0.2)
+            return prepare_document(file_path)
+
+        with patch.object(pipeline.ingester, "_check_memory_limit", side_effect=check_memory), \
+                patch("src.ingestion.pipeline.prepare_document", side_effect=slow_prepare), \
+                pytest.raises(MemoryLimitExceededError):
+            pipeline.run(documents)
+
+        assert sorted(pipeline._results) == [0, 1]
+        assert all(r.status == IngestionStatus.SUCCESS for r in pipeline._results.values())
+        assert sum(len(call.kwargs["ids"]) for call in mock_vector_store.add.call_args_list) == 8
+
+    def test_keyword_index_failure_keeps_stored_documents(
+        self, console, documents, mock_vector_store, mock_embedder
+    ):
+        """A BM25 failure after the vector store add does not fail the documents."""
+        pipeline = make_pipeline(console)
+        pipeline.ingester.bm25_retriever = MagicMock()
+        pipeline.ingester.bm25_retriever.add_documents.side_effect = RuntimeError("index locked")
+
+        summary = pipeline.run(documents[:3])
+
+        assert summary.successful == 3
+        mock_vector_store.add.assert_called()
+
+    def test_unchanged_files_skipped(self, console, documents, mock_vector_store, mock_embedder, temp_dir):
+        """Files recorded in the manifest are not loaded again."""
+        from src.ingestion.manifest import IngestionManifest
+
+        manifest = IngestionManifest(db_path=temp_dir / "manifest.db")
+        make_pipeline(console, manifest=manifest).run(documents)
+
+        with patch("src.ingestion.pipeline.prepare_document") as mock_prepare:
+            summary = make_pipeline(console, manifest=manifest).run(documents)
+
+        mock_prepare.assert_not_called()
+        assert summary.skipped == len(documents)
+
+    def test_changed_file_replaced_after_store(
+        self, console, documents, mock_vector_store, mock_embedder, temp_dir
+    ):
+        """A changed file's old chunks are removed only once the new ones are stored."""
+        from src.ingestion.manifest import IngestionManifest
+
+        manifest = IngestionManifest(db_path=temp_dir / "manifest.db")
+        previous_id = make_pipeline(console, manifest=manifest).run(documents[:1]).results[0].document_id
+        documents[0].write_text("Rewritten line\n" * 4)
+
+        def lookup(where):
+            if where.get("document_id") == previous_id:
+                return {"ids": ["old-chunk"]}
+            return {"ids": []}
+
+        events = []
+        mock_vector_store.get_documents_by_metadata.side_effect = lookup
+        mock_vector_store.add.side_effect = lambda **kwargs: events.append("add")
+        mock_vector_store.delete.side_effect = lambda **kwargs: events.append(("delete", kwargs["ids"]))
+
+        summary = make_pipeline(console, manifest=manifest).run(documents[:1])
+
+        assert summary.successful == 1
+        assert events == ["add", ("delete", ["old-chunk"])]
+
+    def test_file_rewritten_as_duplicate_removes_previous_chunks(
+        self, console, documents, mock_vector_store, mock_embedder, temp_dir
+    ):
+        """A file rewritten to match another file drops its own old chunks."""
+        from src.ingestion.manifest import IngestionManifest
+
+        manifest = IngestionManifest(db_path=temp_dir / "manifest.db")
+        previous_id = make_pipeline(console, manifest=manifest).run(documents[:2]).results[0].document_id
+        documents[0].write_bytes(documents[1].read_bytes())
+
+        def lookup(where):
+            if where.get("document_id") == previous_id:
+                return {"ids": ["old-chunk"]}
+            return {"ids": []}
+
+        mock_vector_store.get_documents_by_metadata.side_effect = lookup
+        summary = make_pipeline(console, manifest=manifest).run(documents[:1])
+
+        assert summary.duplicates == 1
+        mock_vector_store.delete.assert_called_once_with(ids=["old-chunk"])
+
+    def test_batch_ingester_uses_pipeline_with_workers(self, console, documents):
+        """BatchIngester hands off to the pipeline when workers > 1."""
+        ingester = BatchIngester(console, workers=4, use_resource_governor=False)
+
+        with patch("src.ingestion.pipeline.IngestionPipeline.run") as mock_run:
+            ingester.ingest_batch(documents)
+
+        mock_run.assert_called_once_with(documents, None)
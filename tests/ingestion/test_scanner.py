@@ -627,3 +627,34 @@ class TestHelperMethods:
 
         assert scanner._should_ignore(test_file) is True
         assert scanner._should_ignore(normal_file) is False
+
+
+class TestManifestScanning:
+    """Tests for skipping unchanged files via the ingestion manifest."""
+
+    def test_unchanged_files_skipped(self, temp_dir):
+        """Files recorded in the manifest are left out of scan results."""
+        from src.ingestion.manifest import IngestionManifest
+
+        docs_dir = temp_dir / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "a.txt").write_text("A")
+        (docs_dir / "b.txt").write_text("B")
+
+        manifest = IngestionManifest(db_path=temp_dir / "manifest.db")
+        manifest.record(manifest.check(docs_dir / "a.txt").fingerprint, "doc-a")
+
+        scanner = DocumentScanner(manifest=manifest)
+        results = scanner.scan(docs_dir)
+
+        assert results == [(docs_dir / "b.txt").resolve()]
+        assert scanner.unchanged == [(docs_dir / "a.txt").resolve()]
+
+    def test_no_manifest_returns_all(self, temp_dir):
+        """Without a manifest every supported file is returned."""
+        (temp_dir / "a.txt").write_text("A")
+
+        scanner = DocumentScanner()
+
+        assert scanner.scan(temp_dir / "a.txt") == [(temp_dir / "a.txt").resolve()]
+        assert scanner.unchanged == []
@@ -0,0 +1,86 @@
+"""Throughput benchmark for pipelined batch ingestion.
+
+Compares documents per second for the serial BatchIngester path against the
+staged IngestionPipeline. Parsing, embedding and storage are simulated with
+fixed latencies (a per-call overhead plus a per-chunk cost for embedding), so
+the numbers reflect how well the stages overlap and batch, not model speed.
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from rich.console import Console
+
+from src.ingestion.batch import BatchIngester
+from src.ingestion.pipeline import IngestionPipeline
+from tests.ingestion.conftest import fake_chunk
+
+DOCUMENTS = 60
+LOAD_SECONDS = 0.01
+EMBED_CALL_SECONDS = 0.01
+EMBED_CHUNK_SECONDS = 0.0005
+WRITE_CALL_SECONDS = 0.005
+
+
+def slow_chunk(document):
+    """Chunk a document after a simulated parse."""
+    time.sleep(LOAD_SECONDS)
+    return fake_chunk(document)
+
+
+def slow_embed(texts):
+    """Embed with a fixed per-call overhead and a per-chunk cost."""
+    time.sleep(EMBED_CALL_SECONDS + EMBED_CHUNK_SECONDS * len(texts))
+    return np.ones((len(texts), 8))
+
+
+@pytest.fixture
+def documents(tmp_path, monkeypatch):
+    """Distinct text documents of twenty lines each."""
+    monkeypatch.setenv("RAGGED_DATA_DIR", str(tmp_path / ".ragged"))
+    paths = []
+    for i in range(DOCUMENTS):
+        path = tmp_path / f"doc{i}.txt"
+        path.write_text("".join(f"Document {i} line {line}\n" for line in range(20)))
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def simulated_backends():
+    """Patch chunking, embedding and the vector store with timed fakes."""
+    store = MagicMock()
+    store.get_documents_by_metadata.return_value = {"ids": []}
+    store.add.side_effect = lambda **kwargs: time.sleep(WRITE_CALL_SECONDS)
+    embedder = MagicMock()
+    embedder.embed_batch.side_effect = slow_embed
+
+    with patch("src.ingestion.batch.VectorStore", return_value=store), \
+            patch("src.ingestion.batch.get_embedder", return_value=embedder), \
+            patch("src.ingestion.batch.chunk_document", side_effect=slow_chunk), \
+            patch("src.ingestion.pipeline.chunk_document", side_effect=slow_chunk):
+        yield
+
+
+@pytest.mark.performance
+def test_pipeline_throughput(documents, simulated_backends):
+    """Pipelined ingestion sustains higher docs/s than the serial path."""
+    console = Console(quiet=True)
+
+    serial = BatchIngester(console, use_resource_governor=False)
+    start = time.perf_counter()
+    serial_summary = serial.ingest_batch(documents)
+    serial_seconds = time.perf_counter() - start
+
+    pipelined = BatchIngester(console, use_resource_governor=False, workers=4)
+    start = time.perf_counter()
+    pipeline_summary = IngestionPipeline(pipelined, use_process_pool=False).run(documents)
+    pipeline_seconds = time.perf_counter() - start
+
+    assert serial_summary.successful == pipeline_summary.successful == DOCUMENTS
+
+    serial_rate = DOCUMENTS / serial_seconds
+    pipeline_rate = DOCUMENTS / pipeline_seconds
+    assert pipeline_rate > 2 * serial_rate
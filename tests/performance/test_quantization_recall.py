@@ -0,0 +1,59 @@
+"""Recall and memory of quantized embedding search.
+
+Measures recall@10 of float16 and int8 storage against exact float32
+search on clustered synthetic embeddings (topics with noisy members, as
+chunk embeddings of a document collection are), with and without float32
+rescoring of the top candidates.
+"""
+
+import numpy as np
+import pytest
+
+from src.embeddings.quantization import QuantizedVectors, get_codec
+
+DIMENSIONS = 384
+DOCUMENTS = 20_000
+QUERIES = 200
+K = 10
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    """Clustered, normalised embeddings and queries near them."""
+    rng = np.random.default_rng(0)
+    centres = rng.normal(size=(200, DIMENSIONS))
+    vectors = centres[rng.integers(0, len(centres), DOCUMENTS)] + 0.6 * rng.normal(size=(DOCUMENTS, DIMENSIONS))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    queries = vectors[rng.integers(0, DOCUMENTS, QUERIES)] + 0.3 * rng.normal(size=(QUERIES, DIMENSIONS))
+    return vectors.astype(np.float32), queries.astype(np.float32)
+
+
+def recall_at_k(store: QuantizedVectors, exact: QuantizedVectors, queries: np.ndarray, rescore: bool) -> float:
+    """Fraction of the exact top-k found by the quantized search."""
+    found = 0
+    for query in queries:
+        expected = set(exact.search(query, K)[0])
+        found += len(expected & set(store.search(query, K, rescore=rescore)[0]))
+    return found / (K * len(queries))
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("name,min_recall", [("float16", 0.99), ("int8", 0.9)])
+def test_quantized_recall(corpus, tmp_path, name, min_recall):
+    """Quantized search keeps recall; rescoring recovers the rest."""
+    vectors, queries = corpus
+    exact = QuantizedVectors(get_codec("float32"))
+    exact.add(vectors)
+    store = QuantizedVectors(get_codec(name), originals_path=tmp_path / "rows.f32")
+    store.add(vectors)
+
+    recall = recall_at_k(store, exact, queries, rescore=False)
+    rescored = recall_at_k(store, exact, queries, rescore=True)
+
+    print(
+        f"\n{name}: recall@{K} {recall:.3f}, rescored {rescored:.3f}, "
+        f"{exact.nbytes / store.nbytes:.0f}x smaller"
+    )
+    assert recall >= min_recall
+    assert rescored >= recall
+    assert rescored >= 0.99
@@ -0,0 +1,196 @@
+"""
+Tests for the persistent quality assessment cache.
+
+Tests cover:
+- Round-tripping assessments with page scores
+- Content fingerprinting across renames and edits
+- Version isolation
+- Integration with QualityAssessor
+"""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.processing.assessment_cache import AssessmentCache
+from src.processing.quality_assessor import PageQuality, QualityAssessment, QualityAssessor
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an assessment cache in a temporary directory."""
+    return AssessmentCache(db_path=tmp_path / "quality.db")
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    """Create a file to assess."""
+    path = tmp_path / "report.pdf"
+    path.write_bytes(b"%PDF-1.7 report")
+    return path
+
+
+def make_assessment(score: float = 0.9) -> QualityAssessment:
+    """Create a born-digital assessment with one page."""
+    return QualityAssessment(
+        overall_score=score,
+        is_born_digital=True,
+        is_scanned=False,
+        text_quality=0.95,
+        layout_complexity=0.2,
+        image_quality=0.0,
+        has_tables=True,
+        has_rotated_content=False,
+        page_scores=[PageQuality(page_number=1, is_born_digital=True, text_quality=0.95)],
+        metadata={"file_name": "report.pdf", "total_pages": 1},
+    )
+
+
+class TestAssessmentCache:
+    """Tests for AssessmentCache."""
+
+    def test_round_trip(self, cache, pdf_file):
+        """Stored assessments are read back with their page scores."""
+        cache.put(pdf_file, "v1", make_assessment())
+
+        assessment = cache.get(pdf_file, "v1")
+
+        assert assessment.overall_score == 0.9
+        assert assessment.has_tables is True
+        assert assessment.page_scores == [PageQuality(page_number=1, is_born_digital=True, text_quality=0.95)]
+        assert assessment.metadata["total_pages"] == 1
+
+    def test_miss(self, cache, pdf_file):
+        """Unknown content is a miss."""
+        assert cache.get(pdf_file, "v1") is None
+
+    def test_version_mismatch(self, cache, pdf_file):
+        """Assessments made with other settings are not reused."""
+        cache.put(pdf_file, "v1", make_assessment())
+
+        assert cache.get(pdf_file, "v2") is None
+
+    def test_keyed_by_content(self, cache, pdf_file, tmp_path):
+        """A copy of known content hits under its own name."""
+        cache.put(pdf_file, "v1", make_assessment())
+        copy = tmp_path / "copy.pdf"
+        copy.write_bytes(pdf_file.read_bytes())
+
+        assessment = cache.get(copy, "v1")
+
+        assert assessment is not None
+        assert assessment.metadata["file_name"] == "copy.pdf"
+
+    def test_changed_content_misses(self, cache, pdf_file):
+        """Editing a file invalidates its assessment."""
+        cache.put(pdf_file, "v1", make_assessment())
+        pdf_file.write_bytes(b"%PDF-1.7 revised report")
+
+        assert cache.get(pdf_file, "v1") is None
+
+    def test_unchanged_file_is_not_rehashed(self, cache, pdf_file):
+        """Files with the recorded size and mtime reuse their fingerprint."""
+        cache.put(pdf_file, "v1", make_assessment())
+
+        with patch("src.processing.assessment_cache.hash_file") as mock_hash:
+            assert cache.get(pdf_file, "v1") is not None
+
+        mock_hash.assert_not_called()
+
+    def test_touched_file_is_rehashed(self, cache, pdf_file):
+        """A new mtime with the same content still hits after hashing."""
+        cache.put(pdf_file, "v1", make_assessment())
+        stats = pdf_file.stat()
+        os.utime(pdf_file, ns=(stats.st_atime_ns, stats.st_mtime_ns + 1_000_000_000))
+
+        assert cache.get(pdf_file, "v1") is not None
+
+    def test_clear(self, cache, pdf_file):
+        """Clearing drops all stored assessments."""
+        cache.put(pdf_file, "v1", make_assessment())
+
+        cache.clear()
+
+        assert cache.get(pdf_file, "v1") is None
+
+    def test_persists_across_instances(self, tmp_path, pdf_file):
+        """A new cache on the same database sees earlier assessments."""
+        AssessmentCache(db_path=tmp_path / "quality.db").put(pdf_file, "v1", make_assessment())
+
+        assert AssessmentCache(db_path=tmp_path / "quality.db").get(pdf_file, "v1") is not None
+
+
+class TestQualityAssessorPersistence:
+    """Tests for QualityAssessor with a persistent cache."""
+
+    def test_new_assessor_skips_assessment(self, cache, pdf_file):
+        """A fresh assessor reuses the persisted assessment."""
+        first = QualityAssessor(persistent_cache=cache)
+        with patch.object(first, "_assess_pdf", return_value=make_assessment()):
+            first.assess(pdf_file)
+
+        second = QualityAssessor(persistent_cache=cache)
+        with patch.object(second, "_assess_pdf") as mock_assess:
+            assessment = second.assess(pdf_file)
+
+        mock_assess.assert_not_called()
+        assert assessment.overall_score == 0.9
+
+    def test_settings_change_reassesses(self, cache, pdf_file):
+        """Assessors with different page selection do not share results."""
+        with patch.object(QualityAssessor, "_assess_pdf", return_value=make_assessment()):
+            QualityAssessor(fast_mode=True, persistent_cache=cache).assess(pdf_file)
+
+        full = QualityAssessor(fast_mode=False, persistent_cache=cache)
+        with patch.object(full, "_assess_pdf", return_value=make_assessment(0.5)) as mock_assess:
+            assessment = full.assess(pdf_file)
+
+        mock_assess.assert_called_once()
+        assert assessment.overall_score == 0.5
+
+    def test_fallback_is_not_persisted(self, cache, pdf_file):
+        """Failed assessments are retried by later processes."""
+        first = QualityAssessor(persistent_cache=cache)
+        with patch.object(first, "_assess_pdf", side_effect=RuntimeError("no PyMuPDF")):
+            assert first.assess(pdf_file).metadata["fallback"] is True
+
+        assert cache.get(pdf_file, first.cache_version) is None
+
+    def test_deadline_truncated_is_not_persisted(self, cache, pdf_file):
+        """Assessments cut short by the deadline are redone by later processes."""
+        truncated = make_assessment()
+        truncated.metadata["early_exit"] = "deadline"
+        first = QualityAssessor(persistent_cache=cache, deadline=1.0)
+        with patch.object(first, "_assess_pdf", return_value=truncated):
+            first.assess(pdf_file)
+
+        assert cache.get(pdf_file, first.cache_version) is None
+
+    def test_agreement_exit_is_persisted(self, cache, pdf_file):
+        """Assessments stopped by page agreement are complete enough to reuse."""
+        agreed = make_assessment()
+        agreed.metadata["early_exit"] = "agreement"
+        first = QualityAssessor(persistent_cache=cache, agreement_pages=1)
+        with patch.object(first, "_assess_pdf", return_value=agreed):
+            first.assess(pdf_file)
+
+        assert cache.get(pdf_file, first.cache_version) is not None
+
+    def test_disabled_cache_ignores_persistent_cache(self, cache, pdf_file):
+        """cache_enabled=False turns off the persistent cache too."""
+        assessor = QualityAssessor(cache_enabled=False, persistent_cache=cache)
+
+        assert assessor.persistent_cache is None
+
+    def test_clear_cache_clears_persisted(self, cache, pdf_file):
+        """clear_cache also drops persisted assessments."""
+        assessor = QualityAssessor(persistent_cache=cache)
+        with patch.object(assessor, "_assess_pdf", return_value=make_assessment()):
+            assessor.assess(pdf_file)
+
+        assessor.clear_cache()
+
+        assert cache.get(pdf_file, assessor.cache_version) is None
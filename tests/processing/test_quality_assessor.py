@@ -11,6 +11,10 @@ Tests cover:
 
 from __future__ import annotations
 
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -333,6 +337,173 @@ class TestQualityAssessor:
         assert len(assessor._cache) == 0
 
 
+class TestPageSharding:
+    """Tests for parallel and early-exit page assessment."""
+
+    @staticmethod
+    def make_assessor(tmp_path, page_count: int, **kwargs) -> tuple[QualityAssessor, Path]:
+        """Create a full-mode assessor over a mocked PDF of page_count pages."""
+        test_file = tmp_path / "test.pdf"
+        test_file.write_text("test")
+
+        assessor = QualityAssessor(fast_mode=False, cache_enabled=False, **kwargs)
+        doc = MagicMock()
+        doc.__len__.return_value = page_count
+        assessor._pymupdf = Mock()
+        assessor._pymupdf.open.return_value = doc
+        return assessor, test_file
+
+    @staticmethod
+    def page(page_number: int, born_digital: bool = True) -> PageQuality:
+        return PageQuality(
+            page_number=page_number,
+            is_born_digital=born_digital,
+            is_scanned=not born_digital,
+            text_quality=0.9,
+        )
+
+    def test_serial_stops_on_agreement(self, tmp_path):
+        """Serial assessment stops once enough pages agree."""
+        assessor, test_file = self.make_assessor(tmp_path, 100, agreement_pages=5)
+
+        with patch.object(assessor, "_assess_page", side_effect=lambda page, n: self.page(n)) as mock_page:
+            assessment = assessor.assess(test_file)
+
+        assert mock_page.call_count == 5
+        assert assessment.is_born_digital is True
+        assert assessment.metadata["early_exit"] == "agreement"
+        assert assessment.metadata["total_pages"] == 100
+
+    def test_serial_continues_on_disagreement(self, tmp_path):
+        """Mixed pages never count as agreement."""
+        assessor, test_file = self.make_assessor(tmp_path, 10, agreement_pages=3)
+
+        def assess_page(page, n):
+            return self.page(n, born_digital=n % 2 == 0)
+
+        with patch.object(assessor, "_assess_page", side_effect=assess_page) as mock_page:
+            assessment = assessor.assess(test_file)
+
+        assert mock_page.call_count == 10
+        assert assessment.is_scanned is True
+        assert "early_exit" not in assessment.metadata
+
+    def test_serial_stops_at_deadline(self, tmp_path):
+        """Pages assessed before the deadline are aggregated."""
+        assessor, test_file = self.make_assessor(tmp_path, 100, deadline=10.0)
+        clock = iter(range(0, 1000, 4))
+
+        with patch("src.processing.quality_assessor.time.monotonic", side_effect=lambda: next(clock)), \
+             patch.object(assessor, "_assess_page", side_effect=lambda page, n: self.page(n)):
+            assessment = assessor.assess(test_file)
+
+        assert assessment.metadata["early_exit"] == "deadline"
+        assert 0 < assessment.metadata["pages_analyzed"] < 100
+
+    def test_parallel_assesses_all_shards_in_order(self, tmp_path):
+        """Shards assessed by workers are aggregated in page order."""
+        assessor, test_file = self.make_assessor(tmp_path, 40, workers=2)
+        ranges = []
+
+        def assess_range(file_path, start, stop):
+            ranges.append((start, stop))
+            return [self.page(n + 1) for n in range(start, stop)]
+
+        with patch.object(assessor, "_create_executor", return_value=ThreadPoolExecutor(max_workers=2)), \
+             patch("src.processing.quality_assessor._assess_page_range", side_effect=assess_range), \
+             patch.object(assessor, "_assess_page") as mock_page:
+            assessment = assessor.assess(test_file)
+
+        mock_page.assert_not_called()
+        assert sorted(ranges) == [(0, 16), (16, 32), (32, 40)]
+        assert [p.page_number for p in assessment.page_scores] == list(range(1, 41))
+        assert assessment.metadata["workers"] == 2
+        assert "early_exit" not in assessment.metadata
+
+    def test_parallel_stops_on_agreement(self, tmp_path):
+        """Remaining shards are cancelled once enough pages agree."""
+        assessor, test_file = self.make_assessor(tmp_path, 1000, workers=2, agreement_pages=16)
+
+        def assess_range(file_path, start, stop):
+            return [self.page(n + 1, born_digital=False) for n in range(start, stop)]
+
+        with patch.object(assessor, "_create_executor", return_value=ThreadPoolExecutor(max_workers=1)), \
+             patch("src.processing.quality_assessor._assess_page_range", side_effect=assess_range):
+            assessment = assessor.assess(test_file)
+
+        assert assessment.metadata["early_exit"] == "agreement"
+        assert assessment.metadata["pages_analyzed"] < 1000
+        assert assessment.is_scanned is True
+
+    def test_parallel_reuses_pool_across_documents(self, tmp_path):
+        """One worker pool serves every document until shutdown."""
+        assessor, test_file = self.make_assessor(tmp_path, 40, workers=2)
+        executor = ThreadPoolExecutor(max_workers=2)
+
+        def assess_range(file_path, start, stop):
+            return [self.page(n + 1) for n in range(start, stop)]
+
+        with patch.object(assessor, "_create_executor", return_value=executor) as mock_executor, \
+             patch("src.processing.quality_assessor._assess_page_range", side_effect=assess_range):
+            assessor.assess(test_file)
+            assessor.assess(test_file)
+            assessor.shutdown()
+
+        mock_executor.assert_called_once()
+        assert assessor._executor is None
+
+    def test_parallel_deadline_before_any_shard(self, tmp_path):
+        """Shards still running at the deadline are abandoned and the result says so."""
+        assessor, test_file = self.make_assessor(tmp_path, 40, workers=2, deadline=0.05)
+        release = threading.Event()
+
+        def assess_range(file_path, start, stop):
+            release.wait(5)
+            return [self.page(n + 1) for n in range(start, stop)]
+
+        with patch.object(assessor, "_create_executor", return_value=ThreadPoolExecutor(max_workers=2)), \
+             patch("src.processing.quality_assessor._assess_page_range", side_effect=assess_range), \
+             patch.object(assessor, "_terminate_executor", wraps=assessor._terminate_executor) as terminate:
+            assessment = assessor.assess(test_file)
+            release.set()
+
+        terminate.assert_called_once()
+        assert assessor._executor is None
+        assert assessment.metadata["early_exit"] == "deadline"
+        assert assessment.metadata["fallback"] is True
+        assert assessment.metadata["pages_analyzed"] == 0
+        assert assessment.metadata["total_pages"] == 40
+
+    def test_terminate_kills_running_workers(self):
+        """Worker processes stuck in a shard are killed."""
+        assessor = QualityAssessor(workers=1)
+        assessor._executor = ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        )
+        future = assessor._executor.submit(time.sleep, 60)
+        while not future.running():
+            time.sleep(0.01)
+        processes = list(assessor._executor._processes.values())
+
+        assessor._terminate_executor()
+
+        for process in processes:
+            process.join(10)
+            assert not process.is_alive()
+        assert assessor._executor is None
+
+    def test_small_documents_are_assessed_serially(self, tmp_path):
+        """Documents within one shard do not start a worker pool."""
+        assessor, test_file = self.make_assessor(tmp_path, 3, workers=4)
+
+        with patch.object(assessor, "_create_executor") as mock_executor, \
+             patch.object(assessor, "_assess_page", side_effect=lambda page, n: self.page(n)):
+            assessment = assessor.assess(test_file)
+
+        mock_executor.assert_not_called()
+        assert assessment.metadata["pages_analyzed"] == 3
+
+
 class TestIntegration:
     """Integration tests for quality assessment."""
 
@@ -342,7 +513,6 @@ class TestIntegration:
         test_file.write_text("test")
 
         # Mock PyMuPDF
-        import fitz
         with patch("fitz.open") as mock_open:
             # Mock PDF document
             mock_doc = Mock()
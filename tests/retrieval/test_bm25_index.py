@@ -0,0 +1,520 @@
+"""Tests for the native inverted-index BM25 engine."""
+
+import math
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.retrieval.bm25 import COMPACT_DELETED_FRACTION, COMPACT_MIN_DELETED, BM25Retriever
+from src.retrieval.bm25_index import BM25Index, tokenize
+
+
+@pytest.fixture
+def corpus():
+    """Small tokenized corpus."""
+    return [
+        tokenize("the quick brown fox"),
+        tokenize("machine learning and deep learning"),
+        tokenize("python for machine learning"),
+        tokenize("the lazy dog sleeps"),
+    ]
+
+
+@pytest.fixture
+def index(corpus):
+    """Index populated with the corpus."""
+    index = BM25Index()
+    for tokens in corpus:
+        index.add(tokens)
+    return index
+
+
+def reference_scores(corpus, query, k1=1.5, b=0.75):
+    """Brute-force BM25 over a list of token lists."""
+    n = len(corpus)
+    avgdl = sum(len(doc) for doc in corpus) / n
+    scores = []
+    for doc in corpus:
+        score = 0.0
+        for term in query:
+            df = sum(1 for d in corpus if term in d)
+            if df == 0:
+                continue
+            idf = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+            tf = doc.count(term)
+            score += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(doc) / avgdl))
+        scores.append(score)
+    return np.array(scores)
+
+
+class TestBM25Index:
+    """Tests for BM25Index."""
+
+    def test_add_updates_statistics(self, index, corpus):
+        """Test adds update counts and average length."""
+        assert index.num_slots == 4
+        assert index.num_live == 4
+        assert index.avgdl == pytest.approx(sum(len(d) for d in corpus) / 4)
+
+    def test_scores_match_reference(self, index, corpus):
+        """Test scores match a brute-force BM25 computation."""
+        query = tokenize("machine learning dog")
+        np.testing.assert_allclose(index.get_scores(query), reference_scores(corpus, query))
+
+    def test_unknown_terms_score_zero(self, index):
+        """Test query terms outside the vocabulary contribute nothing."""
+        assert not index.get_scores(["xyzzy"]).any()
+
+    def test_delete_tombstones_slot(self, index, corpus):
+        """Test deleted documents score zero and leave the statistics."""
+        assert index.delete(1) is True
+        assert index.delete(1) is False
+        assert index.is_deleted(1)
+        assert index.num_live == 3
+        assert index.num_deleted == 1
+
+        live = [corpus[0], corpus[2], corpus[3]]
+        query = tokenize("machine learning")
+        scores = index.get_scores(query)
+
+        assert scores[1] == 0.0
+        np.testing.assert_allclose(scores[[0, 2, 3]], reference_scores(live, query))
+
+    def test_delete_out_of_range(self, index):
+        """Test deleting an unknown slot is a no-op."""
+        assert index.delete(99) is False
+        assert index.num_live == 4
+
+    def test_compact_renumbers_slots(self, index, corpus):
+        """Test compaction drops tombstones and preserves scores."""
+        index.delete(0)
+        index.delete(2)
+
+        keep = index.compact()
+
+        assert keep == [1, 3]
+        assert index.num_slots == 2
+        assert index.num_deleted == 0
+        assert "quick" not in index.vocab
+
+        query = tokenize("learning dog")
+        np.testing.assert_allclose(
+            index.get_scores(query), reference_scores([corpus[1], corpus[3]], query)
+        )
+
+    def test_add_after_compact(self, index):
+        """Test the index keeps accepting documents after compaction."""
+        index.delete(0)
+        index.compact()
+
+        slot = index.add(tokenize("quick thinking"))
+
+        assert slot == 3
+        assert index.get_scores(["quick"])[slot] > 0
+
+    def test_top_k_matches_full_ranking(self):
+        """Test top_k agrees with sorting the full score vector."""
+        rng = np.random.default_rng(0)
+        words = [f"w{i}" for i in range(50)]
+        index = BM25Index()
+        for _ in range(300):
+            index.add(list(rng.choice(words, size=int(rng.integers(3, 30)))))
+        query = ["w1", "w7", "w42"]
+
+        slots, scores = index.top_k(query, 10)
+
+        full = index.get_scores(query)
+        expected = np.lexsort((np.arange(len(full)), -full))[:10]
+        np.testing.assert_array_equal(slots, expected)
+        np.testing.assert_allclose(scores, full[expected])
+
+    def test_top_k_only_positive_scores(self, index):
+        """Test top_k never pads results with non-matching documents."""
+        slots, scores = index.top_k(tokenize("python"), 10)
+
+        assert slots.tolist() == [2]
+        assert (scores > 0).all()
+
+    def test_top_k_skips_tombstones(self, index):
+        """Test deleted documents are not returned."""
+        index.delete(1)
+
+        slots, _ = index.top_k(tokenize("learning"), 10)
+
+        assert slots.tolist() == [2]
+
+    def test_top_k_no_matches(self, index):
+        """Test top_k with no matching terms or k=0."""
+        assert len(index.top_k(["xyzzy"], 5)[0]) == 0
+        assert len(index.top_k(tokenize("learning"), 0)[0]) == 0
+
+    def test_empty_index(self):
+        """Test scoring an empty index."""
+        index = BM25Index()
+        assert index.get_scores(["anything"]).shape == (0,)
+        assert index.avgdl == 0.0
+
+
+class TestBM25RetrieverIncremental:
+    """Tests for incremental updates through BM25Retriever."""
+
+    def test_add_documents_only_tokenizes_new(self):
+        """Test adding documents does not re-tokenize the existing corpus."""
+        retriever = BM25Retriever()
+        retriever.index_documents(["alpha beta", "beta gamma"], ["a", "b"])
+
+        with patch("src.retrieval.bm25.tokenize", wraps=tokenize) as spy:
+            retriever.add_documents(["gamma delta"], ["c"])
+
+        assert spy.call_count == 1
+        assert retriever.count() == 3
+        assert retriever.search("delta", top_k=1)[0][0] == "c"
+
+    def test_add_documents_without_index(self):
+        """Test add_documents creates the index on first use."""
+        retriever = BM25Retriever()
+        retriever.add_documents(["alpha"], ["a"])
+
+        assert retriever.index is not None
+        assert retriever.search("alpha")[0][0] == "a"
+
+    def test_readding_id_replaces_document(self):
+        """Test re-adding an ID supersedes the previous version."""
+        retriever = BM25Retriever()
+        retriever.index_documents(["old text"], ["a"])
+        retriever.add_documents(["new text"], ["a"])
+
+        assert retriever.search("old") == []
+        assert retriever.search("new")[0][0] == "a"
+        assert retriever.index.num_live == 1
+        assert retriever.live_count() == 1
+
+    def test_compact_drops_superseded_documents(self):
+        """Test compaction reclaims superseded slots and keeps results."""
+        retriever = BM25Retriever()
+        retriever.index_documents(["alpha beta", "beta gamma"], ["a", "b"], [{"v": 1}, {"v": 1}])
+        retriever.add_documents(["alpha delta"], ["a"], [{"v": 2}])
+        retriever.remove_documents(["b"])
+
+        assert retriever.compact() == 2
+        assert list(retriever.doc_ids) == ["a"]
+        doc_id, text, _, metadata = retriever.search("delta")[0]
+        assert (doc_id, text, metadata) == ("a", "alpha delta", {"v": 2})
+
+        retriever.add_documents(["beta gamma"], ["b"])
+        retriever.remove_documents(["a"])
+        assert [r[0] for r in retriever.search("gamma")] == ["b"]
+
+    def test_repeated_readds_stay_bounded(self):
+        """Test re-adding the same IDs does not grow the corpus without bound."""
+        retriever = BM25Retriever()
+        for version in range(50):
+            retriever.add_documents(
+                [f"document {i} version {version}" for i in range(100)],
+                [f"doc-{i}" for i in range(100)],
+            )
+
+        assert retriever.live_count() == 100
+        assert len(retriever.documents) <= 100 + max(COMPACT_MIN_DELETED, 100 / (1 - COMPACT_DELETED_FRACTION))
+        assert retriever.search("version 49", top_k=1)[0][1].endswith("version 49")
+
+    def test_compaction_survives_reopen(self, tmp_path):
+        """Test a compacted retriever still journals and reloads correctly."""
+        index_dir = tmp_path / "bm25"
+        retriever = BM25Retriever(index_dir=index_dir)
+        retriever.index_documents(["alpha beta", "beta gamma"], ["a", "b"])
+        retriever.save()
+
+        retriever.add_documents(["alpha delta"], ["a"])
+        retriever.compact()
+        retriever.save()
+
+        reopened = BM25Retriever(index_dir=index_dir)
+        assert reopened.live_count() == 2
+        assert reopened.search("delta")[0][0] == "a"
+        assert reopened.search("alpha")[0][1] == "alpha delta"
+
+
+    def test_search_during_compaction(self):
+        """Test searches on another thread never see a half-compacted corpus."""
+        retriever = BM25Retriever()
+        retriever.add_documents([f"common word{i}" for i in range(200)], [f"id{i}" for i in range(200)])
+        errors = []
+        stop = threading.Event()
+
+        def search():
+            while not stop.is_set():
+                try:
+                    for doc_id, text, _, _ in retriever.search("common", top_k=50):
+                        if text != f"common word{doc_id[2:]}":
+                            errors.append((doc_id, text))
+                except Exception as e:
+                    errors.append(e)
+
+        searcher = threading.Thread(target=search)
+        searcher.start()
+        try:
+            for round_ in range(50):
+                removed = [f"id{i}" for i in range(round_ % 4, 200, 4)]
+                retriever.remove_documents(removed)
+                retriever.compact()
+                retriever.add_documents([f"common word{doc_id[2:]}" for doc_id in removed], removed)
+        finally:
+            stop.set()
+            searcher.join()
+
+        assert errors == []
+
+
+class TestBM25Persistence:
+    """Tests for binary BM25 segments."""
+
+    def test_index_round_trip(self, index, corpus, tmp_path):
+        """Test a saved segment scores identically after loading."""
+        index.delete(3)
+        index.save(tmp_path / "segment")
+
+        loaded = BM25Index.load(tmp_path / "segment")
+
+        assert loaded.num_slots == 4
+        assert loaded.num_live == 3
+        assert loaded.is_deleted(3)
+        query = tokenize("machine learning dog")
+        np.testing.assert_allclose(loaded.get_scores(query), index.get_scores(query))
+
+    def test_loaded_vocab_lookup(self, index, tmp_path):
+        """Test the memory-mapped vocabulary resolves terms by binary search."""
+        index.save(tmp_path / "segment")
+        loaded = BM25Index.load(tmp_path / "segment")
+
+        assert "learning" in loaded.vocab
+        assert "missing" not in loaded.vocab
+        assert len(loaded.vocab) == len(index.vocab)
+
+    def test_add_and_delete_after_load(self, index, corpus, tmp_path):
+        """Test a loaded segment accepts adds, deletes and compaction."""
+        index.save(tmp_path / "segment")
+        loaded = BM25Index.load(tmp_path / "segment")
+
+        extra = tokenize("deep learning for dogs")
+        loaded.add(extra)
+        loaded.delete(0)
+
+        expected = reference_scores(corpus[1:] + [extra], tokenize("learning dogs"))
+        np.testing.assert_allclose(loaded.get_scores(tokenize("learning dogs"))[1:], expected)
+
+        loaded.compact()
+        np.testing.assert_allclose(loaded.get_scores(tokenize("learning dogs")), expected)
+
+    def test_resave_loaded_segment(self, index, tmp_path):
+        """Test saving a loaded segment with new documents merges base and tail."""
+        index.save(tmp_path / "first")
+        loaded = BM25Index.load(tmp_path / "first")
+        loaded.add(tokenize("brand new words"))
+        loaded.save(tmp_path / "second")
+
+        reloaded = BM25Index.load(tmp_path / "second")
+        assert reloaded.num_slots == 5
+        assert reloaded.top_k(tokenize("brand"), 1)[0].tolist() == [4]
+        assert reloaded.top_k(tokenize("learning"), 1)[0].tolist() == [1]
+
+    def test_unsupported_version(self, index, tmp_path):
+        """Test segments from a different format version are rejected."""
+        index.save(tmp_path / "segment")
+        meta = tmp_path / "segment" / "meta.json"
+        meta.write_text(meta.read_text().replace('"version": 1', '"version": 99'))
+
+        with pytest.raises(ValueError, match="Unsupported"):
+            BM25Index.load(tmp_path / "segment")
+
+    def test_retriever_reopens_without_tokenizing(self, tmp_path):
+        """Test a retriever opens a persisted index without re-tokenizing."""
+        index_dir = tmp_path / "bm25"
+        retriever = BM25Retriever(index_dir=index_dir)
+        retriever.index_documents(
+            ["alpha beta", "beta gamma"], ["a", "b"], [{"page": 1}, {"page": 2}]
+        )
+        retriever.save()
+
+        with patch("src.retrieval.bm25.tokenize", wraps=tokenize) as spy:
+            reopened = BM25Retriever(index_dir=index_dir)
+            results = reopened.search("gamma", top_k=1)
+
+        assert spy.call_count == 1  # the query only
+        assert results[0][0] == "b"
+        assert results[0][1] == "beta gamma"
+        assert results[0][3] == {"page": 2}
+        assert reopened.count() == 2
+
+    def test_retriever_updates_after_reopen(self, tmp_path):
+        """Test adds and removals on a reopened retriever persist."""
+        index_dir = tmp_path / "bm25"
+        retriever = BM25Retriever(index_dir=index_dir)
+        retriever.index_documents(["alpha beta", "beta gamma"], ["a", "b"])
+        retriever.save()
+
+        reopened = BM25Retriever(index_dir=index_dir)
+        reopened.add_documents(["gamma delta"], ["c"])
+        reopened.remove_documents(["b"])
+        reopened.save()
+
+        final = BM25Retriever(index_dir=index_dir)
+        assert [r[0] for r in final.search("gamma")] == ["c"]
+        assert final.index.num_live == 2
+        assert not (tmp_path / "bm25.tmp").exists()
+        assert not (tmp_path / "bm25.old").exists()
+
+    def test_retriever_without_segment(self, tmp_path):
+        """Test a missing segment leaves the retriever empty."""
+        retriever = BM25Retriever(index_dir=tmp_path / "missing")
+
+        assert retriever.index is None
+        assert retriever.count() == 0
+
+    def test_retriever_journals_updates(self, tmp_path):
+        """Test saving after small updates appends to the journal only."""
+        index_dir = tmp_path / "bm25"
+        retriever = BM25Retriever(index_dir=index_dir)
+        retriever.index_documents(["alpha beta", "beta gamma"], ["a", "b"])
+        retriever.save()
+        segment = {path.name: path.stat().st_mtime_ns for path in index_dir.iterdir()}
+
+        reopened = BM25Retriever(index_dir=index_dir)
+        reopened.add_documents(["gamma delta"], ["c"], [{"page": 3}])
+        reopened.remove_documents(["b"])
+        reopened.save()
+
+        assert {p.name: p.stat().st_mtime_ns for p in index_dir.iterdir() if p.name in segment} == segment
+        assert len((index_dir / "journal.jsonl").read_text().splitlines()) == 2
+
+        with patch("src.retrieval.bm25.tokenize", wraps=tokenize) as spy:
+            final = BM25Retriever(index_dir=index_dir)
+        assert spy.call_count == 1  # the journaled document only
+        assert [r[0] for r in final.search("gamma")] == ["c"]
+        assert final.search("gamma")[0][3] == {"page": 3}
+        assert final.live_count() == 2
+
+    def test_retriever_folds_large_journal(self, tmp_path):
+        """Test a journal larger than the limit is folded into a new segment."""
+        index_dir = tmp_path / "bm25"
+        retriever = BM25Retriever(index_dir=index_dir)
+        retriever.index_documents(["alpha beta"], ["a"])
+        retriever.save()
+
+        with patch("src.retrieval.bm25.JOURNAL_MIN_DOCUMENTS", 1):
+            retriever.add_documents(["beta gamma"], ["b"])
+            retriever.save()
+            assert (index_dir / "journal.jsonl").exists()
+
+            retriever.add_documents(["gamma delta"], ["c"])
+            retriever.save()
+            assert not (index_dir / "journal.jsonl").exists()
+
+        final = BM25Retriever(index_dir=index_dir)
+        assert final.live_count() == 3
+        assert [r[0] for r in final.search("delta")] == ["c"]
+
+    def test_retriever_ignores_torn_journal_entry(self, tmp_path):
+        """Test a partially written last journal line is skipped on load."""
+        index_dir = tmp_path / "bm25"
+        retriever = BM25Retriever(index_dir=index_dir)
+        retriever.index_documents(["alpha beta"], ["a"])
+        retriever.save()
+        retriever.add_documents(["beta gamma"], ["b"])
+        retriever.save()
+        with open(index_dir / "journal.jsonl", "a") as f:
+            f.write('{"op": "add", "documents": ["gam')
+
+        final = BM25Retriever(index_dir=index_dir)
+
+        assert final.live_count() == 2
+
+    def test_retriever_appends_after_torn_journal_entry(self, tmp_path):
+        """Test a later save replaces a torn last entry instead of appending after it."""
+        index_dir = tmp_path / "bm25"
+        retriever = BM25Retriever(index_dir=index_dir)
+        retriever.index_documents(["alpha beta"], ["a"])
+        retriever.save()
+        with open(index_dir / "journal.jsonl", "a") as f:
+            f.write('{"op": "add", "documents": ["gam')
+
+        reopened = BM25Retriever(index_dir=index_dir)
+        reopened.add_documents(["gamma delta"], ["c"])
+        reopened.save()
+
+        final = BM25Retriever(index_dir=index_dir)
+        assert final.live_count() == 2
+        assert [r[0] for r in final.search("delta")] == ["c"]
+
+    def test_retrievers_sharing_directory_keep_each_others_changes(self, tmp_path):
+        """Test a save first applies what another retriever journaled."""
+        index_dir = tmp_path / "bm25"
+        first = BM25Retriever(index_dir=index_dir)
+        first.index_documents(["alpha beta"], ["a"])
+        first.save()
+        second = BM25Retriever(index_dir=index_dir)
+
+        first.add_documents(["beta gamma"], ["b"])
+        first.save()
+        second.add_documents(["gamma delta"], ["c"])
+        second.remove_documents(["a"])
+        second.save()
+
+        assert second.live_ids() == {"b", "c"}
+        assert BM25Retriever(index_dir=index_dir).live_ids() == {"b", "c"}
+
+    def test_retrievers_sharing_directory_survive_folding(self, tmp_path):
+        """Test neither a folded segment nor a stale writer loses changes."""
+        index_dir = tmp_path / "bm25"
+        first = BM25Retriever(index_dir=index_dir)
+        first.index_documents(["alpha beta"], ["a"])
+        first.save()
+        second = BM25Retriever(index_dir=index_dir)
+
+        first.add_documents(["beta gamma"], ["b"])
+        first.save()
+        with patch("src.retrieval.bm25.JOURNAL_MIN_DOCUMENTS", 0), \
+                patch("src.retrieval.bm25.JOURNAL_MAX_FRACTION", 0):
+            second.add_documents(["gamma delta"], ["c"])
+            second.save()
+        assert not (index_dir / "journal.jsonl").exists()
+
+        # The first retriever still has the replaced segment open
+        first.add_documents(["delta epsilon"], ["d"])
+        first.save()
+
+        assert BM25Retriever(index_dir=index_dir).live_ids() == {"a", "b", "c", "d"}
+
+    def test_retriever_refresh_picks_up_other_writers(self, tmp_path):
+        """Test refresh applies changes saved by another retriever."""
+        index_dir = tmp_path / "bm25"
+        reader = BM25Retriever(index_dir=index_dir)
+        writer = BM25Retriever(index_dir=index_dir)
+        writer.index_documents(["alpha beta"], ["a"])
+        writer.save()
+
+        assert reader.refresh()
+        assert [r[0] for r in reader.search("alpha")] == ["a"]
+        assert not reader.refresh()
+
+        writer.remove_documents(["a"])
+        writer.add_documents(["gamma delta"], ["c"])
+        writer.save()
+
+        assert reader.refresh()
+        assert reader.search("alpha") == []
+        assert reader.live_ids() == {"c"}
+
+    def test_retriever_clear_rewrites_segment(self, tmp_path):
+        """Test clearing a persisted index writes an empty segment."""
+        index_dir = tmp_path / "bm25"
+        retriever = BM25Retriever(index_dir=index_dir)
+        retriever.index_documents(["alpha beta"], ["a"])
+        retriever.save()
+
+        retriever.clear()
+        retriever.save()
+
+        assert BM25Retriever(index_dir=index_dir).live_count() == 0
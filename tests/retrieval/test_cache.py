@@ -321,3 +321,27 @@ class TestQueryCache:
         assert stats["hits"] == 3
         assert stats["misses"] == 2
         assert stats["hit_rate"] == 0.6  # 3/5
+
+    def test_get_results_batch(self):
+        """Test batched lookup returns a hit mask and the hit values."""
+        cache = QueryCache()
+        cache.set_results(["q1", "q2"], ["r1", "r2"], top_k=10)
+
+        hits, results = cache.get_results(["q2", "q3", "q1"], top_k=10)
+
+        assert hits.tolist() == [True, False, True]
+        assert results == ["r2", "r1"]
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 1
+
+    def test_get_many_respects_ttl(self):
+        """Test expired entries are misses in batched lookups."""
+        cache = LRUCache(ttl_seconds=1)
+        cache.set_many(["q1"], ["r1"])
+        time.sleep(1.1)
+
+        hits, values = cache.get_many(["q1"])
+
+        assert hits.tolist() == [False]
+        assert values == []
+        assert len(cache) == 0
@@ -1,10 +1,13 @@
 """Tests for hybrid retrieval combining vector and BM25 search."""
 
+import asyncio
+import time
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import AsyncMock, Mock, MagicMock
 from src.retrieval.hybrid import HybridRetriever, HybridConfig
 from src.retrieval.retriever import RetrievedChunk
 from src.retrieval.bm25 import BM25Retriever
+from src.exceptions import SearchError
 
 
 @pytest.fixture
@@ -140,6 +143,7 @@ class TestBM25OnlyRetrieval:
 
         # Should call only BM25 retriever
         mock_bm25_retriever.search.assert_called_once_with("test query", top_k=5)
+        mock_bm25_retriever.refresh.assert_called_once()
         assert len(results) == 3  # From mock
 
     def test_bm25_only_converts_to_chunks(self, hybrid_retriever):
@@ -198,6 +202,72 @@ class TestHybridRetrieval:
         assert len(results) > 0
 
 
+class TestParallelLegs:
+    """Test concurrent vector/BM25 legs with per-leg timeouts."""
+
+    @staticmethod
+    def _slow(mock, delay):
+        results = mock.return_value
+        mock.side_effect = lambda *args, **kwargs: time.sleep(delay) or results
+
+    def test_legs_run_concurrently(self, mock_vector_retriever, mock_bm25_retriever):
+        """Test latency is close to the slower leg, not the sum."""
+        self._slow(mock_vector_retriever.retrieve, 0.3)
+        self._slow(mock_bm25_retriever.search, 0.3)
+        retriever = HybridRetriever(mock_vector_retriever, mock_bm25_retriever)
+
+        start = time.perf_counter()
+        results = retriever.retrieve("test query", top_k=5)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+        assert {c.chunk_id for c in results} >= {"vec1", "bm25_1"}
+
+    def test_late_vector_leg_degrades_to_bm25(self, mock_vector_retriever, mock_bm25_retriever):
+        """Test a vector leg past its deadline is dropped from fusion."""
+        self._slow(mock_vector_retriever.retrieve, 0.5)
+        config = HybridConfig(vector_timeout=0.05)
+        retriever = HybridRetriever(mock_vector_retriever, mock_bm25_retriever, config)
+
+        start = time.perf_counter()
+        results = retriever.retrieve("test query", top_k=5)
+
+        assert time.perf_counter() - start < 0.4
+        assert [c.chunk_id for c in results] == ["bm25_1", "bm25_2", "vec2"]
+
+    def test_failed_bm25_leg_degrades_to_vector(self, mock_vector_retriever, mock_bm25_retriever):
+        """Test a failing BM25 leg falls back to vector results."""
+        mock_bm25_retriever.search.side_effect = RuntimeError("index unavailable")
+        retriever = HybridRetriever(mock_vector_retriever, mock_bm25_retriever)
+
+        results = retriever.retrieve("test query", top_k=5)
+
+        assert [c.chunk_id for c in results] == ["vec1", "vec2", "vec3"]
+
+    def test_both_legs_failing_raises(self, mock_vector_retriever, mock_bm25_retriever):
+        """Test a search error is raised when neither leg returns."""
+        mock_vector_retriever.retrieve.side_effect = RuntimeError("store down")
+        mock_bm25_retriever.search.side_effect = RuntimeError("index unavailable")
+        retriever = HybridRetriever(mock_vector_retriever, mock_bm25_retriever)
+
+        with pytest.raises(SearchError):
+            retriever.retrieve("test query", top_k=5)
+
+    def test_async_late_leg_degrades(self, mock_vector_retriever, mock_bm25_retriever):
+        """Test retrieve_async drops a leg that misses its deadline."""
+        async def slow_retrieve(query, k):
+            await asyncio.sleep(0.5)
+            return mock_vector_retriever.retrieve(query, k=k)
+
+        mock_vector_retriever.retrieve_async = slow_retrieve
+        config = HybridConfig(vector_timeout=0.05)
+        retriever = HybridRetriever(mock_vector_retriever, mock_bm25_retriever, config)
+
+        results = asyncio.run(retriever.retrieve_async("test query", top_k=5))
+
+        assert [c.chunk_id for c in results] == ["bm25_1", "bm25_2", "vec2"]
+
+
 class TestRetrieveMethodSelection:
     """Test retrieval method selection logic."""
 
@@ -228,29 +298,134 @@ class TestUpdateBM25Index:
     """Test BM25 index update functionality."""
 
     def test_update_bm25_index(self, hybrid_retriever, mock_bm25_retriever):
-        """Test updating BM25 index."""
+        """Test updating BM25 index appends to the existing corpus."""
+        mock_bm25_retriever.index_dir = None
         documents = ["doc1", "doc2", "doc3"]
         doc_ids = ["id1", "id2", "id3"]
         metadatas = [{"a": 1}, {"b": 2}, {"c": 3}]
 
         hybrid_retriever.update_bm25_index(documents, doc_ids, metadatas)
 
-        # Should call BM25 index_documents
-        mock_bm25_retriever.index_documents.assert_called_once_with(
+        # Should add to, not replace, the indexed corpus
+        mock_bm25_retriever.add_documents.assert_called_once_with(
             documents, doc_ids, metadatas
         )
+        mock_bm25_retriever.index_documents.assert_not_called()
+        mock_bm25_retriever.save.assert_not_called()
 
     def test_update_bm25_index_without_metadata(self, hybrid_retriever, mock_bm25_retriever):
         """Test updating BM25 index without metadata."""
+        mock_bm25_retriever.index_dir = None
         documents = ["doc1", "doc2"]
         doc_ids = ["id1", "id2"]
 
         hybrid_retriever.update_bm25_index(documents, doc_ids)
 
-        mock_bm25_retriever.index_documents.assert_called_once_with(
+        mock_bm25_retriever.add_documents.assert_called_once_with(
             documents, doc_ids, None
         )
 
+    def test_update_persisted_index(self, mock_vector_retriever, tmp_path):
+        """Test updates keep earlier documents and survive a reopen."""
+        bm25 = BM25Retriever(index_dir=tmp_path / "bm25")
+        retriever = HybridRetriever(mock_vector_retriever, bm25)
+
+        retriever.update_bm25_index(["alpha beta"], ["a"])
+        retriever.update_bm25_index(["gamma delta"], ["b"])
+        retriever.remove_from_bm25_index(["a"])
+
+        reopened = BM25Retriever(index_dir=tmp_path / "bm25")
+        assert [r[0] for r in reopened.search("gamma")] == ["b"]
+        assert reopened.search("alpha") == []
+        assert reopened.live_count() == 1
+
+
+class TestSyncBM25Index:
+    """Test rebuilding the BM25 index from the vector store."""
+
+    def test_in_sync(self, mock_vector_retriever, tmp_path):
+        """Test nothing is rebuilt when the chunk IDs agree."""
+        bm25 = BM25Retriever(index_dir=tmp_path / "bm25")
+        bm25.add_documents(["alpha"], ["a"])
+        store = mock_vector_retriever.vector_store
+        store.list.return_value = {"ids": ["a"], "next_cursor": None}
+
+        assert not HybridRetriever(mock_vector_retriever, bm25).sync_bm25_index()
+        assert store.list.call_args.kwargs["include"] == []
+
+    def test_rebuild_when_ids_differ(self, mock_vector_retriever, tmp_path):
+        """Test a swapped chunk is caught even though the counts agree."""
+        bm25 = BM25Retriever(index_dir=tmp_path / "bm25")
+        bm25.add_documents(["alpha", "stale"], ["a", "old"])
+        store = mock_vector_retriever.vector_store
+        store.list.side_effect = [
+            {"ids": ["a", "b"], "next_cursor": None},
+            {"ids": ["a", "b"], "documents": ["alpha", "beta"], "metadatas": [{}, {}], "next_cursor": None},
+        ]
+
+        assert HybridRetriever(mock_vector_retriever, bm25).sync_bm25_index()
+        assert bm25.live_ids() == {"a", "b"}
+        assert bm25.search("stale") == []
+
+    def test_rebuild_from_vector_store(self, mock_vector_retriever, tmp_path):
+        """Test a stale index is rebuilt page by page from the vector store."""
+        bm25 = BM25Retriever(index_dir=tmp_path / "bm25")
+        bm25.add_documents(["stale"], ["old"])
+        store = mock_vector_retriever.vector_store
+        store.list.side_effect = [
+            {"ids": ["a", "b"], "next_cursor": "2"},
+            {"ids": ["c"], "next_cursor": None},
+            {"ids": ["a", "b"], "documents": ["alpha", "beta"], "metadatas": [{}, {}], "next_cursor": "2"},
+            {"ids": ["c"], "documents": ["gamma"], "metadatas": [{}], "next_cursor": None},
+        ]
+
+        assert HybridRetriever(mock_vector_retriever, bm25).sync_bm25_index(page_size=2)
+
+        assert store.list.call_args_list[1].kwargs["cursor"] == "2"
+        assert store.list.call_args_list[3].kwargs["cursor"] == "2"
+        reopened = BM25Retriever(index_dir=tmp_path / "bm25")
+        assert reopened.live_count() == 3
+        assert reopened.search("stale") == []
+
+
+class TestRetrieveAsync:
+    """Test the event-loop friendly retrieve_async."""
+
+    @pytest.fixture
+    def async_retriever(self, mock_vector_retriever, mock_bm25_retriever):
+        mock_vector_retriever.retrieve_async = AsyncMock(
+            side_effect=lambda query, k: mock_vector_retriever.retrieve(query, k=k)
+        )
+        return HybridRetriever(mock_vector_retriever, mock_bm25_retriever)
+
+    def test_hybrid_matches_sync(self, async_retriever):
+        """Test async hybrid search fuses the same results as retrieve."""
+        expected = async_retriever.retrieve("query", top_k=3)
+
+        results = asyncio.run(async_retriever.retrieve_async("query", top_k=3))
+
+        assert [c.chunk_id for c in results] == [c.chunk_id for c in expected]
+        async_retriever.vector.retrieve_async.assert_awaited_once_with("query", k=6)
+
+    def test_vector_only_awaits_vector_leg(self, async_retriever, mock_bm25_retriever):
+        """Test vector mode only awaits the vector retriever."""
+        results = asyncio.run(async_retriever.retrieve_async("query", top_k=2, method="vector"))
+
+        assert len(results) == 3
+        mock_bm25_retriever.search.assert_not_called()
+
+    def test_bm25_only(self, async_retriever):
+        """Test BM25 mode runs the keyword search off the event loop."""
+        results = asyncio.run(async_retriever.retrieve_async("query", top_k=3, method="bm25"))
+
+        assert [c.chunk_id for c in results] == ["bm25_1", "bm25_2", "vec2"]
+        async_retriever.vector.retrieve_async.assert_not_awaited()
+
+    def test_invalid_method_raises(self, async_retriever):
+        """Test invalid methods raise like retrieve."""
+        with pytest.raises(ValueError, match="Unknown retrieval method"):
+            asyncio.run(async_retriever.retrieve_async("query", method="invalid"))
+
 
 class TestHybridIntegration:
     """Integration tests with real BM25 retriever."""
@@ -3,6 +3,7 @@
 v0.2.9: Tests for differential updates and checkpointing.
 """
 
+import json
 import pytest
 import tempfile
 from pathlib import Path
@@ -118,8 +119,12 @@ class TestIncrementalBM25Retriever:
         result_ids = [doc_id for doc_id, _, _, _ in results]
         assert "doc2" not in result_ids
 
-    def test_fragmentation_ratio(self, retriever, sample_docs):
+    def test_fragmentation_ratio(self, temp_checkpoint_dir, sample_docs):
         """Test fragmentation ratio calculation."""
+        # Never compacts automatically, so deletions accumulate
+        retriever = IncrementalBM25Retriever(
+            checkpoint_dir=temp_checkpoint_dir, compaction_threshold=1.0
+        )
         retriever.index_documents(
             sample_docs["docs"],
             sample_docs["ids"],
@@ -158,8 +163,11 @@ class TestIncrementalBM25Retriever:
         assert len(retriever.deleted_ids) == 0
         assert retriever.count() == 1  # Only doc3 remains
 
-    def test_manual_compaction(self, retriever, sample_docs):
+    def test_manual_compaction(self, temp_checkpoint_dir, sample_docs):
         """Test manual compaction."""
+        retriever = IncrementalBM25Retriever(
+            checkpoint_dir=temp_checkpoint_dir, compaction_threshold=1.0
+        )
         retriever.index_documents(
             sample_docs["docs"],
             sample_docs["ids"],
@@ -191,9 +199,11 @@ class TestIncrementalBM25Retriever:
             [{"topic": "new"}]
         )
 
-        # Check checkpoint file exists
-        checkpoints = list(temp_checkpoint_dir.glob("bm25_checkpoint_v*.pkl"))
-        assert len(checkpoints) > 0
+        # Base snapshot from indexing, delta appended to the log
+        assert (temp_checkpoint_dir / "bm25_base_v0" / "checkpoint.json").exists()
+        log_lines = (temp_checkpoint_dir / "bm25_wal_v0.jsonl").read_text().splitlines()
+        assert len(log_lines) == 1
+        assert json.loads(log_lines[0])["doc_ids"] == ["doc4"]
 
     def test_checkpoint_loading(self, retriever, sample_docs):
         """Test checkpoint can be loaded."""
@@ -243,7 +253,7 @@ class TestIncrementalBM25Retriever:
             )
 
         # Should keep only last 3
-        checkpoints = list(temp_checkpoint_dir.glob("bm25_checkpoint_v*.pkl"))
+        checkpoints = list(temp_checkpoint_dir.glob("bm25_base_v*"))
         assert len(checkpoints) <= 3
 
     def test_rebuild_index(self, retriever, sample_docs):
@@ -303,7 +313,7 @@ class TestIncrementalBM25Retriever:
         )
 
         # No checkpoint files should be created
-        checkpoints = list(temp_checkpoint_dir.glob("bm25_checkpoint_v*.pkl"))
+        checkpoints = list(temp_checkpoint_dir.glob("bm25_*"))
         assert len(checkpoints) == 0
 
     def test_concurrent_compaction_prevention(self, retriever, sample_docs):
@@ -325,6 +335,103 @@ class TestIncrementalBM25Retriever:
         assert result is False
 
 
+class TestCheckpointLog:
+    """Tests for base snapshot + write-ahead log checkpoints."""
+
+    def test_add_cost_proportional_to_delta(self, retriever, sample_docs, temp_checkpoint_dir):
+        """Test adds append to the log instead of rewriting the corpus."""
+        retriever.index_documents(sample_docs["docs"], sample_docs["ids"], sample_docs["metadatas"])
+
+        with patch.object(retriever, "save", wraps=retriever.save) as save:
+            for i in range(5):
+                retriever.add_documents([f"Doc {i}"], [f"doc_{i}"])
+
+        save.assert_not_called()
+        log = temp_checkpoint_dir / "bm25_wal_v0.jsonl"
+        assert len(log.read_text().splitlines()) == 5
+
+    def test_snapshot_interval_compacts_log(self, temp_checkpoint_dir, sample_docs):
+        """Test a new base is written every snapshot_interval operations."""
+        retriever = IncrementalBM25Retriever(
+            checkpoint_dir=temp_checkpoint_dir, snapshot_interval=3
+        )
+        retriever.index_documents(sample_docs["docs"], sample_docs["ids"], sample_docs["metadatas"])
+
+        for i in range(3):
+            retriever.add_documents([f"Doc {i}"], [f"doc_{i}"])
+
+        assert (temp_checkpoint_dir / "bm25_base_v3" / "checkpoint.json").exists()
+        assert (temp_checkpoint_dir / "bm25_wal_v3.jsonl").read_text() == ""
+
+    def test_recovery_replays_log(self, retriever, sample_docs):
+        """Test recovery applies adds and removals logged after the base."""
+        retriever.index_documents(sample_docs["docs"], sample_docs["ids"], sample_docs["metadatas"])
+        retriever.add_documents(["Parrots and cats"], ["doc4"], [{"topic": "parrots"}])
+        retriever.remove_documents(["doc1"])
+
+        recovered = IncrementalBM25Retriever(checkpoint_dir=retriever.checkpoint_dir)
+        assert recovered.load_checkpoint() is True
+
+        results = recovered.search("cats", top_k=5)
+        assert [doc_id for doc_id, _, _, _ in results] == ["doc4"]
+        assert results[0][3] == {"topic": "parrots"}
+        assert recovered.version == retriever.version
+
+    def test_recovery_ignores_torn_entry(self, retriever, sample_docs, temp_checkpoint_dir):
+        """Test a partially written final log entry is skipped."""
+        retriever.index_documents(sample_docs["docs"], sample_docs["ids"], sample_docs["metadatas"])
+        retriever.add_documents(["Extra document"], ["doc4"])
+        with open(temp_checkpoint_dir / "bm25_wal_v0.jsonl", "a") as f:
+            f.write('{"op": "add", "docu')
+
+        recovered = IncrementalBM25Retriever(checkpoint_dir=temp_checkpoint_dir)
+
+        assert recovered.load_checkpoint() is True
+        assert recovered.count() == 4
+
+    def test_load_specific_version(self, retriever, sample_docs):
+        """Test loading an earlier version stops replay at that version."""
+        retriever.index_documents(sample_docs["docs"], sample_docs["ids"], sample_docs["metadatas"])
+        retriever.add_documents(["First extra"], ["doc4"])
+        retriever.add_documents(["Second extra"], ["doc5"])
+
+        recovered = IncrementalBM25Retriever(checkpoint_dir=retriever.checkpoint_dir)
+
+        assert recovered.load_checkpoint(version=1) is True
+        assert recovered.version == 1
+        assert recovered.count() == 4
+
+    def test_compaction_writes_new_base(self, retriever, sample_docs, temp_checkpoint_dir):
+        """Test compaction snapshots a base and recovery uses it."""
+        retriever.index_documents(sample_docs["docs"], sample_docs["ids"], sample_docs["metadatas"])
+        retriever.remove_documents(["doc1", "doc2"])
+        retriever.compact_if_needed(force=True)
+
+        assert (temp_checkpoint_dir / f"bm25_base_v{retriever.version}").exists()
+
+        recovered = IncrementalBM25Retriever(checkpoint_dir=temp_checkpoint_dir)
+        recovered.load_checkpoint()
+        assert recovered.count() == 1
+        assert recovered.deleted_ids == set()
+
+    def test_legacy_json_checkpoint_migrates(self, temp_checkpoint_dir):
+        """Test a full-corpus JSON checkpoint is loaded and migrated."""
+        (temp_checkpoint_dir / "bm25_checkpoint_v2.json").write_text(json.dumps({
+            "documents": ["legacy cats"],
+            "doc_ids": ["old1"],
+            "metadatas": [{}],
+            "deleted_ids": [],
+            "timestamp": 0.0,
+            "version": 2,
+        }))
+        retriever = IncrementalBM25Retriever(checkpoint_dir=temp_checkpoint_dir)
+
+        assert retriever.load_checkpoint() is True
+        assert retriever.search("cats")[0][0] == "old1"
+        assert (temp_checkpoint_dir / "bm25_base_v2" / "checkpoint.json").exists()
+        assert not (temp_checkpoint_dir / "bm25_checkpoint_v2.json").exists()
+
+
 class TestEdgeCases:
     """Tests for edge cases and error conditions."""
 
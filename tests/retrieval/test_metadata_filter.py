@@ -5,10 +5,12 @@ v0.3.7d: Test filter parsing, query building, and faceted search.
 
 import pytest
 from datetime import datetime
+from unittest.mock import Mock
 
 from src.retrieval.metadata_filter import (
     FilterCondition,
     MetadataFilter,
+    MetadataFilterSecurityError,
     FilterParser,
     FacetedSearch,
     create_filter,
@@ -345,27 +347,42 @@ class TestFilterParser:
 class TestFacetedSearch:
     """Test FacetedSearch class."""
 
-    def test_get_facets_placeholder(self):
-        """Test get_facets method (placeholder)."""
-        # Mock vector store
-        mock_store = None
-
-        facets = FacetedSearch.get_facets(mock_store, fields=["tag", "author"])
-
-        # Should return empty dict for now (placeholder)
-        assert isinstance(facets, dict)
-        assert "tag" in facets
-        assert "author" in facets
-
-    def test_count_facet_values_placeholder(self):
-        """Test count_facet_values method (placeholder)."""
-        # Mock vector store
-        mock_store = None
-
-        counts = FacetedSearch.count_facet_values(mock_store, "tag")
-
-        # Should return empty dict for now (placeholder)
-        assert isinstance(counts, dict)
+    @pytest.fixture
+    def store(self):
+        """Vector store maintaining facet counts."""
+        counts = {"tag": {"python": 3, "java": 1}, "author": {"Smith": 2}}
+        store = Mock()
+        store.facet_fields.return_value = sorted(counts)
+        store.facet_counts.side_effect = lambda field: counts.get(field, {})
+        return store
+
+    def test_get_facets(self, store):
+        """Test get_facets returns values per field, most frequent first."""
+        facets = FacetedSearch.get_facets(store, fields=["tag", "author"])
+
+        assert facets == {"tag": ["python", "java"], "author": ["Smith"]}
+
+    def test_get_facets_all_fields(self, store):
+        """Test get_facets defaults to every counted field."""
+        facets = FacetedSearch.get_facets(store, limit=1)
+
+        assert facets == {"author": ["Smith"], "tag": ["python"]}
+
+    def test_count_facet_values(self, store):
+        """Test count_facet_values reads the store's facet counts."""
+        assert FacetedSearch.count_facet_values(store, "TAG") == {"python": 3, "java": 1}
+        store.facet_counts.assert_called_with("tag")
+
+    def test_count_facet_values_rejects_unknown_field(self, store):
+        """Test fields outside the whitelist are rejected."""
+        with pytest.raises(MetadataFilterSecurityError):
+            FacetedSearch.count_facet_values(store, "$where")
+
+    def test_store_without_facets(self):
+        """Test stores without facet counts give empty results."""
+        assert FacetedSearch.count_facet_values(None, "tag") == {}
+        assert FacetedSearch.get_facets(None, fields=["tag"]) == {"tag": []}
+        assert FacetedSearch.get_facets(None) == {}
 
 
 class TestConvenienceFunction:
@@ -1,7 +1,8 @@
 """Tests for retriever."""
 
+import asyncio
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import AsyncMock, Mock, MagicMock
 from src.retrieval.retriever import Retriever, RetrievedChunk
 
 
@@ -209,6 +210,32 @@ class TestRetriever:
         mock_embedder.embed_text.assert_called_once()
 
 
+    def test_retrieve_async(self, mock_embedder, mock_vector_store):
+        """Test async retrieval awaits the embedder and shares the query cache."""
+        mock_embedder.embed_text_async = AsyncMock(return_value=[0.1, 0.2, 0.3, 0.4])
+        mock_vector_store.query.return_value = {
+            "ids": [["chunk1"]],
+            "distances": [[0.1]],
+            "documents": [["Content 1"]],
+            "metadatas": [[{"document_id": "doc1", "document_path": "file1.txt", "chunk_position": 0}]]
+        }
+
+        retriever = Retriever(
+            embedder=mock_embedder,
+            vector_store=mock_vector_store
+        )
+
+        results = asyncio.run(retriever.retrieve_async("test query", k=1))
+
+        mock_embedder.embed_text_async.assert_awaited_once_with("test query")
+        mock_embedder.embed_text.assert_not_called()
+        assert [chunk.chunk_id for chunk in results] == ["chunk1"]
+
+        if retriever.query_cache:
+            assert retriever.retrieve("test query", k=1) == results
+            mock_vector_store.query.assert_called_once()
+
+
 class TestRetrievedChunk:
     """Tests for RetrievedChunk dataclass."""
 
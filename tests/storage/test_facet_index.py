@@ -0,0 +1,92 @@
+"""Tests for persistent facet counts."""
+
+import pytest
+
+from src.storage.facet_index import FacetIndex
+
+
+@pytest.fixture
+def facets(temp_dir):
+    """Facet index in a temporary database."""
+    return FacetIndex(db_path=temp_dir / "facets.db")
+
+
+class TestFacetIndex:
+    """Tests for FacetIndex."""
+
+    def test_counts_added_metadata(self, facets):
+        """Values are counted per chunk, most frequent first."""
+        facets.add("docs", [{"tag": "python"}, {"tag": "java"}, {"tag": "python"}])
+
+        assert facets.counts("docs", "tag") == {"python": 2, "java": 1}
+        assert list(facets.counts("docs", "tag")) == ["python", "java"]
+        assert facets.total("docs") == 3
+
+    def test_remove_and_replace(self, facets):
+        """Deleted and re-tagged chunks move their counts."""
+        facets.add("docs", [{"tag": "python"}, {"tag": "python"}, {"tag": "java"}])
+
+        facets.remove("docs", [{"tag": "java"}])
+        facets.replace("docs", [{"tag": "python"}], [{"tag": "rust"}])
+
+        assert facets.counts("docs", "tag") == {"python": 1, "rust": 1}
+        assert facets.total("docs") == 2
+
+    def test_values_keep_their_type(self, facets):
+        """Numbers and strings are distinct values."""
+        facets.add("docs", [{"page_number": 1}, {"page_number": "1"}, {"confidence": 0.5}])
+
+        assert facets.counts("docs", "page_number") == {1: 1, "1": 1}
+        assert facets.counts("docs", "confidence") == {0.5: 1}
+
+    def test_list_values_counted_per_element(self, facets):
+        """Each element of a list value is a facet value."""
+        facets.add("docs", [{"tags": ["ml", "ai"]}, {"tags": ["ml"]}])
+
+        assert facets.counts("docs", "tags") == {"ml": 2, "ai": 1}
+
+    def test_only_configured_fields(self, temp_dir):
+        """Bookkeeping fields are not counted by default."""
+        facets = FacetIndex(db_path=temp_dir / "facets.db")
+        facets.add("docs", [{"tag": "python", "file_hash": "abc", "chunk_position": 0}])
+
+        assert facets.field_names("docs") == ["tag"]
+
+        custom = FacetIndex(db_path=temp_dir / "custom.db", fields=["file_hash"])
+        custom.add("docs", [{"tag": "python", "file_hash": "abc"}])
+        assert custom.field_names("docs") == ["file_hash"]
+
+    def test_collections_separate(self, facets):
+        """Counts are kept per collection."""
+        facets.add("a", [{"tag": "python"}])
+        facets.add("b", [{"tag": "java"}])
+
+        facets.clear("a")
+
+        assert facets.counts("a", "tag") == {}
+        assert facets.counts("b", "tag") == {"java": 1}
+
+    def test_persists(self, facets):
+        """Counts survive reopening the database."""
+        facets.add("docs", [{"author": "Smith"}])
+
+        reopened = FacetIndex(db_path=facets.db_path)
+
+        assert reopened.counts("docs", "author") == {"Smith": 1}
+
+    def test_rebuild(self, facets):
+        """Rebuilding replaces counts with a fresh tally."""
+        facets.add("docs", [{"tag": "stale"}])
+
+        facets.rebuild("docs", [{"tag": "python"}, {"tag": "python"}])
+
+        assert facets.counts("docs", "tag") == {"python": 2}
+        assert facets.total("docs") == 2
+
+    def test_default_path_in_data_dir(self, temp_dir, monkeypatch):
+        """The default database lives in the data directory."""
+        monkeypatch.setenv("RAGGED_DATA_DIR", str(temp_dir))
+
+        facets = FacetIndex()
+
+        assert facets.db_path == temp_dir / "facet_index.db"
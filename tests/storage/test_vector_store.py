@@ -1,5 +1,6 @@
 """Tests for vector store (ChromaDB wrapper)."""
 
+import numpy as np
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
@@ -10,8 +11,10 @@ class TestVectorStore:
     """Tests for VectorStore class."""
 
     @pytest.fixture
-    def mock_chroma_client(self):
+    def mock_chroma_client(self, tmp_path, monkeypatch):
         """Create a mock ChromaDB client."""
+        # Facet counts are kept under the data directory
+        monkeypatch.setenv("RAGGED_DATA_DIR", str(tmp_path))
         # v0.3.6: Update patches to use chromadb_store module
         with patch("src.storage.chromadb_store.chromadb.HttpClient") as mock_client_class, \
              patch("src.storage.chromadb_store.get_settings") as mock_settings:
@@ -347,3 +350,130 @@ class TestVectorStore:
         assert metadata["path"] == "/data/file.pdf"
         assert metadata["tags"] == ["ML", "AI"]  # Deserialised from JSON
         assert metadata["count"] == 5
+
+    def test_facets_follow_writes(self, mock_chroma_client, tmp_path):
+        """Test facet counts are updated on add, metadata update and delete."""
+        from src.storage.facet_index import FacetIndex
+
+        mock_client, mock_collection = mock_chroma_client
+        store = VectorStore(
+            host="localhost",
+            port=8001,
+            collection_name="test_collection",
+            facet_index=FacetIndex(db_path=tmp_path / "facets.db"),
+        )
+
+        store.add(
+            ids=["id1", "id2"],
+            embeddings=np.array([[0.1, 0.2], [0.3, 0.4]]),
+            documents=["Doc 1", "Doc 2"],
+            metadatas=[{"tag": "python"}, {"tag": "python"}],
+        )
+        assert store.facet_counts("tag") == {"python": 2}
+
+        mock_collection.get.return_value = {"metadatas": [{"tag": "python"}]}
+        store.update_metadata(["id1"], [{"tag": "java"}])
+        assert store.facet_counts("tag") == {"python": 1, "java": 1}
+
+        mock_collection.get.return_value = {"metadatas": [{"tag": "java"}]}
+        store.delete(ids=["id1"])
+        assert store.facet_counts("tag") == {"python": 1}
+        mock_collection.get.assert_called_with(ids=["id1"], where=None, include=["metadatas"])
+
+    def test_facets_ignore_existing_ids(self, mock_chroma_client, tmp_path):
+        """Test re-adding chunks ChromaDB already holds does not count them again."""
+        from src.storage.facet_index import FacetIndex
+
+        mock_client, mock_collection = mock_chroma_client
+        store = VectorStore(
+            host="localhost",
+            port=8001,
+            collection_name="test_collection",
+            facet_index=FacetIndex(db_path=tmp_path / "facets.db"),
+        )
+        mock_collection.get.return_value = {"ids": []}
+        store.add(
+            ids=["id1", "id2"],
+            embeddings=np.array([[0.1, 0.2], [0.3, 0.4]]),
+            documents=["Doc 1", "Doc 2"],
+            metadatas=[{"tag": "python"}, {"tag": "python"}],
+        )
+
+        mock_collection.get.return_value = {"ids": ["id2"]}
+        store.add(
+            ids=["id2", "id3"],
+            embeddings=np.array([[0.3, 0.4], [0.5, 0.6]]),
+            documents=["Doc 2", "Doc 3"],
+            metadatas=[{"tag": "python"}, {"tag": "java"}],
+        )
+
+        assert store.facet_counts("tag") == {"python": 2, "java": 1}
+        mock_collection.get.assert_called_with(ids=["id2", "id3"], include=[])
+
+    def test_rebuild_facets(self, mock_chroma_client, tmp_path):
+        """Test facets are recounted from the collection."""
+        from src.storage.facet_index import FacetIndex
+
+        mock_client, mock_collection = mock_chroma_client
+        store = VectorStore(
+            host="localhost",
+            port=8001,
+            collection_name="test_collection",
+            facet_index=FacetIndex(db_path=tmp_path / "facets.db"),
+        )
+        mock_collection.get.return_value = {"metadatas": [{"author": "Smith"}, {"author": "Jones"}]}
+        mock_collection.count.return_value = 2
+
+        assert store.facets_stale()
+        assert store.rebuild_facets() == 2
+        assert store.facet_counts("author") == {"Jones": 1, "Smith": 1}
+        assert not store.facets_stale()
+
+    def test_count_with_filter_fetches_ids_only(self, mock_chroma_client):
+        """Test a filtered count does not download documents or metadata."""
+        mock_client, mock_collection = mock_chroma_client
+        store = VectorStore(host="localhost", port=8001, collection_name="test_collection")
+        mock_collection.get.return_value = {"ids": ["id1", "id2", "id3"]}
+
+        assert store.count(where={"file_type": "pdf"}) == 3
+        mock_collection.get.assert_called_once_with(where={"file_type": "pdf"}, include=[])
+        mock_collection.count.assert_not_called()
+
+    def test_list_projection_and_cursor(self, mock_chroma_client):
+        """Test listing fetches only requested fields and pages by cursor."""
+        mock_client, mock_collection = mock_chroma_client
+        store = VectorStore(host="localhost", port=8001, collection_name="test_collection")
+        mock_collection.get.return_value = {
+            "ids": ["id1", "id2", "id3"],
+            "metadatas": [{"page": 1}, {"page": 2}, {"page": 3}],
+        }
+
+        page = store.list(limit=2, include=["metadatas"], with_total=False)
+
+        assert page["ids"] == ["id1", "id2"]
+        assert page["metadatas"] == [{"page": 1}, {"page": 2}]
+        assert "documents" not in page
+        assert page["total"] is None
+        mock_collection.get.assert_called_once_with(
+            where=None, limit=3, offset=0, include=["metadatas"]
+        )
+
+        mock_collection.get.return_value = {"ids": ["id3"], "metadatas": [{"page": 3}]}
+        last = store.list(limit=2, include=["metadatas"], cursor=page["next_cursor"], with_total=False)
+
+        assert last["ids"] == ["id3"]
+        assert last["next_cursor"] is None
+        mock_collection.get.assert_called_with(where=None, limit=3, offset=2, include=["metadatas"])
+
+    def test_list_total(self, mock_chroma_client):
+        """Test listing reports the number of matching documents."""
+        mock_client, mock_collection = mock_chroma_client
+        store = VectorStore(host="localhost", port=8001, collection_name="test_collection")
+        mock_collection.count.return_value = 5
+        mock_collection.get.return_value = {"ids": ["id1"], "documents": ["Doc 1"], "metadatas": [{}]}
+
+        page = store.list(limit=1)
+
+        assert page["total"] == 5
+        assert page["documents"] == ["Doc 1"]
+        assert page["next_cursor"] is None
@@ -1,5 +1,6 @@
 """Tests for circuit breaker pattern."""
 
+import asyncio
 import pytest
 import time
 from unittest.mock import Mock
@@ -250,6 +251,35 @@ class TestCircuitBreakerHalfOpenState:
             breaker.call(mock_func)
 
 
+class TestCircuitBreakerAsync:
+    """Tests for call_async."""
+
+    def test_call_async_success(self):
+        """Test awaited calls pass through and count as successes."""
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        async def func(value):
+            return value * 2
+
+        assert asyncio.run(breaker.call_async(func, 21)) == 42
+        assert breaker.is_closed
+
+    def test_call_async_failures_open_shared_circuit(self):
+        """Test async failures open the circuit for sync callers too."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10.0)
+
+        async def failing():
+            raise ConnectionError("down")
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                asyncio.run(breaker.call_async(failing))
+
+        assert breaker.is_open
+        with pytest.raises(CircuitBreakerOpenError):
+            breaker.call(lambda: "should not execute")
+
+
 class TestCircuitBreakerDecorator:
     """Tests for circuit breaker decorator."""
 
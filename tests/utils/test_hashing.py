@@ -4,7 +4,7 @@ v0.2.9: Comprehensive tests for content hashing functions.
 """
 
 import pytest
-from src.utils.hashing import hash_content, hash_file_content, hash_query
+from src.utils.hashing import hash_content, hash_file, hash_file_content, hash_query
 
 
 class TestHashContent:
@@ -168,6 +168,23 @@ class TestHashFileContent:
         assert result == expected
 
 
+class TestHashFile:
+    """Tests for hash_file function."""
+
+    def test_matches_content_hash(self, temp_dir):
+        """Streaming file hash equals hashing the bytes in memory."""
+        data = b"binary \x00 data " * 100_000
+        path = temp_dir / "data.bin"
+        path.write_bytes(data)
+
+        assert hash_file(path) == hash_content(data)
+
+    def test_missing_file(self, temp_dir):
+        """Missing files raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            hash_file(temp_dir / "missing.bin")
+
+
 class TestHashQuery:
     """Tests for hash_query function."""
 
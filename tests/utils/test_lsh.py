@@ -0,0 +1,91 @@
+"""Tests for locality-sensitive hashing utilities."""
+
+import random
+
+import pytest
+
+from src.utils.lsh import HammingLSH, MinHashLSH, hamming_distance, jaccard, word_shingles
+
+
+class TestHelpers:
+    """Tests for hashing and similarity helpers."""
+
+    def test_hamming_distance(self):
+        """Differing bits are counted."""
+        assert hamming_distance(0b1010, 0b1010) == 0
+        assert hamming_distance(0b1010, 0b0101) == 4
+        assert hamming_distance(0, (1 << 64) - 1) == 64
+
+    def test_word_shingles(self):
+        """Text is lowercased and split into overlapping word runs."""
+        assert word_shingles("The quick brown Fox") == {"the quick brown", "quick brown fox"}
+
+    def test_word_shingles_short_and_blank(self):
+        """Short text forms one shingle; blank text forms none."""
+        assert word_shingles("Hello world") == {"hello world"}
+        assert word_shingles("  \n ") == set()
+
+    def test_jaccard(self):
+        """Jaccard similarity of sets, with empty sets identical."""
+        assert jaccard({"a", "b"}, {"b", "c"}) == pytest.approx(1 / 3)
+        assert jaccard(set(), set()) == 1.0
+        assert jaccard({"a"}, set()) == 0.0
+
+
+class TestHammingLSH:
+    """Tests for HammingLSH."""
+
+    def test_finds_every_pair_within_distance(self):
+        """Pigeonhole banding never misses a pair within max_distance."""
+        # Seeded so every run checks the same hashes; not used for security
+        rng = random.Random(0)  # noqa: S311
+        index = HammingLSH(bits=64, max_distance=3)
+        base = rng.getrandbits(64)
+        index.add(0, base)
+        for key in range(1, 50):
+            flipped = base
+            for bit in rng.sample(range(64), rng.randint(0, 3)):
+                flipped ^= 1 << bit
+            index.add(key, flipped)
+
+        candidates = index.candidates()
+
+        assert all((0, key) in candidates for key in range(1, 50))
+
+    def test_distant_hashes_are_not_candidates(self):
+        """Hashes differing in every band do not collide."""
+        index = HammingLSH(bits=64, max_distance=3)
+        index.add(1, 0)
+        index.add(2, (1 << 64) - 1)
+
+        assert index.candidates() == set()
+
+
+class TestMinHashLSH:
+    """Tests for MinHashLSH."""
+
+    @staticmethod
+    def random_text(rng: random.Random, words: int = 300) -> str:
+        return " ".join(f"w{rng.randrange(5000)}" for _ in range(words))
+
+    def test_rows_per_band_follow_threshold(self):
+        """Higher thresholds use longer bands."""
+        assert MinHashLSH(threshold=0.95).rows > MinHashLSH(threshold=0.5).rows
+
+    def test_near_duplicates_are_candidates(self):
+        """Sets above the threshold collide; unrelated sets do not."""
+        # Seeded so every run checks the same texts; not used for security
+        rng = random.Random(0)  # noqa: S311
+        texts = [self.random_text(rng) for _ in range(200)]
+        texts[7] = texts[3] + " appendix"
+        index = MinHashLSH(threshold=0.95)
+        for key, text in enumerate(texts):
+            index.add(key, word_shingles(text))
+
+        assert index.candidates() == {(3, 7)}
+
+    def test_signatures_are_deterministic(self):
+        """Indexes with the same seed produce the same signatures."""
+        shingles = word_shingles("the quick brown fox jumps over the lazy dog")
+
+        assert (MinHashLSH(0.9).signature(shingles) == MinHashLSH(0.9).signature(shingles)).all()
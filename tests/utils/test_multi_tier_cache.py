@@ -3,12 +3,16 @@
 v0.2.9: Tests for L1/L2/L3 caches and cache coherency.
 """
 
+import json
+import pickle
 import pytest
 import numpy as np
 from pathlib import Path
 import tempfile
 import shutil
 import time
+from collections import OrderedDict
+from unittest.mock import patch
 
 from src.utils.multi_tier_cache import (
     L1QueryEmbeddingCache,
@@ -16,6 +20,7 @@ from src.utils.multi_tier_cache import (
     MultiTierCache,
     EmbeddingCacheEntry,
 )
+from src.utils.hashing import hash_content
 
 
 class TestEmbeddingCacheEntry:
@@ -389,6 +394,310 @@ class TestL2DocumentEmbeddingCache:
         assert stats["utilization"] == 0.2
 
 
+class TestL2SlabStorage:
+    """Tests for the memory-mapped L2 slab backend."""
+
+    @pytest.fixture
+    def temp_cache_dir(self):
+        """Create temporary cache directory."""
+        temp_dir = tempfile.mkdtemp()
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir)
+
+    def test_no_file_per_entry(self, temp_cache_dir):
+        """Test entries share one slab file instead of one file each."""
+        cache = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=100)
+
+        for i in range(50):
+            cache.set(f"doc{i}", np.full(8, float(i)))
+
+        assert sorted(p.name for p in temp_cache_dir.iterdir()) == [
+            "l2_index.jsonl", "l2_meta.json", "l2_slab.bin"
+        ]
+
+    def test_get_returns_copy(self, temp_cache_dir):
+        """Test hits are copies, not views into the slab."""
+        cache = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=10)
+        cache.set("doc1", np.array([1.0, 2.0, 3.0]))
+
+        hot = cache.get("doc1")
+        cache._hot_cache.clear()
+        cold = cache.get("doc1")
+
+        assert cold.dtype == np.float32
+        assert not np.shares_memory(hot, cache._slab)
+        assert not np.shares_memory(cold, cache._slab)
+
+    def test_returned_embedding_survives_slot_reuse(self, temp_cache_dir):
+        """Test an embedding already returned is unchanged when its slot is reused."""
+        cache = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=1)
+        cache.set("doc1", np.array([1.0, 1.0]))
+        result = cache.get("doc1")
+
+        cache.set("doc2", np.array([2.0, 2.0]))
+
+        assert np.array_equal(result, np.array([1.0, 1.0]))
+
+    def test_evicted_slot_reused(self, temp_cache_dir):
+        """Test eviction frees a slot for the next insert."""
+        cache = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=2)
+        cache.set("doc1", np.array([1.0]))
+        cache.set("doc2", np.array([2.0]))
+        slot = cache._index[hash_content("doc1")]["slot"]
+
+        cache.set("doc3", np.array([3.0]))
+
+        assert cache._index[hash_content("doc3")]["slot"] == slot
+        assert cache._capacity == 2
+
+    def test_journal_appends_per_insert(self, temp_cache_dir):
+        """Test inserts append one journal line instead of rewriting the index."""
+        cache = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=100)
+        cache.set("doc1", np.array([1.0]))
+        cache.flush()
+        journal = (temp_cache_dir / "l2_index.jsonl").read_text()
+
+        cache.set("doc2", np.array([2.0]))
+        cache.flush()
+
+        assert (temp_cache_dir / "l2_index.jsonl").read_text().startswith(journal)
+        assert cache._journal_lines == 2
+
+    def test_persistence_after_eviction_and_growth(self, temp_cache_dir):
+        """Test a reopened cache sees evictions and grown slabs."""
+        cache1 = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=100)
+        for i in range(100):
+            cache1.set(f"doc{i}", np.full(4, float(i)))
+        cache1.delete("doc5")
+        del cache1
+
+        cache2 = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=100)
+
+        assert len(cache2._index) == 99
+        assert cache2.get("doc5") is None
+        assert np.array_equal(cache2.get("doc99"), np.full(4, 99.0))
+        assert cache2._free_slots == [cache2._free_slots[0]]
+
+    def test_journal_compaction(self, temp_cache_dir):
+        """Test the journal is rewritten once it outgrows the live entries."""
+        cache = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=4)
+        for i in range(200):
+            cache.set(f"doc{i}", np.array([float(i)]))
+        cache.flush()
+
+        lines = (temp_cache_dir / "l2_index.jsonl").read_text().splitlines()
+        assert len(lines) <= 2 * 64 + 2
+
+        reopened = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=4)
+        assert np.array_equal(reopened.get("doc199"), np.array([199.0]))
+        assert reopened.get("doc195") is None
+
+    def test_float16_storage(self, temp_cache_dir):
+        """Test half-precision slabs."""
+        cache = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=10, dtype="float16")
+        cache.set("doc1", np.array([0.5, 0.25]))
+
+        result = cache.get("doc1")
+
+        assert result.dtype == np.float16
+        assert np.array_equal(result, np.array([0.5, 0.25]))
+
+    def test_dimension_change_resets(self, temp_cache_dir):
+        """Test storing a different dimension clears stale embeddings."""
+        cache = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=10)
+        cache.set("doc1", np.array([1.0, 2.0]))
+
+        cache.set("doc2", np.array([1.0, 2.0, 3.0]))
+
+        assert cache.get("doc1") is None
+        assert cache.get("doc2").shape == (3,)
+
+    def test_legacy_json_cache_migrated(self, temp_cache_dir):
+        """Test per-entry JSON caches are moved into the slab."""
+        key = hash_content("doc1")
+        (temp_cache_dir / "l2_index.json").write_text(
+            json.dumps({"version": "1.0", "entries": {key: {"doc_id": "doc1"}}})
+        )
+        (temp_cache_dir / f"{key}.json").write_text(
+            json.dumps({"version": "1.0", "embedding": [1.0, 2.0]})
+        )
+
+        cache = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=10)
+
+        assert np.array_equal(cache.get("doc1"), np.array([1.0, 2.0]))
+        assert not (temp_cache_dir / "l2_index.json").exists()
+        assert not (temp_cache_dir / f"{key}.json").exists()
+
+    def test_legacy_pickle_cache_migrated(self, temp_cache_dir):
+        """Test pre-v0.2.10 pickle caches are moved into the slab."""
+        key = hash_content("doc1")
+        with open(temp_cache_dir / "l2_index.pkl", "wb") as f:
+            pickle.dump(OrderedDict({key: {"doc_id": "doc1"}}), f)
+        with open(temp_cache_dir / f"{key}.pkl", "wb") as f:
+            pickle.dump(np.array([1.0, 2.0]), f)
+
+        cache = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=10)
+
+        assert np.array_equal(cache.get("doc1"), np.array([1.0, 2.0]))
+        assert cache._index[key]["doc_id"] == "doc1"
+        assert not (temp_cache_dir / "l2_index.pkl").exists()
+        assert not (temp_cache_dir / f"{key}.pkl").exists()
+
+    def test_journal_is_fsynced(self, temp_cache_dir):
+        """Test journal appends are forced to disk on flush."""
+        cache = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=10)
+
+        with patch("src.utils.multi_tier_cache.os.fsync") as mock_fsync:
+            cache.set("doc1", np.array([1.0]))
+            cache.flush()
+
+        mock_fsync.assert_called()
+
+    def test_single_sets_fsync_once_per_checkpoint(self, temp_cache_dir):
+        """Test single sets are buffered instead of fsynced one by one."""
+        cache = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=100)
+        cache.set("doc0", np.array([0.0]))
+        cache.flush()
+
+        with patch("src.utils.multi_tier_cache.os.fsync") as mock_fsync:
+            for i in range(1, 11):
+                cache.set(f"doc{i}", np.array([float(i)]))
+            assert mock_fsync.call_count == 0
+
+            cache.close()
+
+        assert mock_fsync.call_count == 1
+        reopened = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=100)
+        assert np.array_equal(reopened.get("doc10"), np.array([10.0]))
+
+    def test_single_sets_synced_after_threshold(self, temp_cache_dir):
+        """Test the buffer is written out once it reaches the sync threshold."""
+        cache = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=1000)
+
+        for i in range(cache.JOURNAL_SYNC_RECORDS):
+            cache.set(f"doc{i}", np.array([float(i)]))
+
+        assert cache._pending_records == []
+        assert cache._journal_lines == cache.JOURNAL_SYNC_RECORDS
+
+
+class TestBatchOperations:
+    """Tests for batched get_many/set_many across tiers."""
+
+    @pytest.fixture
+    def temp_cache_dir(self):
+        """Create temporary cache directory."""
+        temp_dir = tempfile.mkdtemp()
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir)
+
+    def test_l1_get_many(self):
+        """Test L1 returns a hit mask and stacked hits."""
+        cache = L1QueryEmbeddingCache(maxsize=10)
+        cache.set_many(["q1", "q2"], np.array([[1.0, 2.0], [3.0, 4.0]]))
+
+        hits, embeddings = cache.get_many(["q2", "missing", "q1"])
+
+        assert hits.tolist() == [True, False, True]
+        assert np.array_equal(embeddings, np.array([[3.0, 4.0], [1.0, 2.0]]))
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 1
+
+    def test_l1_get_many_all_miss(self):
+        """Test an all-miss lookup returns an empty array."""
+        cache = L1QueryEmbeddingCache(maxsize=10)
+
+        hits, embeddings = cache.get_many(["q1", "q2"])
+
+        assert not hits.any()
+        assert len(embeddings) == 0
+
+    def test_l1_set_many_evicts(self):
+        """Test batched inserts respect maxsize."""
+        cache = L1QueryEmbeddingCache(maxsize=2)
+        cache.set_many(["q1", "q2", "q3"], np.eye(3))
+
+        hits, _ = cache.get_many(["q1", "q2", "q3"])
+
+        assert hits.tolist() == [False, True, True]
+
+    def test_l2_set_many_single_journal_append(self, temp_cache_dir):
+        """Test a batch is journalled in one append and read back in one gather."""
+        cache = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=100)
+        vectors = np.arange(12, dtype=np.float32).reshape(4, 3)
+
+        cache.set_many(["d0", "d1", "d2", "d3"], vectors)
+        hits, embeddings = cache.get_many(["d3", "nope", "d0"])
+
+        assert cache._journal_lines == 4
+        assert hits.tolist() == [True, False, True]
+        assert np.array_equal(embeddings, vectors[[3, 0]])
+        assert np.array_equal(cache.get("d1"), vectors[1])
+
+    def test_l2_set_many_persists(self, temp_cache_dir):
+        """Test batched entries survive a reopen."""
+        cache = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=3)
+        cache.set_many([f"d{i}" for i in range(5)], np.eye(5))
+        del cache
+
+        reopened = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir, maxsize=3)
+        hits, embeddings = reopened.get_many([f"d{i}" for i in range(5)])
+
+        assert hits.tolist() == [False, False, True, True, True]
+        assert np.array_equal(embeddings, np.eye(5)[2:])
+
+    def test_l2_set_many_shape_mismatch(self, temp_cache_dir):
+        """Test misaligned batches are rejected."""
+        cache = L2DocumentEmbeddingCache(cache_dir=temp_cache_dir)
+
+        with pytest.raises(ValueError):
+            cache.set_many(["d0", "d1"], np.ones((3, 4)))
+
+    def test_facade_only_misses_need_embedding(self, temp_cache_dir):
+        """Test the facade supports embedding only the cache misses."""
+        cache = MultiTierCache(cache_dir=temp_cache_dir)
+        cache.set_many_document_embeddings(["a", "c"], np.array([[1.0], [3.0]]))
+
+        ids = ["a", "b", "c"]
+        hits, cached = cache.get_many_document_embeddings(ids)
+        misses = [doc_id for doc_id, hit in zip(ids, hits, strict=True) if not hit]
+
+        result = np.empty((len(ids), 1))
+        result[hits] = cached
+        result[~hits] = np.array([[2.0]])
+
+        assert misses == ["b"]
+        assert result.ravel().tolist() == [1.0, 2.0, 3.0]
+
+    def test_facade_query_tiers(self, temp_cache_dir):
+        """Test batched L1 and L3 access through the facade."""
+        cache = MultiTierCache(cache_dir=temp_cache_dir)
+        cache.set_many_query_embeddings(["q1"], np.array([[0.5, 0.5]]))
+        cache.set_many_query_results(["q1", "q2"], ["r1", "r2"], top_k=3)
+
+        hits, embeddings = cache.get_many_query_embeddings(["q1", "q2"])
+        result_hits, results = cache.get_many_query_results(["q2", "q1"], top_k=3)
+
+        assert hits.tolist() == [True, False]
+        assert embeddings.shape == (1, 2)
+        assert result_hits.tolist() == [True, True]
+        assert results == ["r2", "r1"]
+
+    def test_facade_disabled_tiers(self, temp_cache_dir):
+        """Test disabled tiers report all misses."""
+        cache = MultiTierCache(
+            cache_dir=temp_cache_dir, enable_l1=False, enable_l2=False, enable_l3=False
+        )
+
+        hits, embeddings = cache.get_many_document_embeddings(["a", "b"])
+        result_hits, results = cache.get_many_query_results(["q"])
+
+        assert hits.tolist() == [False, False]
+        assert len(embeddings) == 0
+        assert result_hits.tolist() == [False]
+        assert results == []
+
+
 class TestMultiTierCache:
     """Tests for multi-tier cache orchestration."""
 
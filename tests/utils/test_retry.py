@@ -1,5 +1,6 @@
 """Tests for retry utilities with exponential backoff."""
 
+import asyncio
 import pytest
 import time
 from unittest.mock import Mock, patch
@@ -243,6 +244,44 @@ class TestWithRetryDecorator:
         mock_func.assert_called_with("a", "b", kwarg1="c")
 
 
+class TestAsyncWithRetry:
+    """Tests for with_retry on coroutine functions."""
+
+    def test_async_retries_then_succeeds(self):
+        """Test coroutines are retried and awaited."""
+        mock_func = Mock(side_effect=[LLMConnectionError("timeout"), "success"])
+
+        @with_retry(max_attempts=3, base_delay=0.01)
+        async def test_func():
+            return mock_func()
+
+        assert asyncio.run(test_func()) == "success"
+        assert mock_func.call_count == 2
+
+    def test_async_backs_off_without_blocking(self):
+        """Test the backoff uses asyncio.sleep rather than time.sleep."""
+        @with_retry(max_attempts=2, base_delay=0.01)
+        async def test_func():
+            raise LLMConnectionError("down")
+
+        with patch("src.utils.retry.time.sleep") as mock_sleep, pytest.raises(LLMConnectionError):
+            asyncio.run(test_func())
+
+        mock_sleep.assert_not_called()
+
+    def test_async_non_retryable_raises_immediately(self):
+        """Test non-retryable exceptions are not retried for coroutines."""
+        mock_func = Mock(side_effect=ValueError("bad input"))
+
+        @with_retry(max_attempts=3, base_delay=0.01)
+        async def test_func():
+            return mock_func()
+
+        with pytest.raises(ValueError):
+            asyncio.run(test_func())
+        assert mock_func.call_count == 1
+
+
 class TestRetryContext:
     """Tests for RetryContext context manager."""
 
@@ -66,6 +66,35 @@ class TestLEANNStore:
         for doc in results.documents:
             assert doc.metadata["type"] == "A"
 
+    def test_search_with_operator_filter(self, store):
+        """Test where clauses with operators pre-filter the search."""
+        embeddings = np.random.default_rng(0).normal(size=(30, 4))
+        metadatas = [{"tag": ["a", "b", "c"][i % 3], "confidence": i / 30} for i in range(30)]
+        store.add([f"doc{i}" for i in range(30)], embeddings, ["Doc"] * 30, metadatas)
+
+        where = {"$and": [{"tag": {"$in": ["a", "b"]}}, {"confidence": {"$gte": 0.5}}]}
+        results = store.search(embeddings[0], n_results=30, filter_dict=where)
+
+        assert len(results.ids) == 10
+        assert all(doc.metadata["tag"] != "c" and doc.metadata["confidence"] >= 0.5 for doc in results.documents)
+
+        store.update(["doc15"], metadatas=[{"tag": "c", "confidence": 0.5}])
+        assert "doc15" not in store.search(embeddings[15], n_results=30, filter_dict=where).ids
+        assert store.search(embeddings[0], filter_dict={"tag": "z"}).ids == []
+
+    def test_facet_counts(self, store):
+        """Test facet counts follow adds, updates and deletes."""
+        embeddings = np.random.default_rng(0).normal(size=(4, 4))
+        metadatas = [{"tag": "python"}, {"tag": "python"}, {"tag": "java"}, {"author": "Smith"}]
+        store.add(["doc1", "doc2", "doc3", "doc4"], embeddings, ["Doc"] * 4, metadatas)
+
+        store.update(["doc1"], metadatas=[{"tag": "rust"}])
+        store.delete(["doc3"])
+
+        assert store.facet_counts("tag") == {"python": 1, "rust": 1}
+        assert store.facet_fields() == ["author", "tag"]
+        assert store.facet_counts("tag", collection_name="missing") == {}
+
     def test_count(self, store):
         """Test counting documents."""
         ids = ["doc1", "doc2"]
@@ -147,6 +176,161 @@ class TestLEANNStore:
         with pytest.raises(VectorStoreNotFoundError):
             store.search(query_embedding, collection_name="nonexistent")
 
+    @pytest.mark.parametrize("quantization", ["float16", "int8"])
+    def test_quantized_search(self, tmp_path, quantization):
+        """Test search over quantized embeddings, with and without rescoring."""
+        rng = np.random.default_rng(0)
+        embeddings = rng.normal(size=(100, 16))
+        ids = [f"doc{i}" for i in range(100)]
+
+        for rescore in (False, True):
+            store = LEANNStore(config={
+                "persist_directory": str(tmp_path / f"{quantization}_{rescore}"),
+                "quantization": quantization,
+                "rescore": rescore,
+            })
+            store.add(ids, embeddings, [f"Doc {i}" for i in range(100)], [{}] * 100)
+
+            results = store.search(embeddings[42], n_results=3)
+            assert results.ids[0] == "doc42"
+            assert results.distances[0] == pytest.approx(0.0, abs=1e-2)
+
+    def test_update_embedding_replaces_vector(self, store):
+        """Test updated embeddings are searched instead of the old ones."""
+        ids = ["doc1", "doc2"]
+        embeddings = np.array([[1.0, 0.0], [0.0, 1.0]])
+        store.add(ids, embeddings, ["Doc 1", "Doc 2"], [{}, {}])
+
+        store.update(["doc1"], embeddings=np.array([[0.0, 1.0]]))
+
+        results = store.search(np.array([1.0, 0.0]), n_results=2)
+        assert results.distances[0] == pytest.approx(1.0)
+
+    def test_persists_across_restart(self, tmp_path):
+        """Test documents, deletes and updates survive reopening the store."""
+        config = {"persist_directory": str(tmp_path / "leann"), "quantization": "int8"}
+        embeddings = np.random.default_rng(0).normal(size=(20, 8))
+        ids = [f"doc{i}" for i in range(20)]
+        store = LEANNStore(config=config)
+        store.create_collection("kept", metadata={"owner": "test"})
+        store.add(ids, embeddings, [f"Doc {i}" for i in range(20)], [{"i": i} for i in range(20)], "kept")
+        store.delete(["doc3"], "kept")
+        store.update(["doc4"], embeddings=embeddings[5:6], metadatas=[{"i": 44}], collection_name="kept")
+
+        # Journal replay without close, then again after compaction
+        for close in (False, True):
+            if close:
+                store.close()
+            reopened = LEANNStore(config=config)
+
+            assert reopened.list_collections() == ["kept"]
+            assert reopened.collections["kept"]["metadata"] == {"owner": "test"}
+            assert reopened.count("kept") == 19
+            assert reopened.get(["doc3"], "kept") == []
+            assert reopened.get(["doc4"], "kept")[0].metadata == {"i": 44}
+            results = reopened.search(embeddings[7], n_results=1, collection_name="kept")
+            assert results.ids == ["doc7"]
+            results = reopened.search(embeddings[5], n_results=2, collection_name="kept")
+            assert set(results.ids) == {"doc4", "doc5"}
+
+    @pytest.mark.parametrize("rescore", [False, True])
+    def test_close_compacts_vector_files(self, tmp_path, monkeypatch, rescore):
+        """Test closing rewrites the vector files without removed rows."""
+        import ragged.vectorstore.leann_store as leann_store
+
+        monkeypatch.setattr(leann_store, "VECTOR_COMPACT_MIN_DEAD_ROWS", 1)
+        config = {"persist_directory": str(tmp_path / "leann"), "quantization": "int8", "rescore": rescore}
+        embeddings = np.random.default_rng(0).normal(size=(20, 8))
+        store = LEANNStore(config=config)
+        store.add([f"doc{i}" for i in range(20)], embeddings, ["Doc"] * 20, [{"i": i} for i in range(20)])
+        store.delete([f"doc{i}" for i in range(0, 20, 2)])
+
+        store.close()
+        reopened = LEANNStore(config=config)
+
+        path = tmp_path / "leann" / "default"
+        assert not (path / "codes.bin").exists()
+        assert (path / "codes.1.bin").exists()
+        assert reopened.collections["default"]["vectors"].size == 10
+        assert reopened.count() == 10
+        assert reopened.search(embeddings[7], n_results=1).ids == ["doc7"]
+        assert reopened.search(embeddings[7], n_results=1, filter_dict={"i": 9}).ids == ["doc9"]
+
+        reopened.add(["doc20"], embeddings[:1], ["Doc"], [{"i": 20}])
+        assert LEANNStore(config=config).search(embeddings[0], n_results=1).ids == ["doc20"]
+
+    def test_graph_index_kept_up_to_date_without_close(self, tmp_path):
+        """Test a saved graph index is updated on load rather than rebuilt."""
+        pytest.importorskip("hnswlib")
+        embeddings = np.random.default_rng(0).normal(size=(400, 16))
+        config = {"persist_directory": str(tmp_path / "leann"), "ann_threshold": 100}
+        store = LEANNStore(config=config)
+        store.add([f"doc{i}" for i in range(300)], embeddings[:300], ["Doc"] * 300, [{}] * 300)
+        store.search(embeddings[0], n_results=1)
+        store.add([f"doc{i}" for i in range(300, 400)], embeddings[300:], ["Doc"] * 100, [{}] * 100)
+        store.delete(["doc42"])
+
+        reopened = LEANNStore(config=config)
+
+        assert len(reopened.collections["default"]["index"]) == 399
+        assert reopened.search(embeddings[350], n_results=1).ids == ["doc350"]
+        assert "doc42" not in reopened.search(embeddings[42], n_results=5).ids
+
+    def test_delete_collection_removes_files(self, store):
+        """Test deleted collections are not reloaded."""
+        store.add(["doc1"], np.array([[0.1, 0.2]]), ["Doc 1"], [{}], collection_name="gone")
+
+        store.delete_collection("gone")
+
+        assert not (store.persist_dir / "gone").exists()
+        assert LEANNStore(config=store.config).list_collections() == []
+
+    @pytest.mark.parametrize("rescore", [False, True])
+    def test_graph_index_search(self, tmp_path, rescore):
+        """Test large collections are searched through the HNSW graph index."""
+        pytest.importorskip("hnswlib")
+        rng = np.random.default_rng(0)
+        embeddings = rng.normal(size=(500, 16))
+        ids = [f"doc{i}" for i in range(500)]
+        config = {
+            "persist_directory": str(tmp_path / "leann"),
+            "ann_threshold": 100,
+            "quantization": "int8",
+            "rescore": rescore,
+        }
+        store = LEANNStore(config=config)
+        store.add(ids, embeddings, [f"Doc {i}" for i in range(500)], [{"half": i % 2} for i in range(500)])
+
+        results = store.search(embeddings[42], n_results=5)
+        assert store.collections["default"]["index"] is not None
+        assert results.ids[0] == "doc42"
+        assert results.distances == sorted(results.distances)
+
+        filtered = store.search(embeddings[42], n_results=5, filter_dict={"half": 1})
+        assert all(doc.metadata["half"] == 1 for doc in filtered.documents)
+
+        store.delete(["doc42"])
+        assert "doc42" not in store.search(embeddings[42], n_results=5).ids
+
+        store.close()
+        reopened = LEANNStore(config=config)
+        assert reopened.collections["default"]["index"] is not None
+        assert reopened.search(embeddings[7], n_results=1).ids == ["doc7"]
+
+    def test_large_collection_without_hnswlib_searched_exactly(self, tmp_path, monkeypatch):
+        """Test collections above the threshold fall back to exact search."""
+        import ragged.vectorstore.leann_store as leann_store
+
+        monkeypatch.setattr(leann_store, "HNSWLIB_AVAILABLE", False)
+        store = LEANNStore(config={"persist_directory": str(tmp_path / "leann"), "ann_threshold": 10})
+        embeddings = np.random.default_rng(0).normal(size=(50, 8))
+        store.add([f"doc{i}" for i in range(50)], embeddings, ["Doc"] * 50, [{}] * 50)
+
+        results = store.search(embeddings[9], n_results=1)
+
+        assert results.ids == ["doc9"]
+        assert store.collections["default"]["index"] is None
+
 
 @pytest.mark.skipif(LEANN_AVAILABLE, reason="Test for when LEANN is not available")
 def test_leann_import_error_when_not_available():
@@ -0,0 +1,107 @@
+"""Tests for the in-process metadata index."""
+
+import numpy as np
+import pytest
+from ragged.vectorstore.exceptions import VectorStoreQueryError
+from ragged.vectorstore.metadata_index import MetadataIndex
+
+from src.retrieval.metadata_filter import FilterParser
+
+
+@pytest.fixture
+def index():
+    """Index over a small set of documents."""
+    index = MetadataIndex()
+    index.add(0, {"tag": "python", "confidence": 0.95, "date": "2023-05-01T00:00:00"})
+    index.add(1, {"tag": "java", "confidence": 0.80, "date": "2022-01-15T00:00:00"})
+    index.add(2, {"tag": "python", "confidence": 0.60, "author": "Smith"})
+    index.add(3, {"tag": "rust", "confidence": 0.99, "author": "Jones"})
+    index.add(4, {"tags": ["python", "ml"], "title": "Intro to Machine Learning"})
+    return index
+
+
+class TestMetadataIndex:
+    """Tests for MetadataIndex."""
+
+    @pytest.mark.parametrize(
+        "where,expected",
+        [
+            ({"tag": "python"}, [0, 2]),
+            ({"tag": {"$eq": "python"}}, [0, 2]),
+            ({"tag": {"$ne": "python"}}, [1, 3]),
+            ({"tag": {"$in": ["java", "rust"]}}, [1, 3]),
+            ({"tag": {"$nin": ["java", "rust"]}}, [0, 2]),
+            ({"confidence": {"$gt": 0.8}}, [0, 3]),
+            ({"confidence": {"$gte": 0.8}}, [0, 1, 3]),
+            ({"confidence": {"$lt": 0.8}}, [2]),
+            ({"confidence": {"$lte": 0.8}}, [1, 2]),
+            ({"date": {"$gte": "2023-01-01T00:00:00"}}, [0]),
+            ({"title": {"$contains": "machine"}}, [4]),
+            ({"tags": "ml"}, [4]),
+            ({"tag": "go"}, []),
+            ({"missing": {"$gt": 1}}, []),
+        ],
+    )
+    def test_operators(self, index, where, expected):
+        """Each operator selects the expected rows."""
+        assert index.match(where).tolist() == expected
+
+    def test_and_or(self, index):
+        """Clauses combine with $and, $or and multiple keys."""
+        assert index.match({"$and": [{"tag": "python"}, {"confidence": {"$gt": 0.9}}]}).tolist() == [0]
+        assert index.match({"$or": [{"tag": "java"}, {"author": "Jones"}]}).tolist() == [1, 3]
+        assert index.match({"tag": "python", "author": "Smith"}).tolist() == [2]
+
+    def test_metadata_filter_clauses(self, index):
+        """Where clauses built by FilterParser are supported."""
+        where = FilterParser.parse("tag=python,rust confidence>0.9").to_dict()
+
+        assert index.match(where).tolist() == [0, 3]
+
+    def test_remove_and_replace(self, index):
+        """Removed rows no longer match and replaced rows match their new values."""
+        index.remove(0)
+        index.add(2, {"tag": "java", "confidence": 0.7})
+
+        assert index.match({"tag": "python"}).size == 0
+        assert index.match({"tag": "java"}).tolist() == [1, 2]
+        assert index.match({"confidence": {"$lt": 0.75}}).tolist() == [2]
+        assert len(index) == 4
+
+    def test_rows_beyond_initial_size(self):
+        """Rows can be added in any order."""
+        index = MetadataIndex()
+        index.add(1000, {"tag": "late"})
+        index.add(3, {"tag": "early"})
+
+        assert index.match({"tag": {"$in": ["late", "early"]}}).tolist() == [3, 1000]
+
+    def test_unsupported_operator(self, index):
+        """Unknown operators are rejected."""
+        with pytest.raises(VectorStoreQueryError, match="Unsupported"):
+            index.match({"tag": {"$regex": "py.*"}})
+
+    def test_range_needs_orderable_value(self, index):
+        """Range comparisons against non-orderable values are rejected."""
+        with pytest.raises(VectorStoreQueryError):
+            index.match({"confidence": {"$gt": None}})
+
+    def test_facet_counts(self, index):
+        """Facet counts come from postings, most frequent first."""
+        index.remove(2)
+
+        assert index.facet_counts("tag") == {"python": 1, "java": 1, "rust": 1}
+        assert index.facet_counts("tags") == {"python": 1, "ml": 1}
+        assert index.facet_counts("missing") == {}
+        assert index.field_names() == ["author", "confidence", "date", "tag", "tags", "title"]
+
+    def test_match_returns_sorted_rows(self):
+        """Matches come back as a sorted integer array."""
+        index = MetadataIndex()
+        for row in np.random.default_rng(0).permutation(50):
+            index.add(int(row), {"score": int(row) % 5})
+
+        rows = index.match({"score": {"$gte": 3}})
+
+        assert rows.dtype == np.int64
+        assert rows.tolist() == [row for row in range(50) if row % 5 >= 3]
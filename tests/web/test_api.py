@@ -3,7 +3,7 @@
 import pytest
 import json
 from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from src.web.api import app
 
 
@@ -219,7 +219,7 @@ class TestUploadEndpoint:
             files={"file": ("test.pdf", b"PDF content", "application/pdf")}
         )
 
-        assert response.status_code == 200
+        assert response.status_code == 202
 
     def test_upload_txt_file(self, client):
         """Test uploading TXT file."""
@@ -228,7 +228,7 @@ class TestUploadEndpoint:
             files={"file": ("test.txt", b"Text content", "text/plain")}
         )
 
-        assert response.status_code == 200
+        assert response.status_code == 202
 
     def test_upload_md_file(self, client):
         """Test uploading Markdown file."""
@@ -237,7 +237,7 @@ class TestUploadEndpoint:
             files={"file": ("test.md", b"# Markdown", "text/markdown")}
         )
 
-        assert response.status_code == 200
+        assert response.status_code == 202
 
     def test_upload_html_file(self, client):
         """Test uploading HTML file."""
@@ -246,7 +246,7 @@ class TestUploadEndpoint:
             files={"file": ("test.html", b"<html></html>", "text/html")}
         )
 
-        assert response.status_code == 200
+        assert response.status_code == 202
 
     def test_upload_unsupported_file_type(self, client):
         """Test uploading unsupported file type."""
@@ -278,6 +278,85 @@ class TestUploadEndpoint:
         assert response.status_code == 422  # Validation error
 
 
+class TestJobsEndpoint:
+    """Test /api/jobs/{job_id} endpoint."""
+
+    def test_job_progress(self, client, temp_dir):
+        """Test job progress is reported."""
+        from src.ingestion.jobs import IngestionJob, JobStatus
+
+        jobs = Mock()
+        jobs.get = AsyncMock(return_value=IngestionJob(
+            "job-1", "report.pdf", temp_dir / "job-1.pdf", 2048,
+            status=JobStatus.RUNNING, stage="embedding", chunks_total=100, chunks_done=40,
+            created_at=1.0, started_at=2.0,
+        ))
+
+        with patch("src.web.api._ingestion_jobs", jobs):
+            response = client.get("/api/jobs/job-1")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "running"
+        assert data["stage"] == "embedding"
+        assert (data["chunks_done"], data["chunks_total"]) == (40, 100)
+        assert data["throughput"] > 0
+
+    def test_unknown_job(self, client):
+        """Test unknown jobs return 404."""
+        jobs = Mock()
+        jobs.get = AsyncMock(return_value=None)
+
+        with patch("src.web.api._ingestion_jobs", jobs):
+            response = client.get("/api/jobs/missing")
+
+        assert response.status_code == 404
+
+    def test_jobs_without_initialized_services(self, client):
+        """Test jobs return 503 before startup completes."""
+        with patch("src.web.api._ingestion_jobs", None):
+            response = client.get("/api/jobs/job-1")
+
+        assert response.status_code == 503
+
+    def test_resumed_job_rewrites_same_chunks(self, temp_dir):
+        """Test running a job again stores its chunks under the same ids."""
+        import asyncio
+
+        from src.ingestion.jobs import IngestionJob
+        from src.web import api
+
+        path = temp_dir / "job-1.txt"
+        path.write_text("First paragraph.\n\nSecond paragraph.\n")
+        job = IngestionJob("job-1", "notes.txt", path, path.stat().st_size)
+        chunked = []
+
+        def chunk_document(document):
+            chunked.append(document.document_id)
+            chunks = [
+                Mock(text=text, position=position, metadata=Mock(model_dump=Mock(return_value={})))
+                for position, text in enumerate(document.content.split("\n\n"))
+            ]
+            return Mock(chunks=chunks)
+
+        embedder = Mock()
+        embedder.embed_batch_async = AsyncMock(side_effect=lambda texts: [[0.1, 0.2]] * len(texts))
+        vector_store = Mock()
+        retriever = Mock()
+
+        with patch.object(api, "_embedder", embedder), \
+             patch.object(api, "_vector_store", vector_store), \
+             patch.object(api, "_hybrid_retriever", retriever), \
+             patch("src.web.api.chunk_document", side_effect=chunk_document):
+            for _ in range(2):
+                asyncio.run(api._ingest_upload(job, Mock()))
+
+        stored = [call.kwargs["ids"] for call in vector_store.add.call_args_list]
+        indexed = [call.args[1] for call in retriever.update_bm25_index.call_args_list]
+        assert chunked == ["job-1", "job-1"]
+        assert stored == indexed == [["job-1-0", "job-1-1"]] * 2
+
+
 class TestCollectionsEndpoints:
     """Test collection management endpoints."""
 
@@ -300,6 +379,49 @@ class TestCollectionsEndpoints:
         assert data["collection"] == "default"
 
 
+class TestFacetsEndpoint:
+    """Test /api/facets endpoint."""
+
+    def test_facets(self, client):
+        """Test facet counts are returned per field."""
+        store = Mock()
+        store.facet_fields.return_value = ["tag"]
+        store.facet_counts.return_value = {"python": 3, "java": 1, "rust": 1}
+
+        with patch("src.web.api._vector_store", store):
+            response = client.get("/api/facets", params={"limit": 2})
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "facets": {"tag": [{"value": "python", "count": 3}, {"value": "java", "count": 1}]}
+        }
+
+    def test_facets_selected_fields(self, client):
+        """Test only requested fields are counted."""
+        store = Mock()
+        store.facet_counts.return_value = {"Smith": 2}
+
+        with patch("src.web.api._vector_store", store):
+            response = client.get("/api/facets", params={"field": ["author"]})
+
+        assert response.json()["facets"] == {"author": [{"value": "Smith", "count": 2}]}
+        store.facet_fields.assert_not_called()
+
+    def test_facets_invalid_field(self, client):
+        """Test fields outside the metadata whitelist are rejected."""
+        with patch("src.web.api._vector_store", Mock()):
+            response = client.get("/api/facets", params={"field": ["$where"]})
+
+        assert response.status_code == 400
+
+    def test_facets_without_initialized_services(self, client):
+        """Test facets return 503 before startup completes."""
+        with patch("src.web.api._vector_store", None):
+            response = client.get("/api/facets")
+
+        assert response.status_code == 503
+
+
 class TestCORS:
     """Test CORS middleware configuration."""
 
@@ -462,10 +584,12 @@ class TestAPIIntegration:
         mock_result.score = 0.95
         mock_result.document_path = "test.pdf"
         mock_result.metadata = {"filename": "test.pdf", "chunk_index": 0}
-        mock_retriever.retrieve.return_value = [mock_result]
+        mock_retriever.retrieve_async = AsyncMock(return_value=[mock_result])
 
         mock_llm_client = Mock()
-        mock_llm_client.generate.return_value = "This is a generated answer based on the context."
+        mock_llm_client.generate_async = AsyncMock(
+            return_value="This is a generated answer based on the context."
+        )
 
         # Temporarily replace services
         original_retriever = api._hybrid_retriever
@@ -484,8 +608,8 @@ class TestAPIIntegration:
             data = response.json()
 
             # Verify actual implementation was used
-            assert mock_retriever.retrieve.called
-            assert mock_llm_client.generate.called
+            assert mock_retriever.retrieve_async.await_count == 1
+            assert mock_llm_client.generate_async.await_count == 1
 
             # Verify response structure
             assert "answer" in data
@@ -503,7 +627,7 @@ class TestAPIIntegration:
 
         # Mock retriever to return empty results
         mock_retriever = Mock()
-        mock_retriever.retrieve.return_value = []
+        mock_retriever.retrieve_async = AsyncMock(return_value=[])
 
         # Mock LLM client (needed for initialization check)
         mock_llm_client = Mock()
@@ -532,46 +656,58 @@ class TestAPIIntegration:
             api._llm_client = original_client
 
     def test_upload_integration_with_mocked_services(self, client, temp_dir):
-        """Test upload endpoint uses real implementation logic."""
+        """Test upload spools the file and queues an ingestion job."""
+        from src.ingestion.jobs import IngestionJobQueue, IngestionJobStore
         from src.web import api
 
-        # Create test content
         test_content = "# Test Document\n\nThis is test content.\n" * 20
+        # Workers are not started, so the job stays queued
+        jobs = IngestionJobQueue(
+            AsyncMock(),
+            upload_dir=temp_dir / "uploads",
+            store=IngestionJobStore(db_path=temp_dir / "jobs.db"),
+        )
 
-        # Mock services
-        mock_embedder = Mock()
-        mock_embedder.embed.return_value = [[0.1] * 384]  # Mock embeddings
-
-        mock_vector_store = Mock()
-        mock_vector_store.add_documents.return_value = None
-
-        original_embedder = api._embedder
-        original_vector_store = api._vector_store
-
-        try:
-            api._embedder = mock_embedder
-            api._vector_store = mock_vector_store
-
+        with patch.object(api, "_embedder", Mock()), \
+             patch.object(api, "_vector_store", Mock()), \
+             patch.object(api, "_ingestion_jobs", jobs):
             response = client.post(
                 "/api/upload",
                 files={"file": ("test.md", test_content.encode(), "text/markdown")}
             )
 
-            assert response.status_code == 200
+            assert response.status_code == 202
             data = response.json()
+            assert data["status"] == "queued"
+            assert data["size"] == len(test_content.encode())
 
-            # Verify actual implementation was used
-            assert mock_embedder.embed.called
-            assert mock_vector_store.add_documents.called
+            job = jobs.store.get(data["job_id"])
+            assert job.filename == "test.md"
+            assert job.path.read_text() == test_content
 
-            # Verify response
-            assert data["status"] == "success"
-            assert "ingested" in data["message"].lower()
-            assert "chunks" in data["message"].lower()
+            status = client.get(f"/api/jobs/{data['job_id']}").json()
+            assert status["status"] == "queued"
+            assert status["chunks_done"] == 0
 
-        finally:
-            api._embedder = original_embedder
-            api._vector_store = original_vector_store
+    def test_upload_too_large(self, client, temp_dir):
+        """Test uploads over the size limit are rejected and not kept."""
+        from src.web import api
+
+        jobs = Mock()
+        jobs.upload_dir = temp_dir
+
+        with patch.object(api, "_embedder", Mock()), \
+             patch.object(api, "_vector_store", Mock()), \
+             patch.object(api, "_ingestion_jobs", jobs), \
+             patch("src.web.api.get_settings", return_value=Mock(max_file_size_mb=0)):
+            response = client.post(
+                "/api/upload",
+                files={"file": ("test.txt", b"content", "text/plain")}
+            )
+
+        assert response.status_code == 413
+        assert not jobs.submit.called
+        assert not any(temp_dir.iterdir())
 
     def test_health_reports_service_status(self, client):
         """Test health endpoint accurately reports service initialization status."""